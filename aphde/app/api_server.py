@@ -0,0 +1,391 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import ipaddress
+import json
+import logging
+import re
+import threading
+from collections import OrderedDict
+from datetime import date
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable
+from urllib.parse import parse_qs, urlsplit
+
+from aphde.app.services.dashboard_service import build_history_payload, load_dashboard_data, trigger_evaluation
+from aphde.app.services.view_precompute import load_view
+from core.data.db import get_connection
+from core.data.repositories.calorie_repo import CalorieLogRepository
+from core.data.repositories.data_version_repo import UserDataVersionRepository
+from core.data.repositories.weight_repo import WeightLogRepository
+from core.data.repositories.workout_repo import WorkoutLogRepository
+from core.models.entities import CalorieLog, WeightLog, WorkoutLog
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8600
+DEFAULT_CACHE_ENTRIES = 1024
+MAX_BODY_BYTES = 4 * 1024 * 1024
+
+logger = logging.getLogger(__name__)
+
+
+class ApiError(Exception):
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class ResponseCache:
+    """Thread-safe LRU of encoded response bodies keyed by ETag."""
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, etag: str) -> bytes | None:
+        with self._lock:
+            body = self._entries.get(etag)
+            if body is not None:
+                self._entries.move_to_end(etag)
+            return body
+
+    def put(self, etag: str, body: bytes) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[etag] = body
+            self._entries.move_to_end(etag)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+def _encode(payload: Any) -> bytes:
+    return json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def _int_param(query: dict[str, list[str]], name: str, default: int, *, low: int = 1, high: int = 200) -> int:
+    raw = query.get(name, [None])[0]
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError as exc:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"'{name}' must be an integer") from exc
+    return max(low, min(high, value))
+
+
+def _data_version(db_path: str, user_id: int) -> int:
+    with get_connection(db_path) as conn:
+        return UserDataVersionRepository(conn).get(user_id)
+
+
+def _etag(path: str, query: str, data_version: int) -> str:
+    # Views use day-relative windows, so the date is part of the validator too.
+    basis = f"{path}?{query}|v{data_version}|{date.today().isoformat()}"
+    return '"' + hashlib.sha256(basis.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def _latest_view(db_path: str, user_id: int, query: dict[str, list[str]]) -> dict[str, Any]:
+    data = load_dashboard_data(user_id=user_id, db_path=db_path, recent_limit=1)
+    return {"latest": data.get("latest")}
+
+
+def _history_view(db_path: str, user_id: int, query: dict[str, list[str]]) -> dict[str, Any]:
+    limit = _int_param(query, "limit", 25)
+    recent_runs = load_dashboard_data(user_id=user_id, db_path=db_path, recent_limit=limit).get("recent_runs", [])
+    return {
+        "runs": [
+            {
+                "id": run["id"],
+                "alignment_score": run["alignment_score"],
+                "risk_score": run["risk_score"],
+                "alignment_confidence": run["alignment_confidence"],
+                "engine_version": run["engine_version"],
+                "output_hash": run["output_hash"],
+                "determinism_verified": run["determinism_verified"],
+            }
+            for run in recent_runs
+        ],
+        "history": build_history_payload(recent_runs=recent_runs),
+    }
+
+
+def _insights_view(db_path: str, user_id: int, query: dict[str, list[str]]) -> dict[str, Any]:
+    view = load_view("insights", user_id=user_id, db_path=db_path, recent_limit=_int_param(query, "limit", 42))
+    view.pop("recent_runs", None)
+    return view
+
+
+def _action_plan_view(db_path: str, user_id: int, query: dict[str, list[str]]) -> dict[str, Any]:
+    view = load_view("action_center", user_id=user_id, db_path=db_path, recent_limit=_int_param(query, "limit", 28))
+    view.pop("recent_runs", None)
+    return view
+
+
+def _require_list(payload: dict[str, Any], key: str) -> list[dict[str, Any]]:
+    items = payload.get(key, [])
+    if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"'{key}' must be a list of objects")
+    return items
+
+
+def _parse_log_batch(user_id: int, payload: dict[str, Any]) -> tuple[list[WeightLog], list[CalorieLog], list[WorkoutLog]]:
+    try:
+        weight_logs = [
+            WeightLog(user_id=user_id, log_date=date.fromisoformat(item["log_date"]), weight_kg=float(item["weight_kg"]))
+            for item in _require_list(payload, "weight_logs")
+        ]
+        calorie_logs = [
+            CalorieLog(
+                user_id=user_id,
+                log_date=date.fromisoformat(item["log_date"]),
+                calories_kcal=int(item["calories_kcal"]),
+                protein_g=int(item["protein_g"]) if item.get("protein_g") is not None else None,
+            )
+            for item in _require_list(payload, "calorie_logs")
+        ]
+        workout_logs = [
+            WorkoutLog(
+                user_id=user_id,
+                log_date=date.fromisoformat(item["log_date"]),
+                session_type=str(item["session_type"]),
+                duration_min=int(item["duration_min"]),
+                volume_load=float(item["volume_load"]) if item.get("volume_load") is not None else None,
+                avg_rpe=float(item["avg_rpe"]) if item.get("avg_rpe") is not None else None,
+                planned_flag=bool(item.get("planned_flag", True)),
+                completed_flag=bool(item.get("completed_flag", True)),
+            )
+            for item in _require_list(payload, "workout_logs")
+        ]
+    except KeyError as exc:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"missing field {exc.args[0]!r}") from exc
+    except (TypeError, ValueError) as exc:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"invalid log entry: {exc}") from exc
+    return weight_logs, calorie_logs, workout_logs
+
+
+_ViewBuilder = Callable[[str, int, dict[str, list[str]]], dict[str, Any]]
+
+_CACHED_VIEWS: list[tuple[re.Pattern[str], _ViewBuilder]] = [
+    (re.compile(r"^/users/(?P<user_id>\d+)/decisions/latest$"), _latest_view),
+    (re.compile(r"^/users/(?P<user_id>\d+)/decisions$"), _history_view),
+    (re.compile(r"^/users/(?P<user_id>\d+)/insights$"), _insights_view),
+    (re.compile(r"^/users/(?P<user_id>\d+)/action-plan$"), _action_plan_view),
+]
+_EVALUATE_ROUTE = re.compile(r"^/users/(?P<user_id>\d+)/evaluate$")
+_LOGS_ROUTE = re.compile(r"^/users/(?P<user_id>\d+)/logs$")
+
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class ApiServer(ThreadingHTTPServer):
+    """
+    Loopback-only server: routes trust the `user_id` in the path and carry no
+    session token, so binding any other interface is refused.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        *,
+        db_path: str | Path,
+        cache_entries: int = DEFAULT_CACHE_ENTRIES,
+        quiet: bool = True,
+    ) -> None:
+        if not _is_loopback(address[0]):
+            raise ValueError(f"API server is loopback-only; refusing to bind {address[0]!r}")
+        super().__init__(address, ApiRequestHandler)
+        self.db_path = str(db_path)
+        self.response_cache = ResponseCache(cache_entries)
+        self.quiet = quiet
+
+
+class ApiRequestHandler(BaseHTTPRequestHandler):
+    """
+    JSON handler. Uses HTTP/1.1 so clients can keep connections alive; every
+    response carries an explicit Content-Length for that reason.
+    """
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out as separate writes; without TCP_NODELAY each
+    # kept-alive response stalls on delayed ACKs.
+    disable_nagle_algorithm = True
+    server: ApiServer
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    def do_GET(self) -> None:  # noqa: N802
+        self._dispatch(self._handle_get)
+
+    def do_POST(self) -> None:  # noqa: N802
+        self._dispatch(self._handle_post)
+
+    def _dispatch(self, handler: Callable[[str, str], None]) -> None:
+        parts = urlsplit(self.path)
+        try:
+            handler(parts.path, parts.query)
+        except ApiError as exc:
+            self._send_json(exc.status, {"error": exc.message})
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("%s %s failed", self.command, parts.path)
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": type(exc).__name__})
+
+    def _handle_get(self, path: str, query: str) -> None:
+        if path == "/health":
+            self._send_json(HTTPStatus.OK, {"status": "ok"})
+            return
+        for pattern, builder in _CACHED_VIEWS:
+            match = pattern.match(path)
+            if match is None:
+                continue
+            user_id = int(match.group("user_id"))
+            etag = _etag(path, query, _data_version(self.server.db_path, user_id))
+            if etag in {tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")}:
+                self._send_not_modified(etag)
+                return
+            body = self.server.response_cache.get(etag)
+            if body is None:
+                body = _encode(builder(self.server.db_path, user_id, parse_qs(query)))
+                self.server.response_cache.put(etag, body)
+            self._send_body(HTTPStatus.OK, body, etag=etag)
+            return
+        raise ApiError(HTTPStatus.NOT_FOUND, "route not found")
+
+    def _handle_post(self, path: str, query: str) -> None:
+        # Always drain the body first so the kept-alive connection stays in sync.
+        payload = self._read_json()
+        match = _EVALUATE_ROUTE.match(path)
+        if match is not None:
+            self._send_json(HTTPStatus.CREATED, {"decision_id": self._evaluate(int(match.group("user_id")))})
+            return
+        match = _LOGS_ROUTE.match(path)
+        if match is not None:
+            self._ingest_logs(int(match.group("user_id")), payload)
+            return
+        raise ApiError(HTTPStatus.NOT_FOUND, "route not found")
+
+    def _evaluate(self, user_id: int) -> int:
+        try:
+            return trigger_evaluation(user_id=user_id, db_path=self.server.db_path)
+        except ValueError as exc:
+            raise ApiError(HTTPStatus.UNPROCESSABLE_ENTITY, str(exc)) from exc
+
+    def _ingest_logs(self, user_id: int, payload: dict[str, Any]) -> None:
+        weight_logs, calorie_logs, workout_logs = _parse_log_batch(user_id, payload)
+        with get_connection(self.server.db_path) as conn:
+            inserted = {
+                "weight_logs": WeightLogRepository(conn).add_many(weight_logs),
+                "calorie_logs": CalorieLogRepository(conn).add_many(calorie_logs),
+                "workout_logs": WorkoutLogRepository(conn).add_many(workout_logs),
+            }
+        response: dict[str, Any] = {"inserted": inserted}
+        if bool(payload.get("evaluate", False)):
+            response["decision_id"] = self._evaluate(user_id)
+        self._send_json(HTTPStatus.CREATED, response)
+
+    def _read_json(self) -> dict[str, Any]:
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        # The body is left unread on these errors, so the connection cannot be reused.
+        if length < 0:
+            self.close_connection = True
+            raise ApiError(HTTPStatus.BAD_REQUEST, "invalid Content-Length")
+        if length > MAX_BODY_BYTES:
+            self.close_connection = True
+            raise ApiError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "request body too large")
+        if length == 0:
+            return {}
+        try:
+            payload = json.loads(self.rfile.read(length))
+        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+            raise ApiError(HTTPStatus.BAD_REQUEST, "request body must be JSON") from exc
+        if not isinstance(payload, dict):
+            raise ApiError(HTTPStatus.BAD_REQUEST, "request body must be a JSON object")
+        return payload
+
+    def _send_json(self, status: HTTPStatus, payload: Any) -> None:
+        self._send_body(status, _encode(payload))
+
+    def _send_body(self, status: HTTPStatus, body: bytes, *, etag: str | None = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        if etag is not None:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_not_modified(self, etag: str) -> None:
+        self.send_response(HTTPStatus.NOT_MODIFIED)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+def make_server(
+    *,
+    db_path: str | Path,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    cache_entries: int = DEFAULT_CACHE_ENTRIES,
+    quiet: bool = True,
+) -> ApiServer:
+    return ApiServer((host, port), db_path=db_path, cache_entries=cache_entries, quiet=quiet)
+
+
+def main(argv: list[str] | None = None) -> int:
+    from aphde.app.utils import DB_PATH, bootstrap_db
+
+    parser = argparse.ArgumentParser(description="Serve Stratify evaluations over HTTP/JSON.")
+    parser.add_argument("--db", default=str(DB_PATH), help="SQLite database path")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--cache-entries", type=int, default=DEFAULT_CACHE_ENTRIES)
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args(argv)
+
+    if not _is_loopback(args.host):
+        parser.error("--host must be a loopback address; the API does not authenticate callers")
+    if Path(args.db).resolve() == Path(DB_PATH).resolve():
+        bootstrap_db()
+    server = make_server(
+        db_path=args.db,
+        host=args.host,
+        port=args.port,
+        cache_entries=args.cache_entries,
+        quiet=not args.verbose,
+    )
+    print(f"Stratify API listening on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
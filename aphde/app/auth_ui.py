@@ -2,19 +2,41 @@ from __future__ import annotations
 
 import streamlit as st
 
+from aphde.app.ui.data_cache import ensure_database, get_login_throttle, get_session_store
 from aphde.app.ui.layout import render_page_header
-from aphde.app.utils import DB_PATH, bootstrap_db
-from core.auth.service import AuthError, AuthService
+from aphde.app.utils import DB_PATH
+from core.auth.service import AuthError, AuthIdentity, AuthService
 from core.auth.session import (
     clear_auth_session,
     get_authenticated_user_id,
-    is_authenticated,
+    get_session_token,
     set_authenticated_session,
 )
 from core.data.db import get_connection
 from core.data.repositories.user_repo import UserRepository
 
 
+def _client_identifier() -> str | None:
+    try:
+        return st.context.ip_address
+    except Exception:  # noqa: BLE001
+        return None
+
+
+def _start_session(identity: AuthIdentity) -> None:
+    token = get_session_store(str(DB_PATH)).issue(
+        user_id=identity.id,
+        email=identity.email,
+        display_name=identity.display_name,
+    )
+    set_authenticated_session(
+        user_id=identity.id,
+        email=identity.email,
+        display_name=identity.display_name,
+        session_token=token,
+    )
+
+
 def _render_login_form() -> None:
     st.markdown("#### Log In")
     with st.form("login_form", clear_on_submit=False):
@@ -27,8 +49,8 @@ def _render_login_form() -> None:
 
     try:
         with get_connection(DB_PATH) as conn:
-            service = AuthService(UserRepository(conn))
-            identity = service.login(email=email, password=password)
+            service = AuthService(UserRepository(conn), throttle=get_login_throttle(str(DB_PATH)))
+            identity = service.login(email=email, password=password, client_id=_client_identifier())
     except AuthError as exc:
         st.error(str(exc))
         return
@@ -36,11 +58,7 @@ def _render_login_form() -> None:
         st.error(f"Login failed: {exc}")
         return
 
-    set_authenticated_session(
-        user_id=identity.id,
-        email=identity.email,
-        display_name=identity.display_name,
-    )
+    _start_session(identity)
     st.rerun()
 
 
@@ -66,11 +84,7 @@ def _render_signup_form() -> None:
         st.error(f"Signup failed: {exc}")
         return
 
-    set_authenticated_session(
-        user_id=identity.id,
-        email=identity.email,
-        display_name=identity.display_name,
-    )
+    _start_session(identity)
     st.success("Account created.")
     st.rerun()
 
@@ -93,15 +107,14 @@ def render_auth_gate() -> None:
 
 
 def require_authenticated_user() -> int:
-    bootstrap_db()
-    if is_authenticated():
-        user_id = get_authenticated_user_id()
-        if user_id is not None:
-            with get_connection(DB_PATH) as conn:
-                row = UserRepository(conn).get_by_id(user_id)
-            if row is not None and int(row["is_active"]) == 1:
-                return user_id
-        clear_auth_session()
+    ensure_database(str(DB_PATH))
+    token = get_session_token()
+    if token is not None:
+        # Served from the token store's LRU on reruns; no users query.
+        identity = get_session_store(str(DB_PATH)).resolve(token)
+        if identity is not None and identity.user_id == get_authenticated_user_id():
+            return identity.user_id
+    clear_auth_session()
 
     render_auth_gate()
     st.stop()
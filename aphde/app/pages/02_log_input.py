@@ -7,6 +7,7 @@ from typing import Any
 import streamlit as st
 
 from aphde.app.auth_ui import require_authenticated_user
+from aphde.app.ui.data_cache import invalidate_user_views
 from aphde.app.ui.layout import render_page_header, render_sidebar_navigation
 from aphde.app.utils import DB_PATH
 from core.data.db import get_connection
@@ -256,6 +257,7 @@ def render_commit_button(*, user_id: int) -> None:
                     payload=payload,
                 )
 
+        invalidate_user_views(user_id)
         st.success("Log entry recorded successfully.")
 
 
@@ -13,7 +13,7 @@ from aphde.app.ui.layout import render_page_header, render_sidebar_navigation
 from aphde.app.services.dashboard_service import (
     trigger_evaluation,
 )
-from aphde.app.services.ui_data_service import load_dashboard_view
+from aphde.app.ui.data_cache import cached_dashboard_view, invalidate_user_views
 from aphde.app.utils import DB_PATH
 
 
@@ -35,6 +35,7 @@ if run_button:
     with st.spinner("Running evaluation..."):
         try:
             decision_id = trigger_evaluation(user_id=user_id, db_path=str(DB_PATH))
+            invalidate_user_views(user_id)
             st.success(f"Evaluation complete. decision_id={decision_id}")
         except ValueError as exc:
             st.error(str(exc))
@@ -43,7 +44,7 @@ if run_button:
 
 try:
     with st.spinner("Loading dashboard data..."):
-        view = load_dashboard_view(user_id=user_id, db_path=str(DB_PATH), recent_limit=25)
+        view = cached_dashboard_view(user_id=user_id, db_path=str(DB_PATH), recent_limit=25)
 except Exception as exc:  # noqa: BLE001
     st.error(f"Failed to load dashboard data: {exc}")
     st.stop()
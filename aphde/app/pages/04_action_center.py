@@ -3,7 +3,7 @@ from __future__ import annotations
 import streamlit as st
 
 from aphde.app.auth_ui import require_authenticated_user
-from aphde.app.services.action_center_service import load_action_center_view
+from aphde.app.ui.data_cache import cached_action_center_view
 from aphde.app.ui.layout import render_page_header, render_sidebar_navigation
 from aphde.app.utils import DB_PATH
 
@@ -154,7 +154,7 @@ def main() -> None:
     )
 
     try:
-        view = load_action_center_view(user_id=user_id, db_path=str(DB_PATH), recent_limit=28)
+        view = cached_action_center_view(user_id=user_id, db_path=str(DB_PATH), recent_limit=28)
     except Exception as exc:  # noqa: BLE001
         st.error(f"Failed to load action center view: {exc}")
         st.stop()
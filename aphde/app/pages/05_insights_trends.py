@@ -4,7 +4,7 @@ import pandas as pd
 import streamlit as st
 
 from aphde.app.auth_ui import require_authenticated_user
-from aphde.app.services.insights_service import load_insights_view
+from aphde.app.ui.data_cache import cached_insights_view
 from aphde.app.ui.layout import render_page_header, render_sidebar_navigation
 from aphde.app.utils import DB_PATH
 
@@ -131,6 +131,24 @@ def render_weekly_snapshot(summary: dict) -> None:
         )
 
 
+def render_weekly_trend(weekly_trend: list[dict]) -> None:
+    with st.container():
+        st.markdown("### Weekly Trend")
+        if not weekly_trend:
+            st.info("No weekly data available.")
+            return
+        frame = pd.DataFrame(
+            {
+                "Week": [point["iso_week"] for point in weekly_trend],
+                "Sessions": [f'{point["completed_sessions"]} / {point["planned_sessions"]}' for point in weekly_trend],
+                "Compliance (avg)": [point.get("compliance_ratio_mean") for point in weekly_trend],
+                "Recovery (avg)": [point.get("recovery_index_mean") for point in weekly_trend],
+                "Overload (avg)": [point.get("progressive_overload_score_mean") for point in weekly_trend],
+            }
+        )
+        st.dataframe(frame, hide_index=True)
+
+
 def render_drift_status(drift: dict) -> None:
     with st.container():
         st.markdown("### Drift Status")
@@ -232,6 +250,8 @@ def render_technical_trace(view: dict) -> None:
     with st.expander("Technical Trace (Advanced)", expanded=False):
         st.write("Weekly insight payload")
         st.json(view.get("weekly_insight") or {})
+        st.write("Weekly trend payload")
+        st.json(view.get("weekly_trend") or [])
         st.write("Stagnation alerts payload")
         st.json(view.get("stagnation_alerts") or [])
         st.write("Drift detection payload")
@@ -250,7 +270,7 @@ def main() -> None:
     )
 
     try:
-        view = load_insights_view(user_id=user_id, db_path=str(DB_PATH), recent_limit=42)
+        view = cached_insights_view(user_id=user_id, db_path=str(DB_PATH), recent_limit=42)
     except Exception as exc:  # noqa: BLE001
         st.error(f"Failed to load insights view: {exc}")
         st.stop()
@@ -269,6 +289,8 @@ def main() -> None:
     st.markdown("<br>", unsafe_allow_html=True)
     render_weekly_snapshot(summary)
     st.markdown("<br>", unsafe_allow_html=True)
+    render_weekly_trend(view.get("weekly_trend", []))
+    st.markdown("<br>", unsafe_allow_html=True)
     render_drift_status(drift)
     st.markdown("<br>", unsafe_allow_html=True)
     render_stagnation_alerts(alerts)
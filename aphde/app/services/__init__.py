@@ -1,5 +1,6 @@
 __all__: list[str] = [
     "action_center_service",
+    "async_views",
     "dashboard_service",
     "insights_service",
     "ui_data_service",
@@ -5,26 +5,8 @@ from typing import Any
 from aphde.app.services.dashboard_service import load_dashboard_data
 from core.data.db import get_connection
 from core.data.repositories.workout_repo import WorkoutLogRepository
-from core.guidance.tomorrow_plan import build_tomorrow_plan
-
-
-def _signal_series(recent_runs: list[dict[str, Any]], key: str) -> list[float]:
-    values: list[float] = []
-    for run in reversed(recent_runs):
-        trace = run.get("trace", {})
-        if not isinstance(trace, dict):
-            continue
-        computed = trace.get("computed_signals", {})
-        if not isinstance(computed, dict):
-            continue
-        raw = computed.get(key)
-        if raw is None:
-            continue
-        try:
-            values.append(float(raw))
-        except (TypeError, ValueError):
-            continue
-    return values
+from core.insights.signal_frame import SignalSeriesFrame
+from core.services.tomorrow_plans import load_tomorrow_plan
 
 
 def _risk_level_and_message(*, rules: list[str]) -> tuple[str, str]:
@@ -54,8 +36,9 @@ def _high_rpe_streak(*, user_id: int, db_path: str, days: int = 28, threshold: f
 
 
 def _build_action_explainability(*, latest: dict[str, Any], recent_runs: list[dict[str, Any]], user_id: int, db_path: str) -> dict[str, Any]:
-    recovery = _signal_series(recent_runs, "recovery_index")
-    compliance = _signal_series(recent_runs, "compliance_ratio")
+    frame = SignalSeriesFrame.from_runs(recent_runs, keys=("recovery_index", "compliance_ratio"))
+    recovery = frame.series("recovery_index")
+    compliance = frame.series("compliance_ratio")
     recovery_summary = "Recovery trend unavailable."
     compliance_summary = "Compliance trend unavailable."
 
@@ -94,7 +77,9 @@ def load_action_center_view(*, user_id: int, db_path: str, recent_limit: int = 2
             "recent_runs": recent_runs,
         }
 
-    plan = build_tomorrow_plan(latest_run=latest, recent_runs=recent_runs)
+    with get_connection(db_path) as conn:
+        # Stored by the nightly batch or an earlier render for the same run.
+        plan = load_tomorrow_plan(conn, user_id=user_id, latest_run=latest)
     trace = latest.get("trace", {}) if isinstance(latest.get("trace"), dict) else {}
     rules = trace.get("triggered_rules", [])
     risk_level, risk_message = _risk_level_and_message(rules=rules)
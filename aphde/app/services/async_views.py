@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import Any
+
+from aphde.app.services.action_center_service import load_action_center_view
+from aphde.app.services.insights_service import load_insights_view
+from aphde.app.services.ui_data_service import load_dashboard_view
+from core.services.async_evaluation import AsyncEvaluationRuntime, async_run_evaluation, run_db_read
+from domains.health.domain_definition import HealthDomainDefinition
+
+
+async def async_trigger_evaluation(
+    *,
+    user_id: int,
+    db_path: str,
+    timeout: float | None = None,
+    runtime: AsyncEvaluationRuntime | None = None,
+) -> int:
+    return await async_run_evaluation(
+        user_id=user_id,
+        db_path=db_path,
+        domain_definition=HealthDomainDefinition(),
+        timeout=timeout,
+        runtime=runtime,
+    )
+
+
+async def async_load_dashboard_view(
+    *,
+    user_id: int,
+    db_path: str,
+    recent_limit: int = 25,
+    timeout: float | None = None,
+    runtime: AsyncEvaluationRuntime | None = None,
+) -> dict[str, Any]:
+    return await run_db_read(
+        db_path,
+        load_dashboard_view,
+        user_id=user_id,
+        db_path=db_path,
+        recent_limit=recent_limit,
+        timeout=timeout,
+        runtime=runtime,
+    )
+
+
+async def async_load_action_center_view(
+    *,
+    user_id: int,
+    db_path: str,
+    recent_limit: int = 28,
+    timeout: float | None = None,
+    runtime: AsyncEvaluationRuntime | None = None,
+) -> dict[str, Any]:
+    return await run_db_read(
+        db_path,
+        load_action_center_view,
+        user_id=user_id,
+        db_path=db_path,
+        recent_limit=recent_limit,
+        timeout=timeout,
+        runtime=runtime,
+    )
+
+
+async def async_load_insights_view(
+    *,
+    user_id: int,
+    db_path: str,
+    recent_limit: int = 42,
+    timeout: float | None = None,
+    runtime: AsyncEvaluationRuntime | None = None,
+) -> dict[str, Any]:
+    return await run_db_read(
+        db_path,
+        load_insights_view,
+        user_id=user_id,
+        db_path=db_path,
+        recent_limit=recent_limit,
+        timeout=timeout,
+        runtime=runtime,
+    )
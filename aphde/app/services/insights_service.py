@@ -1,32 +1,19 @@
 from __future__ import annotations
 
+from datetime import date
 from typing import Any
 
 from aphde.app.services.dashboard_service import load_dashboard_data
 from core.data.db import get_connection
 from core.data.repositories.weight_repo import WeightLogRepository
-from core.insights.stagnation import detect_stagnation_alerts
+from core.insights.signal_frame import SignalSeriesFrame
+from core.insights.stagnation_detector import StagnationDetector
 from core.insights.trend_views import build_series_with_slope
-from core.insights.weekly_summary import build_weekly_insight
-
-
-def _signal_series(recent_runs: list[dict[str, Any]], signal_key: str) -> list[float]:
-    values: list[float] = []
-    for run in reversed(recent_runs):
-        trace = run.get("trace", {})
-        if not isinstance(trace, dict):
-            continue
-        computed = trace.get("computed_signals", {})
-        if not isinstance(computed, dict):
-            continue
-        raw = computed.get(signal_key)
-        if raw is None:
-            continue
-        try:
-            values.append(float(raw))
-        except (TypeError, ValueError):
-            continue
-    return values
+from core.insights.weekly_aggregates import WeeklyAggregator
+from core.insights.weekly_summary import build_weekly_insight, build_weekly_trend, iso_week_of
+
+
+TREND_SIGNALS: tuple[str, ...] = ("compliance_ratio", "recovery_index", "progressive_overload_score")
 
 
 def _drift_detection(*, compliance_series: list[float], recovery_series: list[float], alerts: list[dict[str, Any]]) -> dict[str, Any]:
@@ -47,18 +34,32 @@ def _drift_detection(*, compliance_series: list[float], recovery_series: list[fl
     }
 
 
-def load_insights_view(*, user_id: int, db_path: str, recent_limit: int = 42) -> dict[str, Any]:
+def load_insights_view(
+    *,
+    user_id: int,
+    db_path: str,
+    recent_limit: int = 42,
+    weekly_limit: int = 8,
+) -> dict[str, Any]:
     data = load_dashboard_data(user_id=user_id, db_path=db_path, recent_limit=recent_limit)
     recent_runs = data.get("recent_runs", [])
-    alerts = detect_stagnation_alerts(recent_runs=recent_runs)
-    weekly = build_weekly_insight(recent_runs=recent_runs)
-
-    compliance_series = _signal_series(recent_runs, "compliance_ratio")
-    recovery_series = _signal_series(recent_runs, "recovery_index")
-    overload_series = _signal_series(recent_runs, "progressive_overload_score")
+    frame = SignalSeriesFrame.from_runs(recent_runs, keys=TREND_SIGNALS)
+    compliance_series = frame.series("compliance_ratio")
+    recovery_series = frame.series("recovery_index")
+    overload_series = frame.series("progressive_overload_score")
 
     with get_connection(db_path) as conn:
+        # Maintained on every decision write; this is one indexed read.
+        alerts = StagnationDetector(conn).active_alerts(user_id)
+        # Calendar weeks, kept current by decision writes and workout_logs triggers.
+        weeks = WeeklyAggregator(conn).weeks(user_id, limit=weekly_limit)
         weight_rows = WeightLogRepository(conn).list_recent(user_id=user_id, days=42)
+    # The summary covers the current calendar week, which may have no
+    # activity yet even when earlier weeks do.
+    today = date.today()
+    current_week, _ = iso_week_of(today)
+    week = next((week for week in weeks if week["iso_week"] == current_week), None)
+    weekly = build_weekly_insight(week=week, today=today)
     weight_values = [float(row["weight_kg"]) for row in weight_rows]
 
     trends = {
@@ -76,6 +77,7 @@ def load_insights_view(*, user_id: int, db_path: str, recent_limit: int = 42) ->
     return {
         "latest": data.get("latest"),
         "weekly_insight": weekly,
+        "weekly_trend": build_weekly_trend(weeks),
         "stagnation_alerts": alerts,
         "drift_detection": drift,
         "trends": trends,
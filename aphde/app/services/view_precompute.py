@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import date
+from typing import Any
+
+from aphde.app.services.action_center_service import load_action_center_view
+from aphde.app.services.insights_service import load_insights_view
+from core.data.db import get_connection
+from core.data.migrations.migrate_v16_precomputed_views import run_migration
+from core.data.repositories.data_version_repo import UserDataVersionRepository
+from core.data.repositories.decision_repo import DecisionRunRepository
+from core.data.repositories.precomputed_view_repo import PrecomputedViewRepository
+from core.services.user_batches import iter_user_batches
+
+
+# View name -> (loader, the recent_limit its page requests and the batch stores).
+VIEW_LOADERS: dict[str, tuple[Callable[..., dict[str, Any]], int]] = {
+    "action_center": (load_action_center_view, 28),
+    "insights": (load_insights_view, 42),
+}
+
+# Bump a view's version when its payload changes shape or content, so rows
+# stored by older code are rebuilt instead of served.
+VIEW_VERSIONS: dict[str, str] = {
+    "action_center": "action_center_v1",
+    "insights": "insights_v1",
+}
+
+
+@dataclass(slots=True)
+class ViewPrecomputeResult:
+    users_processed: int = 0
+    views_written: int = 0
+    views_fresh: int = 0
+
+
+def _current_versions(conn: sqlite3.Connection, user_ids: Sequence[int]) -> dict[int, tuple[int, int]]:
+    # The latest decision id names the run a view was built from; the data
+    # version also moves on log, goal and context writes, which change the
+    # RPE streak, weight trend and weekly session counts without a new run.
+    decision_ids = DecisionRunRepository(conn).latest_ids(user_ids)
+    data_versions = UserDataVersionRepository(conn).get_many(user_ids)
+    return {user_id: (decision_ids[user_id], data_versions[user_id]) for user_id in decision_ids}
+
+
+def load_view(
+    view_name: str,
+    *,
+    user_id: int,
+    db_path: str,
+    recent_limit: int | None = None,
+) -> dict[str, Any]:
+    """
+    The stored payload of `view_name` when it was built today by the current
+    view version from the user's latest decision run and data version,
+    otherwise the live view, stored for the next read. Limits other than the
+    page's are always computed live.
+    """
+
+    loader, page_limit = VIEW_LOADERS[view_name]
+    view_version = VIEW_VERSIONS[view_name]
+    limit = page_limit if recent_limit is None else recent_limit
+    if limit != page_limit:
+        return loader(user_id=user_id, db_path=db_path, recent_limit=limit)
+
+    as_of = date.today().isoformat()
+    with get_connection(db_path) as conn:
+        decision_id, data_version = _current_versions(conn, [user_id])[user_id]
+        stored = PrecomputedViewRepository(conn).get(user_id, view_name=view_name, recent_limit=limit)
+    if (
+        stored is not None
+        and stored["view_version"] == view_version
+        and int(stored["decision_id"]) == decision_id
+        and int(stored["data_version"]) == data_version
+        and stored["as_of"] == as_of
+    ):
+        return json.loads(stored["payload_json"])
+
+    # Versions are read before computing, so a write that lands meanwhile
+    # leaves the stored payload stale rather than mislabelled.
+    payload = loader(user_id=user_id, db_path=db_path, recent_limit=limit)
+    with get_connection(db_path) as conn:
+        PrecomputedViewRepository(conn).save_many(
+            [(user_id, view_name, limit, view_version, decision_id, data_version, as_of, payload)]
+        )
+    return payload
+
+
+def precompute_views(
+    *,
+    db_path: str = "aphde.db",
+    user_ids: Sequence[int] | None = None,
+    chunk_size: int = 200,
+    view_names: Sequence[str] = tuple(VIEW_LOADERS),
+) -> ViewPrecomputeResult:
+    """
+    Store the payload of each of `view_names` for `user_ids`, or every active
+    user read in chunks of `chunk_size`. Views already built today by the
+    current view version from the user's current versions are left as they are.
+    """
+
+    run_migration(db_path)
+    as_of = date.today().isoformat()
+    total = ViewPrecomputeResult()
+
+    for batch in iter_user_batches(db_path, user_ids=user_ids, chunk_size=chunk_size):
+        with get_connection(db_path) as conn:
+            versions = _current_versions(conn, batch)
+            repo = PrecomputedViewRepository(conn)
+            stored = {
+                name: repo.versions_for_users(batch, view_name=name, recent_limit=VIEW_LOADERS[name][1])
+                for name in view_names
+            }
+        views = []
+        for user_id in batch:
+            decision_id, data_version = versions[int(user_id)]
+            for name in view_names:
+                if stored[name].get(int(user_id)) == (VIEW_VERSIONS[name], decision_id, data_version, as_of):
+                    total.views_fresh += 1
+                    continue
+                loader, limit = VIEW_LOADERS[name]
+                payload = loader(user_id=user_id, db_path=db_path, recent_limit=limit)
+                views.append((user_id, name, limit, VIEW_VERSIONS[name], decision_id, data_version, as_of, payload))
+        if views:
+            with get_connection(db_path) as conn:
+                total.views_written += PrecomputedViewRepository(conn).save_many(views)
+        total.users_processed += len(batch)
+
+    return total
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from datetime import date
+from typing import Any
+
+import streamlit as st
+
+from aphde.app.services.ui_data_service import load_dashboard_view
+from aphde.app.services.view_precompute import load_view
+from aphde.app.utils import bootstrap_db
+from core.auth.throttle import LoginThrottle
+from core.auth.tokens import SessionTokenStore
+from core.data.db import ConnectionPool
+from core.data.repositories.data_version_repo import UserDataVersionRepository
+from core.data.repositories.goal_repo import GoalRepository
+
+# Payloads are keyed by the user's data version, which triggers bump on every
+# goal, log, context or decision write from any process, so the next rerun
+# recomputes and old entries age out of the LRU.
+VIEW_CACHE_MAX_ENTRIES = 256
+
+
+@dataclass(frozen=True, slots=True)
+class ViewKey:
+    user_id: int
+    data_version: int
+    as_of: str
+    generation: int
+
+
+class _Generations:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._values: dict[int, int] = {}
+
+    def get(self, user_id: int) -> int:
+        with self._lock:
+            return self._values.get(user_id, 0)
+
+    def bump(self, user_id: int) -> None:
+        with self._lock:
+            self._values[user_id] = self._values.get(user_id, 0) + 1
+
+
+@st.cache_resource(show_spinner=False)
+def get_connection_pool(db_path: str) -> ConnectionPool:
+    return ConnectionPool(db_path)
+
+
+@st.cache_resource(show_spinner=False)
+def get_session_store(db_path: str) -> SessionTokenStore:
+    return SessionTokenStore(db_path)
+
+
+@st.cache_resource(show_spinner=False)
+def get_login_throttle(db_path: str) -> LoginThrottle:
+    return LoginThrottle(db_path)
+
+
+@st.cache_resource(show_spinner=False)
+def _bootstrapped(db_path: str) -> bool:
+    bootstrap_db(db_path)
+    return True
+
+
+@st.cache_resource(show_spinner=False)
+def _generations() -> _Generations:
+    return _Generations()
+
+
+def ensure_database(db_path: str) -> None:
+    """Run schema bootstrap and migrations once per process instead of on every rerun."""
+
+    _bootstrapped(db_path)
+
+
+def current_view_key(*, user_id: int, db_path: str) -> ViewKey:
+    with get_connection_pool(db_path).connection() as conn:
+        data_version = UserDataVersionRepository(conn).get(user_id)
+    return ViewKey(
+        user_id=user_id,
+        data_version=data_version,
+        as_of=date.today().isoformat(),
+        generation=_generations().get(user_id),
+    )
+
+
+def invalidate_user_views(user_id: int) -> None:
+    """Force the next rerun for `user_id` to rebuild its views; other users keep their entries."""
+
+    _generations().bump(user_id)
+
+
+@st.cache_data(show_spinner=False, max_entries=VIEW_CACHE_MAX_ENTRIES)
+def _dashboard_view(key: ViewKey, db_path: str, recent_limit: int) -> dict[str, Any]:
+    return load_dashboard_view(user_id=key.user_id, db_path=db_path, recent_limit=recent_limit)
+
+
+@st.cache_data(show_spinner=False, max_entries=VIEW_CACHE_MAX_ENTRIES)
+def _action_center_view(key: ViewKey, db_path: str, recent_limit: int) -> dict[str, Any]:
+    # Served from the precompute batch while it matches the user's data.
+    return load_view("action_center", user_id=key.user_id, db_path=db_path, recent_limit=recent_limit)
+
+
+@st.cache_data(show_spinner=False, max_entries=VIEW_CACHE_MAX_ENTRIES)
+def _insights_view(key: ViewKey, db_path: str, recent_limit: int) -> dict[str, Any]:
+    return load_view("insights", user_id=key.user_id, db_path=db_path, recent_limit=recent_limit)
+
+
+@st.cache_data(show_spinner=False, max_entries=VIEW_CACHE_MAX_ENTRIES)
+def _active_goal_type(key: ViewKey, db_path: str) -> str:
+    with get_connection_pool(db_path).connection() as conn:
+        row = GoalRepository(conn).get_active_goal(key.user_id)
+    return "not_set" if row is None else str(row["goal_type"])
+
+
+def cached_dashboard_view(*, user_id: int, db_path: str, recent_limit: int = 25) -> dict[str, Any]:
+    return _dashboard_view(current_view_key(user_id=user_id, db_path=db_path), db_path, recent_limit)
+
+
+def cached_action_center_view(*, user_id: int, db_path: str, recent_limit: int = 28) -> dict[str, Any]:
+    return _action_center_view(current_view_key(user_id=user_id, db_path=db_path), db_path, recent_limit)
+
+
+def cached_insights_view(*, user_id: int, db_path: str, recent_limit: int = 42) -> dict[str, Any]:
+    return _insights_view(current_view_key(user_id=user_id, db_path=db_path), db_path, recent_limit)
+
+
+def cached_active_goal_type(*, user_id: int, db_path: str) -> str:
+    return _active_goal_type(current_view_key(user_id=user_id, db_path=db_path), db_path)
@@ -8,9 +8,9 @@ from core.auth.session import (
     clear_auth_session,
     get_authenticated_display_name,
     get_authenticated_email,
+    get_session_token,
 )
-from core.data.db import get_connection
-from core.data.repositories.goal_repo import GoalRepository
+from aphde.app.ui.data_cache import cached_active_goal_type, get_session_store
 
 
 def inject_global_styles() -> None:
@@ -138,11 +138,7 @@ def render_page_header(title: str, subtitle: str) -> None:
 
 def _load_active_goal(*, db_path: str, user_id: int) -> str:
     try:
-        with get_connection(db_path) as conn:
-            row = GoalRepository(conn).get_active_goal(user_id)
-            if row is None:
-                return "not_set"
-            return str(row["goal_type"])
+        return cached_active_goal_type(user_id=user_id, db_path=db_path)
     except Exception:  # noqa: BLE001
         return "unknown"
 
@@ -174,6 +170,7 @@ def render_sidebar_navigation(
         )
         st.caption(f"Signed in as {identity_line}")
         if st.button("Log Out", use_container_width=True, key=f"logout_btn_{current_page}"):
+            get_session_store(str(db_path)).revoke(get_session_token())
             clear_auth_session()
             try:
                 st.switch_page("main.py")
@@ -7,17 +7,31 @@ from core.data.migrations.migrate_v2_confidence import run_migration as run_v2_m
 from core.data.migrations.migrate_v3_context import run_migration as run_v3_migration
 from core.data.migrations.migrate_v5_governance import run_migration as run_v5_migration
 from core.data.migrations.migrate_v7_multi_user_auth import run_migration as run_v7_migration
+from core.data.migrations.migrate_v8_data_versions import run_migration as run_v8_migration
+from core.data.migrations.migrate_v11_auth_sessions import run_migration as run_v11_migration
+from core.data.migrations.migrate_v12_login_throttle import run_migration as run_v12_migration
+from core.data.migrations.migrate_v13_insight_alerts import run_migration as run_v13_migration
+from core.data.migrations.migrate_v14_weekly_aggregates import run_migration as run_v14_migration
+from core.data.migrations.migrate_v15_tomorrow_plans import run_migration as run_v15_migration
+from core.data.migrations.migrate_v16_precomputed_views import run_migration as run_v16_migration
 from core.data.repositories.user_repo import UserRepository
 
 DB_PATH = Path(__file__).resolve().parents[1] / "aphde.db"
 
 
-def bootstrap_db() -> None:
-    init_db(DB_PATH)
-    run_v2_migration(DB_PATH)
-    run_v3_migration(DB_PATH)
-    run_v5_migration(DB_PATH)
-    run_v7_migration(DB_PATH)
+def bootstrap_db(db_path: str | Path = DB_PATH) -> None:
+    init_db(db_path)
+    run_v2_migration(db_path)
+    run_v3_migration(db_path)
+    run_v5_migration(db_path)
+    run_v7_migration(db_path)
+    run_v8_migration(db_path)
+    run_v11_migration(db_path)
+    run_v12_migration(db_path)
+    run_v13_migration(db_path)
+    run_v14_migration(db_path)
+    run_v15_migration(db_path)
+    run_v16_migration(db_path)
 
 
 def bootstrap_db_and_user(default_user_id: int = 1) -> int:
@@ -1,24 +1,40 @@
-﻿from .service import AuthService, AuthError
+﻿from .hashing_pool import HashPoolBusyError, PasswordHasherPool, get_default_hasher_pool
+from .service import AuthBusyError, AuthService, AuthError, AuthThrottledError
 from .session import (
     AUTH_DISPLAY_NAME_KEY,
     AUTH_EMAIL_KEY,
     AUTH_IS_AUTHENTICATED_KEY,
+    AUTH_SESSION_TOKEN_KEY,
     AUTH_USER_ID_KEY,
     clear_auth_session,
     get_authenticated_user_id,
+    get_session_token,
     is_authenticated,
     set_authenticated_session,
 )
+from .throttle import LoginThrottle, ThrottleRule
+from .tokens import SessionIdentity, SessionTokenStore
 
 __all__ = [
     "AuthService",
     "AuthError",
+    "AuthBusyError",
+    "AuthThrottledError",
+    "LoginThrottle",
+    "ThrottleRule",
+    "HashPoolBusyError",
+    "PasswordHasherPool",
+    "get_default_hasher_pool",
+    "SessionIdentity",
+    "SessionTokenStore",
     "AUTH_DISPLAY_NAME_KEY",
     "AUTH_EMAIL_KEY",
     "AUTH_IS_AUTHENTICATED_KEY",
+    "AUTH_SESSION_TOKEN_KEY",
     "AUTH_USER_ID_KEY",
     "clear_auth_session",
     "get_authenticated_user_id",
+    "get_session_token",
     "is_authenticated",
     "set_authenticated_session",
 ]
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, TypeVar
+
+from .passwords import BCRYPT_ROUNDS, hash_password, needs_rehash, verify_password
+
+
+T = TypeVar("T")
+
+DEFAULT_HASH_WORKERS = max(1, min(4, (os.cpu_count() or 2) // 2))
+DEFAULT_HASH_QUEUE_SIZE = 16
+DEFAULT_ADMISSION_TIMEOUT_SECONDS = 2.0
+
+
+class HashPoolBusyError(RuntimeError):
+    """Raised when the hashing queue stays full for the whole admission timeout."""
+
+
+@dataclass(slots=True)
+class _Timing:
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def snapshot(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_seconds * 1000.0 / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_seconds * 1000.0, 3),
+        }
+
+
+class PasswordHasherPool:
+    """
+    Bounded worker pool for bcrypt work.
+
+    bcrypt releases the GIL while hashing, so `workers` threads use that many
+    cores while request threads only wait. At most `workers + queue_size` jobs
+    are admitted at once; further callers wait up to `admission_timeout` for a
+    slot and then get `HashPoolBusyError`, so a login burst is shed instead of
+    piling up. `metrics()` reports queue wait and hash time for sizing.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int = DEFAULT_HASH_WORKERS,
+        queue_size: int = DEFAULT_HASH_QUEUE_SIZE,
+        rounds: int = BCRYPT_ROUNDS,
+        admission_timeout: float = DEFAULT_ADMISSION_TIMEOUT_SECONDS,
+    ) -> None:
+        if workers <= 0 or queue_size < 0:
+            raise ValueError("workers must be positive and queue_size non-negative")
+        self.workers = workers
+        self.queue_size = queue_size
+        self.rounds = rounds
+        self.admission_timeout = admission_timeout
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="aphde-auth")
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self._lock = threading.Lock()
+        self._queue_wait = _Timing()
+        self._hash_time = _Timing()
+        self._in_flight = 0
+        self._rejected = 0
+
+    def _run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        if not self._slots.acquire(timeout=self.admission_timeout):
+            with self._lock:
+                self._rejected += 1
+            raise HashPoolBusyError("password hashing queue is full")
+        submitted = time.perf_counter()
+        with self._lock:
+            self._in_flight += 1
+
+        def _job() -> T:
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                finished = time.perf_counter()
+                with self._lock:
+                    self._queue_wait.add(started - submitted)
+                    self._hash_time.add(finished - started)
+
+        try:
+            return self._executor.submit(_job).result()
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+            self._slots.release()
+
+    def hash(self, plain_password: str) -> str:
+        return self._run(hash_password, plain_password, rounds=self.rounds)
+
+    def verify(self, plain_password: str, password_hash: str) -> bool:
+        return self._run(verify_password, plain_password, password_hash)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        return needs_rehash(password_hash, rounds=self.rounds)
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queue_size": self.queue_size,
+                "rounds": self.rounds,
+                "in_flight": self._in_flight,
+                "rejected": self._rejected,
+                "queue_wait": self._queue_wait.snapshot(),
+                "hash_time": self._hash_time.snapshot(),
+            }
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_default_pool: PasswordHasherPool | None = None
+_default_pool_lock = threading.Lock()
+
+
+def get_default_hasher_pool() -> PasswordHasherPool:
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = PasswordHasherPool()
+        return _default_pool
@@ -6,9 +6,9 @@ import bcrypt
 BCRYPT_ROUNDS = 12
 
 
-def hash_password(plain_password: str) -> str:
+def hash_password(plain_password: str, *, rounds: int = BCRYPT_ROUNDS) -> str:
     password = plain_password.encode("utf-8")
-    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    salt = bcrypt.gensalt(rounds=rounds)
     return bcrypt.hashpw(password, salt).decode("utf-8")
 
 
@@ -17,3 +17,16 @@ def verify_password(plain_password: str, password_hash: str) -> bool:
         return bcrypt.checkpw(plain_password.encode("utf-8"), password_hash.encode("utf-8"))
     except ValueError:
         return False
+
+
+def password_hash_rounds(password_hash: str) -> int | None:
+    """Cost factor of a `$2<x>$<cost>$...` bcrypt hash, or None if it is not one."""
+
+    parts = password_hash.split("$")
+    if len(parts) < 4 or not parts[1].startswith("2") or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+def needs_rehash(password_hash: str, *, rounds: int = BCRYPT_ROUNDS) -> bool:
+    return password_hash_rounds(password_hash) != rounds
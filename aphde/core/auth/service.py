@@ -1,17 +1,32 @@
 ﻿from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from typing import Any
 
 from core.data.repositories.user_repo import UserRepository
 
-from .passwords import hash_password, verify_password
+from .hashing_pool import HashPoolBusyError, PasswordHasherPool, get_default_hasher_pool
+from .throttle import LoginThrottle
+from .tokens import SessionTokenStore
 
 
 class AuthError(ValueError):
     pass
 
 
+class AuthBusyError(AuthError):
+    """Password hashing is saturated; the caller should retry shortly."""
+
+
+class AuthThrottledError(AuthError):
+    """Too many failed attempts for this email or client; no password check was made."""
+
+    def __init__(self, message: str, *, retry_after: float) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 @dataclass(frozen=True)
 class AuthIdentity:
     id: int
@@ -27,8 +42,15 @@ class AuthIdentity:
 
 
 class AuthService:
-    def __init__(self, user_repo: UserRepository) -> None:
+    def __init__(
+        self,
+        user_repo: UserRepository,
+        hasher: PasswordHasherPool | None = None,
+        throttle: LoginThrottle | None = None,
+    ) -> None:
         self.user_repo = user_repo
+        self.hasher = hasher or get_default_hasher_pool()
+        self.throttle = throttle
 
     def signup(self, *, email: str, password: str, display_name: str | None = None) -> AuthIdentity:
         normalized_email = _normalize_email(email)
@@ -37,7 +59,10 @@ class AuthService:
         if self.user_repo.email_exists(normalized_email):
             raise AuthError("Email already registered.")
 
-        hashed = hash_password(password)
+        try:
+            hashed = self.hasher.hash(password)
+        except HashPoolBusyError as exc:
+            raise AuthBusyError(_BUSY_MESSAGE) from exc
         user_id = self.user_repo.create(
             email=normalized_email,
             password_hash=hashed,
@@ -50,8 +75,38 @@ class AuthService:
             raise AuthError("Failed to create account.")
         return _row_to_identity(row)
 
-    def login(self, *, email: str, password: str) -> AuthIdentity:
+    def login(self, *, email: str, password: str, client_id: str | None = None) -> AuthIdentity:
         normalized_email = _normalize_email(email)
+        if self.throttle is None:
+            return self._login(normalized_email, password)
+
+        retry_after = self.throttle.reserve(email=normalized_email, client_id=client_id)
+        if retry_after is not None:
+            minutes = max(1, math.ceil(retry_after / 60.0))
+            raise AuthThrottledError(
+                f"Too many failed sign-in attempts. Try again in {minutes} minute{'s' if minutes != 1 else ''}.",
+                retry_after=retry_after,
+            )
+        try:
+            identity = self._login(normalized_email, password)
+        except AuthBusyError:
+            raise
+        except AuthError:
+            self.throttle.record_failure(email=normalized_email, client_id=client_id)
+            raise
+        finally:
+            # Released after the failure is recorded, so the attempt is never uncounted.
+            self.throttle.release(email=normalized_email, client_id=client_id)
+        self.throttle.record_success(email=normalized_email)
+        return identity
+
+    def deactivate_user(self, user_id: int, *, sessions: SessionTokenStore) -> None:
+        """Block sign-in for `user_id` and revoke every session it holds."""
+
+        self.user_repo.set_active(user_id, False)
+        sessions.revoke_user(user_id)
+
+    def _login(self, normalized_email: str, password: str) -> AuthIdentity:
         row = self.user_repo.get_by_email(normalized_email)
 
         if row is None:
@@ -60,16 +115,36 @@ class AuthService:
             raise AuthError("Account is inactive.")
 
         password_hash = row["password_hash"]
-        if not isinstance(password_hash, str) or not verify_password(password, password_hash):
+        if not isinstance(password_hash, str):
+            raise AuthError("Invalid email or password.")
+        try:
+            verified = self.hasher.verify(password, password_hash)
+        except HashPoolBusyError as exc:
+            raise AuthBusyError(_BUSY_MESSAGE) from exc
+        if not verified:
             raise AuthError("Invalid email or password.")
 
         user_id = int(row["id"])
+        if self.hasher.needs_rehash(password_hash):
+            self._rehash(user_id, password)
         self.user_repo.touch_last_login(user_id)
         refreshed = self.user_repo.get_by_id(user_id)
         if refreshed is None:
             raise AuthError("Account lookup failed.")
         return _row_to_identity(refreshed)
 
+    def _rehash(self, user_id: int, password: str) -> None:
+        # The plain password is only available at login, so hashes move to the
+        # configured cost here. A saturated pool just defers it to a later login.
+        try:
+            upgraded = self.hasher.hash(password)
+        except HashPoolBusyError:
+            return
+        self.user_repo.set_password_hash(user_id, upgraded)
+
+
+_BUSY_MESSAGE = "Too many sign-in requests right now. Please try again in a moment."
+
 
 def _normalize_email(email: str) -> str:
     normalized = email.strip().lower()
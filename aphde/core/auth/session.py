@@ -9,13 +9,21 @@ AUTH_USER_ID_KEY = "auth_user_id"
 AUTH_EMAIL_KEY = "auth_email"
 AUTH_DISPLAY_NAME_KEY = "auth_display_name"
 AUTH_IS_AUTHENTICATED_KEY = "is_authenticated"
+AUTH_SESSION_TOKEN_KEY = "auth_session_token"
 
 
-def set_authenticated_session(*, user_id: int, email: str, display_name: str | None) -> None:
+def set_authenticated_session(
+    *,
+    user_id: int,
+    email: str,
+    display_name: str | None,
+    session_token: str | None = None,
+) -> None:
     st.session_state[AUTH_USER_ID_KEY] = int(user_id)
     st.session_state[AUTH_EMAIL_KEY] = email
     st.session_state[AUTH_DISPLAY_NAME_KEY] = display_name
     st.session_state[AUTH_IS_AUTHENTICATED_KEY] = True
+    st.session_state[AUTH_SESSION_TOKEN_KEY] = session_token
 
 
 def clear_auth_session() -> None:
@@ -24,6 +32,7 @@ def clear_auth_session() -> None:
         AUTH_EMAIL_KEY,
         AUTH_DISPLAY_NAME_KEY,
         AUTH_IS_AUTHENTICATED_KEY,
+        AUTH_SESSION_TOKEN_KEY,
     ):
         if key in st.session_state:
             del st.session_state[key]
@@ -43,6 +52,11 @@ def get_authenticated_user_id() -> int | None:
         return None
 
 
+def get_session_token() -> str | None:
+    value: Any = st.session_state.get(AUTH_SESSION_TOKEN_KEY)
+    return str(value) if value else None
+
+
 def get_authenticated_email() -> str | None:
     value: Any = st.session_state.get(AUTH_EMAIL_KEY)
     if value is None:
@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+from core.data.db import get_connection
+from core.data.repositories.login_throttle_repo import LoginThrottleRepository
+
+
+EMAIL_SCOPE = "email"
+CLIENT_SCOPE = "client"
+DEFAULT_THROTTLE_CACHE_SIZE = 10_000
+
+
+@dataclass(frozen=True, slots=True)
+class ThrottleRule:
+    """At most `limit` failures per sliding `window_seconds`; `lockout_seconds` extends a block once reached."""
+
+    limit: int
+    window_seconds: float
+    lockout_seconds: float = 0.0
+
+
+DEFAULT_EMAIL_RULE = ThrottleRule(limit=5, window_seconds=900.0, lockout_seconds=900.0)
+DEFAULT_CLIENT_RULE = ThrottleRule(limit=30, window_seconds=60.0)
+
+
+@dataclass(slots=True)
+class _Counter:
+    # Sliding-window counter: the previous fixed window is weighted by how much
+    # of it still overlaps the sliding window, so each key needs two integers.
+    window_index: int
+    current: int = 0
+    previous: int = 0
+    locked_until: float = 0.0
+    # Attempts reserved and still being verified; they count toward the limit.
+    pending: int = 0
+
+    def is_clean(self) -> bool:
+        return not (self.current or self.previous or self.locked_until)
+
+    def roll(self, now: float, window_seconds: float) -> None:
+        index = int(now // window_seconds)
+        if index == self.window_index:
+            return
+        self.previous = self.current if index == self.window_index + 1 else 0
+        self.current = 0
+        self.window_index = index
+
+    def estimate(self, now: float, window_seconds: float) -> float:
+        self.roll(now, window_seconds)
+        elapsed = now / window_seconds - self.window_index
+        return self.previous * (1.0 - elapsed) + self.current
+
+    def retry_after(self, now: float, rule: ThrottleRule) -> float | None:
+        if self.locked_until > now:
+            return self.locked_until - now
+        if self.estimate(now, rule.window_seconds) + self.pending < rule.limit:
+            return None
+        window = rule.window_seconds
+        window_end = (self.window_index + 1) * window
+        current = self.current + self.pending
+        if current >= rule.limit:
+            # Wait for the next window and for this one's weight to decay enough.
+            return window_end - now + window * (1.0 - rule.limit / current)
+        unblocked_at = window_end - window * (rule.limit - current) / self.previous
+        return max(0.0, unblocked_at - now)
+
+
+def _key_hash(key: str) -> str:
+    # Emails and client addresses are only needed as counter keys, so the
+    # table stores digests instead.
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+
+
+class LoginThrottle:
+    """
+    Failed-login limits per email and per client identifier.
+
+    Counters live in an in-process LRU and are written through to
+    `login_throttle` on every recorded failure, so limits survive restarts
+    and eviction. `reserve` is checked before any password verification and
+    counts the attempt as pending until `release`, so concurrent attempts
+    cannot all pass the check before the first failure is recorded. Rejected
+    attempts are not counted, so a blocked attacker costs neither bcrypt time
+    nor writes. SQLite is only touched outside the counter lock. Counters are
+    per process: another process sees this one's failures only after loading
+    the key from SQLite.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path | None = None,
+        *,
+        email_rule: ThrottleRule = DEFAULT_EMAIL_RULE,
+        client_rule: ThrottleRule = DEFAULT_CLIENT_RULE,
+        cache_size: int = DEFAULT_THROTTLE_CACHE_SIZE,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if email_rule.limit <= 0 or client_rule.limit <= 0:
+            raise ValueError("throttle limits must be positive")
+        if email_rule.window_seconds <= 0 or client_rule.window_seconds <= 0:
+            raise ValueError("throttle windows must be positive")
+        self.db_path = db_path
+        self.rules = {EMAIL_SCOPE: email_rule, CLIENT_SCOPE: client_rule}
+        self.cache_size = max(1, cache_size)
+        self._clock = clock
+        self._counters: OrderedDict[tuple[str, str], _Counter] = OrderedDict()
+        self._lock = threading.Lock()
+        # Serializes write-through so the last write carries the latest counts.
+        self._write_lock = threading.Lock()
+
+    def _keys(self, email: str, client_id: str | None) -> list[tuple[str, str]]:
+        keys = [(EMAIL_SCOPE, _key_hash(email))]
+        if client_id:
+            keys.append((CLIENT_SCOPE, _key_hash(client_id)))
+        return keys
+
+    def _load(self, keys: list[tuple[str, str]], now: float) -> None:
+        """Bring counters missing from the LRU in from SQLite, reading without the lock."""
+
+        with self._lock:
+            missing = [key for key in keys if key not in self._counters]
+        if not missing:
+            return
+        rows = {}
+        if self.db_path is not None:
+            with get_connection(self.db_path) as conn:
+                repo = LoginThrottleRepository(conn)
+                rows = {key: repo.get(scope=key[0], key_hash=key[1]) for key in missing}
+        with self._lock:
+            for scope, key_hash in missing:
+                if (scope, key_hash) in self._counters:
+                    continue
+                row = rows.get((scope, key_hash))
+                if row is None:
+                    counter = _Counter(window_index=int(now // self.rules[scope].window_seconds))
+                else:
+                    counter = _Counter(
+                        window_index=int(row["window_index"]),
+                        current=int(row["current_count"]),
+                        previous=int(row["previous_count"]),
+                        locked_until=float(row["locked_until"]),
+                    )
+                self._counters[(scope, key_hash)] = counter
+            while len(self._counters) > self.cache_size:
+                self._counters.popitem(last=False)
+
+    def _counter(self, scope: str, key_hash: str, now: float) -> _Counter:
+        # Caller holds the lock and has run _load for this key.
+        counter = self._counters.get((scope, key_hash))
+        if counter is None:
+            # Evicted since _load; only possible with a tiny cache.
+            counter = self._counters[(scope, key_hash)] = _Counter(
+                window_index=int(now // self.rules[scope].window_seconds)
+            )
+        self._counters.move_to_end((scope, key_hash))
+        return counter
+
+    def _write_through(self, keys: list[tuple[str, str]], now: float) -> None:
+        if self.db_path is None:
+            return
+        with self._write_lock:
+            snapshots = []
+            with self._lock:
+                for scope, key_hash in keys:
+                    counter = self._counters.get((scope, key_hash))
+                    if counter is None:
+                        continue
+                    values = (counter.window_index, counter.current, counter.previous, counter.locked_until)
+                    snapshots.append((scope, key_hash, None if counter.is_clean() else values))
+            with get_connection(self.db_path) as conn:
+                repo = LoginThrottleRepository(conn)
+                for scope, key_hash, values in snapshots:
+                    if values is None:
+                        repo.delete(scope=scope, key_hash=key_hash)
+                        continue
+                    window_index, current, previous, locked_until = values
+                    repo.upsert(
+                        scope=scope,
+                        key_hash=key_hash,
+                        window_index=window_index,
+                        current_count=current,
+                        previous_count=previous,
+                        locked_until=locked_until,
+                        updated_at=now,
+                    )
+
+    def _wait(self, keys: list[tuple[str, str]], now: float) -> float | None:
+        waits = []
+        for scope, key_hash in keys:
+            wait = self._counter(scope, key_hash, now).retry_after(now, self.rules[scope])
+            if wait is not None:
+                waits.append(wait)
+        return max(waits) if waits else None
+
+    def retry_after(self, *, email: str, client_id: str | None = None) -> float | None:
+        """Seconds until another attempt is allowed, or None if it is allowed now."""
+
+        now = self._clock()
+        keys = self._keys(email, client_id)
+        self._load(keys, now)
+        with self._lock:
+            return self._wait(keys, now)
+
+    def reserve(self, *, email: str, client_id: str | None = None) -> float | None:
+        """
+        Like `retry_after`, but an allowed attempt is counted as pending until
+        `release`; call it once the attempt has been recorded or abandoned.
+        """
+
+        now = self._clock()
+        keys = self._keys(email, client_id)
+        self._load(keys, now)
+        with self._lock:
+            wait = self._wait(keys, now)
+            if wait is None:
+                for scope, key_hash in keys:
+                    self._counter(scope, key_hash, now).pending += 1
+            return wait
+
+    def release(self, *, email: str, client_id: str | None = None) -> None:
+        with self._lock:
+            for key in self._keys(email, client_id):
+                counter = self._counters.get(key)
+                if counter is not None and counter.pending > 0:
+                    counter.pending -= 1
+
+    def record_failure(self, *, email: str, client_id: str | None = None) -> None:
+        now = self._clock()
+        keys = self._keys(email, client_id)
+        self._load(keys, now)
+        with self._lock:
+            for scope, key_hash in keys:
+                rule = self.rules[scope]
+                counter = self._counter(scope, key_hash, now)
+                counter.roll(now, rule.window_seconds)
+                counter.current += 1
+                if rule.lockout_seconds > 0 and counter.estimate(now, rule.window_seconds) >= rule.limit:
+                    counter.locked_until = max(counter.locked_until, now + rule.lockout_seconds)
+        self._write_through(keys, now)
+
+    def record_success(self, *, email: str) -> None:
+        """Clear the email counter; client counters keep limiting sprays across accounts."""
+
+        now = self._clock()
+        keys = [(EMAIL_SCOPE, _key_hash(email))]
+        # retry_after/reserve have already loaded the counter, so a clean account costs no write.
+        self._load(keys, now)
+        with self._lock:
+            counter = self._counter(EMAIL_SCOPE, keys[0][1], now)
+            if counter.is_clean():
+                return
+            # Reset in place so other attempts' reservations survive.
+            counter.current = counter.previous = 0
+            counter.locked_until = 0.0
+        self._write_through(keys, now)
+
+    def purge_stale(self, *, max_age_seconds: float = 86_400.0) -> int:
+        if self.db_path is None:
+            return 0
+        now = self._clock()
+        with get_connection(self.db_path) as conn:
+            return LoginThrottleRepository(conn).delete_stale(updated_before=now - max_age_seconds, now=now)
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import os
+import secrets
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Callable
+
+from core.data.db import get_connection
+from core.data.repositories.auth_session_repo import AuthSessionRepository
+
+
+SESSION_SECRET_ENV = "APHDE_SESSION_SECRET"
+DEFAULT_SESSION_TTL = timedelta(days=7)
+DEFAULT_SESSION_CACHE_SIZE = 1024
+# How long a cached session is trusted before `auth_sessions`/`users` are re-read.
+DEFAULT_SESSION_RECHECK = timedelta(seconds=60)
+
+
+def _utc_now() -> datetime:
+    return datetime.now(UTC)
+
+
+def _default_secret() -> bytes:
+    # Without a configured secret, tokens are only valid for this process.
+    configured = os.environ.get(SESSION_SECRET_ENV)
+    return configured.encode("utf-8") if configured else secrets.token_bytes(32)
+
+
+@dataclass(frozen=True, slots=True)
+class SessionIdentity:
+    user_id: int
+    email: str | None
+    display_name: str | None
+    expires_at: datetime
+
+
+class SessionTokenStore:
+    """
+    Signed session tokens backed by `auth_sessions` with an in-process LRU.
+
+    A token is `<token_id>.<hmac>`; forged or malformed tokens are rejected
+    before any lookup. `resolve` answers from the LRU for up to `recheck`
+    after the last read and then re-reads SQLite, so most authenticated reruns
+    do not query `users`. `revoke`/`revoke_user` update the table and evict
+    locally; other processes, and users deactivated since, stop resolving
+    within `recheck`.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path = "aphde.db",
+        *,
+        secret: bytes | None = None,
+        ttl: timedelta = DEFAULT_SESSION_TTL,
+        cache_size: int = DEFAULT_SESSION_CACHE_SIZE,
+        recheck: timedelta = DEFAULT_SESSION_RECHECK,
+        now: Callable[[], datetime] = _utc_now,
+    ) -> None:
+        if ttl <= timedelta(0):
+            raise ValueError("ttl must be positive")
+        self.db_path = db_path
+        self.ttl = ttl
+        self.cache_size = cache_size
+        self.recheck = recheck
+        self._secret = secret or _default_secret()
+        self._now = now
+        # token_id -> (identity, time after which the row is read again)
+        self._cache: OrderedDict[str, tuple[SessionIdentity, datetime]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _sign(self, token_id: str) -> str:
+        digest = hmac.new(self._secret, token_id.encode("ascii"), hashlib.sha256).digest()
+        return base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
+
+    def _token_id(self, token: str) -> str | None:
+        token_id, _, signature = token.partition(".")
+        if not token_id or not signature:
+            return None
+        try:
+            expected = self._sign(token_id)
+        except UnicodeEncodeError:
+            return None
+        return token_id if hmac.compare_digest(expected, signature) else None
+
+    def _remember(self, token_id: str, identity: SessionIdentity) -> None:
+        if self.cache_size <= 0:
+            return
+        recheck_at = min(identity.expires_at, self._now() + self.recheck)
+        with self._lock:
+            self._cache[token_id] = (identity, recheck_at)
+            self._cache.move_to_end(token_id)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _forget(self, token_id: str) -> None:
+        with self._lock:
+            self._cache.pop(token_id, None)
+
+    def issue(self, *, user_id: int, email: str | None, display_name: str | None) -> str:
+        token_id = secrets.token_urlsafe(24)
+        expires_at = self._now() + self.ttl
+        with get_connection(self.db_path) as conn:
+            AuthSessionRepository(conn).create(token_id=token_id, user_id=user_id, expires_at=expires_at)
+        self._remember(
+            token_id,
+            SessionIdentity(user_id=int(user_id), email=email, display_name=display_name, expires_at=expires_at),
+        )
+        return f"{token_id}.{self._sign(token_id)}"
+
+    def resolve(self, token: str | None) -> SessionIdentity | None:
+        if not token:
+            return None
+        token_id = self._token_id(token)
+        if token_id is None:
+            return None
+
+        now = self._now()
+        with self._lock:
+            cached = self._cache.get(token_id)
+            if cached is not None:
+                identity, recheck_at = cached
+                if recheck_at > now:
+                    self._cache.move_to_end(token_id)
+                    return identity
+                del self._cache[token_id]
+
+        with get_connection(self.db_path) as conn:
+            row = AuthSessionRepository(conn).get_active(token_id, now=now)
+        if row is None:
+            return None
+        identity = SessionIdentity(
+            user_id=int(row["user_id"]),
+            email=str(row["email"]) if row["email"] is not None else None,
+            display_name=str(row["display_name"]) if row["display_name"] is not None else None,
+            expires_at=datetime.fromisoformat(str(row["expires_at"])),
+        )
+        self._remember(token_id, identity)
+        return identity
+
+    def revoke(self, token: str | None) -> None:
+        token_id = self._token_id(token) if token else None
+        if token_id is None:
+            return
+        self._forget(token_id)
+        with get_connection(self.db_path) as conn:
+            AuthSessionRepository(conn).revoke(token_id)
+
+    def revoke_user(self, user_id: int) -> None:
+        with get_connection(self.db_path) as conn:
+            token_ids = AuthSessionRepository(conn).revoke_user(user_id)
+        with self._lock:
+            for token_id in token_ids:
+                self._cache.pop(token_id, None)
+
+    def purge_expired(self) -> int:
+        with get_connection(self.db_path) as conn:
+            return AuthSessionRepository(conn).delete_expired(now=self._now())
@@ -30,3 +30,94 @@ class BaseContext(ABC):
         context_input: dict[str, Any],
     ) -> ContextResult:
         raise NotImplementedError
+
+
+@dataclass(frozen=True, slots=True)
+class ThresholdShift:
+    """`threshold -> clamp(threshold * scale + offset, low, high)` when the threshold is present."""
+
+    threshold: str
+    scale: float = 1.0
+    offset: float = 0.0
+    low: float = float("-inf")
+    high: float = float("inf")
+    note: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class PhaseModulation:
+    shifts: tuple[ThresholdShift, ...] = ()
+    scalars: tuple[tuple[str, float], ...] = ()
+
+
+class PhaseTableContext(BaseContext):
+    """
+    Context whose effect depends only on a phase label.
+
+    Subclasses declare `phase_table` (phase -> `PhaseModulation`); `apply` is
+    a dict lookup plus at most one clamp per declared shift, with no
+    per-phase branching. Instances hold no per-call state and are shared by
+    the context registry.
+    """
+
+    phase_key: str = "phase"
+    phase_table: dict[str, PhaseModulation] = {}
+    default_scalars: tuple[tuple[str, float], ...] = ()
+    _phase_scalars: dict[str, dict[str, float]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Scalars are resolved once per phase so apply only copies them.
+        cls._phase_scalars = {
+            phase: {**dict(cls.default_scalars), **dict(modulation.scalars)}
+            for phase, modulation in cls.phase_table.items()
+        }
+
+    def phase_of(self, context_input: dict[str, Any]) -> str | None:
+        phase = str(context_input.get(self.phase_key, "")).strip().lower()
+        return phase if phase in self.phase_table else None
+
+    def apply(
+        self,
+        *,
+        goal_type: str,
+        base_thresholds: dict[str, float],
+        score_inputs: dict[str, float],
+        context_input: dict[str, Any],
+    ) -> ContextResult:
+        phase = self.phase_of(context_input)
+        if phase is None:
+            return ContextResult(
+                modulated_thresholds=dict(base_thresholds),
+                context_applied=False,
+                context_version=self.context_version,
+                context_metadata={"context_type": self.context_name, "phase": None},
+            )
+
+        modulated = dict(base_thresholds)
+        adjustments: dict[str, float] = {}
+        notes: list[str] = []
+        for shift in self.phase_table[phase].shifts:
+            prev = modulated.get(shift.threshold)
+            if prev is None:
+                continue
+            value = max(shift.low, min(shift.high, prev * shift.scale + shift.offset))
+            modulated[shift.threshold] = value
+            adjustments[f"{shift.threshold}_delta"] = round(value - prev, 4)
+            if shift.note:
+                notes.append(shift.note)
+
+        return ContextResult(
+            modulated_thresholds=modulated,
+            penalty_scalars=dict(self._phase_scalars[phase]),
+            tolerance_adjustments=adjustments,
+            context_applied=True,
+            context_notes=notes or [f"{self.context_name.capitalize()} context applied for phase: {phase}."],
+            context_version=self.context_version,
+            context_metadata={
+                "context_type": self.context_name,
+                "phase": phase,
+                "goal_type": goal_type,
+                "score_inputs": score_inputs,
+            },
+        )
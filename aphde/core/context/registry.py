@@ -2,10 +2,136 @@ from __future__ import annotations
 
 from typing import Any
 
-from core.context.base import ContextResult
+from core.context.base import BaseContext, ContextResult
 from core.context.cycle_context import CycleContext
 
 
+DEFAULT_CONTEXT_VERSION = "ctx_v1"
+
+
+def _passthrough(
+    base_thresholds: dict[str, float],
+    *,
+    context_type: str | None,
+    notes: list[str] | None = None,
+) -> ContextResult:
+    return ContextResult(
+        modulated_thresholds=dict(base_thresholds),
+        context_applied=False,
+        context_notes=notes or [],
+        context_version=DEFAULT_CONTEXT_VERSION,
+        context_metadata={"context_type": context_type},
+    )
+
+
+class ContextRegistry:
+    """
+    Context type -> shared context instance.
+
+    Contexts are stateless, so each type is instantiated once at registration.
+    `apply` accepts either one context payload or `{"contexts": [...]}` and
+    folds all of them in one pass: thresholds flow from one context into the
+    next, scalars multiply, adjustments add and notes concatenate.
+    """
+
+    def __init__(self, contexts: list[type[BaseContext]] | None = None) -> None:
+        self._contexts: dict[str, BaseContext] = {}
+        for context_cls in contexts or []:
+            self.register(context_cls)
+
+    def register(self, context_cls: type[BaseContext]) -> None:
+        self._contexts[context_cls.context_name] = context_cls()
+
+    def get(self, context_type: str) -> BaseContext | None:
+        return self._contexts.get(context_type)
+
+    def _resolve(self, context_input: dict[str, Any]) -> tuple[str, BaseContext | None]:
+        context_type = str(context_input.get("context_type", "cycle")).lower()
+        context = self._contexts.get(context_type)
+        if context is None and context_input.get("phase"):
+            # Legacy payloads carry a phase without a context_type.
+            context = self._contexts.get("cycle")
+        return context_type, context
+
+    def apply(
+        self,
+        *,
+        goal_type: str,
+        base_thresholds: dict[str, float],
+        score_inputs: dict[str, float],
+        context_input: dict[str, Any] | None,
+    ) -> ContextResult:
+        if not context_input:
+            return _passthrough(base_thresholds, context_type=None)
+
+        payloads = context_input.get("contexts")
+        if not isinstance(payloads, list):
+            context_type, context = self._resolve(context_input)
+            if context is None:
+                return _passthrough(
+                    base_thresholds,
+                    context_type=context_type,
+                    notes=[f"Unsupported context_type '{context_type}' ignored."],
+                )
+            return context.apply(
+                goal_type=goal_type,
+                base_thresholds=base_thresholds,
+                score_inputs=score_inputs,
+                context_input=context_input,
+            )
+
+        thresholds = dict(base_thresholds)
+        scalars: dict[str, float] = {}
+        adjustments: dict[str, float] = {}
+        notes: list[str] = []
+        versions: list[str] = []
+        applied: list[dict[str, Any]] = []
+        for payload in payloads:
+            context_type, context = self._resolve(payload) if isinstance(payload, dict) else ("unknown", None)
+            if context is None:
+                notes.append(f"Unsupported context_type '{context_type}' ignored.")
+                continue
+            result = context.apply(
+                goal_type=goal_type,
+                base_thresholds=thresholds,
+                score_inputs=score_inputs,
+                context_input=payload,
+            )
+            if not result.context_applied:
+                continue
+            thresholds = result.modulated_thresholds
+            for key, value in result.penalty_scalars.items():
+                scalars[key] = scalars.get(key, 1.0) * value
+            for key, value in result.tolerance_adjustments.items():
+                adjustments[key] = round(adjustments.get(key, 0.0) + value, 4)
+            notes.extend(result.context_notes)
+            if result.context_version not in versions:
+                versions.append(result.context_version)
+            applied.append(result.context_metadata)
+
+        if not applied:
+            return _passthrough(base_thresholds, context_type=None, notes=notes)
+        metadata: dict[str, Any] = {
+            "context_type": "+".join(str(item["context_type"]) for item in applied),
+            "phase": next((item["phase"] for item in applied if item.get("phase")), None),
+            "goal_type": goal_type,
+            "score_inputs": score_inputs,
+            "contexts": applied,
+        }
+        return ContextResult(
+            modulated_thresholds=thresholds,
+            penalty_scalars=scalars,
+            tolerance_adjustments=adjustments,
+            context_applied=True,
+            context_notes=notes,
+            context_version="+".join(versions),
+            context_metadata=metadata,
+        )
+
+
+CONTEXT_REGISTRY = ContextRegistry([CycleContext])
+
+
 def apply_context(
     *,
     goal_type: str,
@@ -13,27 +139,9 @@ def apply_context(
     score_inputs: dict[str, float],
     context_input: dict[str, Any] | None,
 ) -> ContextResult:
-    if not context_input:
-        return ContextResult(
-            modulated_thresholds=dict(base_thresholds),
-            context_applied=False,
-            context_version="ctx_v1",
-            context_metadata={"context_type": None},
-        )
-
-    context_type = str(context_input.get("context_type", "cycle")).lower()
-    if context_type == "cycle" or context_input.get("phase"):
-        return CycleContext().apply(
-            goal_type=goal_type,
-            base_thresholds=base_thresholds,
-            score_inputs=score_inputs,
-            context_input=context_input,
-        )
-
-    return ContextResult(
-        modulated_thresholds=dict(base_thresholds),
-        context_applied=False,
-        context_notes=[f"Unsupported context_type '{context_type}' ignored."],
-        context_version="ctx_v1",
-        context_metadata={"context_type": context_type},
+    return CONTEXT_REGISTRY.apply(
+        goal_type=goal_type,
+        base_thresholds=base_thresholds,
+        score_inputs=score_inputs,
+        context_input=context_input,
     )
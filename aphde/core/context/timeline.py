@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+from bisect import bisect_right
+from collections.abc import Iterable, Mapping, Sequence
+from datetime import date
+from typing import Any
+
+
+def _parse_payload(raw: Any) -> dict[str, Any] | None:
+    try:
+        payload = json.loads(raw)
+    except (TypeError, json.JSONDecodeError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+class ContextTimeline:
+    """
+    Context in effect on each date, per (user, context type).
+
+    A `context_inputs` row applies from its `log_date` until the next row of
+    the same type (the highest id wins within a day), so each track is a step
+    function stored as sorted start dates; `at` is one bisect. Payloads are
+    parsed once when the timeline is built and shared between lookups, so
+    callers must not mutate them.
+    """
+
+    def __init__(self) -> None:
+        self._tracks: dict[tuple[int, str], tuple[list[str], list[dict[str, Any] | None]]] = {}
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping[str, Any]]) -> ContextTimeline:
+        """Build from `context_inputs` rows for any number of users, in any order."""
+
+        timeline = cls()
+        ordered = sorted(
+            rows,
+            key=lambda row: (int(row["user_id"]), str(row["context_type"]), str(row["log_date"]), int(row["id"])),
+        )
+        for row in ordered:
+            key = (int(row["user_id"]), str(row["context_type"]))
+            starts, payloads = timeline._tracks.setdefault(key, ([], []))
+            log_date = str(row["log_date"])
+            payload = _parse_payload(row["context_payload_json"])
+            if starts and starts[-1] == log_date:
+                payloads[-1] = payload
+            else:
+                starts.append(log_date)
+                payloads.append(payload)
+        return timeline
+
+    def at(self, user_id: int, day: date, context_type: str = "cycle") -> dict[str, Any] | None:
+        track = self._tracks.get((user_id, context_type))
+        if track is None:
+            return None
+        starts, payloads = track
+        index = bisect_right(starts, day.isoformat())
+        return payloads[index - 1] if index else None
+
+    def payload_at(
+        self,
+        user_id: int,
+        day: date,
+        context_types: Sequence[str] = ("cycle",),
+    ) -> dict[str, Any] | None:
+        """
+        Context input for the decision engine on `day`: the single active
+        payload, or a `{"contexts": [...]}` composite when several types apply.
+        """
+
+        active = [
+            (context_type, payload)
+            for context_type in context_types
+            if (payload := self.at(user_id, day, context_type)) is not None
+        ]
+        if not active:
+            return None
+        if len(active) == 1:
+            return active[0][1]
+        return {"contexts": [{"context_type": context_type, **payload} for context_type, payload in active]}
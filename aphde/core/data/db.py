@@ -1,5 +1,9 @@
-﻿from pathlib import Path
+﻿from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+import queue
 import sqlite3
+import threading
 
 
 def get_connection(db_path: str | Path = "aphde.db") -> sqlite3.Connection:
@@ -8,6 +12,66 @@ def get_connection(db_path: str | Path = "aphde.db") -> sqlite3.Connection:
     return conn
 
 
+class ConnectionPool:
+    """
+    Bounded set of reusable SQLite connections for long-lived processes.
+
+    Connections are opened lazily with `check_same_thread=False` and handed to
+    one borrower at a time, so reruns on different threads reuse them instead
+    of reconnecting. `connection()` commits on success and rolls back on error,
+    matching `with get_connection(...) as conn` call sites.
+    """
+
+    def __init__(self, db_path: str | Path, *, max_size: int = 4) -> None:
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        self.db_path = str(db_path)
+        self.max_size = max_size
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        if self._closed:
+            raise RuntimeError("connection pool is closed")
+        self._slots.acquire()
+        try:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._open()
+            try:
+                with conn:
+                    yield conn
+            except BaseException:
+                conn.close()
+                raise
+            # A connection returned after close() is closed, not pooled again.
+            with self._lock:
+                if self._closed:
+                    conn.close()
+                else:
+                    self._idle.put(conn)
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
 def init_db(db_path: str | Path = "aphde.db") -> None:
     schema_path = Path(__file__).with_name("schema.sql")
     schema_sql = schema_path.read_text(encoding="utf-8")
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from core.data.db import get_connection
+
+
+def run_migration(db_path: str | Path = "aphde.db") -> None:
+    with get_connection(db_path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS shadow_divergence_stats (
+                primary_engine_version TEXT NOT NULL,
+                candidate_engine_version TEXT NOT NULL,
+                runs INTEGER NOT NULL DEFAULT 0,
+                identical_runs INTEGER NOT NULL DEFAULT 0,
+                alignment_abs_delta_sum REAL NOT NULL DEFAULT 0.0,
+                alignment_abs_delta_max REAL NOT NULL DEFAULT 0.0,
+                risk_abs_delta_sum REAL NOT NULL DEFAULT 0.0,
+                risk_abs_delta_max REAL NOT NULL DEFAULT 0.0,
+                confidence_abs_delta_sum REAL NOT NULL DEFAULT 0.0,
+                confidence_abs_delta_max REAL NOT NULL DEFAULT 0.0,
+                recommendation_set_changes INTEGER NOT NULL DEFAULT 0,
+                rank_shift_runs INTEGER NOT NULL DEFAULT 0,
+                context_changes INTEGER NOT NULL DEFAULT 0,
+                failures INTEGER NOT NULL DEFAULT 0,
+                skipped_budget INTEGER NOT NULL DEFAULT 0,
+                skipped_backlog INTEGER NOT NULL DEFAULT 0,
+                updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (primary_engine_version, candidate_engine_version)
+            )
+            """
+        )
+        conn.commit()
+
+
+if __name__ == "__main__":
+    run_migration()
+    print("Applied V10 shadow divergence migration.")
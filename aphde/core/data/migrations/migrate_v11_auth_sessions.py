@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from core.data.db import get_connection
+
+
+def run_migration(db_path: str | Path = "aphde.db") -> None:
+    with get_connection(db_path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS auth_sessions (
+                token_id TEXT PRIMARY KEY,
+                user_id INTEGER NOT NULL,
+                created_at TEXT NOT NULL,
+                expires_at TEXT NOT NULL,
+                revoked_at TEXT,
+                FOREIGN KEY (user_id) REFERENCES users(id)
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_auth_sessions_user ON auth_sessions(user_id)")
+        # Matches `lower(email) = ?` in UserRepository.get_by_email.
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_users_email_lower ON users(lower(email))")
+        conn.commit()
+
+
+if __name__ == "__main__":
+    run_migration()
+    print("Applied V11 auth session migration.")
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from core.data.db import get_connection
+
+
+def run_migration(db_path: str | Path = "aphde.db") -> None:
+    with get_connection(db_path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS login_throttle (
+                scope TEXT NOT NULL,
+                key_hash TEXT NOT NULL,
+                window_index INTEGER NOT NULL,
+                current_count INTEGER NOT NULL DEFAULT 0,
+                previous_count INTEGER NOT NULL DEFAULT 0,
+                locked_until REAL NOT NULL DEFAULT 0,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (scope, key_hash)
+            )
+            """
+        )
+        conn.commit()
+
+
+if __name__ == "__main__":
+    run_migration()
+    print("Applied V12 login throttle migration.")
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from core.data.db import get_connection
+
+
+def run_migration(db_path: str | Path = "aphde.db") -> None:
+    with get_connection(db_path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS insight_alerts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER NOT NULL,
+                alert_id TEXT NOT NULL,
+                alert_type TEXT NOT NULL,
+                severity TEXT NOT NULL,
+                alert_json TEXT NOT NULL,
+                first_triggered_at TEXT NOT NULL,
+                last_triggered_at TEXT NOT NULL,
+                first_decision_id INTEGER,
+                last_decision_id INTEGER,
+                resolved_at TEXT,
+                FOREIGN KEY (user_id) REFERENCES users(id)
+            )
+            """
+        )
+        # At most one open row per (user, alert); also serves the active-alerts read.
+        conn.execute(
+            """
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_insight_alerts_active
+            ON insight_alerts(user_id, alert_id) WHERE resolved_at IS NULL
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS insight_detector_state (
+                user_id INTEGER PRIMARY KEY,
+                detector_version TEXT NOT NULL,
+                last_decision_id INTEGER NOT NULL,
+                state_json TEXT NOT NULL,
+                updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (user_id) REFERENCES users(id)
+            )
+            """
+        )
+        conn.commit()
+
+
+if __name__ == "__main__":
+    run_migration()
+    print("Applied V13 insight alert migration.")
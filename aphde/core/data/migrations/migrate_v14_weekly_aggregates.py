@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sqlite3
+
+from core.data.db import get_connection
+
+
+def week_start_sql(day: str) -> str:
+    """Monday of the ISO week containing the date expression `day`."""
+
+    return f"date({day}, 'weekday 0', '-6 days')"
+
+
+def iso_week_sql(day: str) -> str:
+    """`YYYY-Www` ISO week label of `day`; the week's Thursday fixes the ISO year."""
+
+    thursday = f"date({day}, 'weekday 0', '-3 days')"
+    return (
+        f"printf('%04d-W%02d', CAST(strftime('%Y', {thursday}) AS INTEGER), "
+        f"(CAST(strftime('%j', {thursday}) AS INTEGER) - 1) / 7 + 1)"
+    )
+
+
+def _session_delta_sql(ref: str, sign: str) -> str:
+    planned = f"({ref}.planned_flag != 0)"
+    completed = f"({ref}.planned_flag != 0 AND {ref}.completed_flag != 0)"
+    return f"""
+    INSERT INTO insight_weekly_aggregates (user_id, iso_week, week_start, sessions_planned, sessions_completed)
+    SELECT {ref}.user_id, {iso_week_sql(f"{ref}.log_date")}, {week_start_sql(f"{ref}.log_date")},
+           {sign}{planned}, {sign}{completed}
+    WHERE {ref}.user_id IS NOT NULL
+    ON CONFLICT(user_id, iso_week) DO UPDATE SET
+        sessions_planned = sessions_planned + excluded.sessions_planned,
+        sessions_completed = sessions_completed + excluded.sessions_completed;"""
+
+
+def trigger_statements() -> list[str]:
+    # Session counts follow every workout_logs write, whichever code path makes it.
+    add_new = _session_delta_sql("NEW", "")
+    remove_old = _session_delta_sql("OLD", "-")
+    return [
+        "CREATE TRIGGER IF NOT EXISTS trg_workout_logs_weekly_insert\n"
+        f"AFTER INSERT ON workout_logs\nBEGIN{add_new}\nEND",
+        "CREATE TRIGGER IF NOT EXISTS trg_workout_logs_weekly_update\n"
+        f"AFTER UPDATE ON workout_logs\nBEGIN{remove_old}{add_new}\nEND",
+        "CREATE TRIGGER IF NOT EXISTS trg_workout_logs_weekly_delete\n"
+        f"AFTER DELETE ON workout_logs\nBEGIN{remove_old}\nEND",
+    ]
+
+
+def _table_exists(conn: sqlite3.Connection, table: str) -> bool:
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name = ?",
+        (table,),
+    ).fetchone()
+    return row is not None
+
+
+def run_migration(db_path: str | Path = "aphde.db") -> None:
+    with get_connection(db_path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS insight_weekly_aggregates (
+                user_id INTEGER NOT NULL,
+                iso_week TEXT NOT NULL,
+                week_start TEXT NOT NULL,
+                sessions_planned INTEGER NOT NULL DEFAULT 0,
+                sessions_completed INTEGER NOT NULL DEFAULT 0,
+                run_count INTEGER NOT NULL DEFAULT 0,
+                signals_json TEXT NOT NULL DEFAULT '{}',
+                volatility_direction TEXT NOT NULL DEFAULT 'flat',
+                last_decision_id INTEGER,
+                PRIMARY KEY (user_id, iso_week),
+                FOREIGN KEY (user_id) REFERENCES users(id)
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS insight_weekly_state (
+                user_id INTEGER PRIMARY KEY,
+                aggregate_version TEXT NOT NULL,
+                last_decision_id INTEGER NOT NULL DEFAULT 0,
+                updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (user_id) REFERENCES users(id)
+            )
+            """
+        )
+        if _table_exists(conn, "workout_logs"):
+            for statement in trigger_statements():
+                conn.execute(statement)
+        conn.commit()
+
+
+if __name__ == "__main__":
+    run_migration()
+    print("Applied V14 weekly aggregate migration.")
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from core.data.db import get_connection
+
+
+def run_migration(db_path: str | Path = "aphde.db") -> None:
+    with get_connection(db_path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS recommendation_persistence (
+                user_id INTEGER PRIMARY KEY,
+                window_runs INTEGER NOT NULL,
+                last_decision_id INTEGER NOT NULL,
+                window_json TEXT NOT NULL,
+                counts_json TEXT NOT NULL,
+                updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (user_id) REFERENCES users(id)
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS tomorrow_plans (
+                user_id INTEGER PRIMARY KEY,
+                decision_id INTEGER NOT NULL,
+                plan_json TEXT NOT NULL,
+                computed_at TEXT NOT NULL,
+                FOREIGN KEY (user_id) REFERENCES users(id)
+            )
+            """
+        )
+        conn.commit()
+
+
+if __name__ == "__main__":
+    run_migration()
+    print("Applied V15 tomorrow plan migration.")
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from core.data.db import get_connection
+
+
+def run_migration(db_path: str | Path = "aphde.db") -> None:
+    with get_connection(db_path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS precomputed_views (
+                user_id INTEGER NOT NULL,
+                view_name TEXT NOT NULL,
+                recent_limit INTEGER NOT NULL,
+                view_version TEXT NOT NULL DEFAULT '',
+                decision_id INTEGER NOT NULL,
+                data_version INTEGER NOT NULL,
+                as_of TEXT NOT NULL,
+                payload_json TEXT NOT NULL,
+                computed_at TEXT NOT NULL,
+                PRIMARY KEY (user_id, view_name, recent_limit),
+                FOREIGN KEY (user_id) REFERENCES users(id)
+            )
+            """
+        )
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(precomputed_views)").fetchall()}
+        if "view_version" not in columns:
+            # Rows stored before views were versioned never match a current version.
+            conn.execute("ALTER TABLE precomputed_views ADD COLUMN view_version TEXT NOT NULL DEFAULT ''")
+        conn.commit()
+
+
+if __name__ == "__main__":
+    run_migration()
+    print("Applied V16 precomputed view migration.")
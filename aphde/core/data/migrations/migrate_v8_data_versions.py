@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sqlite3
+
+from core.data.db import get_connection
+
+
+# Tables whose writes change what a user's views and evaluations are built from.
+VERSIONED_TABLES: tuple[str, ...] = (
+    "goals",
+    "weight_logs",
+    "calorie_logs",
+    "workout_logs",
+    "context_inputs",
+    "decision_runs",
+)
+
+_BUMP_SQL = """
+    INSERT INTO user_data_versions (user_id, version, updated_at)
+    SELECT {ref}.user_id, 1, CURRENT_TIMESTAMP WHERE {condition}
+    ON CONFLICT(user_id) DO UPDATE SET version = version + 1, updated_at = excluded.updated_at;"""
+
+
+def _table_exists(conn: sqlite3.Connection, table: str) -> bool:
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name = ?",
+        (table,),
+    ).fetchone()
+    return row is not None
+
+
+def trigger_statements(table: str) -> list[str]:
+    insert_bump = _BUMP_SQL.format(ref="NEW", condition="NEW.user_id IS NOT NULL")
+    delete_bump = _BUMP_SQL.format(ref="OLD", condition="OLD.user_id IS NOT NULL")
+    moved_bump = _BUMP_SQL.format(
+        ref="OLD",
+        condition="OLD.user_id IS NOT NULL AND OLD.user_id IS NOT NEW.user_id",
+    )
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS trg_{table}_data_version_insert\n"
+        f"AFTER INSERT ON {table}\nBEGIN{insert_bump}\nEND",
+        f"CREATE TRIGGER IF NOT EXISTS trg_{table}_data_version_update\n"
+        f"AFTER UPDATE ON {table}\nBEGIN{insert_bump}{moved_bump}\nEND",
+        f"CREATE TRIGGER IF NOT EXISTS trg_{table}_data_version_delete\n"
+        f"AFTER DELETE ON {table}\nBEGIN{delete_bump}\nEND",
+    ]
+
+
+def run_migration(db_path: str | Path = "aphde.db") -> None:
+    with get_connection(db_path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS user_data_versions (
+                user_id INTEGER PRIMARY KEY,
+                version INTEGER NOT NULL DEFAULT 0,
+                updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+        for table in VERSIONED_TABLES:
+            if not _table_exists(conn, table):
+                continue
+            for statement in trigger_statements(table):
+                conn.execute(statement)
+        conn.commit()
+
+
+if __name__ == "__main__":
+    run_migration()
+    print("Applied V8 user data version migration.")
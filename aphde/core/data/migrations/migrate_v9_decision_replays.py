@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from core.data.db import get_connection
+
+
+def run_migration(db_path: str | Path = "aphde.db") -> None:
+    with get_connection(db_path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS decision_replays (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                engine_version TEXT NOT NULL,
+                user_id INTEGER NOT NULL,
+                goal_id INTEGER NOT NULL,
+                replay_date TEXT NOT NULL,
+                alignment_score REAL NOT NULL,
+                risk_score REAL NOT NULL,
+                alignment_confidence REAL NOT NULL,
+                recommendations_json TEXT NOT NULL,
+                confidence_version TEXT NOT NULL,
+                context_applied INTEGER NOT NULL DEFAULT 0,
+                trace_json TEXT NOT NULL,
+                created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE (engine_version, user_id, replay_date),
+                FOREIGN KEY (user_id) REFERENCES users(id),
+                FOREIGN KEY (goal_id) REFERENCES goals(id)
+            )
+            """
+        )
+        conn.commit()
+
+
+if __name__ == "__main__":
+    run_migration()
+    print("Applied V9 decision replay migration.")
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import sqlite3
+from datetime import UTC, datetime
+
+
+class AuthSessionRepository:
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+    def create(self, *, token_id: str, user_id: int, expires_at: datetime) -> None:
+        self.conn.execute(
+            """
+            INSERT INTO auth_sessions (token_id, user_id, created_at, expires_at)
+            VALUES (?, ?, ?, ?)
+            """,
+            (token_id, user_id, datetime.now(UTC).isoformat(), expires_at.isoformat()),
+        )
+        self.conn.commit()
+
+    def get_active(self, token_id: str, *, now: datetime) -> sqlite3.Row | None:
+        """Unrevoked, unexpired session joined with its (active) user."""
+
+        return self.conn.execute(
+            """
+            SELECT s.token_id, s.user_id, s.expires_at, u.email, u.display_name
+            FROM auth_sessions s
+            JOIN users u ON u.id = s.user_id
+            WHERE s.token_id = ?
+              AND s.revoked_at IS NULL
+              AND s.expires_at > ?
+              AND u.is_active = 1
+            """,
+            (token_id, now.isoformat()),
+        ).fetchone()
+
+    def revoke(self, token_id: str) -> None:
+        self.conn.execute(
+            "UPDATE auth_sessions SET revoked_at = ? WHERE token_id = ? AND revoked_at IS NULL",
+            (datetime.now(UTC).isoformat(), token_id),
+        )
+        self.conn.commit()
+
+    def revoke_user(self, user_id: int) -> list[str]:
+        rows = self.conn.execute(
+            "SELECT token_id FROM auth_sessions WHERE user_id = ? AND revoked_at IS NULL",
+            (user_id,),
+        ).fetchall()
+        self.conn.execute(
+            "UPDATE auth_sessions SET revoked_at = ? WHERE user_id = ? AND revoked_at IS NULL",
+            (datetime.now(UTC).isoformat(), user_id),
+        )
+        self.conn.commit()
+        return [str(row["token_id"]) for row in rows]
+
+    def delete_expired(self, *, now: datetime) -> int:
+        cursor = self.conn.execute(
+            "DELETE FROM auth_sessions WHERE expires_at <= ? OR revoked_at IS NOT NULL",
+            (now.isoformat(),),
+        )
+        self.conn.commit()
+        return int(cursor.rowcount)
@@ -1,8 +1,11 @@
 ﻿from __future__ import annotations
 
 import sqlite3
+from collections.abc import Iterable
 from datetime import date
 
+from core.models.entities import CalorieLog
+
 
 class CalorieLogRepository:
     def __init__(self, conn: sqlite3.Connection) -> None:
@@ -16,6 +19,14 @@ class CalorieLogRepository:
         self.conn.commit()
         return int(cursor.lastrowid)
 
+    def add_many(self, logs: Iterable[CalorieLog]) -> int:
+        cursor = self.conn.executemany(
+            "INSERT INTO calorie_logs (user_id, log_date, calories_kcal, protein_g) VALUES (?, ?, ?, ?)",
+            [(log.user_id, log.log_date.isoformat(), log.calories_kcal, log.protein_g) for log in logs],
+        )
+        self.conn.commit()
+        return int(cursor.rowcount)
+
     def list_recent(self, user_id: int, days: int = 28) -> list[sqlite3.Row]:
         return self.conn.execute(
             """
@@ -26,3 +37,14 @@ class CalorieLogRepository:
             """,
             (user_id, f"-{days} day"),
         ).fetchall()
+
+    def list_between(self, user_id: int, start_date: date, end_date: date) -> list[sqlite3.Row]:
+        return self.conn.execute(
+            """
+            SELECT * FROM calorie_logs
+            WHERE user_id = ?
+              AND log_date BETWEEN ? AND ?
+            ORDER BY log_date ASC
+            """,
+            (user_id, start_date.isoformat(), end_date.isoformat()),
+        ).fetchall()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import sqlite3
+from collections.abc import Sequence
 from datetime import UTC, date, datetime
 from typing import Any
 
@@ -37,3 +38,39 @@ class ContextInputRepository:
             """,
             (user_id, context_type),
         ).fetchone()
+
+    def list_until(self, user_id: int, end_date: date, context_type: str = "cycle") -> list[sqlite3.Row]:
+        return self.conn.execute(
+            """
+            SELECT * FROM context_inputs
+            WHERE user_id = ? AND context_type = ? AND log_date <= ?
+            ORDER BY log_date ASC, id ASC
+            """,
+            (user_id, context_type, end_date.isoformat()),
+        ).fetchall()
+
+    def list_for_users(
+        self,
+        user_ids: Sequence[int],
+        *,
+        end_date: date | None = None,
+        context_types: Sequence[str] = ("cycle",),
+        chunk_size: int = 500,
+    ) -> list[sqlite3.Row]:
+        """Rows for many users in a few queries, for building a `ContextTimeline`."""
+
+        rows: list[sqlite3.Row] = []
+        type_marks = ", ".join("?" for _ in context_types)
+        for offset in range(0, len(user_ids), chunk_size):
+            chunk = list(user_ids[offset : offset + chunk_size])
+            user_marks = ", ".join("?" for _ in chunk)
+            sql = (
+                "SELECT * FROM context_inputs "
+                f"WHERE user_id IN ({user_marks}) AND context_type IN ({type_marks})"
+            )
+            params: list[Any] = [*chunk, *context_types]
+            if end_date is not None:
+                sql += " AND log_date <= ?"
+                params.append(end_date.isoformat())
+            rows.extend(self.conn.execute(sql + " ORDER BY user_id ASC, log_date ASC, id ASC", params).fetchall())
+        return rows
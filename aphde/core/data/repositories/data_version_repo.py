@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterable
+
+
+class UserDataVersionRepository:
+    """
+    Reads the per-user counter that triggers bump on every write to goals,
+    logs, context inputs and decision runs. A user with no writes is at 0.
+    """
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+    def get(self, user_id: int) -> int:
+        row = self.conn.execute(
+            "SELECT version FROM user_data_versions WHERE user_id = ?",
+            (user_id,),
+        ).fetchone()
+        return int(row["version"]) if row is not None else 0
+
+    def get_many(self, user_ids: Iterable[int]) -> dict[int, int]:
+        ids = sorted({int(user_id) for user_id in user_ids})
+        if not ids:
+            return {}
+        placeholders = ", ".join("?" for _ in ids)
+        rows = self.conn.execute(
+            f"SELECT user_id, version FROM user_data_versions WHERE user_id IN ({placeholders})",
+            ids,
+        ).fetchall()
+        versions = {user_id: 0 for user_id in ids}
+        versions.update({int(row["user_id"]): int(row["version"]) for row in rows})
+        return versions
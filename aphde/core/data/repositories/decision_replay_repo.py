@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Iterable
+from datetime import date
+from typing import Any
+
+
+class DecisionReplayRepository:
+    """Shadow decision results from historical replays, one row per (engine version, user, date)."""
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+    def upsert_many(self, rows: Iterable[dict[str, Any]]) -> int:
+        cursor = self.conn.executemany(
+            """
+            INSERT INTO decision_replays (
+                engine_version, user_id, goal_id, replay_date, alignment_score, risk_score,
+                alignment_confidence, recommendations_json, confidence_version, context_applied, trace_json
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(engine_version, user_id, replay_date) DO UPDATE SET
+                goal_id = excluded.goal_id,
+                alignment_score = excluded.alignment_score,
+                risk_score = excluded.risk_score,
+                alignment_confidence = excluded.alignment_confidence,
+                recommendations_json = excluded.recommendations_json,
+                confidence_version = excluded.confidence_version,
+                context_applied = excluded.context_applied,
+                trace_json = excluded.trace_json,
+                created_at = CURRENT_TIMESTAMP
+            """,
+            [
+                (
+                    row["engine_version"],
+                    row["user_id"],
+                    row["goal_id"],
+                    row["replay_date"].isoformat(),
+                    row["alignment_score"],
+                    row["risk_score"],
+                    row["alignment_confidence"],
+                    json.dumps(row["recommendations"]),
+                    row["confidence_version"],
+                    int(row["context_applied"]),
+                    json.dumps(row["trace"]),
+                )
+                for row in rows
+            ],
+        )
+        self.conn.commit()
+        return int(cursor.rowcount)
+
+    def list_recent_before(
+        self,
+        *,
+        engine_version: str,
+        user_id: int,
+        before: date,
+        limit: int = 10,
+    ) -> list[sqlite3.Row]:
+        """Newest first, mirroring `DecisionRunRepository.list_recent`."""
+
+        return self.conn.execute(
+            """
+            SELECT * FROM decision_replays
+            WHERE engine_version = ? AND user_id = ? AND replay_date < ?
+            ORDER BY replay_date DESC
+            LIMIT ?
+            """,
+            (engine_version, user_id, before.isoformat(), limit),
+        ).fetchall()
+
+    def list_for_version(self, engine_version: str, user_id: int | None = None) -> list[sqlite3.Row]:
+        if user_id is None:
+            return self.conn.execute(
+                "SELECT * FROM decision_replays WHERE engine_version = ? ORDER BY user_id ASC, replay_date ASC",
+                (engine_version,),
+            ).fetchall()
+        return self.conn.execute(
+            """
+            SELECT * FROM decision_replays
+            WHERE engine_version = ? AND user_id = ?
+            ORDER BY replay_date ASC
+            """,
+            (engine_version, user_id),
+        ).fetchall()
@@ -2,6 +2,7 @@
 
 import json
 import sqlite3
+from collections.abc import Sequence
 from datetime import UTC, datetime
 
 
@@ -91,3 +92,146 @@ class DecisionRunRepository:
             """,
             (user_id, limit),
         ).fetchall()
+
+    def previous_id(self, user_id: int, *, before_id: int) -> int | None:
+        row = self.conn.execute(
+            "SELECT MAX(id) FROM decision_runs WHERE user_id = ? AND id < ?",
+            (user_id, before_id),
+        ).fetchone()
+        return int(row[0]) if row[0] is not None else None
+
+    def latest_ids(self, user_ids: Sequence[int]) -> dict[int, int]:
+        """Latest decision id per user in `user_ids`; 0 for users without runs."""
+
+        ids = sorted({int(user_id) for user_id in user_ids})
+        if not ids:
+            return {}
+        placeholders = ", ".join("?" for _ in ids)
+        rows = self.conn.execute(
+            f"SELECT user_id, MAX(id) FROM decision_runs WHERE user_id IN ({placeholders}) GROUP BY user_id",
+            ids,
+        ).fetchall()
+        latest = {user_id: 0 for user_id in ids}
+        latest.update({int(row[0]): int(row[1]) for row in rows})
+        return latest
+
+    def latest_for_users(self, user_ids: Sequence[int]) -> list[sqlite3.Row]:
+        """Latest run of each user in `user_ids` that has one."""
+
+        if not user_ids:
+            return []
+        placeholders = ", ".join("?" for _ in user_ids)
+        return self.conn.execute(
+            f"""
+            SELECT * FROM decision_runs
+            WHERE id IN (
+                SELECT MAX(id) FROM decision_runs
+                WHERE user_id IN ({placeholders})
+                GROUP BY user_id
+            )
+            ORDER BY user_id ASC
+            """,
+            tuple(user_ids),
+        ).fetchall()
+
+    def scan_columns(self, *, after_id: int = 0, limit: int = 50_000, since: str | None = None) -> list[tuple]:
+        """
+        One chunk of cohort columns in id order, as plain tuples:
+        (id, user_id, goal_type, alignment_score, alignment_confidence, risk_score,
+        determinism_verified (-1 when unchecked), engine_version, context_applied).
+        """
+
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        return cursor.execute(
+            """
+            SELECT dr.id, dr.user_id, COALESCE(g.goal_type, ''), dr.alignment_score,
+                   COALESCE(dr.alignment_confidence, 0.0), dr.risk_score,
+                   COALESCE(dr.determinism_verified, -1), COALESCE(dr.engine_version, ''),
+                   COALESCE(dr.context_applied, 0)
+            FROM decision_runs dr
+            LEFT JOIN goals g ON g.id = dr.goal_id
+            WHERE dr.id > ? AND (? IS NULL OR dr.run_date >= ?)
+            ORDER BY dr.id ASC
+            LIMIT ?
+            """,
+            (after_id, since, since, limit),
+        ).fetchall()
+
+    def triggered_rules_between(self, first_id: int, last_id: int) -> list[tuple]:
+        """(id, rule) tuples from `trace_json.triggered_rules` for ids in [first_id, last_id]."""
+
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        return cursor.execute(
+            """
+            SELECT dr.id, rule.value
+            FROM decision_runs dr,
+                 json_each(
+                     CASE WHEN json_valid(dr.trace_json) THEN dr.trace_json ELSE '{}' END,
+                     '$.triggered_rules'
+                 ) AS rule
+            WHERE dr.id BETWEEN ? AND ?
+            ORDER BY dr.id ASC
+            """,
+            (first_id, last_id),
+        ).fetchall()
+
+    def scan_export_columns(self, *, after_id: int = 0, limit: int = 100_000) -> list[tuple]:
+        """
+        Typed export rows in id order: run metadata, scores and the numeric
+        `computed_signals` from the trace (NULL when absent or the trace is not JSON).
+        """
+
+        signal_paths = (
+            "trend_slope",
+            "volatility_index",
+            "compliance_ratio",
+            "muscle_balance_index",
+            "recovery_index",
+            "progressive_overload_score",
+        )
+        signal_columns = ",\n".join(
+            f"CASE WHEN json_valid(dr.trace_json) THEN json_extract(dr.trace_json, '$.computed_signals.{name}') END"
+            for name in signal_paths
+        )
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        return cursor.execute(
+            f"""
+            SELECT dr.id, dr.user_id, dr.goal_id, COALESCE(g.goal_type, ''),
+                   CAST(ROUND((julianday(dr.run_date) - 2440587.5) * 86400000.0) AS INTEGER),
+                   COALESCE(dr.engine_version, ''), dr.alignment_score, dr.risk_score,
+                   COALESCE(dr.alignment_confidence, 0.0), COALESCE(dr.context_applied, 0),
+                   COALESCE(dr.determinism_verified, -1),
+                   CASE WHEN json_valid(dr.trace_json)
+                        THEN COALESCE(json_array_length(dr.trace_json, '$.triggered_rules'), 0)
+                        ELSE 0 END,
+                   {signal_columns}
+            FROM decision_runs dr
+            LEFT JOIN goals g ON g.id = dr.goal_id
+            WHERE dr.id > ?
+            ORDER BY dr.id ASC
+            LIMIT ?
+            """,
+            (after_id, limit),
+        ).fetchall()
+
+    def signal_values_after(self, user_id: int, *, after_id: int, keys: Sequence[str]) -> list[tuple]:
+        """(id, run_date, *values) for the user's runs after `after_id` in id order, one value per `computed_signals` key."""
+
+        signal_columns = "".join(
+            ",\n                   CASE WHEN json_valid(trace_json) THEN json_extract(trace_json, ?) END"
+            for _ in keys
+        )
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        return cursor.execute(
+            f"""
+            SELECT id, run_date{signal_columns}
+            FROM decision_runs
+            WHERE user_id = ? AND id > ?
+            ORDER BY id ASC
+            """,
+            (*(f"$.computed_signals.{key}" for key in keys), user_id, after_id),
+        ).fetchall()
@@ -29,3 +29,9 @@ class GoalRepository:
             "SELECT * FROM goals WHERE user_id = ? AND is_active = 1 ORDER BY id DESC LIMIT 1",
             (user_id,),
         ).fetchone()
+
+    def list_for_user(self, user_id: int) -> list[sqlite3.Row]:
+        return self.conn.execute(
+            "SELECT * FROM goals WHERE user_id = ? ORDER BY id ASC",
+            (user_id,),
+        ).fetchall()
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import UTC, datetime
+from typing import Any
+
+
+class InsightAlertRepository:
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+    def get_state(self, user_id: int) -> sqlite3.Row | None:
+        return self.conn.execute(
+            "SELECT * FROM insight_detector_state WHERE user_id = ?",
+            (user_id,),
+        ).fetchone()
+
+    def save_state(self, *, user_id: int, detector_version: str, last_decision_id: int, state: dict[str, Any]) -> None:
+        self.conn.execute(
+            """
+            INSERT INTO insight_detector_state (user_id, detector_version, last_decision_id, state_json, updated_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(user_id) DO UPDATE SET
+                detector_version = excluded.detector_version,
+                last_decision_id = excluded.last_decision_id,
+                state_json = excluded.state_json,
+                updated_at = excluded.updated_at
+            """,
+            (user_id, detector_version, last_decision_id, json.dumps(state), datetime.now(UTC).isoformat()),
+        )
+
+    def list_active(self, user_id: int) -> list[sqlite3.Row]:
+        return self.conn.execute(
+            """
+            SELECT * FROM insight_alerts
+            WHERE user_id = ? AND resolved_at IS NULL
+            """,
+            (user_id,),
+        ).fetchall()
+
+    def sync_active(
+        self,
+        *,
+        user_id: int,
+        alerts: list[dict[str, Any]],
+        decision_id: int,
+        triggered_at: str,
+    ) -> None:
+        """
+        Make `alerts` the user's open set: alerts already open are refreshed,
+        new ones open a row and open alerts no longer firing are resolved.
+        """
+
+        for alert in alerts:
+            self.conn.execute(
+                """
+                INSERT INTO insight_alerts (
+                    user_id, alert_id, alert_type, severity, alert_json,
+                    first_triggered_at, last_triggered_at, first_decision_id, last_decision_id
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(user_id, alert_id) WHERE resolved_at IS NULL DO UPDATE SET
+                    alert_type = excluded.alert_type,
+                    severity = excluded.severity,
+                    alert_json = excluded.alert_json,
+                    last_triggered_at = excluded.last_triggered_at,
+                    last_decision_id = excluded.last_decision_id
+                """,
+                (
+                    user_id,
+                    str(alert["alert_id"]),
+                    str(alert["type"]),
+                    str(alert["severity"]),
+                    json.dumps(alert),
+                    triggered_at,
+                    triggered_at,
+                    decision_id,
+                    decision_id,
+                ),
+            )
+        firing = [str(alert["alert_id"]) for alert in alerts]
+        placeholders = ", ".join("?" for _ in firing)
+        condition = f" AND alert_id NOT IN ({placeholders})" if firing else ""
+        self.conn.execute(
+            f"UPDATE insight_alerts SET resolved_at = ? WHERE user_id = ? AND resolved_at IS NULL{condition}",
+            (triggered_at, user_id, *firing),
+        )
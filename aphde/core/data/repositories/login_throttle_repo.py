@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import sqlite3
+
+
+class LoginThrottleRepository:
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+    def get(self, *, scope: str, key_hash: str) -> sqlite3.Row | None:
+        return self.conn.execute(
+            """
+            SELECT window_index, current_count, previous_count, locked_until
+            FROM login_throttle
+            WHERE scope = ? AND key_hash = ?
+            """,
+            (scope, key_hash),
+        ).fetchone()
+
+    def upsert(
+        self,
+        *,
+        scope: str,
+        key_hash: str,
+        window_index: int,
+        current_count: int,
+        previous_count: int,
+        locked_until: float,
+        updated_at: float,
+    ) -> None:
+        self.conn.execute(
+            """
+            INSERT INTO login_throttle (
+                scope, key_hash, window_index, current_count, previous_count, locked_until, updated_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(scope, key_hash) DO UPDATE SET
+                window_index = excluded.window_index,
+                current_count = excluded.current_count,
+                previous_count = excluded.previous_count,
+                locked_until = excluded.locked_until,
+                updated_at = excluded.updated_at
+            """,
+            (scope, key_hash, window_index, current_count, previous_count, locked_until, updated_at),
+        )
+        self.conn.commit()
+
+    def delete(self, *, scope: str, key_hash: str) -> None:
+        self.conn.execute("DELETE FROM login_throttle WHERE scope = ? AND key_hash = ?", (scope, key_hash))
+        self.conn.commit()
+
+    def delete_stale(self, *, updated_before: float, now: float) -> int:
+        cursor = self.conn.execute(
+            "DELETE FROM login_throttle WHERE updated_at < ? AND locked_until <= ?",
+            (updated_before, now),
+        )
+        self.conn.commit()
+        return int(cursor.rowcount)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from typing import Any
+
+
+class PrecomputedViewRepository:
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+    def get(self, user_id: int, *, view_name: str, recent_limit: int) -> sqlite3.Row | None:
+        return self.conn.execute(
+            """
+            SELECT * FROM precomputed_views
+            WHERE user_id = ? AND view_name = ? AND recent_limit = ?
+            """,
+            (user_id, view_name, recent_limit),
+        ).fetchone()
+
+    def versions_for_users(
+        self,
+        user_ids: Sequence[int],
+        *,
+        view_name: str,
+        recent_limit: int,
+    ) -> dict[int, tuple[str, int, int, str]]:
+        """(view_version, decision_id, data_version, as_of) of each stored view in `user_ids`."""
+
+        if not user_ids:
+            return {}
+        placeholders = ", ".join("?" for _ in user_ids)
+        rows = self.conn.execute(
+            f"""
+            SELECT user_id, view_version, decision_id, data_version, as_of FROM precomputed_views
+            WHERE view_name = ? AND recent_limit = ? AND user_id IN ({placeholders})
+            """,
+            (view_name, recent_limit, *user_ids),
+        ).fetchall()
+        return {
+            int(row["user_id"]): (
+                str(row["view_version"]),
+                int(row["decision_id"]),
+                int(row["data_version"]),
+                str(row["as_of"]),
+            )
+            for row in rows
+        }
+
+    def save_many(
+        self,
+        views: Sequence[tuple[int, str, int, str, int, int, str, dict[str, Any]]],
+    ) -> int:
+        """
+        Upsert (user_id, view_name, recent_limit, view_version, decision_id,
+        data_version, as_of, payload) rows.
+        """
+
+        computed_at = datetime.now(UTC).isoformat()
+        cursor = self.conn.executemany(
+            """
+            INSERT INTO precomputed_views (
+                user_id, view_name, recent_limit, view_version, decision_id, data_version, as_of,
+                payload_json, computed_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(user_id, view_name, recent_limit) DO UPDATE SET
+                view_version = excluded.view_version,
+                decision_id = excluded.decision_id,
+                data_version = excluded.data_version,
+                as_of = excluded.as_of,
+                payload_json = excluded.payload_json,
+                computed_at = excluded.computed_at
+            """,
+            [(*view[:-1], json.dumps(view[-1]), computed_at) for view in views],
+        )
+        self.conn.commit()
+        return int(cursor.rowcount)
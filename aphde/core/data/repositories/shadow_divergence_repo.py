@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import sqlite3
+
+from core.governance.shadow_divergence import DIVERGENCE_FIELDS, DIVERGENCE_MAX_FIELDS, DivergenceStats
+
+
+class ShadowDivergenceRepository:
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+    def accumulate(self, *, primary_engine_version: str, candidate_engine_version: str, stats: DivergenceStats) -> None:
+        """Fold `stats` into the stored row for this version pair (sums add, maxima take the larger)."""
+
+        columns = ", ".join(DIVERGENCE_FIELDS)
+        placeholders = ", ".join("?" for _ in DIVERGENCE_FIELDS)
+        updates = ", ".join(
+            f"{name} = max({name}, excluded.{name})" if name in DIVERGENCE_MAX_FIELDS else f"{name} = {name} + excluded.{name}"
+            for name in DIVERGENCE_FIELDS
+        )
+        values = stats.to_dict()
+        self.conn.execute(
+            f"""
+            INSERT INTO shadow_divergence_stats (primary_engine_version, candidate_engine_version, {columns})
+            VALUES (?, ?, {placeholders})
+            ON CONFLICT(primary_engine_version, candidate_engine_version) DO UPDATE SET
+                {updates}, updated_at = CURRENT_TIMESTAMP
+            """,
+            (primary_engine_version, candidate_engine_version, *(values[name] for name in DIVERGENCE_FIELDS)),
+        )
+        self.conn.commit()
+
+    def get(self, *, primary_engine_version: str, candidate_engine_version: str) -> DivergenceStats | None:
+        row = self.conn.execute(
+            """
+            SELECT * FROM shadow_divergence_stats
+            WHERE primary_engine_version = ? AND candidate_engine_version = ?
+            """,
+            (primary_engine_version, candidate_engine_version),
+        ).fetchone()
+        if row is None:
+            return None
+        return DivergenceStats(**{name: row[name] for name in DIVERGENCE_FIELDS})
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import date
+from typing import Any
+
+
+class SignalSnapshotRepository:
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+    def replace_for_date(self, user_id: int, snapshot_date: date, signals_by_window: dict[int, dict[str, Any]]) -> int:
+        """Write one row per window for `snapshot_date`, replacing earlier rows for the same windows."""
+
+        if not signals_by_window:
+            return 0
+        windows = sorted(signals_by_window)
+        placeholders = ", ".join("?" for _ in windows)
+        self.conn.execute(
+            f"""
+            DELETE FROM signal_snapshots
+            WHERE user_id = ? AND snapshot_date = ? AND window_days IN ({placeholders})
+            """,
+            (user_id, snapshot_date.isoformat(), *windows),
+        )
+        self.conn.executemany(
+            "INSERT INTO signal_snapshots (user_id, snapshot_date, window_days, signal_json) VALUES (?, ?, ?, ?)",
+            [
+                (user_id, snapshot_date.isoformat(), window, json.dumps(signals_by_window[window], sort_keys=True))
+                for window in windows
+            ],
+        )
+        self.conn.commit()
+        return len(windows)
+
+    def latest_by_window(self, user_id: int) -> dict[int, dict[str, Any]]:
+        """Signals from the most recent snapshot date, keyed by window length."""
+
+        rows = self.conn.execute(
+            """
+            SELECT window_days, signal_json FROM signal_snapshots
+            WHERE user_id = ?
+              AND snapshot_date = (SELECT MAX(snapshot_date) FROM signal_snapshots WHERE user_id = ?)
+            ORDER BY window_days ASC, id ASC
+            """,
+            (user_id, user_id),
+        ).fetchall()
+        return {int(row["window_days"]): json.loads(row["signal_json"]) for row in rows}
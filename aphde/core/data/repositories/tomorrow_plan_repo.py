@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from typing import Any
+
+
+class TomorrowPlanRepository:
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+    def get_persistence(self, user_id: int) -> sqlite3.Row | None:
+        return self.conn.execute(
+            "SELECT * FROM recommendation_persistence WHERE user_id = ?",
+            (user_id,),
+        ).fetchone()
+
+    def save_persistence(
+        self,
+        *,
+        user_id: int,
+        window_runs: int,
+        last_decision_id: int,
+        window: list[list[str]],
+        counts: dict[str, int],
+    ) -> None:
+        self.conn.execute(
+            """
+            INSERT INTO recommendation_persistence (
+                user_id, window_runs, last_decision_id, window_json, counts_json, updated_at
+            ) VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(user_id) DO UPDATE SET
+                window_runs = excluded.window_runs,
+                last_decision_id = excluded.last_decision_id,
+                window_json = excluded.window_json,
+                counts_json = excluded.counts_json,
+                updated_at = excluded.updated_at
+            """,
+            (
+                user_id,
+                window_runs,
+                last_decision_id,
+                json.dumps(window),
+                json.dumps(counts),
+                datetime.now(UTC).isoformat(),
+            ),
+        )
+
+    def get_plan(self, user_id: int) -> sqlite3.Row | None:
+        return self.conn.execute(
+            "SELECT * FROM tomorrow_plans WHERE user_id = ?",
+            (user_id,),
+        ).fetchone()
+
+    def save_plans(self, plans: Sequence[tuple[int, int, dict[str, Any]]]) -> int:
+        """Upsert (user_id, decision_id, plan) rows."""
+
+        computed_at = datetime.now(UTC).isoformat()
+        cursor = self.conn.executemany(
+            """
+            INSERT INTO tomorrow_plans (user_id, decision_id, plan_json, computed_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(user_id) DO UPDATE SET
+                decision_id = excluded.decision_id,
+                plan_json = excluded.plan_json,
+                computed_at = excluded.computed_at
+            """,
+            [(user_id, decision_id, json.dumps(plan), computed_at) for user_id, decision_id, plan in plans],
+        )
+        self.conn.commit()
+        return int(cursor.rowcount)
@@ -65,9 +65,23 @@ class UserRepository:
         )
         self.conn.commit()
 
+    def set_active(self, user_id: int, is_active: bool) -> None:
+        self.conn.execute(
+            "UPDATE users SET is_active = ? WHERE id = ?",
+            (1 if is_active else 0, user_id),
+        )
+        self.conn.commit()
+
     def list_all(self) -> list[sqlite3.Row]:
         return self.conn.execute("SELECT * FROM users ORDER BY id ASC").fetchall()
 
+    def list_active_ids(self, *, after_id: int = 0, limit: int = 500) -> list[int]:
+        rows = self.conn.execute(
+            "SELECT id FROM users WHERE id > ? AND is_active = 1 ORDER BY id ASC LIMIT ?",
+            (after_id, limit),
+        ).fetchall()
+        return [int(row["id"]) for row in rows]
+
     @staticmethod
     def row_to_identity(row: sqlite3.Row) -> dict[str, Any]:
         return {
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from typing import Any
+
+from core.data.migrations.migrate_v14_weekly_aggregates import iso_week_sql, week_start_sql
+
+
+class WeeklyAggregateRepository:
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+    def get_state(self, user_id: int) -> sqlite3.Row | None:
+        return self.conn.execute(
+            "SELECT * FROM insight_weekly_state WHERE user_id = ?",
+            (user_id,),
+        ).fetchone()
+
+    def save_state(self, *, user_id: int, aggregate_version: str, last_decision_id: int) -> None:
+        self.conn.execute(
+            """
+            INSERT INTO insight_weekly_state (user_id, aggregate_version, last_decision_id, updated_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(user_id) DO UPDATE SET
+                aggregate_version = excluded.aggregate_version,
+                last_decision_id = excluded.last_decision_id,
+                updated_at = excluded.updated_at
+            """,
+            (user_id, aggregate_version, last_decision_id, datetime.now(UTC).isoformat()),
+        )
+
+    def reset_user(self, user_id: int) -> None:
+        """Drop the user's weeks and recount sessions from `workout_logs`; signals are folded again by the caller."""
+
+        self.conn.execute("DELETE FROM insight_weekly_aggregates WHERE user_id = ?", (user_id,))
+        self.conn.execute(
+            f"""
+            INSERT INTO insight_weekly_aggregates (user_id, iso_week, week_start, sessions_planned, sessions_completed)
+            SELECT user_id, {iso_week_sql("log_date")}, {week_start_sql("log_date")},
+                   SUM(planned_flag != 0), SUM(planned_flag != 0 AND completed_flag != 0)
+            FROM workout_logs
+            WHERE user_id = ?
+            GROUP BY 1, 2
+            """,
+            (user_id,),
+        )
+
+    def get_weeks(self, user_id: int, iso_weeks: Sequence[str]) -> list[sqlite3.Row]:
+        if not iso_weeks:
+            return []
+        placeholders = ", ".join("?" for _ in iso_weeks)
+        return self.conn.execute(
+            f"SELECT * FROM insight_weekly_aggregates WHERE user_id = ? AND iso_week IN ({placeholders})",
+            (user_id, *iso_weeks),
+        ).fetchall()
+
+    def save_signals(
+        self,
+        *,
+        user_id: int,
+        iso_week: str,
+        week_start: str,
+        run_count: int,
+        signals: dict[str, Any],
+        volatility_direction: str,
+        last_decision_id: int,
+    ) -> None:
+        # Session columns are left to the workout_logs triggers.
+        self.conn.execute(
+            """
+            INSERT INTO insight_weekly_aggregates (
+                user_id, iso_week, week_start, run_count, signals_json, volatility_direction, last_decision_id
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(user_id, iso_week) DO UPDATE SET
+                run_count = excluded.run_count,
+                signals_json = excluded.signals_json,
+                volatility_direction = excluded.volatility_direction,
+                last_decision_id = excluded.last_decision_id
+            """,
+            (
+                user_id,
+                iso_week,
+                week_start,
+                run_count,
+                json.dumps(signals),
+                volatility_direction,
+                last_decision_id,
+            ),
+        )
+
+    def list_recent(self, user_id: int, limit: int = 8) -> list[sqlite3.Row]:
+        return self.conn.execute(
+            """
+            SELECT * FROM insight_weekly_aggregates
+            WHERE user_id = ?
+            ORDER BY iso_week DESC
+            LIMIT ?
+            """,
+            (user_id, limit),
+        ).fetchall()
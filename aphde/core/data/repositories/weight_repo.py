@@ -1,8 +1,11 @@
 ﻿from __future__ import annotations
 
 import sqlite3
+from collections.abc import Iterable
 from datetime import date
 
+from core.models.entities import WeightLog
+
 
 class WeightLogRepository:
     def __init__(self, conn: sqlite3.Connection) -> None:
@@ -16,6 +19,14 @@ class WeightLogRepository:
         self.conn.commit()
         return int(cursor.lastrowid)
 
+    def add_many(self, logs: Iterable[WeightLog]) -> int:
+        cursor = self.conn.executemany(
+            "INSERT INTO weight_logs (user_id, log_date, weight_kg) VALUES (?, ?, ?)",
+            [(log.user_id, log.log_date.isoformat(), log.weight_kg) for log in logs],
+        )
+        self.conn.commit()
+        return int(cursor.rowcount)
+
     def list_recent(self, user_id: int, days: int = 28) -> list[sqlite3.Row]:
         return self.conn.execute(
             """
@@ -26,3 +37,14 @@ class WeightLogRepository:
             """,
             (user_id, f"-{days} day"),
         ).fetchall()
+
+    def list_between(self, user_id: int, start_date: date, end_date: date) -> list[sqlite3.Row]:
+        return self.conn.execute(
+            """
+            SELECT * FROM weight_logs
+            WHERE user_id = ?
+              AND log_date BETWEEN ? AND ?
+            ORDER BY log_date ASC
+            """,
+            (user_id, start_date.isoformat(), end_date.isoformat()),
+        ).fetchall()
@@ -1,8 +1,11 @@
 ﻿from __future__ import annotations
 
 import sqlite3
+from collections.abc import Iterable
 from datetime import date
 
+from core.models.entities import WorkoutLog
+
 
 class WorkoutLogRepository:
     def __init__(self, conn: sqlite3.Connection) -> None:
@@ -39,6 +42,30 @@ class WorkoutLogRepository:
         self.conn.commit()
         return int(cursor.lastrowid)
 
+    def add_many(self, logs: Iterable[WorkoutLog]) -> int:
+        cursor = self.conn.executemany(
+            """
+            INSERT INTO workout_logs (
+                user_id, log_date, session_type, duration_min, volume_load, avg_rpe, planned_flag, completed_flag
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    log.user_id,
+                    log.log_date.isoformat(),
+                    log.session_type,
+                    log.duration_min,
+                    log.volume_load,
+                    log.avg_rpe,
+                    int(log.planned_flag),
+                    int(log.completed_flag),
+                )
+                for log in logs
+            ],
+        )
+        self.conn.commit()
+        return int(cursor.rowcount)
+
     def list_recent(self, user_id: int, days: int = 28) -> list[sqlite3.Row]:
         return self.conn.execute(
             """
@@ -49,3 +76,14 @@ class WorkoutLogRepository:
             """,
             (user_id, f"-{days} day"),
         ).fetchall()
+
+    def list_between(self, user_id: int, start_date: date, end_date: date) -> list[sqlite3.Row]:
+        return self.conn.execute(
+            """
+            SELECT * FROM workout_logs
+            WHERE user_id = ?
+              AND log_date BETWEEN ? AND ?
+            ORDER BY log_date ASC
+            """,
+            (user_id, start_date.isoformat(), end_date.isoformat()),
+        ).fetchall()
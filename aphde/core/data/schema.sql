@@ -103,4 +103,358 @@ CREATE INDEX IF NOT EXISTS idx_workout_logs_user_log_date ON workout_logs(user_i
 CREATE INDEX IF NOT EXISTS idx_signal_snapshots_user_snapshot_date ON signal_snapshots(user_id, snapshot_date);
 CREATE INDEX IF NOT EXISTS idx_context_inputs_user_log_date ON context_inputs(user_id, log_date);
 CREATE INDEX IF NOT EXISTS idx_decision_runs_user_run_date ON decision_runs(user_id, run_date);
+CREATE INDEX IF NOT EXISTS idx_users_email_lower ON users(lower(email));
 
+CREATE TABLE IF NOT EXISTS user_data_versions (
+    user_id INTEGER PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_goals_data_version_insert
+AFTER INSERT ON goals
+BEGIN
+    INSERT INTO user_data_versions (user_id, version, updated_at)
+    SELECT NEW.user_id, 1, CURRENT_TIMESTAMP WHERE NEW.user_id IS NOT NULL
+    ON CONFLICT(user_id) DO UPDATE SET version = version + 1, updated_at = excluded.updated_at;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_goals_data_version_update
+AFTER UPDATE ON goals
+BEGIN
+    INSERT INTO user_data_versions (user_id, version, updated_at)
+    SELECT NEW.user_id, 1, CURRENT_TIMESTAMP WHERE NEW.user_id IS NOT NULL
+    ON CONFLICT(user_id) DO UPDATE SET version = version + 1, updated_at = excluded.updated_at;
+    INSERT INTO user_data_versions (user_id, version, updated_at)
+    SELECT OLD.user_id, 1, CURRENT_TIMESTAMP WHERE OLD.user_id IS NOT NULL AND OLD.user_id IS NOT NEW.user_id
+    ON CONFLICT(user_id) DO UPDATE SET version = version + 1, updated_at = excluded.updated_at;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_goals_data_version_delete
+AFTER DELETE ON goals
+BEGIN
+    INSERT INTO user_data_versions (user_id, version, updated_at)
+    SELECT OLD.user_id, 1, CURRENT_TIMESTAMP WHERE OLD.user_id IS NOT NULL
+    ON CONFLICT(user_id) DO UPDATE SET version = version + 1, updated_at = excluded.updated_at;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_weight_logs_data_version_insert
+AFTER INSERT ON weight_logs
+BEGIN
+    INSERT INTO user_data_versions (user_id, version, updated_at)
+    SELECT NEW.user_id, 1, CURRENT_TIMESTAMP WHERE NEW.user_id IS NOT NULL
+    ON CONFLICT(user_id) DO UPDATE SET version = version + 1, updated_at = excluded.updated_at;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_weight_logs_data_version_update
+AFTER UPDATE ON weight_logs
+BEGIN
+    INSERT INTO user_data_versions (user_id, version, updated_at)
+    SELECT NEW.user_id, 1, CURRENT_TIMESTAMP WHERE NEW.user_id IS NOT NULL
+    ON CONFLICT(user_id) DO UPDATE SET version = version + 1, updated_at = excluded.updated_at;
+    INSERT INTO user_data_versions (user_id, version, updated_at)
+    SELECT OLD.user_id, 1, CURRENT_TIMESTAMP WHERE OLD.user_id IS NOT NULL AND OLD.user_id IS NOT NEW.user_id
+    ON CONFLICT(user_id) DO UPDATE SET version = version + 1, updated_at = excluded.updated_at;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_weight_logs_data_version_delete
+AFTER DELETE ON weight_logs
+BEGIN
+    INSERT INTO user_data_versions (user_id, version, updated_at)
+    SELECT OLD.user_id, 1, CURRENT_TIMESTAMP WHERE OLD.user_id IS NOT NULL
+    ON CONFLICT(user_id) DO UPDATE SET version = version + 1, updated_at = excluded.updated_at;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_calorie_logs_data_version_insert
+AFTER INSERT ON calorie_logs
+BEGIN
+    INSERT INTO user_data_versions (user_id, version, updated_at)
+    SELECT NEW.user_id, 1, CURRENT_TIMESTAMP WHERE NEW.user_id IS NOT NULL
+    ON CONFLICT(user_id) DO UPDATE SET version = version + 1, updated_at = excluded.updated_at;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_calorie_logs_data_version_update
+AFTER UPDATE ON calorie_logs
+BEGIN
+    INSERT INTO user_data_versions (user_id, version, updated_at)
+    SELECT NEW.user_id, 1, CURRENT_TIMESTAMP WHERE NEW.user_id IS NOT NULL
+    ON CONFLICT(user_id) DO UPDATE SET version = version + 1, updated_at = excluded.updated_at;
+    INSERT INTO user_data_versions (user_id, version, updated_at)
+    SELECT OLD.user_id, 1, CURRENT_TIMESTAMP WHERE OLD.user_id IS NOT NULL AND OLD.user_id IS NOT NEW.user_id
+    ON CONFLICT(user_id) DO UPDATE SET version = version + 1, updated_at = excluded.updated_at;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_calorie_logs_data_version_delete
+AFTER DELETE ON calorie_logs
+BEGIN
+    INSERT INTO user_data_versions (user_id, version, updated_at)
+    SELECT OLD.user_id, 1, CURRENT_TIMESTAMP WHERE OLD.user_id IS NOT NULL
+    ON CONFLICT(user_id) DO UPDATE SET version = version + 1, updated_at = excluded.updated_at;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_workout_logs_data_version_insert
+AFTER INSERT ON workout_logs
+BEGIN
+    INSERT INTO user_data_versions (user_id, version, updated_at)
+    SELECT NEW.user_id, 1, CURRENT_TIMESTAMP WHERE NEW.user_id IS NOT NULL
+    ON CONFLICT(user_id) DO UPDATE SET version = version + 1, updated_at = excluded.updated_at;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_workout_logs_data_version_update
+AFTER UPDATE ON workout_logs
+BEGIN
+    INSERT INTO user_data_versions (user_id, version, updated_at)
+    SELECT NEW.user_id, 1, CURRENT_TIMESTAMP WHERE NEW.user_id IS NOT NULL
+    ON CONFLICT(user_id) DO UPDATE SET version = version + 1, updated_at = excluded.updated_at;
+    INSERT INTO user_data_versions (user_id, version, updated_at)
+    SELECT OLD.user_id, 1, CURRENT_TIMESTAMP WHERE OLD.user_id IS NOT NULL AND OLD.user_id IS NOT NEW.user_id
+    ON CONFLICT(user_id) DO UPDATE SET version = version + 1, updated_at = excluded.updated_at;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_workout_logs_data_version_delete
+AFTER DELETE ON workout_logs
+BEGIN
+    INSERT INTO user_data_versions (user_id, version, updated_at)
+    SELECT OLD.user_id, 1, CURRENT_TIMESTAMP WHERE OLD.user_id IS NOT NULL
+    ON CONFLICT(user_id) DO UPDATE SET version = version + 1, updated_at = excluded.updated_at;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_context_inputs_data_version_insert
+AFTER INSERT ON context_inputs
+BEGIN
+    INSERT INTO user_data_versions (user_id, version, updated_at)
+    SELECT NEW.user_id, 1, CURRENT_TIMESTAMP WHERE NEW.user_id IS NOT NULL
+    ON CONFLICT(user_id) DO UPDATE SET version = version + 1, updated_at = excluded.updated_at;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_context_inputs_data_version_update
+AFTER UPDATE ON context_inputs
+BEGIN
+    INSERT INTO user_data_versions (user_id, version, updated_at)
+    SELECT NEW.user_id, 1, CURRENT_TIMESTAMP WHERE NEW.user_id IS NOT NULL
+    ON CONFLICT(user_id) DO UPDATE SET version = version + 1, updated_at = excluded.updated_at;
+    INSERT INTO user_data_versions (user_id, version, updated_at)
+    SELECT OLD.user_id, 1, CURRENT_TIMESTAMP WHERE OLD.user_id IS NOT NULL AND OLD.user_id IS NOT NEW.user_id
+    ON CONFLICT(user_id) DO UPDATE SET version = version + 1, updated_at = excluded.updated_at;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_context_inputs_data_version_delete
+AFTER DELETE ON context_inputs
+BEGIN
+    INSERT INTO user_data_versions (user_id, version, updated_at)
+    SELECT OLD.user_id, 1, CURRENT_TIMESTAMP WHERE OLD.user_id IS NOT NULL
+    ON CONFLICT(user_id) DO UPDATE SET version = version + 1, updated_at = excluded.updated_at;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_decision_runs_data_version_insert
+AFTER INSERT ON decision_runs
+BEGIN
+    INSERT INTO user_data_versions (user_id, version, updated_at)
+    SELECT NEW.user_id, 1, CURRENT_TIMESTAMP WHERE NEW.user_id IS NOT NULL
+    ON CONFLICT(user_id) DO UPDATE SET version = version + 1, updated_at = excluded.updated_at;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_decision_runs_data_version_update
+AFTER UPDATE ON decision_runs
+BEGIN
+    INSERT INTO user_data_versions (user_id, version, updated_at)
+    SELECT NEW.user_id, 1, CURRENT_TIMESTAMP WHERE NEW.user_id IS NOT NULL
+    ON CONFLICT(user_id) DO UPDATE SET version = version + 1, updated_at = excluded.updated_at;
+    INSERT INTO user_data_versions (user_id, version, updated_at)
+    SELECT OLD.user_id, 1, CURRENT_TIMESTAMP WHERE OLD.user_id IS NOT NULL AND OLD.user_id IS NOT NEW.user_id
+    ON CONFLICT(user_id) DO UPDATE SET version = version + 1, updated_at = excluded.updated_at;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_decision_runs_data_version_delete
+AFTER DELETE ON decision_runs
+BEGIN
+    INSERT INTO user_data_versions (user_id, version, updated_at)
+    SELECT OLD.user_id, 1, CURRENT_TIMESTAMP WHERE OLD.user_id IS NOT NULL
+    ON CONFLICT(user_id) DO UPDATE SET version = version + 1, updated_at = excluded.updated_at;
+END;
+
+CREATE TABLE IF NOT EXISTS decision_replays (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    engine_version TEXT NOT NULL,
+    user_id INTEGER NOT NULL,
+    goal_id INTEGER NOT NULL,
+    replay_date TEXT NOT NULL,
+    alignment_score REAL NOT NULL,
+    risk_score REAL NOT NULL,
+    alignment_confidence REAL NOT NULL,
+    recommendations_json TEXT NOT NULL,
+    confidence_version TEXT NOT NULL,
+    context_applied INTEGER NOT NULL DEFAULT 0,
+    trace_json TEXT NOT NULL,
+    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (engine_version, user_id, replay_date),
+    FOREIGN KEY (user_id) REFERENCES users(id),
+    FOREIGN KEY (goal_id) REFERENCES goals(id)
+);
+
+CREATE TABLE IF NOT EXISTS shadow_divergence_stats (
+    primary_engine_version TEXT NOT NULL,
+    candidate_engine_version TEXT NOT NULL,
+    runs INTEGER NOT NULL DEFAULT 0,
+    identical_runs INTEGER NOT NULL DEFAULT 0,
+    alignment_abs_delta_sum REAL NOT NULL DEFAULT 0.0,
+    alignment_abs_delta_max REAL NOT NULL DEFAULT 0.0,
+    risk_abs_delta_sum REAL NOT NULL DEFAULT 0.0,
+    risk_abs_delta_max REAL NOT NULL DEFAULT 0.0,
+    confidence_abs_delta_sum REAL NOT NULL DEFAULT 0.0,
+    confidence_abs_delta_max REAL NOT NULL DEFAULT 0.0,
+    recommendation_set_changes INTEGER NOT NULL DEFAULT 0,
+    rank_shift_runs INTEGER NOT NULL DEFAULT 0,
+    context_changes INTEGER NOT NULL DEFAULT 0,
+    failures INTEGER NOT NULL DEFAULT 0,
+    skipped_budget INTEGER NOT NULL DEFAULT 0,
+    skipped_backlog INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (primary_engine_version, candidate_engine_version)
+);
+
+CREATE TABLE IF NOT EXISTS auth_sessions (
+    token_id TEXT PRIMARY KEY,
+    user_id INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+    expires_at TEXT NOT NULL,
+    revoked_at TEXT,
+    FOREIGN KEY (user_id) REFERENCES users(id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_auth_sessions_user ON auth_sessions(user_id);
+
+CREATE TABLE IF NOT EXISTS login_throttle (
+    scope TEXT NOT NULL,
+    key_hash TEXT NOT NULL,
+    window_index INTEGER NOT NULL,
+    current_count INTEGER NOT NULL DEFAULT 0,
+    previous_count INTEGER NOT NULL DEFAULT 0,
+    locked_until REAL NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (scope, key_hash)
+);
+
+CREATE TABLE IF NOT EXISTS insight_alerts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    alert_id TEXT NOT NULL,
+    alert_type TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    alert_json TEXT NOT NULL,
+    first_triggered_at TEXT NOT NULL,
+    last_triggered_at TEXT NOT NULL,
+    first_decision_id INTEGER,
+    last_decision_id INTEGER,
+    resolved_at TEXT,
+    FOREIGN KEY (user_id) REFERENCES users(id)
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_insight_alerts_active
+ON insight_alerts(user_id, alert_id) WHERE resolved_at IS NULL;
+
+CREATE TABLE IF NOT EXISTS insight_detector_state (
+    user_id INTEGER PRIMARY KEY,
+    detector_version TEXT NOT NULL,
+    last_decision_id INTEGER NOT NULL,
+    state_json TEXT NOT NULL,
+    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users(id)
+);
+
+CREATE TABLE IF NOT EXISTS insight_weekly_aggregates (
+    user_id INTEGER NOT NULL,
+    iso_week TEXT NOT NULL,
+    week_start TEXT NOT NULL,
+    sessions_planned INTEGER NOT NULL DEFAULT 0,
+    sessions_completed INTEGER NOT NULL DEFAULT 0,
+    run_count INTEGER NOT NULL DEFAULT 0,
+    signals_json TEXT NOT NULL DEFAULT '{}',
+    volatility_direction TEXT NOT NULL DEFAULT 'flat',
+    last_decision_id INTEGER,
+    PRIMARY KEY (user_id, iso_week),
+    FOREIGN KEY (user_id) REFERENCES users(id)
+);
+
+CREATE TABLE IF NOT EXISTS insight_weekly_state (
+    user_id INTEGER PRIMARY KEY,
+    aggregate_version TEXT NOT NULL,
+    last_decision_id INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users(id)
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_workout_logs_weekly_insert
+AFTER INSERT ON workout_logs
+BEGIN
+    INSERT INTO insight_weekly_aggregates (user_id, iso_week, week_start, sessions_planned, sessions_completed)
+    SELECT NEW.user_id, printf('%04d-W%02d', CAST(strftime('%Y', date(NEW.log_date, 'weekday 0', '-3 days')) AS INTEGER), (CAST(strftime('%j', date(NEW.log_date, 'weekday 0', '-3 days')) AS INTEGER) - 1) / 7 + 1), date(NEW.log_date, 'weekday 0', '-6 days'),
+           (NEW.planned_flag != 0), (NEW.planned_flag != 0 AND NEW.completed_flag != 0)
+    WHERE NEW.user_id IS NOT NULL
+    ON CONFLICT(user_id, iso_week) DO UPDATE SET
+        sessions_planned = sessions_planned + excluded.sessions_planned,
+        sessions_completed = sessions_completed + excluded.sessions_completed;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_workout_logs_weekly_update
+AFTER UPDATE ON workout_logs
+BEGIN
+    INSERT INTO insight_weekly_aggregates (user_id, iso_week, week_start, sessions_planned, sessions_completed)
+    SELECT OLD.user_id, printf('%04d-W%02d', CAST(strftime('%Y', date(OLD.log_date, 'weekday 0', '-3 days')) AS INTEGER), (CAST(strftime('%j', date(OLD.log_date, 'weekday 0', '-3 days')) AS INTEGER) - 1) / 7 + 1), date(OLD.log_date, 'weekday 0', '-6 days'),
+           -(OLD.planned_flag != 0), -(OLD.planned_flag != 0 AND OLD.completed_flag != 0)
+    WHERE OLD.user_id IS NOT NULL
+    ON CONFLICT(user_id, iso_week) DO UPDATE SET
+        sessions_planned = sessions_planned + excluded.sessions_planned,
+        sessions_completed = sessions_completed + excluded.sessions_completed;
+    INSERT INTO insight_weekly_aggregates (user_id, iso_week, week_start, sessions_planned, sessions_completed)
+    SELECT NEW.user_id, printf('%04d-W%02d', CAST(strftime('%Y', date(NEW.log_date, 'weekday 0', '-3 days')) AS INTEGER), (CAST(strftime('%j', date(NEW.log_date, 'weekday 0', '-3 days')) AS INTEGER) - 1) / 7 + 1), date(NEW.log_date, 'weekday 0', '-6 days'),
+           (NEW.planned_flag != 0), (NEW.planned_flag != 0 AND NEW.completed_flag != 0)
+    WHERE NEW.user_id IS NOT NULL
+    ON CONFLICT(user_id, iso_week) DO UPDATE SET
+        sessions_planned = sessions_planned + excluded.sessions_planned,
+        sessions_completed = sessions_completed + excluded.sessions_completed;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_workout_logs_weekly_delete
+AFTER DELETE ON workout_logs
+BEGIN
+    INSERT INTO insight_weekly_aggregates (user_id, iso_week, week_start, sessions_planned, sessions_completed)
+    SELECT OLD.user_id, printf('%04d-W%02d', CAST(strftime('%Y', date(OLD.log_date, 'weekday 0', '-3 days')) AS INTEGER), (CAST(strftime('%j', date(OLD.log_date, 'weekday 0', '-3 days')) AS INTEGER) - 1) / 7 + 1), date(OLD.log_date, 'weekday 0', '-6 days'),
+           -(OLD.planned_flag != 0), -(OLD.planned_flag != 0 AND OLD.completed_flag != 0)
+    WHERE OLD.user_id IS NOT NULL
+    ON CONFLICT(user_id, iso_week) DO UPDATE SET
+        sessions_planned = sessions_planned + excluded.sessions_planned,
+        sessions_completed = sessions_completed + excluded.sessions_completed;
+END;
+
+CREATE TABLE IF NOT EXISTS recommendation_persistence (
+    user_id INTEGER PRIMARY KEY,
+    window_runs INTEGER NOT NULL,
+    last_decision_id INTEGER NOT NULL,
+    window_json TEXT NOT NULL,
+    counts_json TEXT NOT NULL,
+    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users(id)
+);
+
+CREATE TABLE IF NOT EXISTS tomorrow_plans (
+    user_id INTEGER PRIMARY KEY,
+    decision_id INTEGER NOT NULL,
+    plan_json TEXT NOT NULL,
+    computed_at TEXT NOT NULL,
+    FOREIGN KEY (user_id) REFERENCES users(id)
+);
+
+CREATE TABLE IF NOT EXISTS precomputed_views (
+    user_id INTEGER NOT NULL,
+    view_name TEXT NOT NULL,
+    recent_limit INTEGER NOT NULL,
+    view_version TEXT NOT NULL DEFAULT '',
+    decision_id INTEGER NOT NULL,
+    data_version INTEGER NOT NULL,
+    as_of TEXT NOT NULL,
+    payload_json TEXT NOT NULL,
+    computed_at TEXT NOT NULL,
+    PRIMARY KEY (user_id, view_name, recent_limit),
+    FOREIGN KEY (user_id) REFERENCES users(id)
+);
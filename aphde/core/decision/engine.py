@@ -1,7 +1,9 @@
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable
 
+from core.context.base import ContextResult
 from core.context.registry import apply_context
+from core.decision.fallbacks import maintenance_fallback_candidates
 from core.decision.ranker import rank_recommendations
 from core.decision.rules import detect_additional_risks
 from core.engine.pipeline import ContextComputation
@@ -38,12 +40,14 @@ def _adapt_context_for_health(
     target: dict[str, Any],
     evaluation: dict[str, Any],
     context_input: dict[str, Any] | None,
+    *,
+    context_resolver: Callable[..., ContextResult] = apply_context,
 ) -> ContextComputation:
     base_thresholds = {
         "max_volatility": float(target.get("max_volatility", 0.08)),
         "min_recovery": float(target.get("min_recovery", 0.55)),
     }
-    context_result = apply_context(
+    context_result = context_resolver(
         goal_type=strategy.goal_name,
         base_thresholds=base_thresholds,
         score_inputs={"priority_score": float(evaluation.get("priority_score", 0.5))},
@@ -94,6 +98,35 @@ def _build_health_signal_payload(signals: SignalBundle, evaluation: dict[str, An
     }
 
 
+def health_pipeline_stages() -> dict[str, Any]:
+    """Stage callables `run_decision_engine` wires into `run_engine_pipeline`."""
+
+    return {
+        "context_adapter": _adapt_context_for_health,
+        "additional_risk_detector": detect_additional_risks,
+        "recommendation_ranker": lambda recommendations, urgency: rank_recommendations(
+            recommendations, urgency=urgency
+        ),
+        "recommendation_serializer": recommendations_to_dicts,
+        "score_breakdown_builder": build_score_breakdown,
+        "penalty_extractor": penalties_from_breakdown,
+        "alignment_scorer": compute_alignment_score,
+        "confidence_calculator": compute_confidence,
+        "computed_signal_builder": _build_health_signal_payload,
+        "trace_builder": build_trace,
+        "fallback_provider": maintenance_fallback_candidates,
+    }
+
+
+def available_observation_days(input_summary: dict[str, Any]) -> int:
+    return max(
+        int(input_summary.get("weight_log_count", 0)),
+        int(input_summary.get("workout_log_count", 0)),
+        int(input_summary.get("calorie_log_count", 0)),
+        0,
+    )
+
+
 def run_decision_engine(
     *,
     strategy: GoalStrategy,
@@ -105,12 +138,6 @@ def run_decision_engine(
     previous_alignment_confidence: float | None = None,
     engine_version: str = "v1",
 ) -> DecisionResult:
-    available_days = max(
-        int(input_summary.get("weight_log_count", 0)),
-        int(input_summary.get("workout_log_count", 0)),
-        int(input_summary.get("calorie_log_count", 0)),
-        0,
-    )
     output = run_engine_pipeline(
         strategy=strategy,
         signals=signals,
@@ -120,20 +147,9 @@ def run_decision_engine(
         history=history,
         previous_alignment_confidence=previous_alignment_confidence,
         engine_version=engine_version,
-        available_observation_count=available_days,
+        available_observation_count=available_observation_days(input_summary),
         required_observation_count=7,
-        context_adapter=_adapt_context_for_health,
-        additional_risk_detector=detect_additional_risks,
-        recommendation_ranker=lambda recommendations, urgency: rank_recommendations(
-            recommendations, urgency=urgency
-        ),
-        recommendation_serializer=recommendations_to_dicts,
-        score_breakdown_builder=build_score_breakdown,
-        penalty_extractor=penalties_from_breakdown,
-        alignment_scorer=compute_alignment_score,
-        confidence_calculator=compute_confidence,
-        computed_signal_builder=_build_health_signal_payload,
-        trace_builder=build_trace,
+        **health_pipeline_stages(),
     )
 
     return DecisionResult(
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from collections.abc import Collection
+from dataclasses import dataclass
+from functools import lru_cache
+
+from core.models.entities import Recommendation
+from core.models.enums import RecommendationCategory
+
+
+MAINTENANCE_REASON_CODE = "MAINTENANCE_FALLBACK"
+# Urgency in [0, 1] is split into this many equal buckets for the confidence memo.
+URGENCY_BUCKETS = 1 << 16
+
+
+@dataclass(frozen=True, slots=True)
+class FallbackTemplate:
+    rec_id: str
+    category: RecommendationCategory
+    action: str
+    expected_effect: str
+    confidence_offset: float
+
+
+MAINTENANCE_FALLBACK_CATALOG: tuple[FallbackTemplate, ...] = (
+    FallbackTemplate(
+        rec_id="maintain_progression",
+        category=RecommendationCategory.HABIT,
+        action="Maintain current progression with consistent session execution.",
+        expected_effect="Stabilizes short-window variance and improves next-run reliability.",
+        confidence_offset=0.0,
+    ),
+    FallbackTemplate(
+        rec_id="incremental_overload",
+        category=RecommendationCategory.TRAINING,
+        action="Apply a small incremental overload only if recovery remains stable.",
+        expected_effect="Supports controlled progression without abrupt fatigue spikes.",
+        confidence_offset=0.03,
+    ),
+    FallbackTemplate(
+        rec_id="calorie_target_band",
+        category=RecommendationCategory.NUTRITION,
+        action="Keep calorie intake within the configured target band.",
+        expected_effect="Reduces behavioral drift and maintains signal consistency.",
+        confidence_offset=0.05,
+    ),
+    FallbackTemplate(
+        rec_id="recovery_consistency",
+        category=RecommendationCategory.RECOVERY,
+        action="Preserve recovery consistency across sleep and low-intensity sessions.",
+        expected_effect="Supports resilience and lowers volatility in recovery signals.",
+        confidence_offset=0.02,
+    ),
+)
+
+
+def _clamp01(value: float) -> float:
+    return max(0.0, min(1.0, value))
+
+
+def _exact_confidences(urgency: float) -> tuple[float, ...]:
+    base_conf = _clamp01(0.58 + (0.22 * (1.0 - urgency)))
+    return tuple(round(_clamp01(base_conf - template.confidence_offset), 4) for template in MAINTENANCE_FALLBACK_CATALOG)
+
+
+@lru_cache(maxsize=URGENCY_BUCKETS)
+def _bucket_confidences(bucket: int) -> tuple[float, ...] | None:
+    # The formula is monotone in urgency, so equal results at both bucket edges
+    # mean every urgency inside the bucket rounds to the same confidences.
+    low = _exact_confidences(bucket / URGENCY_BUCKETS)
+    high = _exact_confidences((bucket + 1) / URGENCY_BUCKETS)
+    return low if low == high else None
+
+
+def fallback_confidences(urgency: float) -> tuple[float, ...]:
+    """Per-template confidences, identical to evaluating the formula at `urgency`."""
+
+    if 0.0 <= urgency < 1.0:
+        cached = _bucket_confidences(int(urgency * URGENCY_BUCKETS))
+        if cached is not None:
+            return cached
+    return _exact_confidences(urgency)
+
+
+def maintenance_fallback_candidates(
+    *,
+    urgency: float,
+    exclude_ids: Collection[str] = (),
+    limit: int | None = None,
+    priority: int = 99,
+) -> list[Recommendation]:
+    """Build only the first `limit` catalog entries not in `exclude_ids`, in catalog order."""
+
+    confidences = fallback_confidences(urgency)
+    candidates: list[Recommendation] = []
+    for template, confidence in zip(MAINTENANCE_FALLBACK_CATALOG, confidences):
+        if limit is not None and len(candidates) >= limit:
+            break
+        if template.rec_id in exclude_ids:
+            continue
+        candidates.append(
+            Recommendation(
+                rec_id=template.rec_id,
+                priority=priority,
+                category=template.category,
+                action=template.action,
+                expected_effect=template.expected_effect,
+                reason_codes=[MAINTENANCE_REASON_CODE],
+                confidence=confidence,
+            )
+        )
+    return candidates
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from typing import Any
+
+
+def history_from_decision_rows(rows: Iterable[Any]) -> list[dict[str, Any]]:
+    """Deviation history the engine reads, from `decision_runs` rows with a `trace_json` column."""
+
+    history: list[dict[str, Any]] = []
+    for row in rows:
+        trace_raw = row["trace_json"] if "trace_json" in row.keys() else None
+        if not trace_raw:
+            continue
+        try:
+            trace = json.loads(trace_raw)
+        except (TypeError, json.JSONDecodeError):
+            continue
+        history.append(
+            {
+                "deviations": trace.get("deviations", trace.get("computed_signals", {}).get("deviations", {})),
+                "triggered_rules": trace.get("triggered_rules", []),
+            }
+        )
+    return history
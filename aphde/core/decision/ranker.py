@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import replace
+from functools import lru_cache
 
 from core.models.entities import Recommendation
 from core.models.enums import RecommendationCategory
@@ -20,6 +21,66 @@ _CATEGORY_EFFORT = {
     RecommendationCategory.HABIT: 0.4,
 }
 
+_DEFAULT_IMPACT = 0.6
+_DEFAULT_EFFORT = 0.5
+
+
+@lru_cache(maxsize=32)
+def _category_terms(impact_weight: float, effort_weight: float) -> dict[RecommendationCategory, tuple[float, float]]:
+    return {
+        category: (
+            impact_weight * _CATEGORY_IMPACT.get(category, _DEFAULT_IMPACT),
+            effort_weight * _CATEGORY_EFFORT.get(category, _DEFAULT_EFFORT),
+        )
+        for category in RecommendationCategory
+    }
+
+
+class RankedRecommendation:
+    """
+    Read-only view of a `Recommendation` at its ranked position.
+
+    Carries the assigned `priority` and ranking `score` and reads every other
+    field from the wrapped recommendation, so ranking does not copy it.
+    """
+
+    __slots__ = ("recommendation", "priority", "score")
+
+    def __init__(self, recommendation: Recommendation, priority: int, score: float) -> None:
+        self.recommendation = recommendation
+        self.priority = priority
+        self.score = score
+
+    @property
+    def rec_id(self) -> str:
+        return self.recommendation.rec_id
+
+    @property
+    def category(self) -> RecommendationCategory:
+        return self.recommendation.category
+
+    @property
+    def action(self) -> str:
+        return self.recommendation.action
+
+    @property
+    def expected_effect(self) -> str:
+        return self.recommendation.expected_effect
+
+    @property
+    def reason_codes(self) -> list[str]:
+        return self.recommendation.reason_codes
+
+    @property
+    def confidence(self) -> float:
+        return self.recommendation.confidence
+
+    def to_recommendation(self) -> Recommendation:
+        return replace(self.recommendation, priority=self.priority)
+
+    def __repr__(self) -> str:
+        return f"RankedRecommendation(rec_id={self.rec_id!r}, priority={self.priority}, score={self.score:.4f})"
+
 
 def rank_recommendations(
     recommendations: list[Recommendation],
@@ -29,21 +90,18 @@ def rank_recommendations(
     impact_weight: float = 0.4,
     urgency_weight: float = 0.2,
     effort_weight: float = 0.15,
-) -> list[Recommendation]:
-    scored: list[tuple[float, Recommendation]] = []
+) -> list[RankedRecommendation]:
+    category_terms = _category_terms(impact_weight, effort_weight)
+    fallback_terms = (impact_weight * _DEFAULT_IMPACT, effort_weight * _DEFAULT_EFFORT)
+    urgency_term = urgency_weight * max(0.0, min(1.0, urgency))
+    scores: list[float] = []
     for rec in recommendations:
-        impact = _CATEGORY_IMPACT.get(rec.category, 0.6)
-        effort = _CATEGORY_EFFORT.get(rec.category, 0.5)
-        score = (
-            impact_weight * impact
-            + urgency_weight * max(0.0, min(1.0, urgency))
-            + confidence_weight * max(0.0, min(1.0, rec.confidence))
-            - effort_weight * effort
-        )
-        scored.append((score, rec))
-
-    scored.sort(key=lambda t: t[0], reverse=True)
-    ranked: list[Recommendation] = []
-    for idx, (_, rec) in enumerate(scored, start=1):
-        ranked.append(replace(rec, priority=idx))
-    return ranked
+        impact_term, effort_term = category_terms.get(rec.category, fallback_terms)
+        # Same operation order as the unrolled formula, so ties break identically.
+        scores.append(impact_term + urgency_term + confidence_weight * max(0.0, min(1.0, rec.confidence)) - effort_term)
+    # Stable sort: equal scores keep their input order.
+    order = sorted(range(len(recommendations)), key=scores.__getitem__, reverse=True)
+    return [
+        RankedRecommendation(recommendations[index], priority, scores[index])
+        for priority, index in enumerate(order, start=1)
+    ]
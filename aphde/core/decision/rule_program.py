@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Any
+
+import numpy as np
+
+from core.models.entities import Recommendation
+from core.models.enums import RecommendationCategory
+
+
+SIGNAL_NAMES: tuple[str, ...] = (
+    "trend_slope",
+    "volatility_index",
+    "compliance_ratio",
+    "muscle_balance_index",
+    "recovery_index",
+    "progressive_overload_score",
+)
+_SIGNAL_INDEX = {name: index for index, name in enumerate(SIGNAL_NAMES)}
+_signal_getter = attrgetter(*SIGNAL_NAMES)
+COMPARATORS: tuple[str, ...] = ("<", ">")
+
+
+@dataclass(frozen=True, slots=True)
+class RecommendationTemplate:
+    """Static part of a recommendation; only `reason_codes` vary per run."""
+
+    rec_id: str
+    priority: int
+    category: RecommendationCategory
+    action: str
+    expected_effect: str
+    confidence: float
+
+    def build(self, reason_codes: list[str]) -> Recommendation:
+        return Recommendation(
+            rec_id=self.rec_id,
+            priority=self.priority,
+            category=self.category,
+            action=self.action,
+            expected_effect=self.expected_effect,
+            reason_codes=reason_codes,
+            confidence=self.confidence,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Rule:
+    """
+    `name` is the deviation key. The rule fires when `signal` (or `abs(signal)`
+    with `absolute`) compares `comparator` against the `threshold` value. A
+    missing signal is replaced by `missing`; with `missing=None` it never fires.
+    """
+
+    name: str
+    signal: str
+    comparator: str
+    threshold: str
+    risk_code: str | None = None
+    recommendation: RecommendationTemplate | None = None
+    missing: float | None = None
+    absolute: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class RuleProgram:
+    """
+    Flat, compiled form of a rule list.
+
+    Risk codes are emitted in `risk_codes` order (first appearance in the rule
+    list), regardless of which of their rules fired. Recommendation templates
+    are ordered by priority.
+    """
+
+    rules: tuple[Rule, ...]
+    threshold_keys: tuple[str, ...]
+    default_thresholds: tuple[float, ...]
+    risk_codes: tuple[str, ...]
+    recommendation_templates: tuple[tuple[str, RecommendationTemplate], ...]
+    # (name, signal index, missing, absolute, less-than, threshold index, risk index or -1)
+    _ops: tuple[tuple[str, int, float | None, bool, bool, int, int], ...]
+    _signal_index: np.ndarray
+    _missing: np.ndarray
+    _absolute: np.ndarray
+    _less: np.ndarray
+    _threshold_index: np.ndarray
+    _risk_matrix: np.ndarray
+
+    def resolve_thresholds(self, target: Mapping[str, Any] | None) -> tuple[float, ...]:
+        if not target:
+            return self.default_thresholds
+        return tuple(
+            float(target.get(key, default)) for key, default in zip(self.threshold_keys, self.default_thresholds)
+        )
+
+    def evaluate(
+        self,
+        values: Sequence[float | None],
+        thresholds: Sequence[float],
+    ) -> tuple[dict[str, bool], list[str]]:
+        """Evaluate one signal vector (`SIGNAL_NAMES` order, None for missing)."""
+
+        deviations: dict[str, bool] = {}
+        risk_hits = [False] * len(self.risk_codes)
+        for name, signal_index, missing, absolute, less, threshold_index, risk_index in self._ops:
+            value = values[signal_index]
+            if value is None:
+                if missing is None:
+                    deviations[name] = False
+                    continue
+                value = missing
+            value = float(value)
+            if absolute:
+                value = abs(value)
+            hit = value < thresholds[threshold_index] if less else value > thresholds[threshold_index]
+            deviations[name] = hit
+            if hit and risk_index >= 0:
+                risk_hits[risk_index] = True
+        return deviations, [code for code, hit in zip(self.risk_codes, risk_hits) if hit]
+
+    def evaluate_batch(self, signal_matrix: np.ndarray, thresholds: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluate many signal vectors at once. `signal_matrix` is (n, len(SIGNAL_NAMES))
+        with NaN for missing signals; `thresholds` is (len(threshold_keys),) or
+        (n, len(threshold_keys)). Returns boolean (n, rules) deviations and
+        (n, risk codes) risks.
+        """
+
+        values = np.asarray(signal_matrix, dtype=np.float64)[:, self._signal_index]
+        values = np.where(np.isnan(values), self._missing, values)
+        values = np.where(self._absolute, np.abs(values), values)
+        limits = np.asarray(thresholds, dtype=np.float64)[..., self._threshold_index]
+        # NaN (a missing signal without a substitute) compares False both ways.
+        deviations = np.where(self._less, values < limits, values > limits)
+        risks = (deviations.astype(np.int32) @ self._risk_matrix) > 0
+        return deviations, risks
+
+    def threshold_matrix(self, targets: Sequence[Mapping[str, Any] | None]) -> np.ndarray:
+        return np.array([self.resolve_thresholds(target) for target in targets], dtype=np.float64).reshape(
+            len(targets), len(self.threshold_keys)
+        )
+
+    def risk_lists(self, risks: np.ndarray) -> list[list[str]]:
+        return [[self.risk_codes[index] for index in np.flatnonzero(row)] for row in risks]
+
+
+def signal_vector(signals: Any) -> tuple[float | None, ...]:
+    return _signal_getter(signals)
+
+
+def signal_matrix(bundles: Sequence[Any]) -> np.ndarray:
+    matrix = np.full((len(bundles), len(SIGNAL_NAMES)), np.nan, dtype=np.float64)
+    for row, signals in enumerate(bundles):
+        for column, name in enumerate(SIGNAL_NAMES):
+            value = getattr(signals, name)
+            if value is not None:
+                matrix[row, column] = value
+    return matrix
+
+
+def compile_rules(rules: Sequence[Rule], thresholds: Sequence[tuple[str, float]]) -> RuleProgram:
+    """`thresholds` is the ordered (key, default) table that `Rule.threshold` refers to."""
+
+    threshold_keys = tuple(key for key, _ in thresholds)
+    threshold_position = {key: index for index, key in enumerate(threshold_keys)}
+    risk_codes: list[str] = []
+    ops: list[tuple[str, int, float | None, bool, bool, int, int]] = []
+    for rule in rules:
+        if rule.signal not in _SIGNAL_INDEX:
+            raise ValueError(f"Unknown signal '{rule.signal}' in rule '{rule.name}'")
+        if rule.comparator not in COMPARATORS:
+            raise ValueError(f"Unsupported comparator '{rule.comparator}' in rule '{rule.name}'")
+        if rule.threshold not in threshold_position:
+            raise ValueError(f"Unknown threshold '{rule.threshold}' in rule '{rule.name}'")
+        risk_index = -1
+        if rule.risk_code is not None:
+            if rule.risk_code not in risk_codes:
+                risk_codes.append(rule.risk_code)
+            risk_index = risk_codes.index(rule.risk_code)
+        ops.append(
+            (
+                rule.name,
+                _SIGNAL_INDEX[rule.signal],
+                None if rule.missing is None else float(rule.missing),
+                rule.absolute,
+                rule.comparator == "<",
+                threshold_position[rule.threshold],
+                risk_index,
+            )
+        )
+
+    risk_matrix = np.zeros((len(ops), len(risk_codes)), dtype=np.int32)
+    for row, op in enumerate(ops):
+        if op[6] >= 0:
+            risk_matrix[row, op[6]] = 1
+    templates = sorted(
+        ((rule.name, rule.recommendation) for rule in rules if rule.recommendation is not None),
+        key=lambda item: item[1].priority,
+    )
+    return RuleProgram(
+        rules=tuple(rules),
+        threshold_keys=threshold_keys,
+        default_thresholds=tuple(float(default) for _, default in thresholds),
+        risk_codes=tuple(risk_codes),
+        recommendation_templates=tuple(templates),
+        _ops=tuple(ops),
+        _signal_index=np.array([op[1] for op in ops], dtype=np.intp),
+        _missing=np.array([np.nan if op[2] is None else op[2] for op in ops], dtype=np.float64),
+        _absolute=np.array([op[3] for op in ops], dtype=bool),
+        _less=np.array([op[4] for op in ops], dtype=bool),
+        _threshold_index=np.array([op[5] for op in ops], dtype=np.intp),
+        _risk_matrix=risk_matrix,
+    )
@@ -1,17 +1,52 @@
 from __future__ import annotations
 
+from core.decision.rule_program import Rule, compile_rules, signal_vector
 from core.models.enums import RiskCode
 from core.signals.aggregator import SignalBundle
 
 
+ADDITIONAL_RISK_THRESHOLDS: tuple[tuple[str, float], ...] = (
+    ("min_recovery", 0.45),
+    ("min_compliance", 0.65),
+    ("max_volatility", 0.10),
+    ("min_overload", 0.5),
+)
+
+# Goal-independent checks; a missing signal never raises a risk here.
+ADDITIONAL_RISK_RULES: tuple[Rule, ...] = (
+    Rule(
+        name="recovery_low",
+        signal="recovery_index",
+        comparator="<",
+        threshold="min_recovery",
+        risk_code=RiskCode.RECOVERY_DROP.value,
+    ),
+    Rule(
+        name="compliance_low",
+        signal="compliance_ratio",
+        comparator="<",
+        threshold="min_compliance",
+        risk_code=RiskCode.COMPLIANCE_DROP.value,
+    ),
+    Rule(
+        name="volatility_high",
+        signal="volatility_index",
+        comparator=">",
+        threshold="max_volatility",
+        risk_code=RiskCode.VOLATILITY_SPIKE.value,
+    ),
+    Rule(
+        name="overload_low",
+        signal="progressive_overload_score",
+        comparator="<",
+        threshold="min_overload",
+        risk_code=RiskCode.STALL_RISK.value,
+    ),
+)
+
+ADDITIONAL_RISK_PROGRAM = compile_rules(ADDITIONAL_RISK_RULES, ADDITIONAL_RISK_THRESHOLDS)
+
+
 def detect_additional_risks(signals: SignalBundle) -> list[str]:
-    risks: list[str] = []
-    if signals.recovery_index is not None and signals.recovery_index < 0.45:
-        risks.append(RiskCode.RECOVERY_DROP.value)
-    if signals.compliance_ratio is not None and signals.compliance_ratio < 0.65:
-        risks.append(RiskCode.COMPLIANCE_DROP.value)
-    if signals.volatility_index is not None and signals.volatility_index > 0.10:
-        risks.append(RiskCode.VOLATILITY_SPIKE.value)
-    if signals.progressive_overload_score is not None and signals.progressive_overload_score < 0.5:
-        risks.append(RiskCode.STALL_RISK.value)
-    return sorted(set(risks))
+    _, risks = ADDITIONAL_RISK_PROGRAM.evaluate(signal_vector(signals), ADDITIONAL_RISK_PROGRAM.default_thresholds)
+    return sorted(risks)
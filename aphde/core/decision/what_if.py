@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import itertools
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field, replace
+from functools import partial
+from typing import Any
+
+from core.context.base import ContextResult
+from core.context.registry import apply_context
+from core.decision.engine import available_observation_days, health_pipeline_stages
+from core.decision.rule_program import SIGNAL_NAMES, signal_vector
+from core.engine.pipeline import EngineRunOutput
+from core.engine.simulation import simulate_engine_pipeline
+from core.scoring.confidence import compute_confidence, history_deviation_patterns
+from core.signals.aggregator import SignalBundle
+from core.strategies.base import GoalStrategy
+
+
+AXIS_MODES: tuple[str, ...] = ("set", "delta")
+# Perturbed values are clamped into each signal's natural range (None = unbounded).
+SIGNAL_BOUNDS: dict[str, tuple[float | None, float | None]] = {
+    "trend_slope": (None, None),
+    "volatility_index": (0.0, None),
+    "compliance_ratio": (0.0, 1.0),
+    "muscle_balance_index": (0.0, 1.0),
+    "recovery_index": (0.0, 1.0),
+    "progressive_overload_score": (0.0, 1.0),
+}
+RESULT_COLUMNS: tuple[str, ...] = (
+    "alignment_score",
+    "risk_score",
+    "alignment_confidence",
+    "alignment_delta",
+    "risk_delta",
+    "triggered_rules",
+    "recommendation_ids",
+)
+MAX_GRID_POINTS = 10_000
+
+
+@dataclass(frozen=True, slots=True)
+class WhatIfAxis:
+    """One grid dimension: `values` replace the signal (`set`) or are added to it (`delta`)."""
+
+    signal: str
+    values: tuple[float, ...]
+    mode: str = "set"
+
+
+@dataclass(slots=True)
+class WhatIfTable:
+    """
+    One row per grid point, in grid order: the axis values followed by
+    `RESULT_COLUMNS`. Deltas are relative to `baseline`.
+    """
+
+    columns: tuple[str, ...]
+    rows: list[tuple[Any, ...]]
+    baseline: dict[str, Any] = field(default_factory=dict)
+    unique_evaluations: int = 0
+
+    def to_records(self) -> list[dict[str, Any]]:
+        return [dict(zip(self.columns, row)) for row in self.rows]
+
+
+def _clamp_signal(name: str, value: float) -> float:
+    low, high = SIGNAL_BOUNDS[name]
+    if low is not None and value < low:
+        return low
+    if high is not None and value > high:
+        return high
+    return value
+
+
+def _validate_axes(axes: Sequence[WhatIfAxis], base_signals: SignalBundle) -> None:
+    seen: set[str] = set()
+    for axis in axes:
+        if axis.signal not in SIGNAL_BOUNDS:
+            raise ValueError(f"Unknown signal '{axis.signal}'")
+        if axis.signal in seen:
+            raise ValueError(f"Signal '{axis.signal}' appears on more than one axis")
+        if axis.mode not in AXIS_MODES:
+            raise ValueError(f"Unsupported axis mode '{axis.mode}'")
+        if not axis.values:
+            raise ValueError(f"Axis '{axis.signal}' has no values")
+        if axis.mode == "delta" and getattr(base_signals, axis.signal) is None:
+            raise ValueError(f"Cannot apply a delta to missing signal '{axis.signal}'")
+        seen.add(axis.signal)
+
+
+def _perturb(base_signals: SignalBundle, overrides: Mapping[str, float]) -> SignalBundle:
+    if not overrides:
+        return base_signals
+    if base_signals.sufficiency is None:
+        return replace(base_signals, **overrides)
+    # An overridden signal has a value, so it no longer counts as missing data.
+    sufficiency = {**base_signals.sufficiency, **{name: True for name in overrides}}
+    return replace(base_signals, **overrides, sufficiency=sufficiency)
+
+
+def _compact_trace(**trace_fields: Any) -> dict[str, Any]:
+    return {"triggered_rules": trace_fields["triggered_rules"]}
+
+
+def _summary_row(output: EngineRunOutput) -> tuple[float, float, float, list[str], list[str]]:
+    return (
+        output.alignment_score,
+        output.risk_score,
+        output.alignment_confidence,
+        output.trace["triggered_rules"],
+        [rec["id"] for rec in output.recommendations],
+    )
+
+
+def simulate_what_if(
+    *,
+    strategy: GoalStrategy,
+    base_signals: SignalBundle,
+    axes: Sequence[WhatIfAxis],
+    target: dict[str, Any],
+    input_summary: dict[str, Any],
+    context_input: dict[str, Any] | None = None,
+    history: list[dict[str, Any]] | None = None,
+    previous_alignment_confidence: float | None = None,
+    engine_version: str = "v1",
+    max_points: int = MAX_GRID_POINTS,
+) -> WhatIfTable:
+    """
+    Evaluate the cartesian product of `axes` against `base_signals` in memory.
+
+    Scores match `run_decision_engine` for the same inputs; the trace is
+    reduced to `triggered_rules`. Signals set by an axis are marked sufficient,
+    so "what if I had logged X" points are not scored as missing X.
+    """
+
+    _validate_axes(axes, base_signals)
+    point_count = 1
+    for axis in axes:
+        point_count *= len(axis.values)
+    if point_count > max_points:
+        raise ValueError(f"Grid has {point_count} points; the limit is {max_points}")
+
+    axis_values: list[list[float]] = []
+    for axis in axes:
+        base_value = getattr(base_signals, axis.signal)
+        offset = float(base_value) if axis.mode == "delta" else 0.0
+        axis_values.append([_clamp_signal(axis.signal, offset + float(value)) for value in axis.values])
+    names = [axis.signal for axis in axes]
+    points = [dict(zip(names, combo)) for combo in itertools.product(*axis_values)]
+
+    # Work that does not depend on the perturbed signals is done once per grid:
+    # the context plugin only varies with the priority score, and history is
+    # reduced to counted deviation patterns instead of being rescanned per point.
+    history = history or []
+    context_results: dict[float, ContextResult] = {}
+
+    def shared_context(**context_kwargs: Any) -> ContextResult:
+        priority_score = context_kwargs["score_inputs"]["priority_score"]
+        result = context_results.get(priority_score)
+        if result is None:
+            result = context_results[priority_score] = apply_context(**context_kwargs)
+        return result
+
+    stages = health_pipeline_stages()
+    stages.update(
+        context_adapter=partial(stages["context_adapter"], context_resolver=shared_context),
+        confidence_calculator=partial(compute_confidence, history_patterns=history_deviation_patterns(history)),
+        computed_signal_builder=lambda signals, evaluation: {},
+        trace_builder=_compact_trace,
+    )
+    outputs = simulate_engine_pipeline(
+        base_signals=base_signals,
+        perturbations=[{}, *points],
+        perturb=_perturb,
+        signal_key=signal_vector,
+        strategy=strategy,
+        target=target,
+        input_summary=input_summary,
+        context_input=context_input,
+        history=history,
+        previous_alignment_confidence=previous_alignment_confidence,
+        engine_version=engine_version,
+        available_observation_count=available_observation_days(input_summary),
+        required_observation_count=7,
+        **stages,
+    )
+
+    baseline_output, point_outputs = outputs[0], outputs[1:]
+    baseline = dict(
+        zip(
+            ("alignment_score", "risk_score", "alignment_confidence", "triggered_rules", "recommendation_ids"),
+            _summary_row(baseline_output),
+        )
+    )
+    baseline.update({name: getattr(base_signals, name) for name in SIGNAL_NAMES})
+    rows: list[tuple[Any, ...]] = []
+    for point, output in zip(points, point_outputs):
+        alignment, risk, confidence, triggered, recommendation_ids = _summary_row(output)
+        rows.append(
+            (
+                *point.values(),
+                alignment,
+                risk,
+                confidence,
+                round(alignment - baseline_output.alignment_score, 2),
+                round(risk - baseline_output.risk_score, 2),
+                triggered,
+                recommendation_ids,
+            )
+        )
+    return WhatIfTable(
+        columns=(*names, *RESULT_COLUMNS),
+        rows=rows,
+        baseline=baseline,
+        unique_evaluations=len({id(output) for output in outputs}),
+    )
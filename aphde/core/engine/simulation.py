@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from collections.abc import Hashable, Mapping, Sequence
+from typing import Any, Callable
+
+from core.engine.contracts import SignalBundleLike
+from core.engine.pipeline import EngineRunOutput
+from core.engine.runner import run_engine_pipeline
+
+
+def simulate_engine_pipeline(
+    *,
+    base_signals: SignalBundleLike,
+    perturbations: Sequence[Mapping[str, Any]],
+    perturb: Callable[[SignalBundleLike, Mapping[str, Any]], SignalBundleLike],
+    signal_key: Callable[[SignalBundleLike], Hashable],
+    **pipeline_kwargs: Any,
+) -> list[EngineRunOutput]:
+    """
+    Run `run_engine_pipeline` once per perturbation of `base_signals`.
+
+    `perturb` builds the signal bundle for one grid point and `signal_key`
+    identifies it; grid points that resolve to the same key share one pipeline
+    run (and the same output object). Every other pipeline argument is passed
+    through unchanged, so callers share stage state across points by passing
+    stage callables that close over precomputed work.
+    """
+
+    outputs_by_key: dict[Hashable, EngineRunOutput] = {}
+    outputs: list[EngineRunOutput] = []
+    for perturbation in perturbations:
+        signals = perturb(base_signals, perturbation)
+        key = signal_key(signals)
+        output = outputs_by_key.get(key)
+        if output is None:
+            output = run_engine_pipeline(signals=signals, **pipeline_kwargs)
+            outputs_by_key[key] = output
+        outputs.append(output)
+    return outputs
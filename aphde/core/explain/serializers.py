@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from core.decision.ranker import RankedRecommendation
 from core.models.entities import Recommendation
 
 
-def recommendation_to_dict(rec: Recommendation) -> dict:
+def recommendation_to_dict(rec: Recommendation | RankedRecommendation) -> dict:
     return {
         "id": rec.rec_id,
         "priority": rec.priority,
@@ -15,5 +16,5 @@ def recommendation_to_dict(rec: Recommendation) -> dict:
     }
 
 
-def recommendations_to_dicts(recommendations: list[Recommendation]) -> list[dict]:
+def recommendations_to_dicts(recommendations: list[Recommendation | RankedRecommendation]) -> list[dict]:
     return [recommendation_to_dict(rec) for rec in recommendations]
@@ -1,9 +1,11 @@
+from core.governance.cohort_analytics import CohortAccumulator
 from core.governance.determinism import DeterminismResult, verify_determinism
 from core.governance.hashing import canonical_sha256
 from core.governance.history_analyzer import summarize_history
 from core.governance.version_diff import diff_runs
 
 __all__ = [
+    "CohortAccumulator",
     "DeterminismResult",
     "canonical_sha256",
     "diff_runs",
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+
+
+ALIGNMENT_RANGE: tuple[float, float] = (0.0, 100.0)
+DEFAULT_ALIGNMENT_BINS = 20
+
+
+class _Vocabulary:
+    """Stable string -> code mapping that grows as new labels appear in later chunks."""
+
+    def __init__(self) -> None:
+        self.labels: list[str] = []
+        self._codes: dict[str, int] = {}
+
+    def encode(self, values: np.ndarray) -> np.ndarray:
+        if values.size == 0:
+            return np.zeros(0, dtype=np.int64)
+        uniques, inverse = np.unique(values, return_inverse=True)
+        lookup = np.empty(len(uniques), dtype=np.int64)
+        for index, label in enumerate(uniques.tolist()):
+            code = self._codes.get(label)
+            if code is None:
+                code = len(self.labels)
+                self._codes[label] = code
+                self.labels.append(label)
+            lookup[index] = code
+        return lookup[inverse.reshape(-1)]
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+
+def _grow(array: np.ndarray, shape: tuple[int, ...]) -> np.ndarray:
+    if array.shape == shape:
+        return array
+    grown = np.zeros(shape, dtype=array.dtype)
+    grown[tuple(slice(0, size) for size in array.shape)] = array
+    return grown
+
+
+class CohortAccumulator:
+    """
+    Streaming population aggregates over decision runs.
+
+    Each `add_chunk` call takes one batch of columns and folds it into
+    fixed-size accumulators (histogram bins, per-label counters), so memory is
+    bounded by the number of distinct goal types, rules, engine versions and the
+    highest user id, not by the number of runs.
+    """
+
+    def __init__(self, *, alignment_bins: int = DEFAULT_ALIGNMENT_BINS) -> None:
+        self.bin_edges = np.linspace(ALIGNMENT_RANGE[0], ALIGNMENT_RANGE[1], alignment_bins + 1)
+        self.histogram = np.zeros(alignment_bins, dtype=np.int64)
+        self.run_count = 0
+        self._alignment_sum = 0.0
+        self._alignment_sq_sum = 0.0
+        self._alignment_min = np.inf
+        self._alignment_max = -np.inf
+        self._confidence_sum = 0.0
+        self._context_applied = 0
+        self._users_seen = np.zeros(0, dtype=bool)
+
+        self.goal_types = _Vocabulary()
+        self.rules = _Vocabulary()
+        self.engine_versions = _Vocabulary()
+        self._goal_runs = np.zeros(0, dtype=np.int64)
+        self._goal_alignment_sum = np.zeros(0, dtype=np.float64)
+        self._goal_rule_runs = np.zeros((0, 0), dtype=np.int64)
+        self._engine_runs = np.zeros(0, dtype=np.int64)
+        self._engine_checked = np.zeros(0, dtype=np.int64)
+        self._engine_verified = np.zeros(0, dtype=np.int64)
+
+    def add_chunk(self, rows: Sequence[Sequence[Any]], rule_pairs: Sequence[Sequence[Any]] = ()) -> None:
+        """
+        `rows` follow `DecisionRunRepository.scan_columns` column order with
+        ids ascending; `rule_pairs` are (run id, rule) tuples. Pairs for runs
+        outside `rows` are ignored.
+        """
+
+        if not rows:
+            return
+        columns = list(zip(*rows))
+        run_ids = np.asarray(columns[0], dtype=np.int64)
+        user_ids = np.asarray(columns[1], dtype=np.int64)
+        goal_codes = self.goal_types.encode(np.asarray(columns[2], dtype=str))
+        alignment = np.asarray(columns[3], dtype=np.float64)
+        confidence = np.asarray(columns[4], dtype=np.float64)
+        determinism = np.asarray(columns[6], dtype=np.int8)
+        engine_codes = self.engine_versions.encode(np.asarray(columns[7], dtype=str))
+        context_applied = np.asarray(columns[8], dtype=bool)
+
+        self.run_count += int(run_ids.size)
+        self._alignment_sum += float(alignment.sum())
+        self._alignment_sq_sum += float(np.dot(alignment, alignment))
+        self._alignment_min = min(self._alignment_min, float(alignment.min()))
+        self._alignment_max = max(self._alignment_max, float(alignment.max()))
+        self._confidence_sum += float(confidence.sum())
+        self._context_applied += int(context_applied.sum())
+        clipped = np.clip(alignment, ALIGNMENT_RANGE[0], ALIGNMENT_RANGE[1])
+        self.histogram += np.histogram(clipped, bins=self.bin_edges)[0]
+
+        if user_ids.size:
+            self._users_seen = _grow(self._users_seen, (max(self._users_seen.size, int(user_ids.max()) + 1),))
+            self._users_seen[user_ids] = True
+
+        goals = len(self.goal_types)
+        self._goal_runs = _grow(self._goal_runs, (goals,)) + np.bincount(goal_codes, minlength=goals)
+        self._goal_alignment_sum = _grow(self._goal_alignment_sum, (goals,)) + np.bincount(
+            goal_codes, weights=alignment, minlength=goals
+        )
+
+        engines = len(self.engine_versions)
+        checked = determinism >= 0
+        self._engine_runs = _grow(self._engine_runs, (engines,)) + np.bincount(engine_codes, minlength=engines)
+        self._engine_checked = _grow(self._engine_checked, (engines,)) + np.bincount(
+            engine_codes[checked], minlength=engines
+        )
+        self._engine_verified = _grow(self._engine_verified, (engines,)) + np.bincount(
+            engine_codes[determinism == 1], minlength=engines
+        )
+
+        self._add_rules(run_ids, goal_codes, rule_pairs)
+
+    def _add_rules(self, run_ids: np.ndarray, goal_codes: np.ndarray, rule_pairs: Sequence[Sequence[Any]]) -> None:
+        goals = len(self.goal_types)
+        if not rule_pairs:
+            self._goal_rule_runs = _grow(self._goal_rule_runs, (goals, len(self.rules)))
+            return
+        pair_ids, pair_rules = zip(*rule_pairs)
+        pair_ids = np.asarray(pair_ids, dtype=np.int64)
+        # run_ids arrive sorted (scan is in id order), so positions come from a binary search.
+        positions = np.searchsorted(run_ids, pair_ids)
+        in_chunk = positions < run_ids.size
+        in_chunk[in_chunk] = run_ids[positions[in_chunk]] == pair_ids[in_chunk]
+        positions = positions[in_chunk]
+        rule_codes = self.rules.encode(np.asarray(pair_rules, dtype=str)[in_chunk])
+
+        rules = len(self.rules)
+        # A rule listed twice in one run still counts that run once.
+        run_rule = np.unique(positions * max(rules, 1) + rule_codes)
+        run_positions, rule_codes = np.divmod(run_rule, max(rules, 1))
+        flat = goal_codes[run_positions] * rules + rule_codes
+        counts = np.bincount(flat, minlength=goals * rules).reshape(goals, rules)
+        self._goal_rule_runs = _grow(self._goal_rule_runs, (goals, rules)) + counts
+
+    def _alignment_percentile(self, pct: float) -> float | None:
+        total = int(self.histogram.sum())
+        if total == 0:
+            return None
+        target = pct / 100.0 * total
+        cumulative = np.cumsum(self.histogram)
+        index = int(np.searchsorted(cumulative, target, side="left"))
+        index = min(index, self.histogram.size - 1)
+        before = float(cumulative[index - 1]) if index > 0 else 0.0
+        in_bin = float(self.histogram[index])
+        fraction = (target - before) / in_bin if in_bin else 0.0
+        low, high = float(self.bin_edges[index]), float(self.bin_edges[index + 1])
+        return round(low + fraction * (high - low), 4)
+
+    def result(self) -> dict[str, Any]:
+        count = self.run_count
+        mean = self._alignment_sum / count if count else 0.0
+        variance = max(0.0, self._alignment_sq_sum / count - mean * mean) if count else 0.0
+
+        by_goal: dict[str, Any] = {}
+        for code, goal_type in enumerate(self.goal_types.labels):
+            runs = int(self._goal_runs[code])
+            rates = {
+                self.rules.labels[rule_code]: round(int(hits) / runs, 4)
+                for rule_code, hits in enumerate(self._goal_rule_runs[code])
+                if hits
+            }
+            by_goal[goal_type] = {
+                "runs": runs,
+                "mean_alignment": round(float(self._goal_alignment_sum[code]) / runs, 4) if runs else 0.0,
+                "rule_trigger_rates": dict(sorted(rates.items())),
+            }
+
+        by_engine: dict[str, Any] = {}
+        for code, version in enumerate(self.engine_versions.labels):
+            checked = int(self._engine_checked[code])
+            verified = int(self._engine_verified[code])
+            by_engine[version] = {
+                "runs": int(self._engine_runs[code]),
+                "checked": checked,
+                "verified": verified,
+                "determinism_pass_rate": round(verified / checked, 4) if checked else 0.0,
+            }
+
+        return {
+            "run_count": count,
+            "user_count": int(self._users_seen.sum()),
+            "context_application_frequency": round(self._context_applied / count, 4) if count else 0.0,
+            "mean_alignment_confidence": round(self._confidence_sum / count, 4) if count else 0.0,
+            "alignment": {
+                "mean": round(mean, 4),
+                "std": round(float(np.sqrt(variance)), 4),
+                "min": round(self._alignment_min, 4) if count else None,
+                "max": round(self._alignment_max, 4) if count else None,
+                "p10": self._alignment_percentile(10),
+                "p50": self._alignment_percentile(50),
+                "p90": self._alignment_percentile(90),
+                "histogram": {
+                    "bin_edges": [round(float(edge), 4) for edge in self.bin_edges],
+                    "counts": [int(value) for value in self.histogram],
+                },
+            },
+            "by_goal_type": dict(sorted(by_goal.items())),
+            "by_engine_version": dict(sorted(by_engine.items())),
+        }
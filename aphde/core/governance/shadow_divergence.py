@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from typing import Any
+
+
+# Fields combined with max() instead of addition when stats are merged.
+DIVERGENCE_MAX_FIELDS = frozenset({"alignment_abs_delta_max", "risk_abs_delta_max", "confidence_abs_delta_max"})
+
+
+@dataclass(slots=True)
+class DivergenceStats:
+    """
+    Running aggregate of `diff_runs` results between a primary and a candidate
+    engine. Only counters and sums are kept, so stats from separate workers or
+    flushes combine with `merge`.
+    """
+
+    runs: int = 0
+    identical_runs: int = 0
+    alignment_abs_delta_sum: float = 0.0
+    alignment_abs_delta_max: float = 0.0
+    risk_abs_delta_sum: float = 0.0
+    risk_abs_delta_max: float = 0.0
+    confidence_abs_delta_sum: float = 0.0
+    confidence_abs_delta_max: float = 0.0
+    recommendation_set_changes: int = 0
+    rank_shift_runs: int = 0
+    context_changes: int = 0
+    failures: int = 0
+    skipped_budget: int = 0
+    skipped_backlog: int = 0
+
+    def add_diff(self, diff: dict[str, Any]) -> None:
+        deltas = diff.get("score_delta", {})
+        alignment = abs(float(deltas.get("alignment_score_delta", 0.0)))
+        risk = abs(float(deltas.get("risk_score_delta", 0.0)))
+        confidence = abs(float(deltas.get("alignment_confidence_delta", 0.0)))
+        recs = diff.get("recommendation_changes", {})
+        context = diff.get("context_changes", {})
+        set_changed = bool(recs.get("added") or recs.get("removed"))
+        rank_shifted = bool(recs.get("rank_shifts"))
+        context_changed = (
+            context.get("context_applied_from") != context.get("context_applied_to")
+            or context.get("context_version_from") != context.get("context_version_to")
+        )
+
+        self.runs += 1
+        self.alignment_abs_delta_sum += alignment
+        self.alignment_abs_delta_max = max(self.alignment_abs_delta_max, alignment)
+        self.risk_abs_delta_sum += risk
+        self.risk_abs_delta_max = max(self.risk_abs_delta_max, risk)
+        self.confidence_abs_delta_sum += confidence
+        self.confidence_abs_delta_max = max(self.confidence_abs_delta_max, confidence)
+        self.recommendation_set_changes += int(set_changed)
+        self.rank_shift_runs += int(rank_shifted)
+        self.context_changes += int(context_changed)
+        if alignment == 0.0 and risk == 0.0 and confidence == 0.0 and not (set_changed or rank_shifted or context_changed):
+            self.identical_runs += 1
+
+    def merge(self, other: DivergenceStats) -> None:
+        for item in fields(self):
+            name = item.name
+            if name in DIVERGENCE_MAX_FIELDS:
+                setattr(self, name, max(getattr(self, name), getattr(other, name)))
+            else:
+                setattr(self, name, getattr(self, name) + getattr(other, name))
+
+    def is_empty(self) -> bool:
+        return all(not getattr(self, item.name) for item in fields(self))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {item.name: getattr(self, item.name) for item in fields(self)}
+
+    def summary(self) -> dict[str, Any]:
+        runs = self.runs or 1
+        return {
+            "runs": self.runs,
+            "identical_rate": round(self.identical_runs / runs, 4),
+            "mean_abs_alignment_delta": round(self.alignment_abs_delta_sum / runs, 4),
+            "max_abs_alignment_delta": round(self.alignment_abs_delta_max, 4),
+            "mean_abs_risk_delta": round(self.risk_abs_delta_sum / runs, 4),
+            "mean_abs_confidence_delta": round(self.confidence_abs_delta_sum / runs, 4),
+            "recommendation_set_change_rate": round(self.recommendation_set_changes / runs, 4),
+            "rank_shift_rate": round(self.rank_shift_runs / runs, 4),
+            "context_change_rate": round(self.context_changes / runs, 4),
+            "failures": self.failures,
+            "skipped_budget": self.skipped_budget,
+            "skipped_backlog": self.skipped_backlog,
+        }
+
+
+DIVERGENCE_FIELDS: tuple[str, ...] = tuple(item.name for item in fields(DivergenceStats))
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections import Counter
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from core.data.repositories.decision_repo import DecisionRunRepository
+from core.data.repositories.tomorrow_plan_repo import TomorrowPlanRepository
+
+
+PERSISTENCE_WINDOW_RUNS = 5
+
+
+def recommendation_ids(recommendations: Iterable[Mapping[str, Any]]) -> list[str]:
+    """Distinct recommendation ids of one run, in ranking order."""
+
+    return list(dict.fromkeys(str(item.get("id", "")) for item in recommendations))
+
+
+@dataclass(frozen=True, slots=True)
+class PersistenceIndex:
+    """How many of a user's last `runs` decision runs recommended each id."""
+
+    runs: int
+    counts: Mapping[str, int]
+
+    @classmethod
+    def from_runs(
+        cls,
+        recent_runs: Sequence[Mapping[str, Any]],
+        *,
+        window_runs: int = PERSISTENCE_WINDOW_RUNS,
+    ) -> PersistenceIndex:
+        """`recent_runs` newest first, each with its decoded `recommendations`."""
+
+        window = recent_runs[:window_runs]
+        counts: Counter[str] = Counter()
+        for run in window:
+            counts.update(recommendation_ids(run.get("recommendations", [])))
+        return cls(runs=len(window), counts=dict(counts))
+
+    def score(self, rec_id: str) -> float:
+        if not self.runs:
+            return 0.5
+        return min(1.0, self.counts.get(rec_id, 0) / self.runs)
+
+
+class RecommendationPersistenceStore:
+    """
+    Per-user `PersistenceIndex` in `recommendation_persistence`, updated as
+    decision runs are written.
+
+    The stored window holds the recommendation ids of the last `window_runs`
+    runs, newest first, next to their running counts. `record_run` pushes the
+    new run and drops the oldest one; if the stored window does not end at
+    the run written just before, it is rebuilt from `decision_runs` instead.
+    `index` rebuilds it when it does not end at the caller's latest run, so
+    runs written without `record_run` are still picked up.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, *, window_runs: int = PERSISTENCE_WINDOW_RUNS) -> None:
+        self.conn = conn
+        self.window_runs = window_runs
+        self.repo = TomorrowPlanRepository(conn)
+
+    def _seed(self, user_id: int) -> tuple[list[list[str]], int]:
+        rows = DecisionRunRepository(self.conn).list_recent(user_id, limit=self.window_runs)
+        window = []
+        for row in rows:
+            try:
+                recommendations = json.loads(row["recommendations_json"])
+            except (TypeError, json.JSONDecodeError):
+                recommendations = []
+            window.append(recommendation_ids(recommendations))
+        return window, int(rows[0]["id"]) if rows else 0
+
+    def _save(self, user_id: int, window: list[list[str]], last_decision_id: int) -> PersistenceIndex:
+        counts: Counter[str] = Counter()
+        for ids in window:
+            counts.update(ids)
+        self.repo.save_persistence(
+            user_id=user_id,
+            window_runs=self.window_runs,
+            last_decision_id=last_decision_id,
+            window=window,
+            counts=dict(counts),
+        )
+        self.conn.commit()
+        return PersistenceIndex(runs=len(window), counts=dict(counts))
+
+    def _load(self, user_id: int) -> tuple[list[list[str]], int, dict[str, int]] | None:
+        row = self.repo.get_persistence(user_id)
+        if row is None or int(row["window_runs"]) != self.window_runs:
+            return None
+        return json.loads(row["window_json"]), int(row["last_decision_id"]), json.loads(row["counts_json"])
+
+    def record_run(
+        self,
+        *,
+        user_id: int,
+        decision_id: int,
+        recommendations: Iterable[Mapping[str, Any]],
+    ) -> PersistenceIndex:
+        """Fold a just-persisted decision run into the user's window."""
+
+        loaded = self._load(user_id)
+        previous_id = DecisionRunRepository(self.conn).previous_id(user_id, before_id=decision_id)
+        if loaded is None or loaded[1] != (previous_id or 0):
+            # Seeding reads the stored runs, which already include this one.
+            window, last_decision_id = self._seed(user_id)
+            return self._save(user_id, window, last_decision_id)
+
+        window, _, counts = loaded
+        ids = recommendation_ids(recommendations)
+        window.insert(0, ids)
+        for rec_id in ids:
+            counts[rec_id] = counts.get(rec_id, 0) + 1
+        for dropped in window[self.window_runs :]:
+            for rec_id in dropped:
+                counts[rec_id] -= 1
+                if counts[rec_id] <= 0:
+                    del counts[rec_id]
+        del window[self.window_runs :]
+        self.repo.save_persistence(
+            user_id=user_id,
+            window_runs=self.window_runs,
+            last_decision_id=decision_id,
+            window=window,
+            counts=counts,
+        )
+        self.conn.commit()
+        return PersistenceIndex(runs=len(window), counts=counts)
+
+    def index(self, user_id: int, *, latest_decision_id: int | None = None) -> PersistenceIndex:
+        loaded = self._load(user_id)
+        if loaded is None or (latest_decision_id is not None and loaded[1] != latest_decision_id):
+            window, last_decision_id = self._seed(user_id)
+            return self._save(user_id, window, last_decision_id)
+        window, _, counts = loaded
+        return PersistenceIndex(runs=len(window), counts=counts)
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Any
 
+from core.guidance.persistence_index import PersistenceIndex
+
 
 def _clamp(value: float, low: float = 0.0, high: float = 1.0) -> float:
     return max(low, min(high, value))
@@ -25,18 +27,6 @@ def _candidate_confidence(rec: dict[str, Any], conf_map: dict[str, float], fallb
     return _clamp(float(raw))
 
 
-def _persistence_score(*, rec_id: str, recent_runs: list[dict[str, Any]]) -> float:
-    if not recent_runs:
-        return 0.5
-    window = recent_runs[: min(5, len(recent_runs))]
-    hit_count = 0
-    for run in window:
-        ids = {str(item.get("id", "")) for item in run.get("recommendations", [])}
-        if rec_id in ids:
-            hit_count += 1
-    return _clamp(hit_count / len(window))
-
-
 def _strategy_relevance(category: str) -> float:
     category = category.lower().strip()
     mapping = {
@@ -52,8 +42,12 @@ def build_tomorrow_plan(
     *,
     latest_run: dict[str, Any],
     recent_runs: list[dict[str, Any]] | None = None,
+    persistence: PersistenceIndex | None = None,
 ) -> dict[str, Any]:
-    recent_runs = recent_runs or []
+    """`persistence` is the user's stored index; without it one is built from `recent_runs`."""
+
+    if persistence is None:
+        persistence = PersistenceIndex.from_runs(recent_runs or [])
     recommendations = latest_run.get("recommendations", [])
     trace = latest_run.get("trace", {}) if isinstance(latest_run.get("trace"), dict) else {}
     triggered_rules = trace.get("triggered_rules", [])
@@ -81,7 +75,7 @@ def build_tomorrow_plan(
     for rec in recommendations:
         rec_id = str(rec.get("id", ""))
         confidence_component = _candidate_confidence(rec, rec_conf_map, alignment_confidence)
-        persistence_component = _persistence_score(rec_id=rec_id, recent_runs=recent_runs)
+        persistence_component = persistence.score(rec_id)
         strategy_component = _strategy_relevance(str(rec.get("category", "")))
         score = (
             0.35 * risk_component
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+
+def signal_value(raw: Any) -> float | None:
+    if raw is None or isinstance(raw, dict):
+        return None
+    try:
+        return float(raw)
+    except (TypeError, ValueError):
+        return None
+
+
+def computed_signals_of(run: Mapping[str, Any]) -> Mapping[str, Any]:
+    trace = run.get("trace", {})
+    if not isinstance(trace, dict):
+        return {}
+    signals = trace.get("computed_signals", {})
+    return signals if isinstance(signals, dict) else {}
+
+
+@dataclass(frozen=True, slots=True)
+class SignalSeriesFrame:
+    """
+    Numeric `computed_signals` of a run history as aligned columns, oldest run
+    first. Each column has one entry per run (`None` where the run lacks the
+    signal or it is not a number); `run_ids` is aligned with the columns.
+    Built with one pass over the runs, so callers that need several signals
+    share it instead of re-walking the traces per signal.
+    """
+
+    run_ids: tuple[int | None, ...]
+    columns: Mapping[str, tuple[float | None, ...]]
+
+    @classmethod
+    def from_runs(
+        cls,
+        recent_runs: Sequence[Mapping[str, Any]],
+        *,
+        keys: Iterable[str] | None = None,
+    ) -> SignalSeriesFrame:
+        """
+        `recent_runs` newest first, as returned by `list_recent` and the
+        dashboard loaders. `keys` limits the frame to the signals a caller
+        reads; by default every signal found in the traces gets a column.
+        """
+
+        ordered = list(reversed(recent_runs))
+        signals = [computed_signals_of(run) for run in ordered]
+        if keys is None:
+            keys = dict.fromkeys(key for run_signals in signals for key in run_signals)
+        columns: dict[str, list[float | None]] = {key: [] for key in keys}
+        items = list(columns.items())
+        for run_signals in signals:
+            for key, column in items:
+                raw = run_signals.get(key)
+                # Traces hold plain floats; only other values need converting.
+                column.append(raw if type(raw) is float else signal_value(raw))
+        return cls(
+            run_ids=tuple(run.get("id") for run in ordered),
+            columns={key: tuple(column) for key, column in items},
+        )
+
+    def __len__(self) -> int:
+        return len(self.run_ids)
+
+    def column(self, key: str) -> tuple[float | None, ...]:
+        return self.columns.get(key, (None,) * len(self.run_ids))
+
+    def series(self, key: str) -> list[float]:
+        """Values present for `key`, oldest first."""
+
+        return [value for value in self.columns.get(key, ()) if value is not None]
+
+    def head(self, count: int) -> SignalSeriesFrame:
+        """The `count` oldest runs."""
+
+        return SignalSeriesFrame(
+            run_ids=self.run_ids[:count],
+            columns={key: column[:count] for key, column in self.columns.items()},
+        )
+
+    def tail(self, count: int) -> SignalSeriesFrame:
+        """The `count` newest runs."""
+
+        start = max(0, len(self.run_ids) - count)
+        return SignalSeriesFrame(
+            run_ids=self.run_ids[start:],
+            columns={key: column[start:] for key, column in self.columns.items()},
+        )
@@ -1,40 +1,48 @@
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
 from datetime import date
 from typing import Any
 
+from core.insights.signal_frame import SignalSeriesFrame
 
-def _severity_rank(level: str) -> int:
-    return {"high": 0, "medium": 1, "low": 2}.get(level, 3)
+
+STAGNATION_SIGNALS: tuple[str, ...] = (
+    "trend_slope",
+    "progressive_overload_score",
+    "compliance_ratio",
+    "recovery_index",
+)
 
 
-def _extract_signal_series(recent_runs: list[dict[str, Any]], key: str) -> list[float]:
-    values: list[float] = []
-    for run in reversed(recent_runs):
-        trace = run.get("trace", {})
-        if not isinstance(trace, dict):
-            continue
-        signals = trace.get("computed_signals", {})
-        if not isinstance(signals, dict):
-            continue
-        raw = signals.get(key)
-        if raw is None:
-            continue
-        try:
-            values.append(float(raw))
-        except (TypeError, ValueError):
-            continue
-    return values
+def severity_rank(level: str) -> int:
+    return {"high": 0, "medium": 1, "low": 2}.get(level, 3)
 
 
 def detect_stagnation_alerts(
     *,
     recent_runs: list[dict[str, Any]],
     min_points: int = 5,
+    frame: SignalSeriesFrame | None = None,
 ) -> list[dict[str, Any]]:
+    if frame is None:
+        frame = SignalSeriesFrame.from_runs(recent_runs, keys=STAGNATION_SIGNALS)
+    series = {key: frame.series(key) for key in STAGNATION_SIGNALS}
+    return alerts_from_series(series, min_points=min_points)
+
+
+def alerts_from_series(
+    series: Mapping[str, Sequence[float]],
+    *,
+    min_points: int = 5,
+    triggered_at: str | None = None,
+) -> list[dict[str, Any]]:
+    """Stagnation rules over per-signal series ordered oldest to newest."""
+
+    triggered_at = triggered_at or date.today().isoformat()
     alerts: list[dict[str, Any]] = []
 
-    trend_values = _extract_signal_series(recent_runs, "trend_slope")
+    trend_values = series.get("trend_slope", ())
     if len(trend_values) >= min_points:
         avg_abs = sum(abs(v) for v in trend_values[-min_points:]) / min_points
         if avg_abs <= 0.01:
@@ -46,12 +54,12 @@ def detect_stagnation_alerts(
                     "message": "Weight trend slope has remained near-flat over the configured window.",
                     "recommendation": "Adjust adherence or calorie consistency and re-check in 5 days.",
                     "confidence": 0.82,
-                    "triggered_at": date.today().isoformat(),
+                    "triggered_at": triggered_at,
                     "version": "stg_v1",
                 }
             )
 
-    overload_values = _extract_signal_series(recent_runs, "progressive_overload_score")
+    overload_values = series.get("progressive_overload_score", ())
     if len(overload_values) >= 4:
         spread = max(overload_values[-4:]) - min(overload_values[-4:])
         if spread <= 0.04:
@@ -63,12 +71,12 @@ def detect_stagnation_alerts(
                     "message": "Progressive overload score has remained flat across recent windows.",
                     "recommendation": "Introduce a controlled overload progression adjustment next cycle.",
                     "confidence": 0.79,
-                    "triggered_at": date.today().isoformat(),
+                    "triggered_at": triggered_at,
                     "version": "stg_v1",
                 }
             )
 
-    compliance_values = _extract_signal_series(recent_runs, "compliance_ratio")
+    compliance_values = series.get("compliance_ratio", ())
     if len(compliance_values) >= min_points:
         if (compliance_values[0] - compliance_values[-1]) >= 0.08:
             alerts.append(
@@ -79,12 +87,12 @@ def detect_stagnation_alerts(
                     "message": "Compliance ratio shows a persistent negative drift.",
                     "recommendation": "Prioritize habit stabilization before raising threshold strictness.",
                     "confidence": 0.86,
-                    "triggered_at": date.today().isoformat(),
+                    "triggered_at": triggered_at,
                     "version": "stg_v1",
                 }
             )
 
-    recovery_values = _extract_signal_series(recent_runs, "recovery_index")
+    recovery_values = series.get("recovery_index", ())
     if len(recovery_values) >= 3:
         last_three = recovery_values[-3:]
         if all(v < 0.50 for v in last_three):
@@ -96,10 +104,10 @@ def detect_stagnation_alerts(
                     "message": "Recovery index remains below floor for three consecutive windows.",
                     "recommendation": "Reduce training stress and improve recovery inputs before progression.",
                     "confidence": 0.88,
-                    "triggered_at": date.today().isoformat(),
+                    "triggered_at": triggered_at,
                     "version": "stg_v1",
                 }
             )
 
-    alerts.sort(key=lambda item: (_severity_rank(str(item.get("severity"))), str(item.get("type"))))
+    alerts.sort(key=lambda item: (severity_rank(str(item.get("severity"))), str(item.get("type"))))
     return alerts
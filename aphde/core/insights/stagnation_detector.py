@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Mapping
+from datetime import date
+from typing import Any
+
+from core.data.repositories.decision_repo import DecisionRunRepository
+from core.data.repositories.insight_alert_repo import InsightAlertRepository
+from core.insights.signal_frame import SignalSeriesFrame, signal_value
+from core.insights.stagnation import STAGNATION_SIGNALS, alerts_from_series, severity_rank
+
+
+STAGNATION_DETECTOR_VERSION = "stg_v1"
+# Same lookback as the insights page (`load_insights_view(recent_limit=42)`).
+STAGNATION_WINDOW_RUNS = 42
+
+
+class StagnationDetector:
+    """
+    Keeps per-user rolling state for `alerts_from_series` so stagnation alerts
+    are computed once per decision run instead of on every insights load.
+
+    The state is one ring buffer per signal holding the last `window_runs`
+    runs' values (`None` where a run lacks the signal), oldest first, so the
+    rules see exactly the series `detect_stagnation_alerts` would extract from
+    the same runs. `record_run` appends the new run, re-evaluates the rules
+    and syncs the open alerts in `insight_alerts`; `active_alerts` is a single
+    indexed read. A user without state (or with state from another window or
+    detector version, or state that does not end at the previous run) is
+    seeded from `decision_runs`.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, *, window_runs: int = STAGNATION_WINDOW_RUNS) -> None:
+        self.conn = conn
+        self.window_runs = window_runs
+        self.repo = InsightAlertRepository(conn)
+
+    def _seed(self, user_id: int) -> tuple[dict[str, list[float | None]], int]:
+        rows = DecisionRunRepository(self.conn).list_recent(user_id, limit=self.window_runs)
+        runs = []
+        for row in rows:
+            try:
+                trace = json.loads(row["trace_json"])
+            except (TypeError, json.JSONDecodeError):
+                trace = {}
+            runs.append({"id": row["id"], "trace": trace})
+        frame = SignalSeriesFrame.from_runs(runs, keys=STAGNATION_SIGNALS)
+        buffers = {key: list(frame.column(key)) for key in STAGNATION_SIGNALS}
+        return buffers, int(rows[0]["id"]) if rows else 0
+
+    def _load(self, user_id: int) -> tuple[dict[str, list[float | None]], int] | None:
+        row = self.repo.get_state(user_id)
+        if row is None or row["detector_version"] != STAGNATION_DETECTOR_VERSION:
+            return None
+        state = json.loads(row["state_json"])
+        if state.get("window_runs") != self.window_runs:
+            return None
+        return state["buffers"], int(row["last_decision_id"])
+
+    def _evaluate(
+        self,
+        user_id: int,
+        buffers: dict[str, list[float | None]],
+        *,
+        decision_id: int,
+        triggered_at: str,
+    ) -> list[dict[str, Any]]:
+        series = {key: [value for value in values if value is not None] for key, values in buffers.items()}
+        alerts = alerts_from_series(series, triggered_at=triggered_at)
+        self.repo.save_state(
+            user_id=user_id,
+            detector_version=STAGNATION_DETECTOR_VERSION,
+            last_decision_id=decision_id,
+            state={"window_runs": self.window_runs, "buffers": buffers},
+        )
+        self.repo.sync_active(user_id=user_id, alerts=alerts, decision_id=decision_id, triggered_at=triggered_at)
+        self.conn.commit()
+        return alerts
+
+    def record_run(
+        self,
+        *,
+        user_id: int,
+        decision_id: int,
+        computed_signals: Mapping[str, Any],
+        run_date: date | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fold a just-persisted decision run into the user's state and return the firing alerts."""
+
+        triggered_at = (run_date or date.today()).isoformat()
+        loaded = self._load(user_id)
+        previous_id = DecisionRunRepository(self.conn).previous_id(user_id, before_id=decision_id)
+        if loaded is None or loaded[1] != (previous_id or 0):
+            # The state does not end at the run before this one (a run was
+            # written without this hook); seeding reads the stored runs,
+            # which already include this one.
+            buffers, _ = self._seed(user_id)
+        else:
+            buffers = loaded[0]
+            for key in STAGNATION_SIGNALS:
+                values = buffers.setdefault(key, [])
+                values.append(signal_value(computed_signals.get(key)))
+                del values[: max(0, len(values) - self.window_runs)]
+        return self._evaluate(user_id, buffers, decision_id=decision_id, triggered_at=triggered_at)
+
+    def active_alerts(self, user_id: int) -> list[dict[str, Any]]:
+        rows = self.repo.list_active(user_id)
+        if not rows and self.repo.get_state(user_id) is None:
+            buffers, last_decision_id = self._seed(user_id)
+            if last_decision_id:
+                self._evaluate(user_id, buffers, decision_id=last_decision_id, triggered_at=date.today().isoformat())
+                rows = self.repo.list_active(user_id)
+        alerts = []
+        for row in rows:
+            alert = json.loads(row["alert_json"])
+            alert["triggered_at"] = row["first_triggered_at"]
+            alerts.append(alert)
+        alerts.sort(key=lambda item: (severity_rank(str(item.get("severity"))), str(item.get("type"))))
+        return alerts
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import date, timedelta
+from typing import Any
+
+from core.data.repositories.decision_repo import DecisionRunRepository
+from core.data.repositories.weekly_aggregate_repo import WeeklyAggregateRepository
+from core.insights.signal_frame import signal_value
+from core.insights.weekly_summary import WEEKLY_SIGNALS, iso_week_of
+
+
+WEEKLY_AGGREGATE_VERSION = "wk_v1"
+
+
+def _volatility_direction(signals: dict[str, Any]) -> str:
+    stats = signals.get("volatility_index")
+    if not stats or int(stats["count"]) < 2:
+        return "flat"
+    return "improving" if float(stats["last"]) < float(stats["first"]) else "worsening"
+
+
+def _week_from_row(row: sqlite3.Row) -> dict[str, Any]:
+    week_start = date.fromisoformat(str(row["week_start"]))
+    signals = {}
+    for key, stats in json.loads(row["signals_json"]).items():
+        count = int(stats["count"])
+        signals[key] = {
+            "first": float(stats["first"]),
+            "last": float(stats["last"]),
+            "mean": float(stats["sum"]) / count,
+            "count": count,
+        }
+    return {
+        "iso_week": str(row["iso_week"]),
+        "week_start": week_start.isoformat(),
+        "week_end": (week_start + timedelta(days=6)).isoformat(),
+        "sessions_planned": int(row["sessions_planned"]),
+        "sessions_completed": int(row["sessions_completed"]),
+        "run_count": int(row["run_count"]),
+        "signals": signals,
+        "volatility_direction": str(row["volatility_direction"]),
+    }
+
+
+class WeeklyAggregator:
+    """
+    Per-user rows in `insight_weekly_aggregates`, one per ISO week.
+
+    Session counts are kept by the `workout_logs` triggers. Decision-run
+    signals (first/last/sum/count per week) are folded in id order by
+    `refresh`, which only reads runs after the user's watermark in
+    `insight_weekly_state`; each week also records the last run it folded,
+    so a refresh racing another one skips runs already counted. A user without state (or with state from
+    another aggregate version) is rebuilt from logs and runs once.
+    """
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+        self.repo = WeeklyAggregateRepository(conn)
+
+    def refresh(self, user_id: int) -> None:
+        state = self.repo.get_state(user_id)
+        seeded = state is not None and state["aggregate_version"] == WEEKLY_AGGREGATE_VERSION
+        after_id = int(state["last_decision_id"]) if seeded else 0
+        runs = DecisionRunRepository(self.conn).signal_values_after(user_id, after_id=after_id, keys=WEEKLY_SIGNALS)
+        if seeded and not runs:
+            return
+        if not seeded:
+            self.repo.reset_user(user_id)
+
+        by_week: dict[str, tuple[date, list[tuple]]] = {}
+        for run in runs:
+            label, week_start = iso_week_of(date.fromisoformat(str(run[1])[:10]))
+            by_week.setdefault(label, (week_start, []))[1].append(run)
+
+        existing = {str(row["iso_week"]): row for row in self.repo.get_weeks(user_id, list(by_week))}
+        for label, (week_start, week_runs) in by_week.items():
+            row = existing.get(label)
+            signals: dict[str, Any] = json.loads(row["signals_json"]) if row is not None else {}
+            run_count = int(row["run_count"]) if row is not None else 0
+            folded_through = int(row["last_decision_id"] or 0) if row is not None else 0
+            for run in week_runs:
+                if run[0] <= folded_through:
+                    continue
+                run_count += 1
+                for key, raw in zip(WEEKLY_SIGNALS, run[2:]):
+                    value = signal_value(raw)
+                    if value is None:
+                        continue
+                    stats = signals.setdefault(key, {"first": value, "last": value, "sum": 0.0, "count": 0})
+                    stats["last"] = value
+                    stats["sum"] += value
+                    stats["count"] += 1
+            self.repo.save_signals(
+                user_id=user_id,
+                iso_week=label,
+                week_start=week_start.isoformat(),
+                run_count=run_count,
+                signals=signals,
+                volatility_direction=_volatility_direction(signals),
+                last_decision_id=int(week_runs[-1][0]),
+            )
+        self.repo.save_state(
+            user_id=user_id,
+            aggregate_version=WEEKLY_AGGREGATE_VERSION,
+            last_decision_id=int(runs[-1][0]) if runs else after_id,
+        )
+        self.conn.commit()
+
+    def _is_current(self, user_id: int) -> bool:
+        state = self.repo.get_state(user_id)
+        if state is None or state["aggregate_version"] != WEEKLY_AGGREGATE_VERSION:
+            return False
+        latest_id = DecisionRunRepository(self.conn).latest_ids([user_id])[user_id]
+        return int(state["last_decision_id"]) >= latest_id
+
+    def weeks(self, user_id: int, *, limit: int = 8) -> list[dict[str, Any]]:
+        """The user's latest `limit` weeks with any activity, newest first."""
+
+        # Decision writes refresh the aggregates; a read only catches up
+        # (and writes) when its watermark is behind the latest run.
+        if not self._is_current(user_id):
+            self.refresh(user_id)
+        return [_week_from_row(row) for row in self.repo.list_recent(user_id, limit=limit)]
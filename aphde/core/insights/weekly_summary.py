@@ -1,26 +1,23 @@
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
 from datetime import date, timedelta
 from typing import Any
 
 
-def _extract_signal_series(recent_runs: list[dict[str, Any]], key: str) -> list[float]:
-    values: list[float] = []
-    for run in reversed(recent_runs):
-        trace = run.get("trace", {})
-        if not isinstance(trace, dict):
-            continue
-        signals = trace.get("computed_signals", {})
-        if not isinstance(signals, dict):
-            continue
-        raw = signals.get(key)
-        if raw is None:
-            continue
-        try:
-            values.append(float(raw))
-        except (TypeError, ValueError):
-            continue
-    return values
+WEEKLY_SIGNALS: tuple[str, ...] = (
+    "compliance_ratio",
+    "recovery_index",
+    "volatility_index",
+    "progressive_overload_score",
+)
+
+
+def iso_week_of(day: date) -> tuple[str, date]:
+    """`YYYY-Www` label and Monday of the ISO week containing `day`."""
+
+    year, week, weekday = day.isocalendar()
+    return f"{year:04d}-W{week:02d}", day - timedelta(days=weekday - 1)
 
 
 def _direction(start: float, end: float, epsilon: float = 0.01) -> str:
@@ -31,37 +28,60 @@ def _direction(start: float, end: float, epsilon: float = 0.01) -> str:
     return "flat"
 
 
-def build_weekly_insight(*, recent_runs: list[dict[str, Any]]) -> dict[str, Any]:
-    window = list(reversed(recent_runs[-7:])) if recent_runs else []
-    today = date.today()
-    week_start = today - timedelta(days=6)
+def _signal(week: Mapping[str, Any], key: str) -> Mapping[str, Any]:
+    return week.get("signals", {}).get(key) or {}
+
+
+def _shift(stats: Mapping[str, Any]) -> str:
+    if int(stats.get("count", 0)) < 2:
+        return "flat"
+    return _direction(float(stats["first"]), float(stats["last"]))
 
-    compliance_series = _extract_signal_series(window, "compliance_ratio")
-    recovery_series = _extract_signal_series(window, "recovery_index")
-    volatility_series = _extract_signal_series(window, "volatility_index")
-    overload_series = _extract_signal_series(window, "progressive_overload_score")
 
-    compliance_last = compliance_series[-1] if compliance_series else 0.0
-    compliance_avg = (sum(compliance_series) / len(compliance_series)) if compliance_series else 0.0
-    planned_sessions = 7
-    completed_sessions = int(round(planned_sessions * compliance_last))
+def build_weekly_insight(*, week: Mapping[str, Any] | None, today: date | None = None) -> dict[str, Any]:
+    """Summary of one `WeeklyAggregator` week; without one, an empty current week."""
 
-    recovery_shift = _direction(recovery_series[0], recovery_series[-1]) if len(recovery_series) >= 2 else "flat"
-    if len(volatility_series) >= 2:
-        volatility_direction = "improving" if volatility_series[-1] < volatility_series[0] else "worsening"
-    else:
-        volatility_direction = "flat"
-    overload_progress = _direction(overload_series[0], overload_series[-1]) if len(overload_series) >= 2 else "flat"
+    if week is None:
+        iso_week, week_start = iso_week_of(today or date.today())
+        week = {
+            "iso_week": iso_week,
+            "week_start": week_start.isoformat(),
+            "week_end": (week_start + timedelta(days=6)).isoformat(),
+        }
+
+    compliance = _signal(week, "compliance_ratio")
+    compliance_last = float(compliance.get("last", 0.0))
+    compliance_avg = float(compliance.get("mean", 0.0))
 
     return {
-        "week_start": week_start.isoformat(),
-        "week_end": today.isoformat(),
-        "planned_sessions": planned_sessions,
-        "completed_sessions": completed_sessions,
+        "iso_week": week["iso_week"],
+        "week_start": week["week_start"],
+        "week_end": week["week_end"],
+        "planned_sessions": int(week.get("sessions_planned", 0)),
+        "completed_sessions": int(week.get("sessions_completed", 0)),
         "compliance_pct": round(compliance_last * 100.0, 2),
         "compliance_avg_pct": round(compliance_avg * 100.0, 2),
-        "recovery_shift": recovery_shift,
-        "volatility_direction": volatility_direction,
-        "overload_progress": overload_progress,
-        "data_sufficient": len(window) >= 3,
+        "recovery_shift": _shift(_signal(week, "recovery_index")),
+        "volatility_direction": str(week.get("volatility_direction", "flat")),
+        "overload_progress": _shift(_signal(week, "progressive_overload_score")),
+        "data_sufficient": int(week.get("run_count", 0)) >= 3,
     }
+
+
+def build_weekly_trend(weeks: Sequence[Mapping[str, Any]]) -> list[dict[str, Any]]:
+    """One point per aggregated week, oldest first; `weeks` newest first as `WeeklyAggregator.weeks` returns them."""
+
+    points = []
+    for week in reversed(weeks):
+        point: dict[str, Any] = {
+            "iso_week": week["iso_week"],
+            "week_start": week["week_start"],
+            "planned_sessions": int(week.get("sessions_planned", 0)),
+            "completed_sessions": int(week.get("sessions_completed", 0)),
+            "run_count": int(week.get("run_count", 0)),
+        }
+        for key in WEEKLY_SIGNALS:
+            mean = _signal(week, key).get("mean")
+            point[f"{key}_mean"] = round(float(mean), 4) if mean is not None else None
+        points.append(point)
+    return points
@@ -1,17 +1,37 @@
 from __future__ import annotations
 
+from collections import Counter
+from collections.abc import Mapping
+from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
+
 from core.signals.aggregator import SignalBundle
 
 
 CONFIDENCE_VERSION = "conf_v1"
 
+CONFIDENCE_WEIGHTS: dict[str, float] = {
+    "data_completeness": 0.30,
+    "signal_stability": 0.20,
+    "threshold_distance": 0.20,
+    "historical_persistence": 0.20,
+    "window_sufficiency": 0.10,
+}
+VOLATILITY_CAP = 0.12
+
 
 def _clamp01(value: float) -> float:
     return max(0.0, min(1.0, value))
 
 
+def _clamp01_array(values: np.ndarray) -> np.ndarray:
+    # Same result as `_clamp01` element-wise, including NaN -> 1.0.
+    upper = np.where(values < 1.0, values, 1.0)
+    return np.where(upper > 0.0, upper, 0.0)
+
+
 def _safe_float(value: Any, default: float = 0.0) -> float:
     try:
         return float(value)
@@ -19,63 +39,253 @@ def _safe_float(value: Any, default: float = 0.0) -> float:
         return default
 
 
-def _data_completeness(signals: SignalBundle) -> float:
-    sufficiency = signals.sufficiency or {}
-    if not sufficiency:
-        return 0.0
-    return _clamp01(sum(1 for ok in sufficiency.values() if ok) / len(sufficiency))
+class _ScalarOps:
+    clamp = staticmethod(_clamp01)
+    minimum = staticmethod(min)
+
+    @staticmethod
+    def where(condition: bool, when_true: float, when_false: float) -> float:
+        return when_true if condition else when_false
+
+    @staticmethod
+    def ratio(numerator: float, denominator: float) -> float:
+        return numerator / denominator if denominator else 0.0
 
 
-def _signal_stability(signals: SignalBundle, volatility_cap: float = 0.12) -> float:
-    volatility = signals.volatility_index
-    if volatility is None:
-        return 0.5
-    normalized = _clamp01(_safe_float(volatility) / max(1e-6, volatility_cap))
-    return _clamp01(1.0 - normalized)
+class _ArrayOps:
+    clamp = staticmethod(_clamp01_array)
+    minimum = staticmethod(np.minimum)
+    where = staticmethod(np.where)
+
+    @staticmethod
+    def ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+        numerator, denominator = np.broadcast_arrays(
+            np.asarray(numerator, dtype=np.float64), np.asarray(denominator, dtype=np.float64)
+        )
+        return np.divide(numerator, denominator, out=np.zeros(numerator.shape), where=denominator != 0)
 
 
-def _threshold_distance_strength(
+# The formulas below take counts/sums prepared by the caller and are evaluated
+# either on Python floats (`_ScalarOps`) or on NumPy arrays (`_ArrayOps`), so the
+# single-run and batch paths share one definition and round identically.
+def _components(
+    ops: Any,
     *,
-    deviations: dict[str, bool],
-    threshold_distances: dict[str, float] | None = None,
-) -> float:
-    if threshold_distances:
-        vals = [_clamp01(_safe_float(v)) for v in threshold_distances.values()]
-        if vals:
-            return sum(vals) / len(vals)
+    sufficient_count: Any,
+    sufficiency_count: Any,
+    volatility: Any,
+    volatility_known: Any,
+    miss_count: Any,
+    deviation_count: Any,
+    distance_sum: Any,
+    distance_count: Any,
+    persistence_matches: Any,
+    history_count: Any,
+    any_active: Any,
+    available_days: Any,
+    required_days: Any,
+) -> tuple[Any, Any, Any, Any, Any]:
+    c_data = ops.where(sufficiency_count > 0, ops.clamp(ops.ratio(sufficient_count, sufficiency_count)), 0.0)
+    normalized = ops.clamp(volatility / max(1e-6, VOLATILITY_CAP))
+    c_stability = ops.where(volatility_known, ops.clamp(1.0 - normalized), 0.5)
+    c_distance = ops.where(
+        distance_count > 0,
+        ops.ratio(distance_sum, distance_count),
+        ops.where(deviation_count > 0, ops.clamp(1.0 - ops.ratio(miss_count, deviation_count)), 0.5),
+    )
+    c_persistence = ops.where(
+        history_count > 0,
+        ops.where(any_active, ops.clamp(ops.ratio(persistence_matches, history_count)), 0.7),
+        0.5,
+    )
+    c_window = ops.where(required_days <= 0, 1.0, ops.clamp(ops.ratio(available_days, required_days)))
+    return c_data, c_stability, c_distance, c_persistence, c_window
+
+
+def _alignment(ops: Any, components: tuple[Any, ...], *, previous: Any, previous_known: Any, alpha: float) -> tuple[Any, Any]:
+    c_data, c_stability, c_distance, c_persistence, c_window = components
+    raw = ops.clamp(
+        CONFIDENCE_WEIGHTS["data_completeness"] * c_data
+        + CONFIDENCE_WEIGHTS["signal_stability"] * c_stability
+        + CONFIDENCE_WEIGHTS["threshold_distance"] * c_distance
+        + CONFIDENCE_WEIGHTS["historical_persistence"] * c_persistence
+        + CONFIDENCE_WEIGHTS["window_sufficiency"] * c_window
+    )
+    smoothed = ops.clamp(alpha * ops.clamp(previous) + (1.0 - alpha) * raw)
+    return raw, ops.where(previous_known, smoothed, raw)
+
+
+def _recommendation_confidence(ops: Any, *, alignment: Any, reason_count: Any, base_confidence: Any) -> Any:
+    has_reasons = reason_count > 0
+    evidence_strength = ops.clamp(ops.minimum(reason_count, 4) / 4)
+    rule_specificity = ops.where(has_reasons, 0.8, 0.4)
+    conflict_penalty = ops.where(has_reasons, 0.0, 0.1)
+    return ops.clamp(
+        0.20
+        + 0.35 * alignment
+        + 0.20 * evidence_strength
+        + 0.15 * rule_specificity
+        + 0.20 * base_confidence
+        - conflict_penalty
+    )
+
+
+@dataclass(slots=True)
+class ConfidenceBatch:
+    alignment_confidence: np.ndarray
+    raw_alignment_confidence: np.ndarray
+    previous_used: np.ndarray
+    components: dict[str, np.ndarray]
+    # (users, recommendations); NaN where `recommendation_mask` is False.
+    recommendation_confidence: np.ndarray
 
-    if not deviations:
-        return 0.5
-    miss_count = sum(1 for is_miss in deviations.values() if is_miss)
-    total = len(deviations)
-    return _clamp01(1.0 - (miss_count / total))
 
+def _mask(mask: np.ndarray | None, shape: tuple[int, ...]) -> np.ndarray:
+    if mask is None:
+        return np.ones(shape, dtype=bool)
+    return np.asarray(mask, dtype=bool)
 
-def _historical_persistence(
+
+def compute_confidence_batch(
     *,
-    current_deviations: dict[str, bool],
-    history: list[dict[str, Any]] | None,
-) -> float:
-    if not history:
-        return 0.5
+    sufficiency: np.ndarray,
+    volatility: np.ndarray,
+    deviations: np.ndarray,
+    available_days: np.ndarray,
+    required_days: np.ndarray | int = 7,
+    sufficiency_mask: np.ndarray | None = None,
+    volatility_known: np.ndarray | None = None,
+    deviation_mask: np.ndarray | None = None,
+    threshold_distances: np.ndarray | None = None,
+    threshold_distance_mask: np.ndarray | None = None,
+    history_deviations: np.ndarray | None = None,
+    history_mask: np.ndarray | None = None,
+    previous_alignment_confidence: np.ndarray | None = None,
+    recommendation_base_confidence: np.ndarray | None = None,
+    recommendation_reason_counts: np.ndarray | None = None,
+    recommendation_mask: np.ndarray | None = None,
+    alpha: float = 0.2,
+) -> ConfidenceBatch:
+    """
+    `compute_confidence` for `n` users at once.
+
+    Shapes: `sufficiency` (n, k) flags; `volatility` (n,), NaN when missing;
+    `deviations` (n, d) over one shared deviation vocabulary; `history_deviations`
+    (n, h, d) over the same vocabulary; `threshold_distances` (n, t); the
+    recommendation arrays (n, r); `previous_alignment_confidence` (n,), NaN when
+    there is no previous run. The optional `*_mask` arrays mark which cells are
+    real for users with fewer entries than the array width.
+    """
+
+    sufficiency = np.asarray(sufficiency, dtype=bool)
+    n = sufficiency.shape[0]
+    sufficiency_mask = _mask(sufficiency_mask, sufficiency.shape)
+
+    volatility = np.asarray(volatility, dtype=np.float64)
+    if volatility_known is None:
+        volatility_known = ~np.isnan(volatility)
+
+    deviations = np.asarray(deviations, dtype=bool).reshape(n, -1)
+    deviation_mask = _mask(deviation_mask, deviations.shape)
+    active = deviations & deviation_mask
+
+    if threshold_distances is None:
+        distance_sum = np.zeros(n)
+        distance_count = np.zeros(n, dtype=np.int64)
+    else:
+        distances = _clamp01_array(np.asarray(threshold_distances, dtype=np.float64).reshape(n, -1))
+        distance_mask = _mask(threshold_distance_mask, distances.shape)
+        distance_count = distance_mask.sum(axis=1)
+        # Column-by-column accumulation keeps Python's left-to-right `sum` rounding.
+        distance_sum = np.zeros(n)
+        for column in range(distances.shape[1]):
+            distance_sum = distance_sum + np.where(distance_mask[:, column], distances[:, column], 0.0)
+
+    if history_deviations is None:
+        history_count = np.zeros(n, dtype=np.int64)
+        matches = np.zeros(n, dtype=np.int64)
+    else:
+        history = np.asarray(history_deviations, dtype=bool)
+        history_valid = _mask(history_mask, history.shape[:2])
+        history_count = history_valid.sum(axis=1)
+        matches = ((history == active[:, None, :]).all(axis=2) & history_valid).sum(axis=1)
+
+    available = np.asarray(available_days, dtype=np.float64)
+    required = np.broadcast_to(np.asarray(required_days, dtype=np.float64), available.shape)
+    components = _components(
+        _ArrayOps,
+        sufficient_count=(sufficiency & sufficiency_mask).sum(axis=1),
+        sufficiency_count=sufficiency_mask.sum(axis=1),
+        volatility=volatility,
+        volatility_known=volatility_known,
+        miss_count=active.sum(axis=1),
+        deviation_count=deviation_mask.sum(axis=1),
+        distance_sum=distance_sum,
+        distance_count=distance_count,
+        persistence_matches=matches,
+        history_count=history_count,
+        any_active=active.any(axis=1),
+        available_days=available,
+        required_days=required,
+    )
+
+    if previous_alignment_confidence is None:
+        previous = np.zeros(n)
+        previous_used = np.zeros(n, dtype=bool)
+    else:
+        previous = np.asarray(previous_alignment_confidence, dtype=np.float64)
+        previous_used = ~np.isnan(previous)
+    raw, alignment = _alignment(_ArrayOps, components, previous=previous, previous_known=previous_used, alpha=_clamp01(alpha))
+
+    if recommendation_reason_counts is None:
+        rec_confidence = np.zeros((n, 0))
+    else:
+        reason_counts = np.asarray(recommendation_reason_counts, dtype=np.int64).reshape(n, -1)
+        rec_confidence = _recommendation_confidence(
+            _ArrayOps,
+            alignment=alignment[:, None],
+            reason_count=reason_counts,
+            base_confidence=np.asarray(recommendation_base_confidence, dtype=np.float64).reshape(reason_counts.shape),
+        )
+        if recommendation_mask is not None:
+            rec_confidence = np.where(np.asarray(recommendation_mask, dtype=bool), rec_confidence, np.nan)
+
+    return ConfidenceBatch(
+        alignment_confidence=alignment,
+        raw_alignment_confidence=raw,
+        previous_used=previous_used,
+        components=dict(zip(CONFIDENCE_WEIGHTS, components)),
+        recommendation_confidence=rec_confidence,
+    )
 
-    current_active = {k for k, v in current_deviations.items() if v}
-    if not current_active:
-        return 0.7
 
+def _historical_matches(current_active: set[str], history: list[dict[str, Any]]) -> int:
     matches = 0
     for item in history:
         prev = item.get("deviations", {})
-        prev_active = {k for k, v in prev.items() if bool(v)}
-        if prev_active == current_active:
+        if {k for k, v in prev.items() if bool(v)} == current_active:
             matches += 1
-    return _clamp01(matches / len(history))
+    return matches
 
 
-def _window_sufficiency(*, available_days: int, required_days: int) -> float:
-    if required_days <= 0:
-        return 1.0
-    return _clamp01(available_days / required_days)
+def _persistence_matches(
+    current_active: set[str],
+    history: list[dict[str, Any]],
+    history_patterns: Mapping[frozenset[str], int] | None,
+) -> int:
+    if not current_active:
+        return 0
+    if history_patterns is not None:
+        return history_patterns.get(frozenset(current_active), 0)
+    return _historical_matches(current_active, history)
+
+
+def history_deviation_patterns(history: list[dict[str, Any]]) -> Counter[frozenset[str]]:
+    """Count of each active-deviation set in `history`, for repeated scoring against one history."""
+
+    return Counter(
+        frozenset(k for k, v in item.get("deviations", {}).items() if bool(v)) for item in history
+    )
 
 
 def compute_confidence(
@@ -84,6 +294,7 @@ def compute_confidence(
     deviations: dict[str, bool],
     recommendations: list[dict[str, Any]],
     history: list[dict[str, Any]] | None = None,
+    history_patterns: Mapping[frozenset[str], int] | None = None,
     threshold_distances: dict[str, float] | None = None,
     available_days: int = 7,
     required_days: int = 7,
@@ -91,67 +302,53 @@ def compute_confidence(
     alpha: float = 0.2,
     model_version: str = CONFIDENCE_VERSION,
 ) -> dict[str, Any]:
-    c_data = _data_completeness(signals)
-    c_stability = _signal_stability(signals)
-    c_distance = _threshold_distance_strength(
-        deviations=deviations,
-        threshold_distances=threshold_distances,
-    )
-    c_persistence = _historical_persistence(
-        current_deviations=deviations,
-        history=history,
-    )
-    c_window = _window_sufficiency(available_days=available_days, required_days=required_days)
-
-    weights = {
-        "data_completeness": 0.30,
-        "signal_stability": 0.20,
-        "threshold_distance": 0.20,
-        "historical_persistence": 0.20,
-        "window_sufficiency": 0.10,
-    }
-    raw_alignment_confidence = (
-        weights["data_completeness"] * c_data
-        + weights["signal_stability"] * c_stability
-        + weights["threshold_distance"] * c_distance
-        + weights["historical_persistence"] * c_persistence
-        + weights["window_sufficiency"] * c_window
-    )
-    raw_alignment_confidence = _clamp01(raw_alignment_confidence)
+    sufficiency = signals.sufficiency or {}
+    distances = [_clamp01(_safe_float(v)) for v in (threshold_distances or {}).values()]
+    current_active = {k for k, v in deviations.items() if v}
+    history = history or []
 
+    components = _components(
+        _ScalarOps,
+        sufficient_count=sum(1 for ok in sufficiency.values() if ok),
+        sufficiency_count=len(sufficiency),
+        volatility=_safe_float(signals.volatility_index),
+        volatility_known=signals.volatility_index is not None,
+        miss_count=len(current_active),
+        deviation_count=len(deviations),
+        distance_sum=sum(distances),
+        distance_count=len(distances),
+        persistence_matches=_persistence_matches(current_active, history, history_patterns),
+        history_count=len(history),
+        any_active=bool(current_active),
+        available_days=available_days,
+        required_days=required_days,
+    )
     alpha = _clamp01(alpha)
-    if previous_alignment_confidence is None:
-        alignment_confidence = raw_alignment_confidence
-        previous_used = False
-    else:
-        prev = _clamp01(previous_alignment_confidence)
-        alignment_confidence = _clamp01(alpha * prev + (1.0 - alpha) * raw_alignment_confidence)
-        previous_used = True
+    previous_used = previous_alignment_confidence is not None
+    _, alignment_confidence = _alignment(
+        _ScalarOps,
+        components,
+        previous=previous_alignment_confidence if previous_used else 0.0,
+        previous_known=previous_used,
+        alpha=alpha,
+    )
 
     recommendation_confidence: list[dict[str, Any]] = []
     for rec in recommendations:
-        rec_id = str(rec.get("id", "unknown"))
-        reason_codes = rec.get("reason_codes", [])
-        confidence_base = _safe_float(rec.get("confidence"), 0.5)
-        evidence_strength = _clamp01(min(len(reason_codes), 4) / 4)
-        rule_specificity = 0.8 if reason_codes else 0.4
-        conflict_penalty = 0.0 if reason_codes else 0.1
-
-        rec_conf = _clamp01(
-            0.20
-            + 0.35 * alignment_confidence
-            + 0.20 * evidence_strength
-            + 0.15 * rule_specificity
-            + 0.20 * confidence_base
-            - conflict_penalty
+        rec_conf = _recommendation_confidence(
+            _ScalarOps,
+            alignment=alignment_confidence,
+            reason_count=len(rec.get("reason_codes", [])),
+            base_confidence=_safe_float(rec.get("confidence"), 0.5),
         )
         recommendation_confidence.append(
             {
-                "id": rec_id,
+                "id": str(rec.get("id", "unknown")),
                 "confidence": round(rec_conf, 4),
             }
         )
 
+    c_data, c_stability, c_distance, c_persistence, c_window = components
     notes: list[str] = []
     if c_data < 0.7:
         notes.append("Lower confidence due to incomplete signal coverage.")
@@ -173,7 +370,7 @@ def compute_confidence(
                 "historical_persistence": round(c_persistence, 4),
                 "window_sufficiency": round(c_window, 4),
             },
-            "weights": weights,
+            "weights": dict(CONFIDENCE_WEIGHTS),
             "smoothing": {
                 "alpha": alpha,
                 "previous_used": previous_used,
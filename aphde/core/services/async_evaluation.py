@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import weakref
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+
+from core.engine.contracts import DomainDefinition, validate_domain_definition
+from core.services.run_evaluation import compute_evaluation, load_evaluation_inputs, persist_evaluation
+
+if TYPE_CHECKING:
+    from core.services.shadow_evaluation import ShadowEvaluator
+
+
+T = TypeVar("T")
+
+DEFAULT_IO_WORKERS = 8
+DEFAULT_MAX_CONCURRENCY_PER_DB = 4
+
+
+def _db_key(db_path: str | Path) -> str:
+    return str(Path(db_path).resolve())
+
+
+class AsyncEvaluationRuntime:
+    """
+    Bounded executors plus per-database admission control for the async facade.
+
+    SQLite work runs on a small I/O pool and engine compute on a separate CPU
+    pool, so any number of awaiting coroutines maps onto a fixed thread count.
+    Each database file admits at most `max_concurrency_per_db` I/O stages at a
+    time and serializes its writes; everything else waits on the event loop.
+    A `ProcessPoolExecutor` may be passed as `cpu_executor`; the compute stage
+    only receives picklable inputs.
+    """
+
+    def __init__(
+        self,
+        *,
+        io_workers: int = DEFAULT_IO_WORKERS,
+        cpu_workers: int | None = None,
+        max_concurrency_per_db: int = DEFAULT_MAX_CONCURRENCY_PER_DB,
+        cpu_executor: Executor | None = None,
+    ) -> None:
+        if io_workers <= 0 or max_concurrency_per_db <= 0:
+            raise ValueError("io_workers and max_concurrency_per_db must be positive")
+        self.max_concurrency_per_db = max_concurrency_per_db
+        self._io_executor = ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix="aphde-io")
+        self._owns_cpu_executor = cpu_executor is None
+        self._cpu_executor = cpu_executor or ThreadPoolExecutor(
+            max_workers=cpu_workers or os.cpu_count() or 2,
+            thread_name_prefix="aphde-cpu",
+        )
+        # asyncio primitives bind to the loop that first uses them, so they are
+        # kept per loop and dropped together with it.
+        self._loop_state: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, tuple[asyncio.Semaphore, asyncio.Lock]]
+        ] = weakref.WeakKeyDictionary()
+
+    def _db_guards(self, db_path: str | Path) -> tuple[asyncio.Semaphore, asyncio.Lock]:
+        loop = asyncio.get_running_loop()
+        per_loop = self._loop_state.setdefault(loop, {})
+        key = _db_key(db_path)
+        guards = per_loop.get(key)
+        if guards is None:
+            guards = (asyncio.Semaphore(self.max_concurrency_per_db), asyncio.Lock())
+            per_loop[key] = guards
+        return guards
+
+    async def run_io(self, db_path: str | Path, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        slots, _ = self._db_guards(db_path)
+        async with slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._io_executor, partial(fn, *args, **kwargs))
+
+    async def run_write(self, db_path: str | Path, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        _, write_lock = self._db_guards(db_path)
+        async with write_lock:
+            return await self.run_io(db_path, fn, *args, **kwargs)
+
+    async def run_cpu(self, fn: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._cpu_executor, fn, *args)
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        self._io_executor.shutdown(wait=wait, cancel_futures=True)
+        if self._owns_cpu_executor:
+            self._cpu_executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_default_runtime: AsyncEvaluationRuntime | None = None
+_default_runtime_lock = threading.Lock()
+
+
+def get_default_runtime() -> AsyncEvaluationRuntime:
+    global _default_runtime
+    with _default_runtime_lock:
+        if _default_runtime is None:
+            _default_runtime = AsyncEvaluationRuntime()
+        return _default_runtime
+
+
+async def _run_evaluation_stages(
+    *,
+    user_id: int,
+    db_path: str,
+    domain: DomainDefinition,
+    runtime: AsyncEvaluationRuntime,
+    shadow: ShadowEvaluator | None = None,
+) -> int:
+    inputs = await runtime.run_io(db_path, load_evaluation_inputs, user_id, db_path)
+    outcome = await runtime.run_cpu(compute_evaluation, inputs, domain)
+    decision_id = await runtime.run_write(db_path, persist_evaluation, outcome, db_path)
+    if shadow is not None:
+        shadow.submit(inputs, outcome, decision_id=decision_id)
+    return decision_id
+
+
+async def async_run_evaluation(
+    user_id: int,
+    db_path: str = "aphde.db",
+    domain_definition: DomainDefinition | None = None,
+    *,
+    timeout: float | None = None,
+    runtime: AsyncEvaluationRuntime | None = None,
+    shadow: ShadowEvaluator | None = None,
+) -> int:
+    """
+    Async counterpart of `run_evaluation`.
+
+    Cancellation or timeout before the persist stage starts leaves the database
+    untouched; a write that has already been handed to the I/O pool still
+    completes in the background.
+    """
+
+    if domain_definition is None:
+        raise ValueError("domain_definition is required")
+    domain = validate_domain_definition(domain_definition)
+    runtime = runtime or get_default_runtime()
+    return await asyncio.wait_for(
+        _run_evaluation_stages(user_id=user_id, db_path=db_path, domain=domain, runtime=runtime, shadow=shadow),
+        timeout=timeout,
+    )
+
+
+async def run_db_read(
+    db_path: str,
+    fn: Callable[..., T],
+    /,
+    *args: Any,
+    timeout: float | None = None,
+    runtime: AsyncEvaluationRuntime | None = None,
+    **kwargs: Any,
+) -> T:
+    """Run a blocking read-side loader on the I/O pool under the per-database limit."""
+
+    runtime = runtime or get_default_runtime()
+    return await asyncio.wait_for(runtime.run_io(db_path, fn, *args, **kwargs), timeout=timeout)
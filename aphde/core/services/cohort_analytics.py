@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from typing import Any
+
+from core.data.db import get_connection
+from core.data.repositories.decision_repo import DecisionRunRepository
+from core.governance.cohort_analytics import DEFAULT_ALIGNMENT_BINS, CohortAccumulator
+
+
+DEFAULT_CHUNK_SIZE = 50_000
+
+
+def analyze_cohort(
+    db_path: str = "aphde.db",
+    *,
+    since: str | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    alignment_bins: int = DEFAULT_ALIGNMENT_BINS,
+) -> dict[str, Any]:
+    """
+    Population aggregates over every user's decision runs (optionally only runs
+    with `run_date >= since`), scanned in id-ordered chunks of `chunk_size`.
+    """
+
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    accumulator = CohortAccumulator(alignment_bins=alignment_bins)
+    with get_connection(db_path) as conn:
+        repo = DecisionRunRepository(conn)
+        after_id = 0
+        while True:
+            rows = repo.scan_columns(after_id=after_id, limit=chunk_size, since=since)
+            if not rows:
+                break
+            first_id, last_id = int(rows[0][0]), int(rows[-1][0])
+            accumulator.add_chunk(rows, repo.triggered_rules_between(first_id, last_id))
+            after_id = last_id
+    return accumulator.result()
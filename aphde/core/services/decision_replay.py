@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import json
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any
+
+from core.context.timeline import ContextTimeline
+from core.data.db import get_connection
+from core.data.migrations.migrate_v9_decision_replays import run_migration
+from core.data.repositories.calorie_repo import CalorieLogRepository
+from core.data.repositories.context_repo import ContextInputRepository
+from core.data.repositories.decision_replay_repo import DecisionReplayRepository
+from core.data.repositories.goal_repo import GoalRepository
+from core.data.repositories.weight_repo import WeightLogRepository
+from core.data.repositories.workout_repo import WorkoutLogRepository
+from core.decision.engine import run_decision_engine
+from core.decision.history import history_from_decision_rows
+from core.engine.contracts import DomainDefinition, DomainLogs, validate_domain_definition
+from core.services.user_batches import iter_user_batches
+
+
+# Same lookback as `load_evaluation_inputs` (`list_recent(days=28)` / `list_recent(limit=10)`).
+REPLAY_LOG_WINDOW_DAYS = 28
+REPLAY_HISTORY_LIMIT = 10
+
+
+@dataclass(slots=True)
+class ReplayResult:
+    engine_version: str
+    users_processed: int = 0
+    days_evaluated: int = 0
+    days_skipped: int = 0
+    rows_written: int = 0
+    user_ids: list[int] = field(default_factory=list)
+
+
+class _TrailingWindow:
+    """
+    Rows sorted by `log_date`, exposed as the trailing window ending at an
+    as-of date. Dates must be advanced in ascending order; each row is added
+    and evicted once.
+    """
+
+    def __init__(self, rows: Sequence[dict[str, Any]], window_days: int) -> None:
+        self._rows = rows
+        self._next = 0
+        self._window: deque[dict[str, Any]] = deque()
+        self.window_days = window_days
+
+    def advance(self, as_of: date) -> list[dict[str, Any]]:
+        end = as_of.isoformat()
+        start = (as_of - timedelta(days=self.window_days)).isoformat()
+        while self._next < len(self._rows) and self._rows[self._next]["log_date"] <= end:
+            self._window.append(self._rows[self._next])
+            self._next += 1
+        while self._window and self._window[0]["log_date"] < start:
+            self._window.popleft()
+        return list(self._window)
+
+
+def _goal_as_of(goals: Sequence[dict[str, Any]], as_of: date) -> dict[str, Any] | None:
+    # On a switch day the old goal's `active_to` equals the new goal's
+    # `active_from`; the newer goal wins, as with `get_active_goal`.
+    day = as_of.isoformat()
+    for goal in reversed(goals):
+        if goal["active_from"] <= day and (goal["active_to"] is None or goal["active_to"] > day):
+            return goal
+    return None
+
+
+def replay_user_decisions(
+    user_id: int,
+    start_date: date,
+    end_date: date,
+    *,
+    engine_version: str,
+    domain_definition: DomainDefinition,
+    db_path: str = "aphde.db",
+    window_days: int = REPLAY_LOG_WINDOW_DAYS,
+    history_limit: int = REPLAY_HISTORY_LIMIT,
+    context_timeline: ContextTimeline | None = None,
+) -> ReplayResult:
+    """
+    Re-run the decision pipeline for every date in `[start_date, end_date]` as
+    if evaluated on that date, writing results to `decision_replays` under
+    `engine_version`.
+
+    Each log table is read once for the whole range and streamed through a
+    trailing window. Decision history for a date is the replayed history of the
+    same engine version (seeded from rows already stored before `start_date`),
+    so replays can be resumed range by range. Dates without an active goal are
+    skipped. The context for each date comes from `context_timeline` (built
+    for this user if not given).
+    """
+
+    if end_date < start_date:
+        raise ValueError("end_date must not be before start_date")
+    domain = validate_domain_definition(domain_definition)
+    run_migration(db_path)
+    result = ReplayResult(engine_version=engine_version)
+    load_start = start_date - timedelta(days=window_days)
+
+    with get_connection(db_path) as conn:
+        goals = [dict(row) for row in GoalRepository(conn).list_for_user(user_id)]
+        windows = {
+            "weight_logs": _TrailingWindow(
+                [dict(row) for row in WeightLogRepository(conn).list_between(user_id, load_start, end_date)],
+                window_days,
+            ),
+            "calorie_logs": _TrailingWindow(
+                [dict(row) for row in CalorieLogRepository(conn).list_between(user_id, load_start, end_date)],
+                window_days,
+            ),
+            "workout_logs": _TrailingWindow(
+                [dict(row) for row in WorkoutLogRepository(conn).list_between(user_id, load_start, end_date)],
+                window_days,
+            ),
+        }
+        if context_timeline is None:
+            context_timeline = ContextTimeline.from_rows(ContextInputRepository(conn).list_until(user_id, end_date))
+        seed_rows = DecisionReplayRepository(conn).list_recent_before(
+            engine_version=engine_version, user_id=user_id, before=start_date, limit=history_limit
+        )
+
+    # Newest first, like `list_recent` in the live evaluation path.
+    history: deque[dict[str, Any]] = deque(history_from_decision_rows(seed_rows), maxlen=history_limit)
+    previous_alignment_confidence = float(seed_rows[0]["alignment_confidence"]) if seed_rows else None
+    config = domain.get_domain_config()
+    rows: list[dict[str, Any]] = []
+
+    day = start_date
+    while day <= end_date:
+        items = {name: window.advance(day) for name, window in windows.items()}
+        context_input = context_timeline.payload_at(user_id, day)
+        goal = _goal_as_of(goals, day)
+        if goal is None:
+            result.days_skipped += 1
+            day += timedelta(days=1)
+            continue
+
+        goal_type = domain.normalize_goal_type(str(goal["goal_type"]))
+        signals = domain.compute_signals(DomainLogs(items=items, metadata={"user_id": user_id}), config=config)
+        decision = run_decision_engine(
+            strategy=domain.get_strategy(goal_type),
+            signals=signals,
+            target=json.loads(goal["target_json"]) if goal["target_json"] else {},
+            input_summary={
+                "user_id": user_id,
+                "goal_id": int(goal["id"]),
+                "goal_type": goal_type,
+                "weight_log_count": len(items["weight_logs"]),
+                "calorie_log_count": len(items["calorie_logs"]),
+                "workout_log_count": len(items["workout_logs"]),
+            },
+            history=list(history),
+            previous_alignment_confidence=previous_alignment_confidence,
+            context_input=context_input,
+            engine_version=engine_version,
+        )
+        decision.trace["domain_name"] = domain.domain_name()
+        decision.trace["domain_version"] = domain.domain_version()
+        rows.append(
+            {
+                "engine_version": engine_version,
+                "user_id": user_id,
+                "goal_id": int(goal["id"]),
+                "replay_date": day,
+                "alignment_score": decision.alignment_score,
+                "risk_score": decision.risk_score,
+                "alignment_confidence": decision.alignment_confidence,
+                "recommendations": decision.recommendations,
+                "confidence_version": decision.confidence_version,
+                "context_applied": decision.context_applied,
+                "trace": decision.trace,
+            }
+        )
+        history.appendleft(
+            {
+                "deviations": decision.trace.get(
+                    "deviations", decision.trace.get("computed_signals", {}).get("deviations", {})
+                ),
+                "triggered_rules": decision.trace.get("triggered_rules", []),
+            }
+        )
+        previous_alignment_confidence = float(decision.alignment_confidence)
+        result.days_evaluated += 1
+        day += timedelta(days=1)
+
+    if rows:
+        with get_connection(db_path) as conn:
+            DecisionReplayRepository(conn).upsert_many(rows)
+    result.rows_written = len(rows)
+    result.users_processed = 1
+    result.user_ids.append(user_id)
+    return result
+
+
+def replay_decisions(
+    start_date: date,
+    end_date: date,
+    *,
+    engine_version: str,
+    domain_definition: DomainDefinition,
+    db_path: str = "aphde.db",
+    user_ids: Sequence[int] | None = None,
+    chunk_size: int = 500,
+) -> ReplayResult:
+    """Replay `user_ids`, or every active user read in chunks of `chunk_size`."""
+
+    total = ReplayResult(engine_version=engine_version)
+
+    for batch in iter_user_batches(db_path, user_ids=user_ids, chunk_size=chunk_size):
+        # One context query per batch instead of one per user.
+        with get_connection(db_path) as conn:
+            timeline = ContextTimeline.from_rows(ContextInputRepository(conn).list_for_users(batch, end_date=end_date))
+        for user_id in batch:
+            partial = replay_user_decisions(
+                user_id,
+                start_date,
+                end_date,
+                engine_version=engine_version,
+                domain_definition=domain_definition,
+                db_path=db_path,
+                context_timeline=timeline,
+            )
+            total.users_processed += 1
+            total.days_evaluated += partial.days_evaluated
+            total.days_skipped += partial.days_skipped
+            total.rows_written += partial.rows_written
+            total.user_ids.append(user_id)
+
+    return total
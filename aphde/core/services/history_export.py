@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from core.data.db import get_connection
+from core.data.repositories.decision_repo import DecisionRunRepository
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.parquet as pa_parquet
+except ImportError:  # pyarrow is optional; the .npy layout needs only numpy.
+    pa = None
+    pa_ipc = None
+    pa_parquet = None
+
+
+SIGNAL_COLUMNS: tuple[str, ...] = (
+    "trend_slope",
+    "volatility_index",
+    "compliance_ratio",
+    "muscle_balance_index",
+    "recovery_index",
+    "progressive_overload_score",
+)
+
+# Column name -> numpy dtype, in `DecisionRunRepository.scan_export_columns` order.
+# Text columns use unsized "U" so each part is as wide as its longest value.
+EXPORT_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("id", "int64"),
+    ("user_id", "int64"),
+    ("goal_id", "int64"),
+    ("goal_type", "U"),
+    ("run_ts", "datetime64[ms]"),
+    ("engine_version", "U"),
+    ("alignment_score", "float64"),
+    ("risk_score", "float64"),
+    ("alignment_confidence", "float64"),
+    ("context_applied", "bool"),
+    ("determinism_verified", "int8"),
+    ("triggered_rule_count", "int32"),
+    *((name, "float64") for name in SIGNAL_COLUMNS),
+)
+
+EXPORT_FORMATS: tuple[str, ...] = ("arrow", "parquet", "npy")
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+DEFAULT_EXPORT_CHUNK_SIZE = 100_000
+
+
+@dataclass(slots=True)
+class ExportResult:
+    format: str
+    watermark: int
+    rows_written: int
+    parts_written: list[str] = field(default_factory=list)
+
+
+def _rows_to_columns(rows: Sequence[Sequence[Any]]) -> dict[str, np.ndarray]:
+    raw_columns = list(zip(*rows))
+    columns: dict[str, np.ndarray] = {}
+    for (name, dtype), values in zip(EXPORT_COLUMNS, raw_columns):
+        if dtype.startswith("datetime64"):
+            columns[name] = np.asarray(values, dtype=np.int64).astype(dtype)
+        else:
+            # None becomes NaN for the float signal columns.
+            columns[name] = np.asarray(values, dtype=dtype)
+    return columns
+
+
+def _arrow_table(columns: dict[str, np.ndarray]) -> Any:
+    arrays = {}
+    for name, values in columns.items():
+        if values.dtype.kind == "M":
+            arrays[name] = pa.array(values).cast(pa.timestamp("ms", tz="UTC"))
+        elif values.dtype.kind == "f":
+            arrays[name] = pa.array(values, from_pandas=True)
+        else:
+            arrays[name] = pa.array(values)
+    return pa.table(arrays)
+
+
+def _read_manifest(out_dir: Path) -> dict[str, Any] | None:
+    path = out_dir / MANIFEST_NAME
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _write_manifest(out_dir: Path, manifest: dict[str, Any]) -> None:
+    tmp_path = out_dir / f"{MANIFEST_NAME}.tmp"
+    tmp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp_path, out_dir / MANIFEST_NAME)
+
+
+def _resolve_format(requested: str, manifest: dict[str, Any] | None) -> str:
+    if manifest is not None:
+        existing = str(manifest["format"])
+        if requested not in {"auto", existing}:
+            raise ValueError(f"export directory already uses format '{existing}'")
+        return existing
+    if requested == "auto":
+        return "arrow" if pa is not None else "npy"
+    if requested not in EXPORT_FORMATS:
+        raise ValueError(f"format must be one of {', '.join(EXPORT_FORMATS)} or 'auto'")
+    if requested in {"arrow", "parquet"} and pa is None:
+        raise ValueError(f"format '{requested}' requires pyarrow")
+    return requested
+
+
+def _write_part(out_dir: Path, fmt: str, name: str, columns: dict[str, np.ndarray]) -> str:
+    if fmt == "npy":
+        part_name = name
+        tmp_dir = out_dir / f"{part_name}.tmp"
+        tmp_dir.mkdir(exist_ok=True)
+        for column, values in columns.items():
+            np.save(tmp_dir / f"{column}.npy", values, allow_pickle=False)
+        part_dir = out_dir / part_name
+        if part_dir.exists():
+            # Left by a run that stopped before recording it in the manifest.
+            shutil.rmtree(part_dir)
+        os.replace(tmp_dir, part_dir)
+        return part_name
+
+    part_name = f"{name}.{fmt}"
+    tmp_path = out_dir / f"{part_name}.tmp"
+    table = _arrow_table(columns)
+    if fmt == "arrow":
+        # Uncompressed IPC file so readers can memory-map it without copying.
+        with pa.OSFile(str(tmp_path), "wb") as sink, pa_ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    else:
+        pa_parquet.write_table(table, str(tmp_path))
+    os.replace(tmp_path, out_dir / part_name)
+    return part_name
+
+
+def export_decision_history(
+    db_path: str = "aphde.db",
+    out_dir: str | Path = "exports/decision_history",
+    *,
+    format: str = "auto",
+    chunk_size: int = DEFAULT_EXPORT_CHUNK_SIZE,
+) -> ExportResult:
+    """
+    Append decision runs newer than the directory's watermark as new part files.
+
+    Each chunk of `chunk_size` runs becomes one immutable part; the manifest
+    (parts + watermark) is replaced atomically after every part, so an
+    interrupted export resumes from the last completed part.
+    """
+
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    out_path = Path(out_dir)
+    out_path.mkdir(parents=True, exist_ok=True)
+    manifest = _read_manifest(out_path)
+    fmt = _resolve_format(format, manifest)
+    if manifest is None:
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "format": fmt,
+            "columns": [{"name": name, "dtype": dtype} for name, dtype in EXPORT_COLUMNS],
+            "watermark": 0,
+            "row_count": 0,
+            "parts": [],
+        }
+
+    result = ExportResult(format=fmt, watermark=int(manifest["watermark"]), rows_written=0)
+    with get_connection(db_path) as conn:
+        repo = DecisionRunRepository(conn)
+        while True:
+            rows = repo.scan_export_columns(after_id=result.watermark, limit=chunk_size)
+            if not rows:
+                break
+            first_id, last_id = int(rows[0][0]), int(rows[-1][0])
+            part_name = _write_part(out_path, fmt, f"part-{first_id:012d}-{last_id:012d}", _rows_to_columns(rows))
+            manifest["parts"].append(
+                {"name": part_name, "first_id": first_id, "last_id": last_id, "rows": len(rows)}
+            )
+            manifest["watermark"] = last_id
+            manifest["row_count"] = int(manifest["row_count"]) + len(rows)
+            _write_manifest(out_path, manifest)
+
+            result.watermark = last_id
+            result.rows_written += len(rows)
+            result.parts_written.append(part_name)
+
+    if not (out_path / MANIFEST_NAME).exists():
+        _write_manifest(out_path, manifest)
+    return result
+
+
+def iter_history_parts(out_dir: str | Path, columns: Sequence[str] | None = None) -> Iterator[dict[str, np.ndarray]]:
+    """
+    Yield each exported part as NumPy columns. `.npy` parts and non-null
+    numeric Arrow columns are memory-mapped views; nullable signal columns are
+    materialized with NaN for missing values.
+    """
+
+    out_path = Path(out_dir)
+    manifest = _read_manifest(out_path)
+    if manifest is None:
+        return
+    fmt = str(manifest["format"])
+    wanted = list(columns) if columns is not None else [item["name"] for item in manifest["columns"]]
+    for part in manifest["parts"]:
+        part_path = out_path / part["name"]
+        if fmt == "npy":
+            yield {name: np.load(part_path / f"{name}.npy", mmap_mode="r") for name in wanted}
+            continue
+        if pa is None:
+            raise ValueError(f"reading '{fmt}' exports requires pyarrow")
+        if fmt == "arrow":
+            # The table's buffers keep the mapping alive after this generator moves on.
+            table = pa_ipc.open_file(pa.memory_map(str(part_path), "r")).read_all().select(wanted)
+        else:
+            table = pa_parquet.read_table(str(part_path), columns=wanted, memory_map=True)
+        yield {name: _column_to_numpy(table.column(name)) for name in wanted}
+
+
+def _column_to_numpy(column: Any) -> np.ndarray:
+    if pa.types.is_timestamp(column.type):
+        column = column.cast(pa.timestamp("ms"))
+    if pa.types.is_string(column.type):
+        return np.asarray(column.to_pylist(), dtype="U")
+    return column.to_numpy()
+
+
+def load_history_columns(out_dir: str | Path, columns: Sequence[str] | None = None) -> dict[str, np.ndarray]:
+    """Concatenate every part; a single-part export is returned without copying."""
+
+    parts = list(iter_history_parts(out_dir, columns))
+    if not parts:
+        names = list(columns) if columns is not None else [name for name, _ in EXPORT_COLUMNS]
+        dtypes = dict(EXPORT_COLUMNS)
+        return {name: np.zeros(0, dtype=dtypes[name]) for name in names}
+    if len(parts) == 1:
+        return parts[0]
+    return {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
@@ -1,12 +1,20 @@
 ﻿from __future__ import annotations
 
 import json
-from typing import Any
+import logging
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
 from core.data.db import get_connection
 from core.data.migrations.migrate_v2_confidence import run_migration
 from core.data.migrations.migrate_v3_context import run_migration as run_context_migration
 from core.data.migrations.migrate_v5_governance import run_migration as run_governance_migration
+from core.data.migrations.migrate_v8_data_versions import run_migration as run_data_version_migration
+from core.data.migrations.migrate_v13_insight_alerts import run_migration as run_insight_alert_migration
+from core.data.migrations.migrate_v14_weekly_aggregates import run_migration as run_weekly_aggregate_migration
+from core.data.migrations.migrate_v15_tomorrow_plans import run_migration as run_tomorrow_plan_migration
 from core.data.repositories.calorie_repo import CalorieLogRepository
 from core.data.repositories.context_repo import ContextInputRepository
 from core.data.repositories.decision_repo import DecisionRunRepository
@@ -15,31 +23,21 @@ from core.data.repositories.weight_repo import WeightLogRepository
 from core.data.repositories.workout_repo import WorkoutLogRepository
 from core.engine.contracts import DomainDefinition, DomainLogs, validate_domain_definition
 from core.decision.engine import run_decision_engine
-from core.governance.determinism import verify_determinism
+from core.decision.history import history_from_decision_rows
+from core.governance.determinism import DeterminismResult, verify_determinism
 from core.governance.hashing import canonical_sha256
+from core.guidance.persistence_index import RecommendationPersistenceStore
+from core.insights.stagnation_detector import StagnationDetector
+from core.insights.weekly_aggregates import WeeklyAggregator
 
+if TYPE_CHECKING:
+    from core.services.shadow_evaluation import ShadowEvaluator
 
-def _row_to_dicts(rows: list[Any]) -> list[dict[str, Any]]:
-    return [dict(row) for row in rows]
+logger = logging.getLogger(__name__)
 
 
-def _history_from_decision_rows(rows: list[Any]) -> list[dict[str, Any]]:
-    history: list[dict[str, Any]] = []
-    for row in rows:
-        trace_raw = row["trace_json"] if "trace_json" in row.keys() else None
-        if not trace_raw:
-            continue
-        try:
-            trace = json.loads(trace_raw)
-        except (TypeError, json.JSONDecodeError):
-            continue
-        history.append(
-            {
-                "deviations": trace.get("deviations", trace.get("computed_signals", {}).get("deviations", {})),
-                "triggered_rules": trace.get("triggered_rules", []),
-            }
-        )
-    return history
+def _row_to_dicts(rows: list[Any]) -> list[dict[str, Any]]:
+    return [dict(row) for row in rows]
 
 
 def _build_input_signature_payload(
@@ -73,7 +71,9 @@ def _build_input_signature_payload(
     }
 
 
-def _build_output_payload(result: Any) -> dict[str, Any]:
+def build_output_payload(result: Any) -> dict[str, Any]:
+    """Fields of a decision result compared by determinism checks and shadow runs."""
+
     return {
         "alignment_score": result.alignment_score,
         "risk_score": result.risk_score,
@@ -120,133 +120,204 @@ def _output_payload_from_row(row: Any) -> dict[str, Any]:
     }
 
 
-def run_evaluation(
-    user_id: int,
-    db_path: str = "aphde.db",
-    domain_definition: DomainDefinition | None = None,
-) -> int:
-    # Ensure older local databases are upgraded before accessing V2 confidence fields.
-    run_migration(db_path)
-    run_context_migration(db_path)
-    run_governance_migration(db_path)
-    if domain_definition is None:
-        raise ValueError("domain_definition is required")
-    domain = validate_domain_definition(domain_definition)
+@dataclass(slots=True)
+class EvaluationInputs:
+    """
+    Everything read from storage for one evaluation. Rows are plain dicts so
+    the bundle can cross thread/process boundaries between I/O and compute.
+    """
+
+    user_id: int
+    goal_id: int
+    raw_goal_type: str
+    target: dict[str, Any]
+    context_input: dict[str, Any] | None
+    weight_logs: list[dict[str, Any]]
+    calorie_logs: list[dict[str, Any]]
+    workout_logs: list[dict[str, Any]]
+    recent_decisions: list[dict[str, Any]]
+
+
+@dataclass(slots=True)
+class EvaluationOutcome:
+    user_id: int
+    goal_id: int
+    result: Any
+    determinism: DeterminismResult
+    governance_json: dict[str, Any]
+
+
+_MIGRATED_DB_PATHS: set[str] = set()
+_MIGRATION_LOCK = threading.Lock()
+
+
+def ensure_evaluation_schema(db_path: str) -> None:
+    """Upgrade an older database to the tables evaluation reads and writes, once per process and path."""
+
+    if db_path in _MIGRATED_DB_PATHS:
+        return
+    with _MIGRATION_LOCK:
+        if db_path in _MIGRATED_DB_PATHS:
+            return
+        run_migration(db_path)
+        run_context_migration(db_path)
+        run_governance_migration(db_path)
+        run_data_version_migration(db_path)
+        run_insight_alert_migration(db_path)
+        run_weekly_aggregate_migration(db_path)
+        run_tomorrow_plan_migration(db_path)
+        _MIGRATED_DB_PATHS.add(db_path)
+
+
+def load_evaluation_inputs(user_id: int, db_path: str = "aphde.db") -> EvaluationInputs:
+    # Older local databases are upgraded on the first evaluation only; each
+    # migration opens a connection and commits DDL, too costly per call.
+    ensure_evaluation_schema(str(db_path))
     with get_connection(db_path) as conn:
-        goal_repo = GoalRepository(conn)
-        decision_repo = DecisionRunRepository(conn)
-        context_repo = ContextInputRepository(conn)
-        weight_repo = WeightLogRepository(conn)
-        calorie_repo = CalorieLogRepository(conn)
-        workout_repo = WorkoutLogRepository(conn)
-
-        goal = goal_repo.get_active_goal(user_id)
+        goal = GoalRepository(conn).get_active_goal(user_id)
         if goal is None:
             raise ValueError("No active goal found for user")
 
-        normalized_goal_type = domain.normalize_goal_type(str(goal["goal_type"]))
-        target = json.loads(goal["target_json"]) if goal["target_json"] else {}
         context_input = None
-        latest_context = context_repo.latest_for_user(user_id=user_id, context_type="cycle")
+        latest_context = ContextInputRepository(conn).latest_for_user(user_id=user_id, context_type="cycle")
         if latest_context is not None:
             try:
                 context_input = json.loads(latest_context["context_payload_json"])
             except (TypeError, json.JSONDecodeError):
                 context_input = None
 
-        weight_logs = _row_to_dicts(weight_repo.list_recent(user_id, days=28))
-        calorie_logs = _row_to_dicts(calorie_repo.list_recent(user_id, days=28))
-        workout_logs = _row_to_dicts(workout_repo.list_recent(user_id, days=28))
-
-        signals = domain.compute_signals(
-            DomainLogs(
-                items={
-                    "weight_logs": weight_logs,
-                    "calorie_logs": calorie_logs,
-                    "workout_logs": workout_logs,
-                },
-                metadata={"user_id": user_id},
-            ),
-            config=domain.get_domain_config(),
-        )
-
-        strategy = domain.get_strategy(normalized_goal_type)
-        recent_decisions = decision_repo.list_recent(user_id=user_id, limit=10)
-        history = _history_from_decision_rows(recent_decisions)
-        previous_alignment_confidence = None
-        if recent_decisions:
-            first_row = recent_decisions[0]
-            if "alignment_confidence" in first_row.keys():
-                previous_alignment_confidence = float(first_row["alignment_confidence"])
-
-        result = run_decision_engine(
-            strategy=strategy,
-            signals=signals,
-            target=target,
-            input_summary={
-                "user_id": user_id,
-                "goal_id": int(goal["id"]),
-                "goal_type": normalized_goal_type,
-                "weight_log_count": len(weight_logs),
-                "calorie_log_count": len(calorie_logs),
-                "workout_log_count": len(workout_logs),
-            },
-            history=history,
-            previous_alignment_confidence=previous_alignment_confidence,
-            context_input=context_input,
-        )
-        result.trace["domain_name"] = domain.domain_name()
-        result.trace["domain_version"] = domain.domain_version()
-
-        input_signature_payload = _build_input_signature_payload(
+        return EvaluationInputs(
             user_id=user_id,
             goal_id=int(goal["id"]),
-            goal_type=normalized_goal_type,
-            target=target,
-            domain_name=domain.domain_name(),
-            domain_version=domain.domain_version(),
+            raw_goal_type=str(goal["goal_type"]),
+            target=json.loads(goal["target_json"]) if goal["target_json"] else {},
             context_input=context_input,
-            weight_logs=weight_logs,
-            calorie_logs=calorie_logs,
-            workout_logs=workout_logs,
-            previous_alignment_confidence=previous_alignment_confidence,
-            history=history,
+            weight_logs=_row_to_dicts(WeightLogRepository(conn).list_recent(user_id, days=28)),
+            calorie_logs=_row_to_dicts(CalorieLogRepository(conn).list_recent(user_id, days=28)),
+            workout_logs=_row_to_dicts(WorkoutLogRepository(conn).list_recent(user_id, days=28)),
+            recent_decisions=_row_to_dicts(DecisionRunRepository(conn).list_recent(user_id=user_id, limit=10)),
         )
-        output_payload = _build_output_payload(result)
-        input_signature_hash = canonical_sha256(input_signature_payload)
 
-        comparable_row = next(
-            (
-                row
-                for row in recent_decisions
-                if "input_signature_hash" in row.keys()
-                and row["input_signature_hash"] == input_signature_hash
-                and "output_hash" in row.keys()
-                and row["output_hash"]
-            ),
-            None,
-        )
-        baseline_payload = _output_payload_from_row(comparable_row) if comparable_row is not None else None
-        determinism = verify_determinism(
-            input_signature_payload=input_signature_payload,
-            output_payload=output_payload,
-            baseline_output_payload=baseline_payload,
-        )
-        governance_json = {
-            "determinism_reason": determinism.determinism_reason,
-            "baseline_decision_id": int(comparable_row["id"]) if comparable_row is not None else None,
-        }
-        result.trace["governance"] = {
-            "input_signature_hash": determinism.input_signature_hash,
-            "output_hash": determinism.output_hash,
-            "determinism_verified": determinism.determinism_verified,
-            "determinism_reason": determinism.determinism_reason,
-            "baseline_decision_id": governance_json["baseline_decision_id"],
-        }
-
-        return decision_repo.create(
-            user_id=user_id,
-            goal_id=int(goal["id"]),
+
+def compute_evaluation(
+    inputs: EvaluationInputs,
+    domain: DomainDefinition,
+    *,
+    engine_version: str = "v1",
+) -> EvaluationOutcome:
+    """
+    Pure compute stage: signals, decision engine and determinism check.
+    Performs no storage access.
+    """
+
+    user_id = inputs.user_id
+    weight_logs = inputs.weight_logs
+    calorie_logs = inputs.calorie_logs
+    workout_logs = inputs.workout_logs
+    recent_decisions = inputs.recent_decisions
+    normalized_goal_type = domain.normalize_goal_type(inputs.raw_goal_type)
+
+    signals = domain.compute_signals(
+        DomainLogs(
+            items={
+                "weight_logs": weight_logs,
+                "calorie_logs": calorie_logs,
+                "workout_logs": workout_logs,
+            },
+            metadata={"user_id": user_id},
+        ),
+        config=domain.get_domain_config(),
+    )
+
+    strategy = domain.get_strategy(normalized_goal_type)
+    history = history_from_decision_rows(recent_decisions)
+    previous_alignment_confidence = None
+    if recent_decisions:
+        first_row = recent_decisions[0]
+        if "alignment_confidence" in first_row.keys():
+            previous_alignment_confidence = float(first_row["alignment_confidence"])
+
+    result = run_decision_engine(
+        strategy=strategy,
+        signals=signals,
+        target=inputs.target,
+        input_summary={
+            "user_id": user_id,
+            "goal_id": inputs.goal_id,
+            "goal_type": normalized_goal_type,
+            "weight_log_count": len(weight_logs),
+            "calorie_log_count": len(calorie_logs),
+            "workout_log_count": len(workout_logs),
+        },
+        history=history,
+        previous_alignment_confidence=previous_alignment_confidence,
+        context_input=inputs.context_input,
+        engine_version=engine_version,
+    )
+    result.trace["domain_name"] = domain.domain_name()
+    result.trace["domain_version"] = domain.domain_version()
+
+    input_signature_payload = _build_input_signature_payload(
+        user_id=user_id,
+        goal_id=inputs.goal_id,
+        goal_type=normalized_goal_type,
+        target=inputs.target,
+        domain_name=domain.domain_name(),
+        domain_version=domain.domain_version(),
+        context_input=inputs.context_input,
+        weight_logs=weight_logs,
+        calorie_logs=calorie_logs,
+        workout_logs=workout_logs,
+        previous_alignment_confidence=previous_alignment_confidence,
+        history=history,
+    )
+    output_payload = build_output_payload(result)
+    input_signature_hash = canonical_sha256(input_signature_payload)
+
+    comparable_row = next(
+        (
+            row
+            for row in recent_decisions
+            if "input_signature_hash" in row.keys()
+            and row["input_signature_hash"] == input_signature_hash
+            and "output_hash" in row.keys()
+            and row["output_hash"]
+        ),
+        None,
+    )
+    baseline_payload = _output_payload_from_row(comparable_row) if comparable_row is not None else None
+    determinism = verify_determinism(
+        input_signature_payload=input_signature_payload,
+        output_payload=output_payload,
+        baseline_output_payload=baseline_payload,
+    )
+    governance_json = {
+        "determinism_reason": determinism.determinism_reason,
+        "baseline_decision_id": int(comparable_row["id"]) if comparable_row is not None else None,
+    }
+    result.trace["governance"] = {
+        "input_signature_hash": determinism.input_signature_hash,
+        "output_hash": determinism.output_hash,
+        "determinism_verified": determinism.determinism_verified,
+        "determinism_reason": determinism.determinism_reason,
+        "baseline_decision_id": governance_json["baseline_decision_id"],
+    }
+    return EvaluationOutcome(
+        user_id=user_id,
+        goal_id=inputs.goal_id,
+        result=result,
+        determinism=determinism,
+        governance_json=governance_json,
+    )
+
+
+def persist_evaluation(outcome: EvaluationOutcome, db_path: str = "aphde.db") -> int:
+    result = outcome.result
+    determinism = outcome.determinism
+    with get_connection(db_path) as conn:
+        decision_id = DecisionRunRepository(conn).create(
+            user_id=outcome.user_id,
+            goal_id=outcome.goal_id,
             alignment_score=result.alignment_score,
             risk_score=result.risk_score,
             alignment_confidence=result.alignment_confidence,
@@ -260,7 +331,55 @@ def run_evaluation(
             input_signature_hash=determinism.input_signature_hash,
             output_hash=determinism.output_hash,
             determinism_verified=determinism.determinism_verified,
-            governance_json=governance_json,
+            governance_json=outcome.governance_json,
             trace=result.trace,
             engine_version=result.engine_version,
         )
+        # The run is committed above. The read models below are rebuilt from
+        # `decision_runs` on their next update, so a failing hook is logged
+        # rather than failing a run that a retry would store twice.
+        hooks: list[tuple[str, Callable[[], object]]] = [
+            (
+                "stagnation alerts",
+                lambda: StagnationDetector(conn).record_run(
+                    user_id=outcome.user_id,
+                    decision_id=decision_id,
+                    computed_signals=result.trace.get("computed_signals", {}),
+                ),
+            ),
+            ("weekly aggregates", lambda: WeeklyAggregator(conn).refresh(outcome.user_id)),
+            (
+                "recommendation persistence",
+                lambda: RecommendationPersistenceStore(conn).record_run(
+                    user_id=outcome.user_id,
+                    decision_id=decision_id,
+                    recommendations=result.recommendations,
+                ),
+            ),
+        ]
+        for name, hook in hooks:
+            try:
+                hook()
+            except Exception:
+                conn.rollback()
+                logger.exception("Updating %s failed for decision run %s", name, decision_id)
+        return decision_id
+
+
+def run_evaluation(
+    user_id: int,
+    db_path: str = "aphde.db",
+    domain_definition: DomainDefinition | None = None,
+    *,
+    shadow: ShadowEvaluator | None = None,
+) -> int:
+    if domain_definition is None:
+        raise ValueError("domain_definition is required")
+    domain = validate_domain_definition(domain_definition)
+    inputs = load_evaluation_inputs(user_id, db_path)
+    outcome = compute_evaluation(inputs, domain)
+    decision_id = persist_evaluation(outcome, db_path)
+    if shadow is not None:
+        # Queued only after the write, so the caller never waits on the candidate.
+        shadow.submit(inputs, outcome, decision_id=decision_id)
+    return decision_id
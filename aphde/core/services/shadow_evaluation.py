@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import zlib
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from core.data.db import get_connection
+from core.data.migrations.migrate_v10_shadow_divergence import run_migration
+from core.data.repositories.shadow_divergence_repo import ShadowDivergenceRepository
+from core.engine.contracts import DomainDefinition, validate_domain_definition
+from core.governance.shadow_divergence import DivergenceStats
+from core.governance.version_diff import diff_runs
+from core.services.run_evaluation import EvaluationInputs, EvaluationOutcome, build_output_payload, compute_evaluation
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SHADOW_MAX_PENDING = 64
+DEFAULT_SHADOW_FLUSH_EVERY = 50
+
+
+@dataclass(frozen=True, slots=True)
+class ShadowConfig:
+    """
+    Candidate engine run next to production.
+
+    `sample_rate` is the share of evaluations shadowed, chosen deterministically
+    from the decision id. `cpu_budget` is the share of one core the candidate
+    may use on average; `cpu_burst_seconds` is how much unused budget can be
+    banked for bursts.
+    """
+
+    domain_definition: DomainDefinition
+    engine_version: str
+    sample_rate: float = 0.1
+    cpu_budget: float = 0.25
+    cpu_burst_seconds: float = 1.0
+
+
+class _CpuBudget:
+    """Token bucket over thread CPU seconds, refilled at `share` seconds per wall-clock second."""
+
+    def __init__(self, share: float, burst: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self.share = share
+        self.burst = burst
+        self._clock = clock
+        self._tokens = burst
+        self._last = clock()
+        self._lock = threading.Lock()
+
+    def available(self) -> bool:
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.share)
+            self._last = now
+            return self._tokens > 0.0
+
+    def charge(self, cpu_seconds: float) -> None:
+        with self._lock:
+            self._tokens -= cpu_seconds
+
+
+def _candidate_payload(
+    inputs: EvaluationInputs,
+    domain: DomainDefinition,
+    engine_version: str,
+) -> tuple[dict[str, Any], float]:
+    # Module-level so it can run in a ProcessPoolExecutor; returns the payload
+    # and the CPU seconds it used there.
+    started = time.thread_time()
+    candidate = compute_evaluation(inputs, domain, engine_version=engine_version)
+    return build_output_payload(candidate.result), time.thread_time() - started
+
+
+def _sampled(decision_id: int, sample_rate: float) -> bool:
+    if sample_rate >= 1.0:
+        return True
+    if sample_rate <= 0.0:
+        return False
+    bucket = zlib.crc32(str(decision_id).encode("ascii")) / 0xFFFFFFFF
+    return bucket < sample_rate
+
+
+class ShadowEvaluator:
+    """
+    Runs a candidate engine in the background after the primary result has
+    been persisted, and stores aggregate `diff_runs` divergence per
+    (primary, candidate) engine version pair in `shadow_divergence_stats`.
+
+    `submit` never blocks: evaluations outside the sample, over the CPU budget
+    or beyond `max_pending` queued jobs are skipped (the latter two are
+    counted). The candidate reuses the primary's loaded inputs, so it adds no
+    reads. Stats are written every `flush_every` diffs and on `flush`/`close`.
+
+    The default single worker thread shares the interpreter with the caller;
+    pass a `ProcessPoolExecutor` as `executor` to keep candidate CPU off it
+    (the domain definition must then be picklable).
+    """
+
+    def __init__(
+        self,
+        config: ShadowConfig,
+        db_path: str = "aphde.db",
+        *,
+        max_pending: int = DEFAULT_SHADOW_MAX_PENDING,
+        flush_every: int = DEFAULT_SHADOW_FLUSH_EVERY,
+        clock: Callable[[], float] = time.monotonic,
+        executor: Executor | None = None,
+    ) -> None:
+        if not 0.0 <= config.sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1")
+        if config.cpu_budget <= 0.0 or config.cpu_burst_seconds <= 0.0:
+            raise ValueError("cpu_budget and cpu_burst_seconds must be positive")
+        if max_pending <= 0 or flush_every <= 0:
+            raise ValueError("max_pending and flush_every must be positive")
+        self.config = config
+        self.db_path = db_path
+        self.max_pending = max_pending
+        self.flush_every = flush_every
+        self._domain = validate_domain_definition(config.domain_definition)
+        self._budget = _CpuBudget(config.cpu_budget, config.cpu_burst_seconds, clock)
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="aphde-shadow")
+        # Diffing and stats writes run here, never on the thread that submitted.
+        self._recorder = ThreadPoolExecutor(max_workers=1, thread_name_prefix="aphde-shadow-record")
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._write_lock = threading.Lock()
+        self._pending = 0
+        self._pending_stats: dict[str, DivergenceStats] = {}
+        self._closed = False
+        run_migration(db_path)
+
+    def _stats_for(self, primary_engine_version: str) -> DivergenceStats:
+        stats = self._pending_stats.get(primary_engine_version)
+        if stats is None:
+            stats = self._pending_stats[primary_engine_version] = DivergenceStats()
+        return stats
+
+    def submit(self, inputs: EvaluationInputs, outcome: EvaluationOutcome, *, decision_id: int) -> Future[Any] | None:
+        if self._closed or not _sampled(decision_id, self.config.sample_rate):
+            return None
+        primary_version = str(outcome.result.engine_version)
+        with self._lock:
+            if not self._budget.available():
+                self._stats_for(primary_version).skipped_budget += 1
+                return None
+            if self._pending >= self.max_pending:
+                self._stats_for(primary_version).skipped_backlog += 1
+                return None
+            self._pending += 1
+        primary_payload = build_output_payload(outcome.result)
+        try:
+            future = self._executor.submit(_candidate_payload, inputs, self._domain, self.config.engine_version)
+        except RuntimeError:
+            # Executor already shut down.
+            with self._lock:
+                self._pending -= 1
+                if self._pending == 0:
+                    self._idle.notify_all()
+            return None
+        future.add_done_callback(lambda done: self._dispatch_record(done, primary_version, primary_payload))
+        return future
+
+    def _dispatch_record(self, future: Future[Any], primary_version: str, primary_payload: dict[str, Any]) -> None:
+        # add_done_callback runs inline on the submitting thread when the
+        # candidate has already finished, so hand the work to the recorder.
+        try:
+            self._recorder.submit(self._record, future, primary_version, primary_payload)
+        except RuntimeError:
+            self._record(future, primary_version, primary_payload)
+
+    def _record(self, future: Future[Any], primary_version: str, primary_payload: dict[str, Any]) -> None:
+        diff = None
+        try:
+            candidate_payload, cpu_seconds = future.result()
+            self._budget.charge(cpu_seconds)
+            diff = diff_runs(primary_payload, candidate_payload)
+        except Exception:
+            logger.exception("Shadow candidate %s failed", self.config.engine_version)
+
+        with self._lock:
+            stats = self._stats_for(primary_version)
+            if diff is None:
+                stats.failures += 1
+            else:
+                stats.add_diff(diff)
+            due = sum(item.runs + item.failures for item in self._pending_stats.values()) >= self.flush_every
+            self._pending -= 1
+            if self._pending == 0:
+                self._idle.notify_all()
+        if due:
+            self._write_stats()
+
+    def _write_stats(self) -> None:
+        # Serialized so a flush returns only after any write already in progress.
+        with self._write_lock:
+            with self._lock:
+                pending, self._pending_stats = self._pending_stats, {}
+            if not pending:
+                return
+            with get_connection(self.db_path) as conn:
+                repo = ShadowDivergenceRepository(conn)
+                for primary_version, stats in pending.items():
+                    if stats.is_empty():
+                        continue
+                    repo.accumulate(
+                        primary_engine_version=primary_version,
+                        candidate_engine_version=self.config.engine_version,
+                        stats=stats,
+                    )
+
+    def flush(self) -> None:
+        """Wait for queued candidate runs and write their stats."""
+
+        with self._idle:
+            self._idle.wait_for(lambda: self._pending == 0)
+        self._write_stats()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self.flush()
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+        self._recorder.shutdown(wait=True)
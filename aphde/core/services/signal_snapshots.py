@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import asdict
+from datetime import date, timedelta
+
+from core.data.db import get_connection
+from core.data.repositories.signal_snapshot_repo import SignalSnapshotRepository
+from core.data.repositories.weight_repo import WeightLogRepository
+from core.data.repositories.workout_repo import WorkoutLogRepository
+from core.engine.contracts import DomainDefinition, validate_domain_definition
+from core.services.user_batches import iter_user_batches
+from core.signals.aggregator import SignalBundle
+from core.signals.multi_window import build_multi_window_signal_bundles
+
+
+def snapshot_windows(domain_definition: DomainDefinition, windows: Sequence[int] | None = None) -> tuple[int, ...]:
+    """`windows` when given, otherwise the domain's `snapshot_windows`."""
+
+    if windows:
+        return tuple(windows)
+    config = validate_domain_definition(domain_definition).get_domain_config()
+    if not config.get("snapshot_windows"):
+        raise ValueError("domain config has no snapshot_windows")
+    return tuple(config["snapshot_windows"])
+
+
+def compute_signal_snapshots(
+    user_id: int,
+    db_path: str = "aphde.db",
+    *,
+    domain_definition: DomainDefinition,
+    as_of: date | None = None,
+    windows: Sequence[int] | None = None,
+) -> dict[int, SignalBundle]:
+    """
+    Build bundles for every window (default: the domain's snapshot windows)
+    from one read of the longest window's logs and store them in
+    `signal_snapshots` under `as_of` (default: today). Re-running for the same
+    date replaces that date's rows.
+    """
+
+    windows = snapshot_windows(domain_definition, windows)
+    as_of = as_of or date.today()
+    start = as_of - timedelta(days=max(windows))
+    with get_connection(db_path) as conn:
+        weight_logs = [dict(row) for row in WeightLogRepository(conn).list_between(user_id, start, as_of)]
+        workout_logs = [dict(row) for row in WorkoutLogRepository(conn).list_between(user_id, start, as_of)]
+        bundles = build_multi_window_signal_bundles(
+            weight_logs=weight_logs,
+            workout_logs=workout_logs,
+            as_of=as_of,
+            windows=windows,
+        )
+        SignalSnapshotRepository(conn).replace_for_date(
+            user_id,
+            as_of,
+            {window: asdict(bundle) for window, bundle in bundles.items()},
+        )
+    return bundles
+
+
+def compute_all_signal_snapshots(
+    db_path: str = "aphde.db",
+    *,
+    domain_definition: DomainDefinition,
+    as_of: date | None = None,
+    windows: Sequence[int] | None = None,
+    chunk_size: int = 500,
+) -> int:
+    """Snapshot every active user, reading user ids in chunks. Returns the number of users processed."""
+
+    windows = snapshot_windows(domain_definition, windows)
+    processed = 0
+    for user_ids in iter_user_batches(db_path, chunk_size=chunk_size):
+        for user_id in user_ids:
+            compute_signal_snapshots(
+                user_id,
+                db_path,
+                domain_definition=domain_definition,
+                as_of=as_of,
+                windows=windows,
+            )
+        processed += len(user_ids)
+    return processed
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from core.data.db import get_connection
+from core.data.migrations.migrate_v15_tomorrow_plans import run_migration
+from core.data.repositories.decision_repo import DecisionRunRepository
+from core.data.repositories.tomorrow_plan_repo import TomorrowPlanRepository
+from core.guidance.persistence_index import RecommendationPersistenceStore
+from core.guidance.tomorrow_plan import build_tomorrow_plan
+from core.services.user_batches import iter_user_batches
+
+
+@dataclass(slots=True)
+class TomorrowPlanBatchResult:
+    users_processed: int = 0
+    plans_written: int = 0
+
+
+def _json_or(raw: Any, fallback: Any) -> Any:
+    try:
+        return json.loads(raw)
+    except (TypeError, json.JSONDecodeError):
+        return fallback
+
+
+def _plan_input(row: sqlite3.Row) -> dict[str, Any]:
+    # Only the fields build_tomorrow_plan reads.
+    trace = _json_or(row["trace_json"], {})
+    return {
+        "id": int(row["id"]),
+        "risk_score": float(row["risk_score"]),
+        "alignment_confidence": float(row["alignment_confidence"] or 0.0),
+        "recommendations": _json_or(row["recommendations_json"], []),
+        "recommendation_confidence": _json_or(row["recommendation_confidence_json"], []),
+        "trace": {"triggered_rules": trace.get("triggered_rules", []) if isinstance(trace, dict) else []},
+    }
+
+
+def load_tomorrow_plan(conn: sqlite3.Connection, *, user_id: int, latest_run: dict[str, Any]) -> dict[str, Any]:
+    """
+    The stored plan when it was computed from `latest_run`, otherwise a plan
+    built from the user's persistence index and stored for the next read.
+    """
+
+    decision_id = int(latest_run["id"])
+    repo = TomorrowPlanRepository(conn)
+    stored = repo.get_plan(user_id)
+    if stored is not None and int(stored["decision_id"]) == decision_id:
+        return json.loads(stored["plan_json"])
+    persistence = RecommendationPersistenceStore(conn).index(user_id, latest_decision_id=decision_id)
+    plan = build_tomorrow_plan(latest_run=latest_run, persistence=persistence)
+    repo.save_plans([(user_id, decision_id, plan)])
+    return plan
+
+
+def precompute_tomorrow_plans(
+    *,
+    db_path: str = "aphde.db",
+    user_ids: Sequence[int] | None = None,
+    chunk_size: int = 500,
+) -> TomorrowPlanBatchResult:
+    """Store tomorrow plans for `user_ids`, or every active user read in chunks of `chunk_size`."""
+
+    run_migration(db_path)
+    total = TomorrowPlanBatchResult()
+
+    for batch in iter_user_batches(db_path, user_ids=user_ids, chunk_size=chunk_size):
+        with get_connection(db_path) as conn:
+            store = RecommendationPersistenceStore(conn)
+            plans = []
+            for row in DecisionRunRepository(conn).latest_for_users(batch):
+                user_id, decision_id = int(row["user_id"]), int(row["id"])
+                persistence = store.index(user_id, latest_decision_id=decision_id)
+                plan = build_tomorrow_plan(latest_run=_plan_input(row), persistence=persistence)
+                plans.append((user_id, decision_id, plan))
+            total.plans_written += TomorrowPlanRepository(conn).save_plans(plans) if plans else 0
+        total.users_processed += len(batch)
+
+    return total
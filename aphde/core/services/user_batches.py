@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+
+from core.data.db import get_connection
+from core.data.repositories.user_repo import UserRepository
+
+
+def iter_user_batches(
+    db_path: str,
+    *,
+    user_ids: Sequence[int] | None = None,
+    chunk_size: int = 500,
+) -> Iterator[Sequence[int]]:
+    """
+    `user_ids` in chunks of `chunk_size`, or every active user paged by id.
+    Each page is read on its own connection, so a batch job holds none while
+    it processes the users it was given.
+    """
+
+    if user_ids is not None:
+        for offset in range(0, len(user_ids), chunk_size):
+            yield user_ids[offset : offset + chunk_size]
+        return
+
+    after_id = 0
+    while True:
+        with get_connection(db_path) as conn:
+            batch = UserRepository(conn).list_active_ids(after_id=after_id, limit=chunk_size)
+        if not batch:
+            return
+        yield batch
+        after_id = batch[-1]
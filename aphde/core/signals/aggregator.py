@@ -37,19 +37,15 @@ def build_signal_bundle(
     recovery = recovery_from_workout_logs(workout_logs, window_days=window_days)
     overload = progressive_overload_from_workout_logs(workout_logs)
 
-    return SignalBundle(
+    return bundle_from_signals(
         trend_slope=trend,
         volatility_index=volatility,
         compliance_ratio=compliance,
         muscle_balance_index=balance,
         recovery_index=recovery,
         progressive_overload_score=overload,
-        sufficiency={
-            "trend_slope": trend is not None,
-            "volatility_index": volatility is not None,
-            "compliance_ratio": compliance is not None,
-            "muscle_balance_index": balance is not None,
-            "recovery_index": recovery is not None,
-            "progressive_overload_score": overload is not None,
-        },
     )
+
+
+def bundle_from_signals(**signals: float | None) -> SignalBundle:
+    return SignalBundle(**signals, sufficiency={name: value is not None for name, value in signals.items()})
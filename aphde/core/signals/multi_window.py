@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Sequence
+from datetime import date, timedelta
+from itertools import accumulate
+from math import sqrt
+from typing import Any
+
+from core.signals.aggregator import SignalBundle, bundle_from_signals
+from core.signals.compliance import compliance_ratio
+from core.signals.muscle_balance import DEFAULT_TARGET_DISTRIBUTION, normalize_session, balance_score_from_counts
+from core.signals.overload import blend_overload_slope, overload_base_score
+from core.signals.recovery import recovery_from_streaks
+from core.signals.trend import slope_from_sums
+
+
+HIGH_RPE_THRESHOLD = 8.0
+
+
+def _suffix_sums(values: Sequence[float]) -> list[float]:
+    """out[i] == sum(values[i:]); out[len(values)] == 0."""
+    sums = list(accumulate(reversed(values), initial=0.0))
+    sums.reverse()
+    return sums
+
+
+def _log_date(row: dict[str, Any]) -> str:
+    return str(row.get("log_date", ""))[:10]
+
+
+def _sorted_until(rows: Iterable[dict[str, Any]], as_of: str) -> list[dict[str, Any]]:
+    ordered = sorted(rows, key=_log_date)
+    return ordered[: bisect_right([_log_date(row) for row in ordered], as_of)]
+
+
+class _SeriesSums:
+    """
+    Suffix sums of a series shifted by its first value, so every window ending
+    at the last point gets count, mean, population stddev and regression slope
+    in O(1). Shifting keeps the variance well conditioned for values like 78.4.
+    """
+
+    def __init__(self, values: Sequence[float]) -> None:
+        self.values = values
+        self.ref = values[0] if values else 0.0
+        shifted = [value - self.ref for value in values]
+        self.sum_y = _suffix_sums(shifted)
+        self.sum_yy = _suffix_sums([value * value for value in shifted])
+        self.sum_iy = _suffix_sums([index * value for index, value in enumerate(shifted)])
+
+    def count(self, start: int) -> int:
+        return len(self.values) - start
+
+    def mean(self, start: int) -> float:
+        return self.ref + self.sum_y[start] / self.count(start)
+
+    def std(self, start: int) -> float:
+        n = self.count(start)
+        centered = self.sum_y[start] / n
+        return sqrt(max(0.0, self.sum_yy[start] / n - centered * centered))
+
+    def slope(self, start: int) -> float | None:
+        local_xy = self.sum_iy[start] - start * self.sum_y[start]
+        return slope_from_sums(self.count(start), self.sum_y[start], local_xy)
+
+
+def _volatility(series: _SeriesSums, start: int) -> float | None:
+    if series.count(start) < 2:
+        return None
+    mean = series.mean(start)
+    if abs(mean) < 1e-9:
+        return None
+    return series.std(start) / abs(mean)
+
+
+def _overload(series: _SeriesSums, improvements: list[float], start: int) -> float | None:
+    n = series.count(start)
+    if n < 2:
+        return None
+    mean = series.mean(start)
+    base = overload_base_score(
+        count=n,
+        improvements=int(improvements[start + 1]),
+        first=series.values[start],
+        last=series.values[-1],
+        mean=mean,
+        std=series.std(start),
+    )
+    if base is None:
+        return None
+    return blend_overload_slope(base, slope=series.slope(start), mean=mean)
+
+
+def build_multi_window_signal_bundles(
+    *,
+    weight_logs: Iterable[dict[str, Any]],
+    workout_logs: Iterable[dict[str, Any]],
+    as_of: date,
+    windows: Sequence[int],
+) -> dict[int, SignalBundle]:
+    """
+    Signal bundles for several trailing windows ending at `as_of`, from one
+    sorted pass over the logs. Window `w` covers log dates in
+    [as_of - w days, as_of], the same bound `list_recent(days=w)` applies, and
+    `recovery_index` uses `w` as its density window. Results match
+    `build_signal_bundle` on the same rows up to float rounding.
+    """
+
+    as_of_key = as_of.isoformat()
+    weights = [row for row in _sorted_until(weight_logs, as_of_key) if "weight_kg" in row]
+    workouts = _sorted_until(workout_logs, as_of_key)
+    weight_dates = [_log_date(row) for row in weights]
+    workout_dates = [_log_date(row) for row in workouts]
+
+    weight_series = _SeriesSums([float(row["weight_kg"]) for row in weights])
+
+    planned: list[float] = []
+    completed: list[float] = []
+    group_hits: dict[str, list[float]] = {group: [] for group in DEFAULT_TARGET_DISTRIBUTION}
+    high_rpe: list[bool] = []
+    volumes: list[float] = []
+    volumes_before: list[int] = []
+    for row in workouts:
+        volumes_before.append(len(volumes))
+        is_planned = bool(row.get("planned_flag", False))
+        planned.append(1.0 if is_planned else 0.0)
+        completed.append(1.0 if is_planned and bool(row.get("completed_flag", False)) else 0.0)
+        session_type = row.get("session_type")
+        group = normalize_session(str(session_type)) if session_type is not None else None
+        for name, hits in group_hits.items():
+            hits.append(1.0 if group == name else 0.0)
+        avg_rpe = row.get("avg_rpe")
+        high_rpe.append(avg_rpe is not None and float(avg_rpe) >= HIGH_RPE_THRESHOLD)
+        if row.get("volume_load") is not None:
+            volumes.append(float(row["volume_load"]))
+    volumes_before.append(len(volumes))
+
+    planned_sums = _suffix_sums(planned)
+    completed_sums = _suffix_sums(completed)
+    group_sums = {name: _suffix_sums(hits) for name, hits in group_hits.items()}
+
+    # Longest high-RPE run inside each suffix: runs starting at or after i.
+    longest_high_rpe = [0] * (len(workouts) + 1)
+    run = 0
+    for index in range(len(workouts) - 1, -1, -1):
+        run = run + 1 if high_rpe[index] else 0
+        longest_high_rpe[index] = max(longest_high_rpe[index + 1], run)
+
+    volume_series = _SeriesSums(volumes)
+    improvements = _suffix_sums(
+        [0.0] + [1.0 if volumes[k] > volumes[k - 1] else 0.0 for k in range(1, len(volumes))]
+    )
+
+    bundles: dict[int, SignalBundle] = {}
+    for window in sorted(set(int(days) for days in windows)):
+        cutoff = (as_of - timedelta(days=window)).isoformat()
+        weight_start = bisect_left(weight_dates, cutoff)
+        workout_start = bisect_left(workout_dates, cutoff)
+        sessions = len(workouts) - workout_start
+
+        bundles[window] = bundle_from_signals(
+            trend_slope=weight_series.slope(weight_start),
+            volatility_index=_volatility(weight_series, weight_start),
+            compliance_ratio=compliance_ratio(
+                int(completed_sums[workout_start]),
+                int(planned_sums[workout_start]),
+            ),
+            muscle_balance_index=balance_score_from_counts(
+                {name: int(sums[workout_start]) for name, sums in group_sums.items()},
+                DEFAULT_TARGET_DISTRIBUTION,
+            ),
+            recovery_index=(
+                recovery_from_streaks(
+                    sessions=sessions,
+                    longest_high_rpe_streak=longest_high_rpe[workout_start],
+                    longest_training_streak=sessions,
+                    window_days=window,
+                )
+                if sessions
+                else None
+            ),
+            progressive_overload_score=_overload(volume_series, improvements, volumes_before[workout_start]),
+        )
+    return bundles
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections import Counter
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 
 
 DEFAULT_TARGET_DISTRIBUTION = {
@@ -29,7 +29,7 @@ SESSION_MAP = {
 }
 
 
-def _normalize_session(session_type: str) -> str | None:
+def normalize_session(session_type: str) -> str | None:
     key = session_type.strip().lower()
     return SESSION_MAP.get(key)
 
@@ -39,17 +39,21 @@ def muscle_balance_index(
     target_distribution: dict[str, float] | None = None,
 ) -> float | None:
     target = target_distribution or DEFAULT_TARGET_DISTRIBUTION
-    normalized = [_normalize_session(s) for s in session_types]
+    normalized = [normalize_session(s) for s in session_types]
     normalized = [s for s in normalized if s in target]
     if not normalized:
         return None
+    return balance_score_from_counts(Counter(normalized), target)
 
-    counts = Counter(normalized)
-    total = sum(counts.values())
+
+def balance_score_from_counts(counts: Mapping[str, int], target: dict[str, float]) -> float | None:
+    total = sum(counts.get(group, 0) for group in target)
+    if total <= 0:
+        return None
 
     deviation = 0.0
     for group, target_share in target.items():
-        actual_share = counts[group] / total if total > 0 else 0.0
+        actual_share = counts.get(group, 0) / total
         deviation += abs(actual_share - target_share)
 
     # Total variation distance in [0, 2]; convert into quality score [0, 1].
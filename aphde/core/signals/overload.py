@@ -16,10 +16,30 @@ def progressive_overload_from_volumes(volumes: list[float]) -> float | None:
         return None
 
     improvements = sum(1 for i in range(1, len(volumes)) if volumes[i] > volumes[i - 1])
-    improved_sessions_ratio = improvements / (len(volumes) - 1)
+    mean = sum(volumes) / len(volumes)
+    return overload_base_score(
+        count=len(volumes),
+        improvements=improvements,
+        first=volumes[0],
+        last=volumes[-1],
+        mean=mean,
+        std=pstdev(volumes),
+    )
+
 
-    first = volumes[0]
-    last = volumes[-1]
+def overload_base_score(
+    *,
+    count: int,
+    improvements: int,
+    first: float,
+    last: float,
+    mean: float,
+    std: float,
+) -> float | None:
+    if count < 2:
+        return None
+
+    improved_sessions_ratio = improvements / (count - 1)
     if abs(first) < 1e-9:
         trend_norm = 0.5
     else:
@@ -27,11 +47,10 @@ def progressive_overload_from_volumes(volumes: list[float]) -> float | None:
         # Map [-10%, +10%] into [0, 1], then clamp.
         trend_norm = _clamp01((pct_change + 0.10) / 0.20)
 
-    mean = sum(volumes) / len(volumes)
     if abs(mean) < 1e-9:
         consistency = 0.0
     else:
-        consistency = _clamp01(1.0 - (pstdev(volumes) / abs(mean)))
+        consistency = _clamp01(1.0 - (std / abs(mean)))
 
     score = 0.5 * improved_sessions_ratio + 0.3 * trend_norm + 0.2 * consistency
     return _clamp01(score)
@@ -44,10 +63,11 @@ def progressive_overload_from_workout_logs(workout_logs: Iterable[dict[str, Any]
     if base is None:
         return None
 
-    slope = linear_regression_slope(volumes)
+    return blend_overload_slope(base, slope=linear_regression_slope(volumes), mean=sum(volumes) / len(volumes))
+
+
+def blend_overload_slope(base: float, *, slope: float | None, mean: float) -> float:
     if slope is None:
         return base
-
-    mean = sum(volumes) / len(volumes)
     slope_boost = 0.0 if abs(mean) < 1e-9 else _clamp01(slope / (abs(mean) * 0.02))
     return _clamp01(0.85 * base + 0.15 * slope_boost)
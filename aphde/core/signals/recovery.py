@@ -30,9 +30,6 @@ def recovery_from_workout_logs(
     if not logs:
         return None
 
-    sessions = len(logs)
-    density_ratio = sessions / max(1, window_days)
-
     longest_high_rpe_streak = 0
     current_high_rpe_streak = 0
     longest_training_streak = 0
@@ -49,6 +46,22 @@ def recovery_from_workout_logs(
         current_training_streak += 1
         longest_training_streak = max(longest_training_streak, current_training_streak)
 
+    return recovery_from_streaks(
+        sessions=len(logs),
+        longest_high_rpe_streak=longest_high_rpe_streak,
+        longest_training_streak=longest_training_streak,
+        window_days=window_days,
+    )
+
+
+def recovery_from_streaks(
+    *,
+    sessions: int,
+    longest_high_rpe_streak: int,
+    longest_training_streak: int,
+    window_days: int = 7,
+) -> float:
+    density_ratio = sessions / max(1, window_days)
     high_rpe_streak_norm = min(1.0, longest_high_rpe_streak / 3.0)
     rest_gap_penalty_norm = min(1.0, max(0.0, longest_training_streak - 2.0) / 5.0)
 
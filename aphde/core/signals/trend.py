@@ -9,11 +9,16 @@ def linear_regression_slope(values: Sequence[float]) -> float | None:
     if n < 2:
         return None
 
+    return slope_from_sums(n, sum(values), sum(i * y for i, y in enumerate(values)))
+
+
+def slope_from_sums(n: int, y_sum: float, xy_sum: float) -> float | None:
+    """Slope for x=[0..n-1] given sum(y) and sum(x*y); lets callers reuse running sums."""
+    if n < 2:
+        return None
+
     x_sum = n * (n - 1) / 2
     xx_sum = (n - 1) * n * (2 * n - 1) / 6
-    y_sum = sum(values)
-    xy_sum = sum(i * y for i, y in enumerate(values))
-
     denominator = n * xx_sum - x_sum * x_sum
     if denominator == 0:
         return None
@@ -1,12 +1,21 @@
 ﻿from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, ClassVar
 
+from core.decision.rule_program import Rule, RuleProgram, compile_rules, signal_vector
 from core.models.entities import Recommendation
 from core.signals.aggregator import SignalBundle
 
 
 class GoalStrategy(ABC):
     goal_name: str
+    # (target key, default) pairs in the order `evaluate` unpacks them.
+    thresholds: ClassVar[tuple[tuple[str, float], ...]] = ()
+    rules: ClassVar[tuple[Rule, ...]] = ()
+    rule_program: ClassVar[RuleProgram]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.rule_program = compile_rules(cls.rules, cls.thresholds)
 
     @staticmethod
     def _clamp01(value: float) -> float:
@@ -18,10 +27,21 @@ class GoalStrategy(ABC):
             return default
         return float(signal)
 
+    def _resolve_thresholds(self, target: dict[str, Any]) -> tuple[float, ...]:
+        return self.rule_program.resolve_thresholds(target)
+
+    def _apply_rules(self, signals: SignalBundle, thresholds: tuple[float, ...]) -> tuple[dict[str, bool], list[str]]:
+        return self.rule_program.evaluate(signal_vector(signals), thresholds)
+
     @abstractmethod
     def evaluate(self, signals: SignalBundle, target: dict[str, Any]) -> dict[str, Any]:
         raise NotImplementedError
 
-    @abstractmethod
     def recommend(self, evaluation: dict[str, Any]) -> list[Recommendation]:
-        raise NotImplementedError
+        deviations = evaluation["deviations"]
+        risks = evaluation["risks"]
+        recs: list[Recommendation] = []
+        for trigger, template in self.rule_program.recommendation_templates:
+            if deviations[trigger]:
+                recs.append(template.build(risks))
+        return recs
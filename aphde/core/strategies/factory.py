@@ -6,15 +6,43 @@ from core.strategies.strength_gain import StrengthGainStrategy
 from core.strategies.weight_loss import WeightLossStrategy
 
 
+class StrategyRegistry:
+    """
+    Goal type -> strategy class, with one shared instance per goal type.
+
+    Strategies are stateless (thresholds and templates are class-level), so the
+    cached instance is safe to reuse across runs and threads.
+    """
+
+    def __init__(self, strategies: dict[GoalType, type[GoalStrategy]] | None = None) -> None:
+        self._classes: dict[GoalType, type[GoalStrategy]] = dict(strategies or {})
+        self._instances: dict[GoalType, GoalStrategy] = {}
+
+    def register(self, goal_type: GoalType, strategy_cls: type[GoalStrategy]) -> None:
+        self._classes[goal_type] = strategy_cls
+        self._instances.pop(goal_type, None)
+
+    def get(self, goal_type: GoalType) -> GoalStrategy:
+        instance = self._instances.get(goal_type)
+        if instance is not None:
+            return instance
+        strategy_cls = self._classes.get(goal_type)
+        if strategy_cls is None:
+            raise ValueError(f"Unsupported goal type: {goal_type}")
+        return self._instances.setdefault(goal_type, strategy_cls())
+
+
+STRATEGY_REGISTRY = StrategyRegistry(
+    {
+        GoalType.WEIGHT_LOSS: WeightLossStrategy,
+        GoalType.RECOMPOSITION: RecompositionStrategy,
+        GoalType.STRENGTH_GAIN: StrengthGainStrategy,
+        GoalType.GENERAL_HEALTH: GeneralHealthStrategy,
+    }
+)
+
+
 class StrategyFactory:
     @staticmethod
     def create(goal_type: GoalType) -> GoalStrategy:
-        if goal_type == GoalType.WEIGHT_LOSS:
-            return WeightLossStrategy()
-        if goal_type == GoalType.RECOMPOSITION:
-            return RecompositionStrategy()
-        if goal_type == GoalType.STRENGTH_GAIN:
-            return StrengthGainStrategy()
-        if goal_type == GoalType.GENERAL_HEALTH:
-            return GeneralHealthStrategy()
-        raise ValueError(f"Unsupported goal type: {goal_type}")
+        return STRATEGY_REGISTRY.get(goal_type)
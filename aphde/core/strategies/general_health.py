@@ -2,13 +2,76 @@ from __future__ import annotations
 
 from typing import Any
 
-from core.models.entities import Recommendation
+from core.decision.rule_program import RecommendationTemplate, Rule
 from core.models.enums import RecommendationCategory, RiskCode
 from core.strategies.base import GoalStrategy
 
 
 class GeneralHealthStrategy(GoalStrategy):
     goal_name = "general_health"
+    thresholds = (
+        ("min_compliance", 0.7),
+        ("min_recovery", 0.55),
+        ("max_volatility", 0.08),
+        ("min_balance", 0.6),
+    )
+    rules = (
+        Rule(
+            name="compliance_miss",
+            signal="compliance_ratio",
+            comparator="<",
+            threshold="min_compliance",
+            risk_code=RiskCode.COMPLIANCE_DROP.value,
+            recommendation=RecommendationTemplate(
+                rec_id="gh_habit_01",
+                priority=1,
+                category=RecommendationCategory.HABIT,
+                action="Set a weekly minimum activity target with calendar reminders.",
+                expected_effect="Improves consistency and baseline health behaviors.",
+                confidence=0.81,
+            ),
+            missing=0.5,
+        ),
+        Rule(
+            name="recovery_miss",
+            signal="recovery_index",
+            comparator="<",
+            threshold="min_recovery",
+            risk_code=RiskCode.RECOVERY_DROP.value,
+            recommendation=RecommendationTemplate(
+                rec_id="gh_recovery_01",
+                priority=2,
+                category=RecommendationCategory.RECOVERY,
+                action="Add one extra rest day and cap high-RPE sessions this week.",
+                expected_effect="Reduces fatigue accumulation and supports sustainability.",
+                confidence=0.76,
+            ),
+            missing=0.5,
+        ),
+        Rule(
+            name="volatility_miss",
+            signal="volatility_index",
+            comparator=">",
+            threshold="max_volatility",
+            risk_code=RiskCode.VOLATILITY_SPIKE.value,
+            recommendation=RecommendationTemplate(
+                rec_id="gh_nutrition_01",
+                priority=3,
+                category=RecommendationCategory.NUTRITION,
+                action="Standardize meal timing and calorie range on weekdays.",
+                expected_effect="Lowers behavioral volatility and improves routine.",
+                confidence=0.7,
+            ),
+            missing=0.08,
+        ),
+        Rule(
+            name="balance_miss",
+            signal="muscle_balance_index",
+            comparator="<",
+            threshold="min_balance",
+            missing=0.5,
+        ),
+    )
 
     def evaluate(self, signals, target: dict[str, Any]) -> dict[str, Any]:
         compliance = self._safe(signals.compliance_ratio, 0.5)
@@ -16,24 +79,9 @@ class GeneralHealthStrategy(GoalStrategy):
         volatility = self._safe(signals.volatility_index, 0.08)
         balance = self._safe(signals.muscle_balance_index, 0.5)
 
-        min_compliance = float(target.get("min_compliance", 0.7))
-        min_recovery = float(target.get("min_recovery", 0.55))
-        max_volatility = float(target.get("max_volatility", 0.08))
-        min_balance = float(target.get("min_balance", 0.6))
-
-        deviations = {
-            "compliance_miss": compliance < min_compliance,
-            "recovery_miss": recovery < min_recovery,
-            "volatility_miss": volatility > max_volatility,
-            "balance_miss": balance < min_balance,
-        }
-        risks: list[str] = []
-        if deviations["compliance_miss"]:
-            risks.append(RiskCode.COMPLIANCE_DROP.value)
-        if deviations["recovery_miss"]:
-            risks.append(RiskCode.RECOVERY_DROP.value)
-        if deviations["volatility_miss"]:
-            risks.append(RiskCode.VOLATILITY_SPIKE.value)
+        thresholds = self._resolve_thresholds(target)
+        _, _, max_volatility, _ = thresholds
+        deviations, risks = self._apply_rules(signals, thresholds)
 
         priority_score = (
             0.35 * (1.0 - self._clamp01(compliance))
@@ -48,45 +96,3 @@ class GeneralHealthStrategy(GoalStrategy):
             "signals": {"compliance_ratio": compliance, "recovery_index": recovery, "volatility_index": volatility},
             "priority_score": self._clamp01(priority_score),
         }
-
-    def recommend(self, evaluation: dict[str, Any]) -> list[Recommendation]:
-        deviations = evaluation["deviations"]
-        risks = evaluation["risks"]
-        recs: list[Recommendation] = []
-        if deviations["compliance_miss"]:
-            recs.append(
-                Recommendation(
-                    rec_id="gh_habit_01",
-                    priority=1,
-                    category=RecommendationCategory.HABIT,
-                    action="Set a weekly minimum activity target with calendar reminders.",
-                    expected_effect="Improves consistency and baseline health behaviors.",
-                    reason_codes=risks,
-                    confidence=0.81,
-                )
-            )
-        if deviations["recovery_miss"]:
-            recs.append(
-                Recommendation(
-                    rec_id="gh_recovery_01",
-                    priority=2,
-                    category=RecommendationCategory.RECOVERY,
-                    action="Add one extra rest day and cap high-RPE sessions this week.",
-                    expected_effect="Reduces fatigue accumulation and supports sustainability.",
-                    reason_codes=risks,
-                    confidence=0.76,
-                )
-            )
-        if deviations["volatility_miss"]:
-            recs.append(
-                Recommendation(
-                    rec_id="gh_nutrition_01",
-                    priority=3,
-                    category=RecommendationCategory.NUTRITION,
-                    action="Standardize meal timing and calorie range on weekdays.",
-                    expected_effect="Lowers behavioral volatility and improves routine.",
-                    reason_codes=risks,
-                    confidence=0.7,
-                )
-            )
-        return recs
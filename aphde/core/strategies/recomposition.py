@@ -2,13 +2,77 @@ from __future__ import annotations
 
 from typing import Any
 
-from core.models.entities import Recommendation
+from core.decision.rule_program import RecommendationTemplate, Rule
 from core.models.enums import RecommendationCategory, RiskCode
 from core.strategies.base import GoalStrategy
 
 
 class RecompositionStrategy(GoalStrategy):
     goal_name = "recomposition"
+    thresholds = (
+        ("max_abs_weight_slope", 0.06),
+        ("min_overload", 0.65),
+        ("min_balance", 0.65),
+        ("min_compliance", 0.8),
+    )
+    rules = (
+        Rule(
+            name="weight_drift",
+            signal="trend_slope",
+            comparator=">",
+            threshold="max_abs_weight_slope",
+            risk_code=RiskCode.STALL_RISK.value,
+            recommendation=RecommendationTemplate(
+                rec_id="rc_nutrition_01",
+                priority=2,
+                category=RecommendationCategory.NUTRITION,
+                action="Adjust calories by +/-100 based on trend direction for 7 days.",
+                expected_effect="Keeps bodyweight inside recomposition band.",
+                confidence=0.77,
+            ),
+            missing=0.0,
+            absolute=True,
+        ),
+        Rule(
+            name="overload_miss",
+            signal="progressive_overload_score",
+            comparator="<",
+            threshold="min_overload",
+            risk_code=RiskCode.STALL_RISK.value,
+            recommendation=RecommendationTemplate(
+                rec_id="rc_training_01",
+                priority=1,
+                category=RecommendationCategory.TRAINING,
+                action="Add one progressive overload anchor lift and track weekly top set.",
+                expected_effect="Improves strength stimulus while preserving recomposition.",
+                confidence=0.82,
+            ),
+            missing=0.5,
+        ),
+        Rule(
+            name="balance_miss",
+            signal="muscle_balance_index",
+            comparator="<",
+            threshold="min_balance",
+            recommendation=RecommendationTemplate(
+                rec_id="rc_training_02",
+                priority=3,
+                category=RecommendationCategory.TRAINING,
+                action="Rebalance weekly split to even push/pull/lower volume.",
+                expected_effect="Improves muscular symmetry and training quality.",
+                confidence=0.72,
+            ),
+            missing=0.5,
+        ),
+        Rule(
+            name="compliance_miss",
+            signal="compliance_ratio",
+            comparator="<",
+            threshold="min_compliance",
+            risk_code=RiskCode.COMPLIANCE_DROP.value,
+            missing=0.5,
+        ),
+    )
 
     def evaluate(self, signals, target: dict[str, Any]) -> dict[str, Any]:
         trend = self._safe(signals.trend_slope, 0.0)
@@ -16,22 +80,9 @@ class RecompositionStrategy(GoalStrategy):
         balance = self._safe(signals.muscle_balance_index, 0.5)
         compliance = self._safe(signals.compliance_ratio, 0.5)
 
-        max_abs_trend = float(target.get("max_abs_weight_slope", 0.06))
-        min_overload = float(target.get("min_overload", 0.65))
-        min_balance = float(target.get("min_balance", 0.65))
-        min_compliance = float(target.get("min_compliance", 0.8))
-
-        deviations = {
-            "weight_drift": abs(trend) > max_abs_trend,
-            "overload_miss": overload < min_overload,
-            "balance_miss": balance < min_balance,
-            "compliance_miss": compliance < min_compliance,
-        }
-        risks: list[str] = []
-        if deviations["overload_miss"] or deviations["weight_drift"]:
-            risks.append(RiskCode.STALL_RISK.value)
-        if deviations["compliance_miss"]:
-            risks.append(RiskCode.COMPLIANCE_DROP.value)
+        thresholds = self._resolve_thresholds(target)
+        max_abs_trend, _, _, _ = thresholds
+        deviations, risks = self._apply_rules(signals, thresholds)
 
         priority_score = (
             0.35 * (1.0 - self._clamp01(overload))
@@ -46,45 +97,3 @@ class RecompositionStrategy(GoalStrategy):
             "signals": {"trend_slope": trend, "overload_score": overload, "balance_score": balance},
             "priority_score": self._clamp01(priority_score),
         }
-
-    def recommend(self, evaluation: dict[str, Any]) -> list[Recommendation]:
-        deviations = evaluation["deviations"]
-        risks = evaluation["risks"]
-        recs: list[Recommendation] = []
-        if deviations["overload_miss"]:
-            recs.append(
-                Recommendation(
-                    rec_id="rc_training_01",
-                    priority=1,
-                    category=RecommendationCategory.TRAINING,
-                    action="Add one progressive overload anchor lift and track weekly top set.",
-                    expected_effect="Improves strength stimulus while preserving recomposition.",
-                    reason_codes=risks,
-                    confidence=0.82,
-                )
-            )
-        if deviations["weight_drift"]:
-            recs.append(
-                Recommendation(
-                    rec_id="rc_nutrition_01",
-                    priority=2,
-                    category=RecommendationCategory.NUTRITION,
-                    action="Adjust calories by +/-100 based on trend direction for 7 days.",
-                    expected_effect="Keeps bodyweight inside recomposition band.",
-                    reason_codes=risks,
-                    confidence=0.77,
-                )
-            )
-        if deviations["balance_miss"]:
-            recs.append(
-                Recommendation(
-                    rec_id="rc_training_02",
-                    priority=3,
-                    category=RecommendationCategory.TRAINING,
-                    action="Rebalance weekly split to even push/pull/lower volume.",
-                    expected_effect="Improves muscular symmetry and training quality.",
-                    reason_codes=risks,
-                    confidence=0.72,
-                )
-            )
-        return recs
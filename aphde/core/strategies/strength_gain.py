@@ -2,13 +2,77 @@ from __future__ import annotations
 
 from typing import Any
 
-from core.models.entities import Recommendation
+from core.decision.rule_program import RecommendationTemplate, Rule
 from core.models.enums import RecommendationCategory, RiskCode
 from core.strategies.base import GoalStrategy
 
 
 class StrengthGainStrategy(GoalStrategy):
     goal_name = "strength_gain"
+    thresholds = (
+        ("min_overload", 0.72),
+        ("min_recovery", 0.6),
+        ("min_compliance", 0.8),
+        ("min_strength_trend", 0.0),
+    )
+    rules = (
+        Rule(
+            name="overload_miss",
+            signal="progressive_overload_score",
+            comparator="<",
+            threshold="min_overload",
+            risk_code=RiskCode.STALL_RISK.value,
+            recommendation=RecommendationTemplate(
+                rec_id="sg_training_01",
+                priority=1,
+                category=RecommendationCategory.TRAINING,
+                action="Increase top-set load by 2.5% and keep accessory volume stable.",
+                expected_effect="Restores progressive overload signal.",
+                confidence=0.85,
+            ),
+            missing=0.5,
+        ),
+        Rule(
+            name="recovery_miss",
+            signal="recovery_index",
+            comparator="<",
+            threshold="min_recovery",
+            risk_code=RiskCode.RECOVERY_DROP.value,
+            recommendation=RecommendationTemplate(
+                rec_id="sg_recovery_01",
+                priority=2,
+                category=RecommendationCategory.RECOVERY,
+                action="Insert one low-intensity day after each heavy session.",
+                expected_effect="Improves readiness for high-intensity lifts.",
+                confidence=0.8,
+            ),
+            missing=0.5,
+        ),
+        Rule(
+            name="compliance_miss",
+            signal="compliance_ratio",
+            comparator="<",
+            threshold="min_compliance",
+            risk_code=RiskCode.COMPLIANCE_DROP.value,
+            recommendation=RecommendationTemplate(
+                rec_id="sg_habit_01",
+                priority=3,
+                category=RecommendationCategory.HABIT,
+                action="Lock a fixed weekly lifting schedule with 3 non-negotiable sessions.",
+                expected_effect="Improves consistency and training frequency.",
+                confidence=0.79,
+            ),
+            missing=0.5,
+        ),
+        Rule(
+            name="progress_miss",
+            signal="trend_slope",
+            comparator="<",
+            threshold="min_strength_trend",
+            risk_code=RiskCode.STALL_RISK.value,
+            missing=0.0,
+        ),
+    )
 
     def evaluate(self, signals, target: dict[str, Any]) -> dict[str, Any]:
         overload = self._safe(signals.progressive_overload_score, 0.5)
@@ -16,24 +80,9 @@ class StrengthGainStrategy(GoalStrategy):
         compliance = self._safe(signals.compliance_ratio, 0.5)
         trend = self._safe(signals.trend_slope, 0.0)
 
-        min_overload = float(target.get("min_overload", 0.72))
-        min_recovery = float(target.get("min_recovery", 0.6))
-        min_compliance = float(target.get("min_compliance", 0.8))
-        min_trend = float(target.get("min_strength_trend", 0.0))
-
-        deviations = {
-            "overload_miss": overload < min_overload,
-            "recovery_miss": recovery < min_recovery,
-            "compliance_miss": compliance < min_compliance,
-            "progress_miss": trend < min_trend,
-        }
-        risks: list[str] = []
-        if deviations["overload_miss"] or deviations["progress_miss"]:
-            risks.append(RiskCode.STALL_RISK.value)
-        if deviations["recovery_miss"]:
-            risks.append(RiskCode.RECOVERY_DROP.value)
-        if deviations["compliance_miss"]:
-            risks.append(RiskCode.COMPLIANCE_DROP.value)
+        thresholds = self._resolve_thresholds(target)
+        _, _, _, min_trend = thresholds
+        deviations, risks = self._apply_rules(signals, thresholds)
 
         priority_score = (
             0.4 * (1.0 - self._clamp01(overload))
@@ -48,45 +97,3 @@ class StrengthGainStrategy(GoalStrategy):
             "signals": {"overload_score": overload, "recovery_index": recovery, "trend_slope": trend},
             "priority_score": self._clamp01(priority_score),
         }
-
-    def recommend(self, evaluation: dict[str, Any]) -> list[Recommendation]:
-        deviations = evaluation["deviations"]
-        risks = evaluation["risks"]
-        recs: list[Recommendation] = []
-        if deviations["overload_miss"]:
-            recs.append(
-                Recommendation(
-                    rec_id="sg_training_01",
-                    priority=1,
-                    category=RecommendationCategory.TRAINING,
-                    action="Increase top-set load by 2.5% and keep accessory volume stable.",
-                    expected_effect="Restores progressive overload signal.",
-                    reason_codes=risks,
-                    confidence=0.85,
-                )
-            )
-        if deviations["recovery_miss"]:
-            recs.append(
-                Recommendation(
-                    rec_id="sg_recovery_01",
-                    priority=2,
-                    category=RecommendationCategory.RECOVERY,
-                    action="Insert one low-intensity day after each heavy session.",
-                    expected_effect="Improves readiness for high-intensity lifts.",
-                    reason_codes=risks,
-                    confidence=0.8,
-                )
-            )
-        if deviations["compliance_miss"]:
-            recs.append(
-                Recommendation(
-                    rec_id="sg_habit_01",
-                    priority=3,
-                    category=RecommendationCategory.HABIT,
-                    action="Lock a fixed weekly lifting schedule with 3 non-negotiable sessions.",
-                    expected_effect="Improves consistency and training frequency.",
-                    reason_codes=risks,
-                    confidence=0.79,
-                )
-            )
-        return recs
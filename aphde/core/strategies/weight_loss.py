@@ -2,13 +2,77 @@ from __future__ import annotations
 
 from typing import Any
 
-from core.models.entities import Recommendation
+from core.decision.rule_program import RecommendationTemplate, Rule
 from core.models.enums import RecommendationCategory, RiskCode
 from core.strategies.base import GoalStrategy
 
 
 class WeightLossStrategy(GoalStrategy):
     goal_name = "weight_loss"
+    thresholds = (
+        ("max_weight_slope", -0.05),
+        ("max_volatility", 0.06),
+        ("min_compliance", 0.8),
+        ("min_recovery", 0.55),
+    )
+    rules = (
+        Rule(
+            name="trend_miss",
+            signal="trend_slope",
+            comparator=">",
+            threshold="max_weight_slope",
+            risk_code=RiskCode.STALL_RISK.value,
+            recommendation=RecommendationTemplate(
+                rec_id="wl_nutrition_01",
+                priority=2,
+                category=RecommendationCategory.NUTRITION,
+                action="Reduce daily calories by 150-200 kcal for 7 days.",
+                expected_effect="Increases likelihood of negative weight trend.",
+                confidence=0.78,
+            ),
+            missing=0.0,
+        ),
+        Rule(
+            name="compliance_miss",
+            signal="compliance_ratio",
+            comparator="<",
+            threshold="min_compliance",
+            risk_code=RiskCode.COMPLIANCE_DROP.value,
+            recommendation=RecommendationTemplate(
+                rec_id="wl_compliance_01",
+                priority=1,
+                category=RecommendationCategory.HABIT,
+                action="Pre-log calories for the next 3 days and set a fixed intake range.",
+                expected_effect="Improves adherence and restores deficit consistency.",
+                confidence=0.84,
+            ),
+            missing=0.5,
+        ),
+        Rule(
+            name="recovery_miss",
+            signal="recovery_index",
+            comparator="<",
+            threshold="min_recovery",
+            risk_code=RiskCode.RECOVERY_DROP.value,
+            recommendation=RecommendationTemplate(
+                rec_id="wl_recovery_01",
+                priority=3,
+                category=RecommendationCategory.RECOVERY,
+                action="Reduce training volume by 10% for one week.",
+                expected_effect="Lowers fatigue and improves training adherence.",
+                confidence=0.73,
+            ),
+            missing=0.5,
+        ),
+        Rule(
+            name="volatility_miss",
+            signal="volatility_index",
+            comparator=">",
+            threshold="max_volatility",
+            risk_code=RiskCode.VOLATILITY_SPIKE.value,
+            missing=0.08,
+        ),
+    )
 
     def evaluate(self, signals, target: dict[str, Any]) -> dict[str, Any]:
         trend = self._safe(signals.trend_slope, 0.0)
@@ -16,26 +80,9 @@ class WeightLossStrategy(GoalStrategy):
         recovery = self._safe(signals.recovery_index, 0.5)
         volatility = self._safe(signals.volatility_index, 0.08)
 
-        target_max_slope = float(target.get("max_weight_slope", -0.05))
-        max_volatility = float(target.get("max_volatility", 0.06))
-        min_compliance = float(target.get("min_compliance", 0.8))
-        min_recovery = float(target.get("min_recovery", 0.55))
-
-        deviations = {
-            "trend_miss": trend > target_max_slope,
-            "compliance_miss": compliance < min_compliance,
-            "recovery_miss": recovery < min_recovery,
-            "volatility_miss": volatility > max_volatility,
-        }
-        risks: list[str] = []
-        if deviations["trend_miss"]:
-            risks.append(RiskCode.STALL_RISK.value)
-        if deviations["compliance_miss"]:
-            risks.append(RiskCode.COMPLIANCE_DROP.value)
-        if deviations["recovery_miss"]:
-            risks.append(RiskCode.RECOVERY_DROP.value)
-        if deviations["volatility_miss"]:
-            risks.append(RiskCode.VOLATILITY_SPIKE.value)
+        thresholds = self._resolve_thresholds(target)
+        target_max_slope, max_volatility, _, _ = thresholds
+        deviations, risks = self._apply_rules(signals, thresholds)
 
         priority_score = (
             0.35 * (1.0 - self._clamp01(compliance))
@@ -50,45 +97,3 @@ class WeightLossStrategy(GoalStrategy):
             "signals": {"trend_slope": trend, "compliance_ratio": compliance, "recovery_index": recovery},
             "priority_score": self._clamp01(priority_score),
         }
-
-    def recommend(self, evaluation: dict[str, Any]) -> list[Recommendation]:
-        deviations = evaluation["deviations"]
-        risks = evaluation["risks"]
-        recs: list[Recommendation] = []
-        if deviations["compliance_miss"]:
-            recs.append(
-                Recommendation(
-                    rec_id="wl_compliance_01",
-                    priority=1,
-                    category=RecommendationCategory.HABIT,
-                    action="Pre-log calories for the next 3 days and set a fixed intake range.",
-                    expected_effect="Improves adherence and restores deficit consistency.",
-                    reason_codes=risks,
-                    confidence=0.84,
-                )
-            )
-        if deviations["trend_miss"]:
-            recs.append(
-                Recommendation(
-                    rec_id="wl_nutrition_01",
-                    priority=2,
-                    category=RecommendationCategory.NUTRITION,
-                    action="Reduce daily calories by 150-200 kcal for 7 days.",
-                    expected_effect="Increases likelihood of negative weight trend.",
-                    reason_codes=risks,
-                    confidence=0.78,
-                )
-            )
-        if deviations["recovery_miss"]:
-            recs.append(
-                Recommendation(
-                    rec_id="wl_recovery_01",
-                    priority=3,
-                    category=RecommendationCategory.RECOVERY,
-                    action="Reduce training volume by 10% for one week.",
-                    expected_effect="Lowers fatigue and improves training adherence.",
-                    reason_codes=risks,
-                    confidence=0.73,
-                )
-            )
-        return recs
@@ -5,7 +5,7 @@ from typing import Any
 from core.engine.contracts import DomainDefinition, DomainLogs, SignalBundleLike, StrategyLike
 from domains.health.signals import compute_health_signals
 from domains.health.strategy import get_health_strategy
-from domains.health.thresholds import DEFAULT_SIGNAL_WINDOW_DAYS, DEFAULT_TARGETS
+from domains.health.thresholds import DEFAULT_SIGNAL_WINDOW_DAYS, DEFAULT_TARGETS, SIGNAL_SNAPSHOT_WINDOWS
 
 
 class HealthDomainDefinition(DomainDefinition):
@@ -16,7 +16,11 @@ class HealthDomainDefinition(DomainDefinition):
         return get_health_strategy(goal_type)
 
     def get_domain_config(self) -> dict[str, Any]:
-        return {"window_days": DEFAULT_SIGNAL_WINDOW_DAYS, "default_targets": dict(DEFAULT_TARGETS)}
+        return {
+            "window_days": DEFAULT_SIGNAL_WINDOW_DAYS,
+            "snapshot_windows": SIGNAL_SNAPSHOT_WINDOWS,
+            "default_targets": dict(DEFAULT_TARGETS),
+        }
 
     def normalize_goal_type(self, raw_goal_type: str) -> str:
         return raw_goal_type.strip().lower()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 DEFAULT_SIGNAL_WINDOW_DAYS = 7
+SIGNAL_SNAPSHOT_WINDOWS: tuple[int, ...] = (7, 14, 28, 56)
 
 DEFAULT_TARGETS: dict[str, float] = {
     "min_compliance": 0.8,
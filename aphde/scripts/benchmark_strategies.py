@@ -0,0 +1,471 @@
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+from typing import Any
+
+from core.models.entities import Recommendation
+from core.models.enums import GoalType, RecommendationCategory, RiskCode
+from core.signals.aggregator import SignalBundle
+from core.strategies.factory import StrategyFactory
+
+
+# Misses every threshold so each strategy emits its full recommendation set.
+_SIGNALS = SignalBundle(
+    trend_slope=0.03,
+    volatility_index=0.12,
+    compliance_ratio=0.55,
+    muscle_balance_index=0.4,
+    recovery_index=0.4,
+    progressive_overload_score=0.4,
+    sufficiency={},
+)
+
+
+# Frozen copy of the strategies before the compiled tables: thresholds read
+# from the target on every call, Recommendation objects spelled out in
+# `recommend`, and a new instance from every `create`.
+class _LegacyGoalStrategy:
+    goal_name: str
+
+    @staticmethod
+    def _clamp01(value: float) -> float:
+        return max(0.0, min(1.0, value))
+
+    @staticmethod
+    def _safe(signal: float | None, default: float = 0.5) -> float:
+        if signal is None:
+            return default
+        return float(signal)
+
+
+class _LegacyWeightLossStrategy(_LegacyGoalStrategy):
+    goal_name = "weight_loss"
+
+    def evaluate(self, signals, target: dict[str, Any]) -> dict[str, Any]:
+        trend = self._safe(signals.trend_slope, 0.0)
+        compliance = self._safe(signals.compliance_ratio, 0.5)
+        recovery = self._safe(signals.recovery_index, 0.5)
+        volatility = self._safe(signals.volatility_index, 0.08)
+
+        target_max_slope = float(target.get("max_weight_slope", -0.05))
+        max_volatility = float(target.get("max_volatility", 0.06))
+        min_compliance = float(target.get("min_compliance", 0.8))
+        min_recovery = float(target.get("min_recovery", 0.55))
+
+        deviations = {
+            "trend_miss": trend > target_max_slope,
+            "compliance_miss": compliance < min_compliance,
+            "recovery_miss": recovery < min_recovery,
+            "volatility_miss": volatility > max_volatility,
+        }
+        risks: list[str] = []
+        if deviations["trend_miss"]:
+            risks.append(RiskCode.STALL_RISK.value)
+        if deviations["compliance_miss"]:
+            risks.append(RiskCode.COMPLIANCE_DROP.value)
+        if deviations["recovery_miss"]:
+            risks.append(RiskCode.RECOVERY_DROP.value)
+        if deviations["volatility_miss"]:
+            risks.append(RiskCode.VOLATILITY_SPIKE.value)
+
+        priority_score = (
+            0.35 * (1.0 - self._clamp01(compliance))
+            + 0.30 * self._clamp01(max(0.0, trend - target_max_slope))
+            + 0.20 * (1.0 - self._clamp01(recovery))
+            + 0.15 * self._clamp01(volatility / max(1e-6, max_volatility))
+        )
+        return {
+            "goal": self.goal_name,
+            "deviations": deviations,
+            "risks": risks,
+            "signals": {"trend_slope": trend, "compliance_ratio": compliance, "recovery_index": recovery},
+            "priority_score": self._clamp01(priority_score),
+        }
+
+    def recommend(self, evaluation: dict[str, Any]) -> list[Recommendation]:
+        deviations = evaluation["deviations"]
+        risks = evaluation["risks"]
+        recs: list[Recommendation] = []
+        if deviations["compliance_miss"]:
+            recs.append(
+                Recommendation(
+                    rec_id="wl_compliance_01",
+                    priority=1,
+                    category=RecommendationCategory.HABIT,
+                    action="Pre-log calories for the next 3 days and set a fixed intake range.",
+                    expected_effect="Improves adherence and restores deficit consistency.",
+                    reason_codes=risks,
+                    confidence=0.84,
+                )
+            )
+        if deviations["trend_miss"]:
+            recs.append(
+                Recommendation(
+                    rec_id="wl_nutrition_01",
+                    priority=2,
+                    category=RecommendationCategory.NUTRITION,
+                    action="Reduce daily calories by 150-200 kcal for 7 days.",
+                    expected_effect="Increases likelihood of negative weight trend.",
+                    reason_codes=risks,
+                    confidence=0.78,
+                )
+            )
+        if deviations["recovery_miss"]:
+            recs.append(
+                Recommendation(
+                    rec_id="wl_recovery_01",
+                    priority=3,
+                    category=RecommendationCategory.RECOVERY,
+                    action="Reduce training volume by 10% for one week.",
+                    expected_effect="Lowers fatigue and improves training adherence.",
+                    reason_codes=risks,
+                    confidence=0.73,
+                )
+            )
+        return recs
+
+
+class _LegacyRecompositionStrategy(_LegacyGoalStrategy):
+    goal_name = "recomposition"
+
+    def evaluate(self, signals, target: dict[str, Any]) -> dict[str, Any]:
+        trend = self._safe(signals.trend_slope, 0.0)
+        overload = self._safe(signals.progressive_overload_score, 0.5)
+        balance = self._safe(signals.muscle_balance_index, 0.5)
+        compliance = self._safe(signals.compliance_ratio, 0.5)
+
+        max_abs_trend = float(target.get("max_abs_weight_slope", 0.06))
+        min_overload = float(target.get("min_overload", 0.65))
+        min_balance = float(target.get("min_balance", 0.65))
+        min_compliance = float(target.get("min_compliance", 0.8))
+
+        deviations = {
+            "weight_drift": abs(trend) > max_abs_trend,
+            "overload_miss": overload < min_overload,
+            "balance_miss": balance < min_balance,
+            "compliance_miss": compliance < min_compliance,
+        }
+        risks: list[str] = []
+        if deviations["overload_miss"] or deviations["weight_drift"]:
+            risks.append(RiskCode.STALL_RISK.value)
+        if deviations["compliance_miss"]:
+            risks.append(RiskCode.COMPLIANCE_DROP.value)
+
+        priority_score = (
+            0.35 * (1.0 - self._clamp01(overload))
+            + 0.25 * (1.0 - self._clamp01(balance))
+            + 0.25 * (1.0 - self._clamp01(compliance))
+            + 0.15 * self._clamp01(abs(trend) / max(1e-6, max_abs_trend))
+        )
+        return {
+            "goal": self.goal_name,
+            "deviations": deviations,
+            "risks": risks,
+            "signals": {"trend_slope": trend, "overload_score": overload, "balance_score": balance},
+            "priority_score": self._clamp01(priority_score),
+        }
+
+    def recommend(self, evaluation: dict[str, Any]) -> list[Recommendation]:
+        deviations = evaluation["deviations"]
+        risks = evaluation["risks"]
+        recs: list[Recommendation] = []
+        if deviations["overload_miss"]:
+            recs.append(
+                Recommendation(
+                    rec_id="rc_training_01",
+                    priority=1,
+                    category=RecommendationCategory.TRAINING,
+                    action="Add one progressive overload anchor lift and track weekly top set.",
+                    expected_effect="Improves strength stimulus while preserving recomposition.",
+                    reason_codes=risks,
+                    confidence=0.82,
+                )
+            )
+        if deviations["weight_drift"]:
+            recs.append(
+                Recommendation(
+                    rec_id="rc_nutrition_01",
+                    priority=2,
+                    category=RecommendationCategory.NUTRITION,
+                    action="Adjust calories by +/-100 based on trend direction for 7 days.",
+                    expected_effect="Keeps bodyweight inside recomposition band.",
+                    reason_codes=risks,
+                    confidence=0.77,
+                )
+            )
+        if deviations["balance_miss"]:
+            recs.append(
+                Recommendation(
+                    rec_id="rc_training_02",
+                    priority=3,
+                    category=RecommendationCategory.TRAINING,
+                    action="Rebalance weekly split to even push/pull/lower volume.",
+                    expected_effect="Improves muscular symmetry and training quality.",
+                    reason_codes=risks,
+                    confidence=0.72,
+                )
+            )
+        return recs
+
+
+class _LegacyStrengthGainStrategy(_LegacyGoalStrategy):
+    goal_name = "strength_gain"
+
+    def evaluate(self, signals, target: dict[str, Any]) -> dict[str, Any]:
+        overload = self._safe(signals.progressive_overload_score, 0.5)
+        recovery = self._safe(signals.recovery_index, 0.5)
+        compliance = self._safe(signals.compliance_ratio, 0.5)
+        trend = self._safe(signals.trend_slope, 0.0)
+
+        min_overload = float(target.get("min_overload", 0.72))
+        min_recovery = float(target.get("min_recovery", 0.6))
+        min_compliance = float(target.get("min_compliance", 0.8))
+        min_trend = float(target.get("min_strength_trend", 0.0))
+
+        deviations = {
+            "overload_miss": overload < min_overload,
+            "recovery_miss": recovery < min_recovery,
+            "compliance_miss": compliance < min_compliance,
+            "progress_miss": trend < min_trend,
+        }
+        risks: list[str] = []
+        if deviations["overload_miss"] or deviations["progress_miss"]:
+            risks.append(RiskCode.STALL_RISK.value)
+        if deviations["recovery_miss"]:
+            risks.append(RiskCode.RECOVERY_DROP.value)
+        if deviations["compliance_miss"]:
+            risks.append(RiskCode.COMPLIANCE_DROP.value)
+
+        priority_score = (
+            0.4 * (1.0 - self._clamp01(overload))
+            + 0.25 * (1.0 - self._clamp01(recovery))
+            + 0.2 * (1.0 - self._clamp01(compliance))
+            + 0.15 * self._clamp01(max(0.0, min_trend - trend))
+        )
+        return {
+            "goal": self.goal_name,
+            "deviations": deviations,
+            "risks": risks,
+            "signals": {"overload_score": overload, "recovery_index": recovery, "trend_slope": trend},
+            "priority_score": self._clamp01(priority_score),
+        }
+
+    def recommend(self, evaluation: dict[str, Any]) -> list[Recommendation]:
+        deviations = evaluation["deviations"]
+        risks = evaluation["risks"]
+        recs: list[Recommendation] = []
+        if deviations["overload_miss"]:
+            recs.append(
+                Recommendation(
+                    rec_id="sg_training_01",
+                    priority=1,
+                    category=RecommendationCategory.TRAINING,
+                    action="Increase top-set load by 2.5% and keep accessory volume stable.",
+                    expected_effect="Restores progressive overload signal.",
+                    reason_codes=risks,
+                    confidence=0.85,
+                )
+            )
+        if deviations["recovery_miss"]:
+            recs.append(
+                Recommendation(
+                    rec_id="sg_recovery_01",
+                    priority=2,
+                    category=RecommendationCategory.RECOVERY,
+                    action="Insert one low-intensity day after each heavy session.",
+                    expected_effect="Improves readiness for high-intensity lifts.",
+                    reason_codes=risks,
+                    confidence=0.8,
+                )
+            )
+        if deviations["compliance_miss"]:
+            recs.append(
+                Recommendation(
+                    rec_id="sg_habit_01",
+                    priority=3,
+                    category=RecommendationCategory.HABIT,
+                    action="Lock a fixed weekly lifting schedule with 3 non-negotiable sessions.",
+                    expected_effect="Improves consistency and training frequency.",
+                    reason_codes=risks,
+                    confidence=0.79,
+                )
+            )
+        return recs
+
+
+class _LegacyGeneralHealthStrategy(_LegacyGoalStrategy):
+    goal_name = "general_health"
+
+    def evaluate(self, signals, target: dict[str, Any]) -> dict[str, Any]:
+        compliance = self._safe(signals.compliance_ratio, 0.5)
+        recovery = self._safe(signals.recovery_index, 0.5)
+        volatility = self._safe(signals.volatility_index, 0.08)
+        balance = self._safe(signals.muscle_balance_index, 0.5)
+
+        min_compliance = float(target.get("min_compliance", 0.7))
+        min_recovery = float(target.get("min_recovery", 0.55))
+        max_volatility = float(target.get("max_volatility", 0.08))
+        min_balance = float(target.get("min_balance", 0.6))
+
+        deviations = {
+            "compliance_miss": compliance < min_compliance,
+            "recovery_miss": recovery < min_recovery,
+            "volatility_miss": volatility > max_volatility,
+            "balance_miss": balance < min_balance,
+        }
+        risks: list[str] = []
+        if deviations["compliance_miss"]:
+            risks.append(RiskCode.COMPLIANCE_DROP.value)
+        if deviations["recovery_miss"]:
+            risks.append(RiskCode.RECOVERY_DROP.value)
+        if deviations["volatility_miss"]:
+            risks.append(RiskCode.VOLATILITY_SPIKE.value)
+
+        priority_score = (
+            0.35 * (1.0 - self._clamp01(compliance))
+            + 0.25 * (1.0 - self._clamp01(recovery))
+            + 0.2 * self._clamp01(volatility / max(1e-6, max_volatility))
+            + 0.2 * (1.0 - self._clamp01(balance))
+        )
+        return {
+            "goal": self.goal_name,
+            "deviations": deviations,
+            "risks": risks,
+            "signals": {"compliance_ratio": compliance, "recovery_index": recovery, "volatility_index": volatility},
+            "priority_score": self._clamp01(priority_score),
+        }
+
+    def recommend(self, evaluation: dict[str, Any]) -> list[Recommendation]:
+        deviations = evaluation["deviations"]
+        risks = evaluation["risks"]
+        recs: list[Recommendation] = []
+        if deviations["compliance_miss"]:
+            recs.append(
+                Recommendation(
+                    rec_id="gh_habit_01",
+                    priority=1,
+                    category=RecommendationCategory.HABIT,
+                    action="Set a weekly minimum activity target with calendar reminders.",
+                    expected_effect="Improves consistency and baseline health behaviors.",
+                    reason_codes=risks,
+                    confidence=0.81,
+                )
+            )
+        if deviations["recovery_miss"]:
+            recs.append(
+                Recommendation(
+                    rec_id="gh_recovery_01",
+                    priority=2,
+                    category=RecommendationCategory.RECOVERY,
+                    action="Add one extra rest day and cap high-RPE sessions this week.",
+                    expected_effect="Reduces fatigue accumulation and supports sustainability.",
+                    reason_codes=risks,
+                    confidence=0.76,
+                )
+            )
+        if deviations["volatility_miss"]:
+            recs.append(
+                Recommendation(
+                    rec_id="gh_nutrition_01",
+                    priority=3,
+                    category=RecommendationCategory.NUTRITION,
+                    action="Standardize meal timing and calorie range on weekdays.",
+                    expected_effect="Lowers behavioral volatility and improves routine.",
+                    reason_codes=risks,
+                    confidence=0.7,
+                )
+            )
+        return recs
+
+
+
+def _legacy_create(goal_type: GoalType) -> _LegacyGoalStrategy:
+    if goal_type == GoalType.WEIGHT_LOSS:
+        return _LegacyWeightLossStrategy()
+    if goal_type == GoalType.RECOMPOSITION:
+        return _LegacyRecompositionStrategy()
+    if goal_type == GoalType.STRENGTH_GAIN:
+        return _LegacyStrengthGainStrategy()
+    if goal_type == GoalType.GENERAL_HEALTH:
+        return _LegacyGeneralHealthStrategy()
+    raise ValueError(f"Unsupported goal type: {goal_type}")
+
+
+def _run_once(goal_type: GoalType, *, legacy: bool) -> tuple[Any, Any]:
+    strategy = _legacy_create(goal_type) if legacy else StrategyFactory.create(goal_type)
+    return strategy, strategy.recommend(strategy.evaluate(_SIGNALS, {}))
+
+
+def check_parity() -> None:
+    """Fail unless the frozen and current strategies agree, so the timings compare like for like."""
+
+    for goal_type in GoalType:
+        old = _legacy_create(goal_type)
+        new = StrategyFactory.create(goal_type)
+        old_evaluation = old.evaluate(_SIGNALS, {})
+        new_evaluation = new.evaluate(_SIGNALS, {})
+        if old_evaluation != new_evaluation or old.recommend(old_evaluation) != new.recommend(new_evaluation):
+            raise RuntimeError(f"Legacy and current {goal_type.value} strategies disagree")
+
+
+def measure(*, iterations: int, legacy: bool) -> dict[str, Any]:
+    """
+    Mean wall time of one create + evaluate + recommend call, plus traced bytes
+    per call: `peak` includes temporaries, `retained` is what stays alive while
+    the strategy and its recommendations are held. `legacy` runs the frozen
+    pre-table strategies instead of `StrategyFactory`.
+    """
+
+    goal_types = list(GoalType)
+    for goal_type in goal_types:
+        _run_once(goal_type, legacy=legacy)
+
+    started = time.perf_counter()
+    for idx in range(iterations):
+        _run_once(goal_types[idx % len(goal_types)], legacy=legacy)
+    elapsed = time.perf_counter() - started
+
+    peak_total = 0
+    held: list[Any] = [None] * iterations
+    tracemalloc.start()
+    try:
+        for idx in range(iterations):
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            _run_once(goal_types[idx % len(goal_types)], legacy=legacy)
+            peak_total += tracemalloc.get_traced_memory()[1] - baseline
+
+        baseline = tracemalloc.get_traced_memory()[0]
+        for idx in range(iterations):
+            held[idx] = _run_once(goal_types[idx % len(goal_types)], legacy=legacy)
+        retained_total = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "iterations": iterations,
+        "mean_us": round(elapsed / iterations * 1e6, 3),
+        "mean_peak_bytes": round(peak_total / iterations, 1),
+        "mean_retained_bytes": round(retained_total / iterations, 1),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare per-call cost of the pre-table and current goal strategies.")
+    parser.add_argument("--iterations", type=int, default=20_000)
+    args = parser.parse_args(argv)
+
+    check_parity()
+    for label, legacy in (("before", True), ("after", False)):
+        result = measure(iterations=args.iterations, legacy=legacy)
+        print(
+            f"{label:<7} mean={result['mean_us']}us peak={result['mean_peak_bytes']}B/call "
+            f"retained={result['mean_retained_bytes']}B/call"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import argparse
+from datetime import date
+
+from core.services.signal_snapshots import compute_all_signal_snapshots, snapshot_windows
+from domains.health.domain_definition import HealthDomainDefinition
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Store multi-window signal snapshots for every active user.")
+    parser.add_argument("--db", default="aphde.db", help="SQLite database path")
+    parser.add_argument("--as-of", type=date.fromisoformat, default=None, help="snapshot date (YYYY-MM-DD), default today")
+    parser.add_argument("--windows", default="", help="comma-separated window lengths in days")
+    parser.add_argument("--chunk-size", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    domain_definition = HealthDomainDefinition()
+    windows = snapshot_windows(
+        domain_definition,
+        tuple(int(item) for item in args.windows.split(",") if item.strip()),
+    )
+
+    processed = compute_all_signal_snapshots(
+        args.db,
+        domain_definition=domain_definition,
+        as_of=args.as_of,
+        windows=windows,
+        chunk_size=args.chunk_size,
+    )
+    print(f"Stored signal snapshots for {processed} users (windows={','.join(map(str, windows))}).")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import argparse
+
+from core.services.history_export import DEFAULT_EXPORT_CHUNK_SIZE, EXPORT_FORMATS, export_decision_history
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Append new decision runs to a columnar history export.")
+    parser.add_argument("--db", default="aphde.db", help="SQLite database path")
+    parser.add_argument("--out", default="exports/decision_history", help="export directory")
+    parser.add_argument("--format", default="auto", choices=("auto", *EXPORT_FORMATS))
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_EXPORT_CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    result = export_decision_history(args.db, args.out, format=args.format, chunk_size=args.chunk_size)
+    print(
+        f"Exported {result.rows_written} runs in {len(result.parts_written)} parts "
+        f"(format={result.format}, watermark={result.watermark})."
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
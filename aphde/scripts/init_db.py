@@ -3,6 +3,7 @@ from core.data.migrations.migrate_v2_confidence import run_migration as run_v2_m
 from core.data.migrations.migrate_v3_context import run_migration as run_v3_migration
 from core.data.migrations.migrate_v5_governance import run_migration as run_v5_migration
 from core.data.migrations.migrate_v7_multi_user_auth import run_migration as run_v7_migration
+from core.data.migrations.migrate_v8_data_versions import run_migration as run_v8_migration
 
 
 if __name__ == "__main__":
@@ -11,4 +12,5 @@ if __name__ == "__main__":
     run_v3_migration()
     run_v5_migration()
     run_v7_migration()
+    run_v8_migration()
     print("Initialized Stratify SQLite schema and applied migrations.")
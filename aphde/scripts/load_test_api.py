@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import random
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+from core.data.db import get_connection, init_db
+from core.data.repositories.goal_repo import GoalRepository
+from core.data.repositories.user_repo import UserRepository
+from core.models.enums import GoalType
+
+
+READ_ENDPOINTS: tuple[str, ...] = ("decisions/latest", "decisions", "insights", "action-plan")
+
+
+def seed_users(db_path: str | Path, user_count: int) -> list[int]:
+    """Create `user_count` users with an active goal; logs are sent through the API."""
+
+    init_db(db_path)
+    goal_types = list(GoalType)
+    user_ids: list[int] = []
+    with get_connection(db_path) as conn:
+        user_repo = UserRepository(conn)
+        goal_repo = GoalRepository(conn)
+        for idx in range(user_count):
+            user_id = user_repo.create()
+            goal_repo.set_active_goal(user_id, goal_types[idx % len(goal_types)], {})
+            user_ids.append(user_id)
+    return user_ids
+
+
+def _log_batch(user_index: int, days: int) -> dict[str, Any]:
+    today = date.today()
+    weight_logs: list[dict[str, Any]] = []
+    calorie_logs: list[dict[str, Any]] = []
+    workout_logs: list[dict[str, Any]] = []
+    for offset in range(days):
+        log_date = (today - timedelta(days=days - 1 - offset)).isoformat()
+        weight_logs.append({"log_date": log_date, "weight_kg": 78.0 + 0.05 * ((offset + user_index) % 5)})
+        calorie_logs.append({"log_date": log_date, "calories_kcal": 2200 + 40 * (offset % 4), "protein_g": 130})
+        workout_logs.append(
+            {
+                "log_date": log_date,
+                "session_type": ("upper", "lower", "pull", "core")[offset % 4],
+                "duration_min": 55,
+                "volume_load": 5000.0 + 35.0 * offset,
+                "avg_rpe": 7.5 + 0.2 * (offset % 3),
+                "planned_flag": True,
+                "completed_flag": (offset + user_index) % 5 != 0,
+            }
+        )
+    return {"weight_logs": weight_logs, "calorie_logs": calorie_logs, "workout_logs": workout_logs}
+
+
+class _Client:
+    """One kept-alive HTTP/1.1 connection."""
+
+    def __init__(self, host: str, port: int, timeout: float) -> None:
+        self._host = host
+        self._port = port
+        self._timeout = timeout
+        self._conn = http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        body: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> tuple[int, dict[str, str], bytes]:
+        payload = json.dumps(body).encode("utf-8") if body is not None else None
+        request_headers = {"Content-Type": "application/json", **(headers or {})}
+        try:
+            self._conn.request(method, path, body=payload, headers=request_headers)
+            response = self._conn.getresponse()
+        except (ConnectionError, http.client.HTTPException):
+            self._conn.close()
+            self._conn = http.client.HTTPConnection(self._host, self._port, timeout=self._timeout)
+            self._conn.request(method, path, body=payload, headers=request_headers)
+            response = self._conn.getresponse()
+        return response.status, dict(response.getheaders()), response.read()
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(pct / 100.0 * (len(sorted_values) - 1)))))
+    return sorted_values[index]
+
+
+def _latency_summary(samples: list[float]) -> dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "p50_ms": round(_percentile(ordered, 50) * 1000.0, 3),
+        "p90_ms": round(_percentile(ordered, 90) * 1000.0, 3),
+        "p99_ms": round(_percentile(ordered, 99) * 1000.0, 3),
+        "max_ms": round((ordered[-1] if ordered else 0.0) * 1000.0, 3),
+    }
+
+
+def run_load(
+    *,
+    base_url: str,
+    user_ids: list[int],
+    duration_s: float = 10.0,
+    concurrency: int = 8,
+    write_ratio: float = 0.05,
+    conditional: bool = True,
+    seed: int = 7,
+    timeout: float = 30.0,
+) -> dict[str, Any]:
+    """
+    Drive a running API with `concurrency` keep-alive clients for `duration_s`
+    seconds. A `write_ratio` share of requests are evaluations; the rest are
+    reads spread across `READ_ENDPOINTS`, revalidated with If-None-Match when
+    `conditional` is set.
+    """
+
+    parts = urlsplit(base_url)
+    host = parts.hostname or "127.0.0.1"
+    port = parts.port or 80
+    latencies: dict[str, list[float]] = defaultdict(list)
+    statuses: Counter[str] = Counter()
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration_s
+
+    def worker(worker_id: int) -> None:
+        rng = random.Random(seed + worker_id)
+        client = _Client(host, port, timeout)
+        etags: dict[str, str] = {}
+        local_latency: dict[str, list[float]] = defaultdict(list)
+        local_status: Counter[str] = Counter()
+        try:
+            while time.perf_counter() < deadline:
+                user_id = rng.choice(user_ids)
+                if rng.random() < write_ratio:
+                    label, method, path, headers = "evaluate", "POST", f"/users/{user_id}/evaluate", {}
+                else:
+                    label = rng.choice(READ_ENDPOINTS)
+                    method, path = "GET", f"/users/{user_id}/{label}"
+                    headers = {"If-None-Match": etags[path]} if conditional and path in etags else {}
+                started = time.perf_counter()
+                try:
+                    status, response_headers, _ = client.request(method, path, headers=headers)
+                except OSError:
+                    local_status["error"] += 1
+                    continue
+                local_latency[label].append(time.perf_counter() - started)
+                local_status[str(status)] += 1
+                if "ETag" in response_headers:
+                    etags[path] = response_headers["ETag"]
+        finally:
+            client.close()
+            with lock:
+                for key, values in local_latency.items():
+                    latencies[key].extend(values)
+                statuses.update(local_status)
+
+    started_at = time.perf_counter()
+    threads = [threading.Thread(target=worker, args=(idx,), daemon=True) for idx in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started_at
+
+    all_samples = [value for values in latencies.values() for value in values]
+    total = len(all_samples)
+    return {
+        "requests": total,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(total / elapsed, 2) if elapsed > 0 else 0.0,
+        "status_counts": dict(sorted(statuses.items())),
+        "latency": _latency_summary(all_samples),
+        "by_endpoint": {key: _latency_summary(values) for key, values in sorted(latencies.items())},
+    }
+
+
+def _prime_users(base_url: str, user_ids: list[int], days: int) -> None:
+    parts = urlsplit(base_url)
+    client = _Client(parts.hostname or "127.0.0.1", parts.port or 80, timeout=60.0)
+    try:
+        for idx, user_id in enumerate(user_ids):
+            batch = _log_batch(idx, days)
+            batch["evaluate"] = True
+            status, _, body = client.request("POST", f"/users/{user_id}/logs", body=batch)
+            if status != 201:
+                raise RuntimeError(f"priming user {user_id} failed: {status} {body!r}")
+    finally:
+        client.close()
+
+
+def _print_report(report: dict[str, Any]) -> None:
+    print(f"requests={report['requests']} elapsed_s={report['elapsed_s']} throughput_rps={report['throughput_rps']}")
+    print(f"status_counts={report['status_counts']}")
+    overall = report["latency"]
+    print(f"latency p50={overall['p50_ms']}ms p90={overall['p90_ms']}ms p99={overall['p99_ms']}ms max={overall['max_ms']}ms")
+    for endpoint, summary in report["by_endpoint"].items():
+        print(
+            f"  {endpoint:<18} n={summary['count']:<7} p50={summary['p50_ms']}ms "
+            f"p90={summary['p90_ms']}ms p99={summary['p99_ms']}ms"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Load-test the Stratify HTTP API.")
+    parser.add_argument("--url", default=None, help="base URL of a running server; omit to spawn a local one")
+    parser.add_argument("--user-ids", default="", help="comma-separated user ids (with --url)")
+    parser.add_argument("--users", type=int, default=20, help="users to seed when spawning")
+    parser.add_argument("--days", type=int, default=14, help="days of logs to ingest per seeded user")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--write-ratio", type=float, default=0.05)
+    parser.add_argument("--no-conditional", action="store_true", help="disable If-None-Match revalidation")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    server = None
+    server_thread = None
+    tmp_dir = None
+    try:
+        if args.url is None:
+            from aphde.app.api_server import make_server
+
+            tmp_dir = tempfile.TemporaryDirectory()
+            db_path = Path(tmp_dir.name) / "load_test.db"
+            user_ids = seed_users(db_path, args.users)
+            server = make_server(db_path=db_path, port=0)
+            server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+            server_thread.start()
+            base_url = f"http://127.0.0.1:{server.server_address[1]}"
+            _prime_users(base_url, user_ids, args.days)
+        else:
+            base_url = args.url
+            user_ids = [int(item) for item in args.user_ids.split(",") if item.strip()]
+            if not user_ids:
+                parser.error("--user-ids is required with --url")
+
+        report = run_load(
+            base_url=base_url,
+            user_ids=user_ids,
+            duration_s=args.duration,
+            concurrency=args.concurrency,
+            write_ratio=args.write_ratio,
+            conditional=not args.no_conditional,
+        )
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+        if tmp_dir is not None:
+            tmp_dir.cleanup()
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print_report(report)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import argparse
+
+from core.services.tomorrow_plans import precompute_tomorrow_plans
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Store tomorrow plans for every active user's latest decision run.")
+    parser.add_argument("--db", default="aphde.db", help="SQLite database path")
+    parser.add_argument("--users", default="", help="comma-separated user ids, default all active users")
+    parser.add_argument("--chunk-size", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    user_ids = [int(item) for item in args.users.split(",") if item.strip()] or None
+    result = precompute_tomorrow_plans(db_path=args.db, user_ids=user_ids, chunk_size=args.chunk_size)
+    print(f"Stored {result.plans_written} tomorrow plans for {result.users_processed} users.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
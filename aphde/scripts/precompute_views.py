@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import argparse
+
+from aphde.app.services.view_precompute import VIEW_LOADERS, precompute_views
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Store Action Center and Insights payloads for every active user.")
+    parser.add_argument("--db", default="aphde.db", help="SQLite database path")
+    parser.add_argument("--users", default="", help="comma-separated user ids, default all active users")
+    parser.add_argument("--views", default=",".join(VIEW_LOADERS), help="comma-separated view names")
+    parser.add_argument("--chunk-size", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    user_ids = [int(item) for item in args.users.split(",") if item.strip()] or None
+    view_names = [item.strip() for item in args.views.split(",") if item.strip()]
+    unknown = sorted(set(view_names) - set(VIEW_LOADERS))
+    if unknown:
+        parser.error(f"unknown views: {', '.join(unknown)}")
+    result = precompute_views(db_path=args.db, user_ids=user_ids, chunk_size=args.chunk_size, view_names=view_names)
+    print(
+        f"Stored {result.views_written} views for {result.users_processed} users "
+        f"({result.views_fresh} already current)."
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
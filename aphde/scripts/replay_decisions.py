@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import argparse
+from datetime import date
+
+from core.services.decision_replay import replay_decisions
+from domains.health.domain_definition import HealthDomainDefinition
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Recompute past decisions into the decision_replays shadow table.")
+    parser.add_argument("--db", default="aphde.db", help="SQLite database path")
+    parser.add_argument("--start", type=date.fromisoformat, required=True, help="first replay date (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, default=None, help="last replay date, default today")
+    parser.add_argument("--engine-version", required=True, help="label stored with every replayed row")
+    parser.add_argument("--users", default="", help="comma-separated user ids, default all active users")
+    parser.add_argument("--chunk-size", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    user_ids = [int(item) for item in args.users.split(",") if item.strip()] or None
+    result = replay_decisions(
+        args.start,
+        args.end or date.today(),
+        engine_version=args.engine_version,
+        domain_definition=HealthDomainDefinition(),
+        db_path=args.db,
+        user_ids=user_ids,
+        chunk_size=args.chunk_size,
+    )
+    print(
+        f"Replayed {result.days_evaluated} user-days for {result.users_processed} users "
+        f"(skipped {result.days_skipped}, engine_version={result.engine_version})."
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
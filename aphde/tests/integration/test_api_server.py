@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import http.client
+import json
+import logging
+import threading
+from datetime import date
+
+import pytest
+
+from aphde.app import api_server
+from aphde.app.api_server import make_server
+from core.data.db import get_connection, init_db
+from core.data.repositories.goal_repo import GoalRepository
+from core.data.repositories.user_repo import UserRepository
+from core.models.enums import GoalType
+from scripts.load_test_api import run_load
+
+
+@pytest.fixture()
+def api(tmp_path):
+    db_path = tmp_path / "api.db"
+    init_db(db_path)
+    with get_connection(db_path) as conn:
+        user_id = UserRepository(conn).create()
+        GoalRepository(conn).set_active_goal(user_id, GoalType.WEIGHT_LOSS, {})
+    server = make_server(db_path=db_path, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=10)
+    yield server, conn, user_id
+    conn.close()
+    server.shutdown()
+    server.server_close()
+
+
+def _request(conn, method: str, path: str, body: dict | None = None, headers: dict | None = None):
+    payload = json.dumps(body).encode("utf-8") if body is not None else None
+    conn.request(method, path, body=payload, headers=headers or {})
+    response = conn.getresponse()
+    raw = response.read()
+    return response, (json.loads(raw) if raw else None)
+
+
+def _log_payload() -> dict:
+    today = date.today().isoformat()
+    return {
+        "weight_logs": [{"log_date": today, "weight_kg": 78.0 + 0.03 * i} for i in range(7)],
+        "calorie_logs": [{"log_date": today, "calories_kcal": 2400, "protein_g": 120} for _ in range(7)],
+        "workout_logs": [
+            {"log_date": today, "session_type": "upper", "duration_min": 50, "volume_load": 5000 + 50 * i, "avg_rpe": 8.1}
+            for i in range(7)
+        ],
+    }
+
+
+def test_api_ingest_evaluate_and_conditional_reads(api) -> None:
+    _, conn, user_id = api
+
+    response, body = _request(conn, "POST", f"/users/{user_id}/logs", _log_payload())
+    assert response.status == 201
+    assert body["inserted"] == {"weight_logs": 7, "calorie_logs": 7, "workout_logs": 7}
+
+    response, body = _request(conn, "POST", f"/users/{user_id}/evaluate")
+    assert response.status == 201
+    decision_id = body["decision_id"]
+
+    response, body = _request(conn, "GET", f"/users/{user_id}/decisions/latest")
+    assert response.status == 200
+    assert body["latest"]["id"] == decision_id
+    etag = response.getheader("ETag")
+    assert etag
+
+    response, body = _request(conn, "GET", f"/users/{user_id}/decisions/latest", headers={"If-None-Match": etag})
+    assert response.status == 304
+    assert body is None
+
+    for path in ("decisions", "insights", "action-plan"):
+        response, body = _request(conn, "GET", f"/users/{user_id}/{path}")
+        assert response.status == 200, path
+        assert "recent_runs" not in body
+
+    response, _ = _request(conn, "GET", f"/users/{user_id}/insights")
+    insights_etag = response.getheader("ETag")
+    _request(conn, "POST", f"/users/{user_id}/logs", {"weight_logs": [{"log_date": date.today().isoformat(), "weight_kg": 77.9}]})
+    response, _ = _request(conn, "GET", f"/users/{user_id}/insights", headers={"If-None-Match": insights_etag})
+    assert response.status == 200
+
+    _request(conn, "POST", f"/users/{user_id}/evaluate")
+    response, _ = _request(conn, "GET", f"/users/{user_id}/decisions/latest", headers={"If-None-Match": etag})
+    assert response.status == 200
+    assert response.getheader("ETag") != etag
+
+
+def test_api_rejects_bad_requests(api) -> None:
+    _, conn, user_id = api
+
+    response, body = _request(conn, "POST", f"/users/{user_id}/logs", {"weight_logs": [{"log_date": "bad"}]})
+    assert response.status == 400
+    assert "error" in body
+
+    response, _ = _request(conn, "GET", "/nope")
+    assert response.status == 404
+
+    response, _ = _request(conn, "POST", "/users/999/evaluate")
+    assert response.status == 422
+
+    response, body = _request(conn, "GET", "/health")
+    assert response.status == 200
+    assert body == {"status": "ok"}
+
+
+def test_api_rejects_unusable_content_length_and_closes(api) -> None:
+    server, _, user_id = api
+    for length in ("-5", "nope", str(10 * 1024 * 1024)):
+        conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=5)
+        conn.putrequest("POST", f"/users/{user_id}/evaluate")
+        conn.putheader("Content-Length", length)
+        conn.endheaders()
+        response = conn.getresponse()
+        response.read()
+        assert response.status in (400, 413), length
+        assert response.getheader("Connection") == "close"
+        conn.close()
+
+
+def test_api_logs_unexpected_failures(api, monkeypatch, caplog) -> None:
+    _, conn, user_id = api
+
+    def _fail(*args, **kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(api_server, "load_view", _fail)
+    with caplog.at_level(logging.ERROR, logger="aphde.app.api_server"):
+        response, body = _request(conn, "GET", f"/users/{user_id}/insights")
+
+    assert response.status == 500
+    assert body == {"error": "RuntimeError"}
+    assert f"GET /users/{user_id}/insights failed" in caplog.text
+    assert "boom" in caplog.text
+
+
+def test_api_server_refuses_non_loopback_hosts(tmp_path) -> None:
+    with pytest.raises(ValueError, match="loopback"):
+        make_server(db_path=tmp_path / "api.db", host="0.0.0.0", port=0)
+
+
+def test_load_generator_reports_throughput(api) -> None:
+    server, conn, user_id = api
+    _request(conn, "POST", f"/users/{user_id}/logs", {**_log_payload(), "evaluate": True})
+
+    report = run_load(
+        base_url=f"http://127.0.0.1:{server.server_address[1]}",
+        user_ids=[user_id],
+        duration_s=0.3,
+        concurrency=2,
+        write_ratio=0.0,
+    )
+    assert report["requests"] > 0
+    assert report["throughput_rps"] > 0
+    assert set(report["status_counts"]) <= {"200", "304"}
+    assert report["latency"]["p50_ms"] <= report["latency"]["max_ms"]
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from datetime import date
+
+import pytest
+
+from aphde.app.services.async_views import async_load_dashboard_view
+from core.data.db import get_connection, init_db
+from core.data.repositories.calorie_repo import CalorieLogRepository
+from core.data.repositories.decision_repo import DecisionRunRepository
+from core.data.repositories.goal_repo import GoalRepository
+from core.data.repositories.user_repo import UserRepository
+from core.data.repositories.weight_repo import WeightLogRepository
+from core.data.repositories.workout_repo import WorkoutLogRepository
+from core.models.enums import GoalType
+from core.services.async_evaluation import AsyncEvaluationRuntime, async_run_evaluation
+from core.services.run_evaluation import run_evaluation
+from domains.health.domain_definition import HealthDomainDefinition
+
+
+def _seed_user(db_path) -> int:
+    with get_connection(db_path) as conn:
+        user_id = UserRepository(conn).create()
+        GoalRepository(conn).set_active_goal(user_id, GoalType.WEIGHT_LOSS, {})
+        today = date.today()
+        for i in range(7):
+            WeightLogRepository(conn).add(user_id, today, 78.0 + (0.03 * i))
+            CalorieLogRepository(conn).add(user_id, today, 2400, 120)
+            WorkoutLogRepository(conn).add(user_id, today, "upper", 50, 5000 + (50 * i), 8.1, True, True)
+    return user_id
+
+
+class _SlowHealthDomain(HealthDomainDefinition):
+    def compute_signals(self, logs, config):
+        time.sleep(0.3)
+        return super().compute_signals(logs, config)
+
+
+def test_async_run_evaluation_matches_sync_output(tmp_path) -> None:
+    sync_db = tmp_path / "sync_eval.db"
+    async_db = tmp_path / "async_eval.db"
+    init_db(sync_db)
+    init_db(async_db)
+    sync_user = _seed_user(sync_db)
+    async_user = _seed_user(async_db)
+    runtime = AsyncEvaluationRuntime(io_workers=2, cpu_workers=2)
+
+    sync_id = run_evaluation(user_id=sync_user, db_path=str(sync_db), domain_definition=HealthDomainDefinition())
+    async_id = asyncio.run(
+        async_run_evaluation(
+            user_id=async_user,
+            db_path=str(async_db),
+            domain_definition=HealthDomainDefinition(),
+            runtime=runtime,
+        )
+    )
+    runtime.shutdown()
+
+    with get_connection(sync_db) as conn:
+        sync_row = DecisionRunRepository(conn).get_by_id(sync_user, sync_id)
+    with get_connection(async_db) as conn:
+        async_row = DecisionRunRepository(conn).get_by_id(async_user, async_id)
+    assert async_row["input_signature_hash"] == sync_row["input_signature_hash"]
+    assert async_row["output_hash"] == sync_row["output_hash"]
+
+
+def test_async_run_evaluation_timeout_skips_persist(tmp_path) -> None:
+    db_path = tmp_path / "async_timeout.db"
+    init_db(db_path)
+    user_id = _seed_user(db_path)
+    runtime = AsyncEvaluationRuntime(io_workers=1, cpu_workers=1)
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(
+            async_run_evaluation(
+                user_id=user_id,
+                db_path=str(db_path),
+                domain_definition=_SlowHealthDomain(),
+                timeout=0.1,
+                runtime=runtime,
+            )
+        )
+    runtime.shutdown()
+
+    with get_connection(db_path) as conn:
+        assert DecisionRunRepository(conn).latest(user_id) is None
+
+
+def test_async_reads_respect_per_db_concurrency_limit(tmp_path, monkeypatch) -> None:
+    db_path = tmp_path / "async_reads.db"
+    init_db(db_path)
+    user_id = _seed_user(db_path)
+    run_evaluation(user_id=user_id, db_path=str(db_path), domain_definition=HealthDomainDefinition())
+    runtime = AsyncEvaluationRuntime(io_workers=8, max_concurrency_per_db=2)
+
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    import aphde.app.services.async_views as async_views
+
+    original = async_views.load_dashboard_view
+
+    def tracked(**kwargs):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        try:
+            time.sleep(0.02)
+            return original(**kwargs)
+        finally:
+            with lock:
+                active -= 1
+
+    monkeypatch.setattr(async_views, "load_dashboard_view", tracked)
+
+    async def _burst() -> list[dict]:
+        return await asyncio.gather(
+            *(
+                async_load_dashboard_view(user_id=user_id, db_path=str(db_path), runtime=runtime)
+                for _ in range(12)
+            )
+        )
+
+    views = asyncio.run(_burst())
+    runtime.shutdown()
+
+    assert len(views) == 12
+    assert all(view["latest"] is not None for view in views)
+    assert peak <= 2
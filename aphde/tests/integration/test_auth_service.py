@@ -2,7 +2,12 @@
 
 from pathlib import Path
 
-from core.auth.service import AuthError, AuthService
+import pytest
+
+from core.auth.hashing_pool import HashPoolBusyError, PasswordHasherPool
+from core.auth.passwords import password_hash_rounds
+from core.auth.service import AuthBusyError, AuthError, AuthService, AuthThrottledError
+from core.auth.throttle import LoginThrottle, ThrottleRule
 from core.data.db import get_connection, init_db
 from core.data.migrations.migrate_v7_multi_user_auth import run_migration as run_v7_migration
 from core.data.repositories.user_repo import UserRepository
@@ -58,3 +63,81 @@ def test_login_rejects_wrong_password(tmp_path: Path) -> None:
             assert False, "Expected invalid login"
         except AuthError as exc:
             assert "invalid" in str(exc).lower()
+
+
+def test_login_rehashes_to_configured_cost(tmp_path: Path) -> None:
+    db_path = tmp_path / "auth.db"
+    init_db(db_path)
+    run_v7_migration(db_path)
+    old_pool = PasswordHasherPool(workers=1, rounds=4)
+    new_pool = PasswordHasherPool(workers=1, rounds=5)
+
+    with get_connection(db_path) as conn:
+        repo = UserRepository(conn)
+        created = AuthService(repo, hasher=old_pool).signup(email="user@example.com", password="StrongPass123")
+        assert password_hash_rounds(repo.get_by_id(created.id)["password_hash"]) == 4
+
+        AuthService(repo, hasher=new_pool).login(email="user@example.com", password="StrongPass123")
+        upgraded = repo.get_by_id(created.id)["password_hash"]
+        assert password_hash_rounds(upgraded) == 5
+
+        AuthService(repo, hasher=new_pool).login(email="user@example.com", password="StrongPass123")
+        assert repo.get_by_id(created.id)["password_hash"] == upgraded
+    old_pool.shutdown()
+    new_pool.shutdown()
+
+
+def test_login_reports_busy_pool_as_auth_error(tmp_path: Path) -> None:
+    db_path = tmp_path / "auth.db"
+    init_db(db_path)
+    run_v7_migration(db_path)
+
+    class _SaturatedPool(PasswordHasherPool):
+        def verify(self, plain_password: str, password_hash: str) -> bool:
+            raise HashPoolBusyError("full")
+
+    pool = _SaturatedPool(workers=1, rounds=4)
+    with get_connection(db_path) as conn:
+        repo = UserRepository(conn)
+        AuthService(repo, hasher=pool).signup(email="user@example.com", password="StrongPass123")
+        with pytest.raises(AuthBusyError):
+            AuthService(repo, hasher=pool).login(email="user@example.com", password="StrongPass123")
+    pool.shutdown()
+
+
+def test_login_throttle_blocks_before_password_check(tmp_path: Path) -> None:
+    db_path = tmp_path / "auth.db"
+    init_db(db_path)
+    run_v7_migration(db_path)
+    now = [1_000_000.0]
+    rule = ThrottleRule(limit=3, window_seconds=60.0, lockout_seconds=300.0)
+
+    class _CountingPool(PasswordHasherPool):
+        verifications = 0
+
+        def verify(self, plain_password: str, password_hash: str) -> bool:
+            type(self).verifications += 1
+            return super().verify(plain_password, password_hash)
+
+    pool = _CountingPool(workers=1, rounds=4)
+    throttle = LoginThrottle(db_path, email_rule=rule, clock=lambda: now[0])
+    with get_connection(db_path) as conn:
+        service = AuthService(UserRepository(conn), hasher=pool, throttle=throttle)
+        service.signup(email="user@example.com", password="StrongPass123")
+
+        for _ in range(3):
+            with pytest.raises(AuthError):
+                service.login(email="user@example.com", password="WrongPass123", client_id="10.0.0.1")
+        with pytest.raises(AuthThrottledError) as blocked:
+            service.login(email="USER@example.com", password="StrongPass123", client_id="10.0.0.2")
+        assert blocked.value.retry_after == pytest.approx(300.0)
+        assert _CountingPool.verifications == 3
+
+        # Lockout is persisted, so a fresh throttle (e.g. after restart) still blocks.
+        restarted = LoginThrottle(db_path, email_rule=rule, clock=lambda: now[0])
+        assert restarted.retry_after(email="user@example.com") == pytest.approx(300.0)
+
+        now[0] += 301.0
+        service.login(email="user@example.com", password="StrongPass123")
+        assert throttle.retry_after(email="user@example.com") is None
+    pool.shutdown()
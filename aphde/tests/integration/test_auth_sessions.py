@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from core.auth.tokens import SessionTokenStore
+from core.data.db import get_connection, init_db
+from core.data.migrations.migrate_v11_auth_sessions import run_migration as run_v11_migration
+from core.data.repositories.user_repo import UserRepository
+
+
+SECRET = b"test-secret"
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.value = datetime(2026, 1, 1, tzinfo=UTC)
+
+    def __call__(self) -> datetime:
+        return self.value
+
+
+def _seed(db_path: Path) -> int:
+    init_db(db_path)
+    run_v11_migration(db_path)
+    with get_connection(db_path) as conn:
+        return UserRepository(conn).create(email="User@Example.com", display_name="User")
+
+
+def test_token_resolves_from_cache_and_database(tmp_path: Path) -> None:
+    db_path = tmp_path / "auth.db"
+    user_id = _seed(db_path)
+    store = SessionTokenStore(db_path, secret=SECRET)
+    token = store.issue(user_id=user_id, email="user@example.com", display_name="User")
+
+    assert store.resolve(token).user_id == user_id
+    # A second process with the same secret resolves through auth_sessions.
+    other = SessionTokenStore(db_path, secret=SECRET)
+    identity = other.resolve(token)
+    assert identity is not None
+    assert identity.email == "User@Example.com"
+
+    token_id, _, signature = token.partition(".")
+    assert store.resolve(f"{token_id}.{signature[:-1]}x") is None
+    assert store.resolve(token_id) is None
+    assert SessionTokenStore(db_path, secret=b"other").resolve(token) is None
+
+
+def test_token_expiry_and_revocation(tmp_path: Path) -> None:
+    db_path = tmp_path / "auth.db"
+    user_id = _seed(db_path)
+    clock = _Clock()
+    store = SessionTokenStore(db_path, secret=SECRET, ttl=timedelta(hours=1), now=clock)
+
+    expiring = store.issue(user_id=user_id, email=None, display_name=None)
+    clock.value += timedelta(hours=2)
+    assert store.resolve(expiring) is None
+
+    revoked = store.issue(user_id=user_id, email=None, display_name=None)
+    assert store.resolve(revoked) is not None
+    store.revoke(revoked)
+    assert store.resolve(revoked) is None
+
+    first = store.issue(user_id=user_id, email=None, display_name=None)
+    second = store.issue(user_id=user_id, email=None, display_name=None)
+    store.revoke_user(user_id)
+    assert store.resolve(first) is None
+    assert store.resolve(second) is None
+    assert store.purge_expired() == 4
+
+
+def test_inactive_user_session_not_restored(tmp_path: Path) -> None:
+    db_path = tmp_path / "auth.db"
+    user_id = _seed(db_path)
+    token = SessionTokenStore(db_path, secret=SECRET).issue(user_id=user_id, email=None, display_name=None)
+    with get_connection(db_path) as conn:
+        conn.execute("UPDATE users SET is_active = 0 WHERE id = ?", (user_id,))
+        conn.commit()
+    assert SessionTokenStore(db_path, secret=SECRET).resolve(token) is None
+
+
+def test_cached_sessions_recheck_revocation_and_deactivation(tmp_path: Path) -> None:
+    from core.auth.service import AuthService
+
+    db_path = tmp_path / "auth.db"
+    user_id = _seed(db_path)
+    clock = _Clock()
+    store = SessionTokenStore(db_path, secret=SECRET, recheck=timedelta(seconds=30), now=clock)
+    other = SessionTokenStore(db_path, secret=SECRET, now=clock)
+
+    revoked = store.issue(user_id=user_id, email=None, display_name=None)
+    kept = store.issue(user_id=user_id, email=None, display_name=None)
+    other.revoke(revoked)
+    # Revoked in another process: served from the LRU until the recheck is due.
+    assert store.resolve(revoked) is not None
+    clock.value += timedelta(seconds=31)
+    assert store.resolve(revoked) is None
+    assert store.resolve(kept) is not None
+
+    with get_connection(db_path) as conn:
+        conn.execute("UPDATE users SET is_active = 0 WHERE id = ?", (user_id,))
+        conn.commit()
+    clock.value += timedelta(seconds=31)
+    assert store.resolve(kept) is None
+
+    with get_connection(db_path) as conn:
+        repo = UserRepository(conn)
+        repo.set_active(user_id, True)
+        token = store.issue(user_id=user_id, email=None, display_name=None)
+        AuthService(repo).deactivate_user(user_id, sessions=store)
+        assert not repo.row_to_identity(repo.get_by_id(user_id))["is_active"]
+    assert store.resolve(token) is None
+
+
+def test_email_lookup_uses_lower_email_index(tmp_path: Path) -> None:
+    db_path = tmp_path / "auth.db"
+    _seed(db_path)
+    with get_connection(db_path) as conn:
+        plan = conn.execute("EXPLAIN QUERY PLAN SELECT * FROM users WHERE lower(email) = ? LIMIT 1", ("x",)).fetchall()
+        assert any("idx_users_email_lower" in row["detail"] for row in plan)
+        assert UserRepository(conn).get_by_email(" USER@example.com ")["display_name"] == "User"
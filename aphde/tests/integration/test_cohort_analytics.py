@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from core.data.db import get_connection, init_db
+from core.data.repositories.decision_repo import DecisionRunRepository
+from core.data.repositories.goal_repo import GoalRepository
+from core.data.repositories.user_repo import UserRepository
+from core.governance.history_analyzer import summarize_history
+from core.models.enums import GoalType
+from core.services.cohort_analytics import analyze_cohort
+
+
+def _seed_runs(db_path) -> list[dict]:
+    init_db(db_path)
+    runs: list[dict] = []
+    goal_types = [GoalType.WEIGHT_LOSS, GoalType.STRENGTH_GAIN, GoalType.WEIGHT_LOSS]
+    with get_connection(db_path) as conn:
+        decisions = DecisionRunRepository(conn)
+        for user_index, goal_type in enumerate(goal_types):
+            user_id = UserRepository(conn).create()
+            goal_id = GoalRepository(conn).set_active_goal(user_id, goal_type, {})
+            for run_index in range(5):
+                rules = ["low_compliance"] if run_index % 2 == 0 else []
+                if (user_index + run_index) % 3 == 0:
+                    rules.append("recovery_risk")
+                verified = None if run_index == 0 else run_index % 4 != 0
+                alignment = 40.0 + 11.0 * run_index + user_index
+                decisions.create(
+                    user_id=user_id,
+                    goal_id=goal_id,
+                    alignment_score=alignment,
+                    risk_score=10.0,
+                    recommendations=[],
+                    trace={"triggered_rules": rules},
+                    alignment_confidence=0.5,
+                    determinism_verified=verified,
+                    engine_version="v1" if run_index < 3 else "v2",
+                )
+                runs.append(
+                    {
+                        "goal_type": goal_type.value,
+                        "engine_version": "v1" if run_index < 3 else "v2",
+                        "alignment_score": alignment,
+                        "determinism_verified": verified,
+                        "triggered_rules": rules,
+                    }
+                )
+        conn.execute("UPDATE decision_runs SET trace_json = 'not json' WHERE id = 2")
+        conn.commit()
+    runs[1]["triggered_rules"] = []
+    return runs
+
+
+def test_cohort_analytics_matches_per_run_reference_for_any_chunk_size(tmp_path) -> None:
+    db_path = str(tmp_path / "cohort.db")
+    runs = _seed_runs(db_path)
+
+    report = analyze_cohort(db_path, chunk_size=4, alignment_bins=10)
+    assert report == analyze_cohort(db_path, chunk_size=1000, alignment_bins=10)
+
+    assert report["run_count"] == 15
+    assert report["user_count"] == 3
+    assert sum(report["alignment"]["histogram"]["counts"]) == 15
+    assert report["alignment"]["min"] == 40.0
+    assert report["alignment"]["max"] == 86.0
+
+    for goal_type, group in report["by_goal_type"].items():
+        members = [run for run in runs if run["goal_type"] == goal_type]
+        reference = summarize_history(members)
+        assert group["runs"] == len(members)
+        assert group["rule_trigger_rates"] == {
+            rule: round(hits / len(members), 4) for rule, hits in reference["rule_trigger_distribution"].items()
+        }
+
+    for version, group in report["by_engine_version"].items():
+        members = [run for run in runs if run["engine_version"] == version]
+        assert group["determinism_pass_rate"] == summarize_history(members)["determinism_pass_rate"]
+
+
+def test_cohort_analytics_handles_empty_table(tmp_path) -> None:
+    db_path = str(tmp_path / "empty.db")
+    init_db(db_path)
+    report = analyze_cohort(db_path)
+    assert report["run_count"] == 0
+    assert report["alignment"]["p50"] is None
+    assert report["by_goal_type"] == {}
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import json
+from datetime import date, timedelta
+
+import pytest
+
+from core.data.db import get_connection, init_db
+from core.data.repositories.calorie_repo import CalorieLogRepository
+from core.data.repositories.context_repo import ContextInputRepository
+from core.data.repositories.decision_replay_repo import DecisionReplayRepository
+from core.data.repositories.decision_repo import DecisionRunRepository
+from core.data.repositories.goal_repo import GoalRepository
+from core.data.repositories.user_repo import UserRepository
+from core.data.repositories.weight_repo import WeightLogRepository
+from core.data.repositories.workout_repo import WorkoutLogRepository
+from core.models.enums import GoalType
+from core.services.decision_replay import replay_decisions, replay_user_decisions
+from core.services.run_evaluation import run_evaluation
+from domains.health.domain_definition import HealthDomainDefinition
+
+
+TODAY = date.today()
+
+
+def _seed_user(db_path, *, goal_from: date) -> int:
+    with get_connection(db_path) as conn:
+        user_id = UserRepository(conn).create()
+        goal_id = GoalRepository(conn).set_active_goal(user_id, GoalType.STRENGTH_GAIN, {"min_compliance": 0.75})
+        conn.execute("UPDATE goals SET active_from = ? WHERE id = ?", (goal_from.isoformat(), goal_id))
+        conn.commit()
+        weight_repo = WeightLogRepository(conn)
+        calorie_repo = CalorieLogRepository(conn)
+        workout_repo = WorkoutLogRepository(conn)
+        for offset in range(45, -1, -1):
+            day = TODAY - timedelta(days=offset)
+            weight_repo.add(user_id, day, 80.0 - 0.04 * (45 - offset) + (0.3 if offset % 5 == 0 else 0.0))
+            calorie_repo.add(user_id, day, 2300 + 20 * (offset % 4), 140)
+            if offset % 2 == 0:
+                workout_repo.add(
+                    user_id,
+                    day,
+                    ("upper", "lower", "push", "pull")[offset % 4],
+                    50,
+                    4800.0 + 15 * (45 - offset),
+                    7.5 + (offset % 3) * 0.5,
+                    completed_flag=offset % 6 != 0,
+                )
+        ContextInputRepository(conn).add(user_id, TODAY - timedelta(days=12), "cycle", {"phase": "luteal"})
+    return user_id
+
+
+def _replay_rows(db_path, engine_version: str, user_id: int) -> list[dict]:
+    with get_connection(db_path) as conn:
+        return [
+            {
+                key: row[key]
+                for key in ("replay_date", "alignment_score", "risk_score", "alignment_confidence", "recommendations_json")
+            }
+            for row in DecisionReplayRepository(conn).list_for_version(engine_version, user_id)
+        ]
+
+
+def test_replay_of_today_matches_live_evaluation(tmp_path) -> None:
+    db_path = str(tmp_path / "replay.db")
+    init_db(db_path)
+    user_id = _seed_user(db_path, goal_from=TODAY - timedelta(days=60))
+
+    result = replay_user_decisions(
+        user_id, TODAY, TODAY, engine_version="replay_test", domain_definition=HealthDomainDefinition(), db_path=db_path
+    )
+    assert result.rows_written == 1
+
+    run_evaluation(user_id, db_path, domain_definition=HealthDomainDefinition())
+    with get_connection(db_path) as conn:
+        live = DecisionRunRepository(conn).latest(user_id)
+    replayed = _replay_rows(db_path, "replay_test", user_id)[0]
+    assert replayed["replay_date"] == TODAY.isoformat()
+    assert replayed["alignment_score"] == live["alignment_score"]
+    assert replayed["risk_score"] == live["risk_score"]
+    assert replayed["alignment_confidence"] == live["alignment_confidence"]
+    assert json.loads(replayed["recommendations_json"]) == json.loads(live["recommendations_json"])
+
+
+def test_replay_skips_days_before_goal_and_resumes_from_stored_history(tmp_path) -> None:
+    db_path = str(tmp_path / "replay.db")
+    init_db(db_path)
+    user_id = _seed_user(db_path, goal_from=TODAY - timedelta(days=12))
+    domain = HealthDomainDefinition()
+    start = TODAY - timedelta(days=15)
+
+    full = replay_user_decisions(
+        user_id, start, TODAY, engine_version="full", domain_definition=domain, db_path=db_path
+    )
+    assert full.days_skipped == 3
+    assert full.rows_written == 13
+
+    middle = TODAY - timedelta(days=5)
+    replay_user_decisions(
+        user_id, start, middle - timedelta(days=1), engine_version="split", domain_definition=domain, db_path=db_path
+    )
+    replay_user_decisions(user_id, middle, TODAY, engine_version="split", domain_definition=domain, db_path=db_path)
+    assert _replay_rows(db_path, "split", user_id) == _replay_rows(db_path, "full", user_id)
+
+    # Re-running a range replaces rows instead of duplicating them.
+    replay_user_decisions(user_id, middle, TODAY, engine_version="full", domain_definition=domain, db_path=db_path)
+    assert len(_replay_rows(db_path, "full", user_id)) == 13
+
+
+def test_replay_decisions_covers_all_active_users(tmp_path) -> None:
+    db_path = str(tmp_path / "replay.db")
+    init_db(db_path)
+    user_ids = [_seed_user(db_path, goal_from=TODAY - timedelta(days=30)) for _ in range(3)]
+
+    result = replay_decisions(
+        TODAY - timedelta(days=2),
+        TODAY,
+        engine_version="all",
+        domain_definition=HealthDomainDefinition(),
+        db_path=db_path,
+        chunk_size=2,
+    )
+
+    assert result.user_ids == user_ids
+    assert result.rows_written == 9
+    with pytest.raises(ValueError):
+        replay_user_decisions(
+            user_ids[0], TODAY, TODAY - timedelta(days=1), engine_version="all", domain_definition=HealthDomainDefinition(), db_path=db_path
+        )
+
+
+def test_batched_context_timeline_matches_per_user_replay(tmp_path) -> None:
+    db_path = str(tmp_path / "replay.db")
+    init_db(db_path)
+    user_ids = [_seed_user(db_path, goal_from=TODAY - timedelta(days=30)) for _ in range(2)]
+    with get_connection(db_path) as conn:
+        ContextInputRepository(conn).add(user_ids[1], TODAY - timedelta(days=1), "cycle", {"phase": "menstrual"})
+    domain = HealthDomainDefinition()
+    start = TODAY - timedelta(days=14)
+
+    replay_decisions(start, TODAY, engine_version="batched", domain_definition=domain, db_path=db_path, user_ids=user_ids)
+    for user_id in user_ids:
+        replay_user_decisions(user_id, start, TODAY, engine_version="single", domain_definition=domain, db_path=db_path)
+        assert _replay_rows(db_path, "batched", user_id) == _replay_rows(db_path, "single", user_id)
+
+    with get_connection(db_path) as conn:
+        rows = DecisionReplayRepository(conn).list_for_version("batched", user_ids[1])
+    phases = {
+        row["replay_date"]: json.loads(row["trace_json"])["context_json"].get("metadata", {}).get("phase")
+        for row in rows
+    }
+    assert phases[(TODAY - timedelta(days=13)).isoformat()] is None
+    assert phases[(TODAY - timedelta(days=12)).isoformat()] == "luteal"
+    assert phases[(TODAY - timedelta(days=2)).isoformat()] == "luteal"
+    assert phases[(TODAY - timedelta(days=1)).isoformat()] == "menstrual"
+    assert phases[TODAY.isoformat()] == "menstrual"
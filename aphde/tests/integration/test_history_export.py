@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from core.data.db import get_connection, init_db
+from core.data.repositories.decision_repo import DecisionRunRepository
+from core.data.repositories.goal_repo import GoalRepository
+from core.data.repositories.user_repo import UserRepository
+from core.models.enums import GoalType
+from core.services.history_export import export_decision_history, load_history_columns, pa
+
+
+def _add_runs(db_path, count: int, *, start: int = 0) -> None:
+    with get_connection(db_path) as conn:
+        user_id = UserRepository(conn).create()
+        goal_id = GoalRepository(conn).set_active_goal(user_id, GoalType.WEIGHT_LOSS, {})
+        for index in range(start, start + count):
+            DecisionRunRepository(conn).create(
+                user_id=user_id,
+                goal_id=goal_id,
+                alignment_score=50.0 + index,
+                risk_score=5.0,
+                recommendations=[],
+                trace={
+                    "triggered_rules": ["low_compliance"] * (index % 3),
+                    "computed_signals": {"trend_slope": -0.1 * index, "compliance_ratio": 0.8},
+                },
+                alignment_confidence=0.6,
+                determinism_verified=True if index % 2 else None,
+            )
+
+
+@pytest.mark.parametrize("fmt", ["npy", "arrow"])
+def test_history_export_appends_from_watermark(tmp_path, fmt) -> None:
+    if fmt == "arrow" and pa is None:
+        pytest.skip("pyarrow not installed")
+    db_path = str(tmp_path / "history.db")
+    out_dir = tmp_path / "export"
+    init_db(db_path)
+    _add_runs(db_path, 5)
+
+    first = export_decision_history(db_path, out_dir, format=fmt, chunk_size=2)
+    assert first.rows_written == 5
+    assert len(first.parts_written) == 3
+    assert export_decision_history(db_path, out_dir, format=fmt).rows_written == 0
+
+    _add_runs(db_path, 2, start=5)
+    with get_connection(db_path) as conn:
+        conn.execute("UPDATE decision_runs SET trace_json = 'not json' WHERE id = 7")
+        conn.commit()
+    second = export_decision_history(db_path, out_dir, chunk_size=10)
+    assert second.format == fmt
+    assert second.rows_written == 2
+    assert second.watermark == 7
+
+    columns = load_history_columns(out_dir)
+    assert columns["id"].tolist() == [1, 2, 3, 4, 5, 6, 7]
+    assert columns["goal_type"][0] == "weight_loss"
+    assert columns["alignment_score"].tolist() == [50.0 + index for index in range(7)]
+    assert columns["triggered_rule_count"].tolist() == [0, 1, 2, 0, 1, 2, 0]
+    assert columns["determinism_verified"].tolist() == [-1, 1, -1, 1, -1, 1, -1]
+    assert columns["run_ts"].dtype == np.dtype("datetime64[ms]")
+    assert math.isclose(float(columns["trend_slope"][3]), -0.3)
+    assert math.isnan(float(columns["trend_slope"][6]))
+    assert np.isnan(columns["recovery_index"]).all()
+
+
+def test_history_export_rejects_format_change(tmp_path) -> None:
+    db_path = str(tmp_path / "history.db")
+    init_db(db_path)
+    export_decision_history(db_path, tmp_path / "export", format="npy")
+    with pytest.raises(ValueError):
+        export_decision_history(db_path, tmp_path / "export", format="parquet")
+
+
+@pytest.mark.parametrize("fmt", ["npy", "arrow"])
+def test_history_export_resumes_over_unrecorded_part_and_keeps_long_text(tmp_path, fmt) -> None:
+    if fmt == "arrow" and pa is None:
+        pytest.skip("pyarrow not installed")
+    db_path = str(tmp_path / "history.db")
+    out_dir = tmp_path / "export"
+    init_db(db_path)
+    export_decision_history(db_path, out_dir, format=fmt)
+    empty_manifest = (out_dir / "manifest.json").read_text(encoding="utf-8")
+
+    _add_runs(db_path, 3)
+    long_version = "engine-" + "x" * 60
+    with get_connection(db_path) as conn:
+        conn.execute("UPDATE decision_runs SET engine_version = ?", (long_version,))
+        conn.commit()
+    export_decision_history(db_path, out_dir)
+    # Crash after the part was written but before the manifest was replaced.
+    (out_dir / "manifest.json").write_text(empty_manifest, encoding="utf-8")
+
+    resumed = export_decision_history(db_path, out_dir)
+    assert resumed.rows_written == 3
+    columns = load_history_columns(out_dir)
+    assert columns["id"].tolist() == [1, 2, 3]
+    assert columns["engine_version"].tolist() == [long_version] * 3
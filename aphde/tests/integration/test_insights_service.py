@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, timedelta
 
 from aphde.app.services.insights_service import load_insights_view
 from core.data.db import get_connection, init_db
@@ -9,6 +9,7 @@ from core.data.repositories.goal_repo import GoalRepository
 from core.data.repositories.user_repo import UserRepository
 from core.data.repositories.weight_repo import WeightLogRepository
 from core.data.repositories.workout_repo import WorkoutLogRepository
+from core.insights.weekly_summary import iso_week_of
 from core.models.enums import GoalType
 from core.services.run_evaluation import run_evaluation
 from domains.health.domain_definition import HealthDomainDefinition
@@ -56,6 +57,10 @@ def test_insights_service_returns_expected_contract(tmp_path) -> None:
     assert "drift_detection" in payload
     assert "trends" in payload
     assert "recent_runs" in payload
+    # All ten seeded sessions fall on today's ISO week.
+    assert payload["weekly_insight"]["planned_sessions"] == 10
+    assert payload["weekly_insight"]["completed_sessions"] == 10
+    assert [week["iso_week"] for week in payload["weekly_trend"]] == [payload["weekly_insight"]["iso_week"]]
 
     trends = payload["trends"]
     assert "weight" in trends
@@ -63,3 +68,18 @@ def test_insights_service_returns_expected_contract(tmp_path) -> None:
     assert "compliance" in trends
     assert "overload" in trends
 
+
+
+def test_weekly_insight_is_the_current_week_even_without_activity(tmp_path) -> None:
+    db_path = tmp_path / "insights.db"
+    init_db(db_path)
+    with get_connection(db_path) as conn:
+        user_id = UserRepository(conn).create()
+        GoalRepository(conn).set_active_goal(user_id, GoalType.WEIGHT_LOSS, {})
+        WorkoutLogRepository(conn).add(user_id, date.today() - timedelta(days=14), "upper", 50)
+
+    payload = load_insights_view(user_id=user_id, db_path=str(db_path))
+    current_week, _ = iso_week_of(date.today())
+    assert payload["weekly_insight"]["iso_week"] == current_week
+    assert payload["weekly_insight"]["planned_sessions"] == 0
+    assert [week["iso_week"] for week in payload["weekly_trend"]] == [iso_week_of(date.today() - timedelta(days=14))[0]]
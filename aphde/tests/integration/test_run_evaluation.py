@@ -14,6 +14,7 @@ from core.data.repositories.weight_repo import WeightLogRepository
 from core.data.repositories.workout_repo import WorkoutLogRepository
 from core.models.enums import GoalType
 from domains.health.domain_definition import HealthDomainDefinition
+from core.insights.weekly_aggregates import WeeklyAggregator
 from core.services.run_evaluation import run_evaluation
 
 def _run_eval(user_id: int, db_path: str) -> int:
@@ -416,3 +417,27 @@ def test_governance_diff_and_history_from_persisted_runs(tmp_path) -> None:
     assert "context_application_frequency" in summary
 
 
+
+
+def test_run_evaluation_keeps_the_run_when_a_read_model_update_fails(tmp_path, monkeypatch, caplog) -> None:
+    db_path = str(tmp_path / "eval.db")
+    init_db(db_path)
+    with get_connection(db_path) as conn:
+        user_id = UserRepository(conn).create()
+        GoalRepository(conn).set_active_goal(user_id, GoalType.WEIGHT_LOSS, {})
+        WeightLogRepository(conn).add(user_id, date.today(), 80.0)
+
+    def _fail(self, user_id: int) -> None:
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(WeeklyAggregator, "refresh", _fail)
+    decision_id = _run_eval(user_id=user_id, db_path=db_path)
+
+    with get_connection(db_path) as conn:
+        count = conn.execute("SELECT COUNT(*) FROM decision_runs WHERE user_id = ?", (user_id,)).fetchone()[0]
+        persistence = conn.execute(
+            "SELECT last_decision_id FROM recommendation_persistence WHERE user_id = ?", (user_id,)
+        ).fetchone()
+    assert count == 1
+    assert persistence["last_decision_id"] == decision_id
+    assert "Updating weekly aggregates failed" in caplog.text
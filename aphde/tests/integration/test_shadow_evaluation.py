@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import Executor, Future
+from dataclasses import replace
+from datetime import date
+
+from core.data.db import get_connection, init_db
+from core.data.repositories.decision_repo import DecisionRunRepository
+from core.data.repositories.goal_repo import GoalRepository
+from core.data.repositories.shadow_divergence_repo import ShadowDivergenceRepository
+from core.data.repositories.user_repo import UserRepository
+from core.data.repositories.weight_repo import WeightLogRepository
+from core.data.repositories.workout_repo import WorkoutLogRepository
+from core.models.enums import GoalType
+from core.services.run_evaluation import run_evaluation
+from core.services.shadow_evaluation import ShadowConfig, ShadowEvaluator
+from domains.health.domain_definition import HealthDomainDefinition
+
+
+class _LowComplianceDomain(HealthDomainDefinition):
+    def compute_signals(self, logs, config):
+        return replace(super().compute_signals(logs, config), compliance_ratio=0.2)
+
+
+class _BrokenDomain(HealthDomainDefinition):
+    def compute_signals(self, logs, config):
+        raise RuntimeError("candidate failure")
+
+
+class _InlineExecutor(Executor):
+    def submit(self, fn, /, *args, **kwargs):
+        future: Future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+def _frozen_clock() -> float:
+    # No budget refill between submissions.
+    return 100.0
+
+
+def _seed(db_path: str) -> int:
+    init_db(db_path)
+    with get_connection(db_path) as conn:
+        user_id = UserRepository(conn).create()
+        GoalRepository(conn).set_active_goal(user_id, GoalType.WEIGHT_LOSS, {})
+        WeightLogRepository(conn).add(user_id, date.today(), 80.0)
+        WorkoutLogRepository(conn).add(user_id, date.today(), "upper", 50, 4000.0, 8.0)
+    return user_id
+
+
+def _stats(db_path: str, candidate: str):
+    with get_connection(db_path) as conn:
+        return ShadowDivergenceRepository(conn).get(primary_engine_version="v1", candidate_engine_version=candidate)
+
+
+def test_shadow_run_stores_aggregate_divergence(tmp_path) -> None:
+    db_path = str(tmp_path / "shadow.db")
+    user_id = _seed(db_path)
+    same = ShadowEvaluator(ShadowConfig(HealthDomainDefinition(), "v1-same", sample_rate=1.0), db_path)
+    changed = ShadowEvaluator(ShadowConfig(_LowComplianceDomain(), "v2-low", sample_rate=1.0), db_path, flush_every=2)
+
+    for _ in range(3):
+        run_evaluation(user_id, db_path, domain_definition=HealthDomainDefinition(), shadow=same)
+        run_evaluation(user_id, db_path, domain_definition=HealthDomainDefinition(), shadow=changed)
+    same.close()
+    changed.close()
+
+    same_stats = _stats(db_path, "v1-same")
+    assert same_stats.runs == 3
+    assert same_stats.identical_runs == 3
+    changed_stats = _stats(db_path, "v2-low")
+    assert changed_stats.runs == 3
+    assert changed_stats.identical_runs == 0
+    assert changed_stats.alignment_abs_delta_max > 0.0
+    assert changed_stats.summary()["mean_abs_alignment_delta"] > 0.0
+    # Shadow results never reach the decision log.
+    with get_connection(db_path) as conn:
+        assert {row["engine_version"] for row in DecisionRunRepository(conn).list_recent(user_id, limit=20)} == {"v1"}
+
+
+def test_shadow_sampling_budget_and_failures(tmp_path) -> None:
+    db_path = str(tmp_path / "shadow.db")
+    user_id = _seed(db_path)
+
+    unsampled = ShadowEvaluator(ShadowConfig(HealthDomainDefinition(), "none", sample_rate=0.0), db_path)
+    run_evaluation(user_id, db_path, domain_definition=HealthDomainDefinition(), shadow=unsampled)
+    unsampled.close()
+    assert _stats(db_path, "none") is None
+
+    budgeted = ShadowEvaluator(
+        ShadowConfig(HealthDomainDefinition(), "budget", sample_rate=1.0, cpu_budget=0.01, cpu_burst_seconds=1e-9),
+        db_path,
+        clock=_frozen_clock,
+    )
+    run_evaluation(user_id, db_path, domain_definition=HealthDomainDefinition(), shadow=budgeted)
+    budgeted.flush()
+    run_evaluation(user_id, db_path, domain_definition=HealthDomainDefinition(), shadow=budgeted)
+    budgeted.close()
+    budget_stats = _stats(db_path, "budget")
+    assert budget_stats.runs == 1
+    assert budget_stats.skipped_budget == 1
+
+
+
+def test_shadow_failures_are_logged_and_recorded_off_the_caller(tmp_path, caplog) -> None:
+    db_path = str(tmp_path / "shadow.db")
+    user_id = _seed(db_path)
+
+    broken = ShadowEvaluator(ShadowConfig(_BrokenDomain(), "broken", sample_rate=1.0), db_path)
+    with caplog.at_level(logging.ERROR, logger="core.services.shadow_evaluation"):
+        decision_id = run_evaluation(user_id, db_path, domain_definition=HealthDomainDefinition(), shadow=broken)
+        broken.close()
+    assert decision_id > 0
+    assert _stats(db_path, "broken").failures == 1
+    (record,) = [item for item in caplog.records if "broken" in item.getMessage()]
+    assert record.exc_info is not None and "candidate failure" in str(record.exc_info[1])
+
+    # The candidate finishes before add_done_callback, which would run _record inline.
+    inline = ShadowEvaluator(ShadowConfig(HealthDomainDefinition(), "inline", sample_rate=1.0), db_path, executor=_InlineExecutor())
+    recorded_on: list[threading.Thread] = []
+    real_record = inline._record
+
+    def tracking_record(*args):
+        recorded_on.append(threading.current_thread())
+        real_record(*args)
+
+    inline._record = tracking_record
+    run_evaluation(user_id, db_path, domain_definition=HealthDomainDefinition(), shadow=inline)
+    inline.close()
+    assert len(recorded_on) == 1
+    assert recorded_on[0] is not threading.current_thread()
+    assert _stats(db_path, "inline").runs == 1
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from core.data.db import get_connection, init_db
+from core.data.repositories.signal_snapshot_repo import SignalSnapshotRepository
+from core.data.repositories.user_repo import UserRepository
+from core.data.repositories.weight_repo import WeightLogRepository
+from core.data.repositories.workout_repo import WorkoutLogRepository
+from core.services.signal_snapshots import compute_all_signal_snapshots, compute_signal_snapshots
+from domains.health.domain_definition import HealthDomainDefinition
+
+
+def test_signal_snapshots_store_one_row_per_window_and_replace_on_rerun(tmp_path) -> None:
+    db_path = str(tmp_path / "snapshots.db")
+    init_db(db_path)
+    as_of = date(2026, 2, 1)
+    with get_connection(db_path) as conn:
+        user_id = UserRepository(conn).create()
+        other_id = UserRepository(conn).create()
+        for offset in range(40):
+            log_date = as_of - timedelta(days=offset)
+            WeightLogRepository(conn).add(user_id, log_date, 80.0 - 0.05 * (40 - offset))
+            if offset % 3 == 0:
+                WorkoutLogRepository(conn).add(user_id, log_date, "upper", 45, 4800.0 + offset, 7.5, True, True)
+
+    bundles = compute_signal_snapshots(user_id, db_path, domain_definition=HealthDomainDefinition(), as_of=as_of)
+    assert sorted(bundles) == [7, 14, 28, 56]
+    assert bundles[7].trend_slope is not None and bundles[7].trend_slope < 0
+
+    assert compute_all_signal_snapshots(
+        db_path, domain_definition=HealthDomainDefinition(), as_of=as_of, chunk_size=1
+    ) == 2
+
+    with get_connection(db_path) as conn:
+        stored = SignalSnapshotRepository(conn).latest_by_window(user_id)
+        empty = SignalSnapshotRepository(conn).latest_by_window(other_id)
+        row_count = conn.execute(
+            "SELECT COUNT(*) AS n FROM signal_snapshots WHERE user_id = ?", (user_id,)
+        ).fetchone()["n"]
+
+    assert row_count == 4
+    assert stored[28]["trend_slope"] == bundles[28].trend_slope
+    assert stored[56]["sufficiency"]["recovery_index"] is True
+    assert empty[7]["trend_slope"] is None
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+import random
+
+from core.data.db import get_connection, init_db
+from core.data.repositories.decision_repo import DecisionRunRepository
+from core.data.repositories.goal_repo import GoalRepository
+from core.data.repositories.user_repo import UserRepository
+from core.insights.stagnation import detect_stagnation_alerts
+from core.insights.stagnation_detector import StagnationDetector
+from core.models.enums import GoalType
+
+
+def _seed(db_path: str) -> tuple[int, int]:
+    init_db(db_path)
+    with get_connection(db_path) as conn:
+        user_id = UserRepository(conn).create()
+        goal_id = GoalRepository(conn).set_active_goal(user_id, GoalType.WEIGHT_LOSS, {})
+    return user_id, goal_id
+
+
+def _write_run(conn, user_id: int, goal_id: int, signals: dict, *, detect: bool = True) -> int:
+    trace = {"computed_signals": signals}
+    decision_id = DecisionRunRepository(conn).create(user_id, goal_id, 50.0, 10.0, [], trace)
+    if detect:
+        StagnationDetector(conn).record_run(user_id=user_id, decision_id=decision_id, computed_signals=signals)
+    return decision_id
+
+
+def _reference(conn, user_id: int) -> list[dict]:
+    rows = DecisionRunRepository(conn).list_recent(user_id, limit=42)
+    runs = [{"trace": json.loads(row["trace_json"])} for row in rows]
+    return detect_stagnation_alerts(recent_runs=runs)
+
+
+def _types(alerts: list[dict]) -> list[str]:
+    return [alert["type"] for alert in alerts]
+
+
+def test_incremental_alerts_match_full_recomputation(tmp_path) -> None:
+    db_path = str(tmp_path / "stagnation.db")
+    user_id, goal_id = _seed(db_path)
+    rng = random.Random(7)
+
+    with get_connection(db_path) as conn:
+        for index in range(60):
+            flat = index % 20 < 12
+            signals = {
+                "trend_slope": None if index % 9 == 0 else (0.002 if flat else 0.05) * rng.choice((1, -1)),
+                "progressive_overload_score": 0.5 + (0.0 if flat else rng.uniform(-0.1, 0.1)),
+                "compliance_ratio": 0.95 - 0.004 * index + rng.uniform(-0.01, 0.01),
+                "recovery_index": rng.uniform(0.3, 0.6) if index % 7 else "n/a",
+            }
+            _write_run(conn, user_id, goal_id, signals)
+            assert _types(StagnationDetector(conn).active_alerts(user_id)) == _types(_reference(conn, user_id))
+
+
+def test_alerts_are_deduplicated_resolved_and_reopened(tmp_path) -> None:
+    db_path = str(tmp_path / "stagnation.db")
+    user_id, goal_id = _seed(db_path)
+    low = {"recovery_index": 0.4}
+    high = {"recovery_index": 0.8}
+
+    with get_connection(db_path) as conn:
+        for signals in (low, low, low, low, high, low, low, low):
+            _write_run(conn, user_id, goal_id, signals)
+        rows = conn.execute(
+            "SELECT alert_id, resolved_at, first_decision_id, last_decision_id FROM insight_alerts ORDER BY id"
+        ).fetchall()
+        active = StagnationDetector(conn).active_alerts(user_id)
+
+    assert [row["alert_id"] for row in rows] == ["stagnation_low_recovery_persistent"] * 2
+    assert rows[0]["resolved_at"] is not None
+    assert (rows[0]["first_decision_id"], rows[0]["last_decision_id"]) == (3, 4)
+    assert rows[1]["resolved_at"] is None
+    assert _types(active) == ["persistent_low_recovery"]
+
+
+def test_detector_seeds_from_existing_runs(tmp_path) -> None:
+    db_path = str(tmp_path / "stagnation.db")
+    user_id, goal_id = _seed(db_path)
+    with get_connection(db_path) as conn:
+        for _ in range(5):
+            _write_run(conn, user_id, goal_id, {"trend_slope": 0.001, "recovery_index": 0.3}, detect=False)
+        assert _types(StagnationDetector(conn).active_alerts(user_id)) == [
+            "persistent_low_recovery",
+            "weight_trend_stagnation",
+        ]
+        assert StagnationDetector(conn).active_alerts(user_id) == StagnationDetector(conn).active_alerts(user_id)
+
+
+def test_detector_reseeds_over_runs_it_did_not_see(tmp_path) -> None:
+    db_path = str(tmp_path / "stagnation.db")
+    user_id, goal_id = _seed(db_path)
+    with get_connection(db_path) as conn:
+        _write_run(conn, user_id, goal_id, {"recovery_index": 0.5})
+        _write_run(conn, user_id, goal_id, {"recovery_index": 0.9}, detect=False)
+        last_id = _write_run(conn, user_id, goal_id, {"recovery_index": 0.6})
+        buffers, stored_id = StagnationDetector(conn)._load(user_id)
+
+    assert buffers["recovery_index"] == [0.5, 0.9, 0.6]
+    assert stored_id == last_id
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import json
+import random
+
+from core.data.db import get_connection, init_db
+from core.data.repositories.decision_repo import DecisionRunRepository
+from core.data.repositories.goal_repo import GoalRepository
+from core.data.repositories.user_repo import UserRepository
+from core.guidance.persistence_index import PersistenceIndex, RecommendationPersistenceStore
+from core.guidance.tomorrow_plan import build_tomorrow_plan
+from core.models.enums import GoalType
+from core.services.tomorrow_plans import load_tomorrow_plan, precompute_tomorrow_plans
+
+
+REC_IDS = ("sleep_anchor", "protein_floor", "deload_week", "step_target", "mobility_block")
+
+
+def _seed(db_path: str, users: int = 1) -> list[tuple[int, int]]:
+    init_db(db_path)
+    seeded = []
+    with get_connection(db_path) as conn:
+        for _ in range(users):
+            user_id = UserRepository(conn).create()
+            seeded.append((user_id, GoalRepository(conn).set_active_goal(user_id, GoalType.WEIGHT_LOSS, {})))
+    return seeded
+
+
+def _recommendations(rng: random.Random) -> list[dict]:
+    picked = rng.sample(REC_IDS, rng.randint(0, 3))
+    return [
+        {"id": rec_id, "priority": index + 1, "category": rng.choice(("recovery", "habit")), "action": rec_id}
+        for index, rec_id in enumerate(picked)
+    ]
+
+
+def _write_run(conn, user_id: int, goal_id: int, recommendations: list[dict], *, record: bool = True) -> int:
+    trace = {"triggered_rules": ["rule"] * len(recommendations)}
+    decision_id = DecisionRunRepository(conn).create(user_id, goal_id, 50.0, 30.0, recommendations, trace)
+    if record:
+        RecommendationPersistenceStore(conn).record_run(
+            user_id=user_id, decision_id=decision_id, recommendations=recommendations
+        )
+    return decision_id
+
+
+def _recent_runs(conn, user_id: int) -> list[dict]:
+    rows = DecisionRunRepository(conn).list_recent(user_id, limit=28)
+    return [{"recommendations": json.loads(row["recommendations_json"])} for row in rows]
+
+
+def test_incremental_index_matches_recent_runs(tmp_path) -> None:
+    db_path = str(tmp_path / "plans.db")
+    ((user_id, goal_id),) = _seed(db_path)
+    rng = random.Random(5)
+
+    with get_connection(db_path) as conn:
+        store = RecommendationPersistenceStore(conn)
+        for index in range(30):
+            # Every seventh run skips record_run, as a write path without the hook would.
+            decision_id = _write_run(conn, user_id, goal_id, _recommendations(rng), record=index % 7 != 3)
+            reference = PersistenceIndex.from_runs(_recent_runs(conn, user_id))
+            assert store.index(user_id, latest_decision_id=decision_id) == reference
+
+
+def test_plan_from_index_matches_plan_from_recent_runs() -> None:
+    rng = random.Random(9)
+    recent_runs = [{"recommendations": _recommendations(rng)} for _ in range(8)]
+    latest = {
+        "id": 8,
+        "risk_score": 40.0,
+        "alignment_confidence": 0.6,
+        "recommendations": recent_runs[0]["recommendations"] or [{"id": "sleep_anchor"}],
+    }
+
+    from_index = build_tomorrow_plan(latest_run=latest, persistence=PersistenceIndex.from_runs(recent_runs))
+    assert from_index == build_tomorrow_plan(latest_run=latest, recent_runs=recent_runs)
+    assert PersistenceIndex(runs=0, counts={}).score("sleep_anchor") == 0.5
+
+
+def test_precomputed_plans_are_served_until_a_new_run(tmp_path) -> None:
+    db_path = str(tmp_path / "plans.db")
+    seeded = _seed(db_path, users=3)
+    rng = random.Random(3)
+
+    with get_connection(db_path) as conn:
+        for user_id, goal_id in seeded[:2]:
+            for _ in range(6):
+                _write_run(conn, user_id, goal_id, _recommendations(rng) or [{"id": "step_target"}])
+
+    result = precompute_tomorrow_plans(db_path=db_path, chunk_size=2)
+    assert (result.users_processed, result.plans_written) == (3, 2)
+
+    user_id, goal_id = seeded[0]
+    with get_connection(db_path) as conn:
+        stored = conn.execute("SELECT decision_id, plan_json FROM tomorrow_plans WHERE user_id = ?", (user_id,)).fetchone()
+        latest = {"id": stored["decision_id"], "risk_score": 30.0, "recommendations": []}
+        # Same decision id: the stored plan is returned as-is.
+        assert load_tomorrow_plan(conn, user_id=user_id, latest_run=latest) == json.loads(stored["plan_json"])
+
+        new_recs = [{"id": "deload_week", "priority": 1, "category": "recovery"}]
+        decision_id = _write_run(conn, user_id, goal_id, new_recs, record=False)
+        latest = {"id": decision_id, "risk_score": 30.0, "alignment_confidence": 0.5, "recommendations": new_recs}
+        plan = load_tomorrow_plan(conn, user_id=user_id, latest_run=latest)
+        expected = build_tomorrow_plan(latest_run=latest, recent_runs=_recent_runs(conn, user_id))
+        assert plan == expected
+        assert conn.execute("SELECT decision_id FROM tomorrow_plans WHERE user_id = ?", (user_id,)).fetchone()[0] == decision_id
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from datetime import date
+
+import aphde.app.ui.data_cache as data_cache
+from core.data.db import get_connection, init_db
+from core.data.repositories.goal_repo import GoalRepository
+from core.data.repositories.user_repo import UserRepository
+from core.data.repositories.weight_repo import WeightLogRepository
+from core.models.enums import GoalType
+from core.services.run_evaluation import run_evaluation
+from domains.health.domain_definition import HealthDomainDefinition
+
+
+def _seed(db_path) -> int:
+    init_db(db_path)
+    with get_connection(db_path) as conn:
+        user_id = UserRepository(conn).create()
+        GoalRepository(conn).set_active_goal(user_id, GoalType.WEIGHT_LOSS, {})
+        for _ in range(5):
+            WeightLogRepository(conn).add(user_id, date.today(), 78.0)
+    return user_id
+
+
+def test_view_key_tracks_data_version_and_explicit_invalidation(tmp_path) -> None:
+    db_path = str(tmp_path / "cache.db")
+    user_id = _seed(db_path)
+
+    initial = data_cache.current_view_key(user_id=user_id, db_path=db_path)
+    assert initial == data_cache.current_view_key(user_id=user_id, db_path=db_path)
+
+    run_evaluation(user_id=user_id, db_path=db_path, domain_definition=HealthDomainDefinition())
+    after_run = data_cache.current_view_key(user_id=user_id, db_path=db_path)
+    assert after_run.data_version > initial.data_version
+
+    with get_connection(db_path) as conn:
+        WeightLogRepository(conn).add(user_id, date.today(), 77.5)
+    after_log = data_cache.current_view_key(user_id=user_id, db_path=db_path)
+    assert after_log.data_version == after_run.data_version + 1
+
+    data_cache.invalidate_user_views(user_id)
+    assert data_cache.current_view_key(user_id=user_id, db_path=db_path).generation == after_log.generation + 1
+
+
+def test_cached_views_rebuild_only_when_key_changes(tmp_path, monkeypatch) -> None:
+    db_path = str(tmp_path / "cache_hits.db")
+    user_id = _seed(db_path)
+    run_evaluation(user_id=user_id, db_path=db_path, domain_definition=HealthDomainDefinition())
+
+    calls: list[int] = []
+    real_loader = data_cache.load_view
+
+    def counting_loader(view_name, **kwargs):
+        calls.append(kwargs["user_id"])
+        return real_loader(view_name, **kwargs)
+
+    monkeypatch.setattr(data_cache, "load_view", counting_loader)
+    data_cache.invalidate_user_views(user_id)
+
+    first = data_cache.cached_insights_view(user_id=user_id, db_path=db_path)
+    second = data_cache.cached_insights_view(user_id=user_id, db_path=db_path)
+    assert len(calls) == 1
+    assert first == second
+    assert first["latest"]["id"] == second["latest"]["id"]
+
+    run_evaluation(user_id=user_id, db_path=db_path, domain_definition=HealthDomainDefinition())
+    third = data_cache.cached_insights_view(user_id=user_id, db_path=db_path)
+    assert len(calls) == 2
+    assert third["latest"]["id"] > first["latest"]["id"]
+
+    assert data_cache.cached_active_goal_type(user_id=user_id, db_path=db_path) == GoalType.WEIGHT_LOSS.value
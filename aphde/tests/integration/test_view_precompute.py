@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import json
+from datetime import date
+
+from aphde.app.services.view_precompute import VIEW_LOADERS, VIEW_VERSIONS, load_view, precompute_views
+from core.data.db import get_connection, init_db
+from core.data.repositories.goal_repo import GoalRepository
+from core.data.repositories.user_repo import UserRepository
+from core.data.repositories.weight_repo import WeightLogRepository
+from core.data.repositories.workout_repo import WorkoutLogRepository
+from core.models.enums import GoalType
+from core.services.run_evaluation import run_evaluation
+from domains.health.domain_definition import HealthDomainDefinition
+
+
+def _seed(db_path: str, users: int = 1, evaluated: int = 1) -> list[int]:
+    init_db(db_path)
+    user_ids = []
+    with get_connection(db_path) as conn:
+        for _ in range(users):
+            user_id = UserRepository(conn).create()
+            GoalRepository(conn).set_active_goal(user_id, GoalType.WEIGHT_LOSS, {})
+            for i in range(6):
+                WeightLogRepository(conn).add(user_id, date.today(), 78.0 - (0.1 * i))
+                WorkoutLogRepository(conn).add(user_id, date.today(), "upper", 50, 5000, 8.5, True, True)
+            user_ids.append(user_id)
+    for user_id in user_ids[:evaluated]:
+        for _ in range(3):
+            run_evaluation(user_id=user_id, db_path=db_path, domain_definition=HealthDomainDefinition())
+    return user_ids
+
+
+def _stored(db_path: str, user_id: int, view_name: str):
+    with get_connection(db_path) as conn:
+        return conn.execute(
+            "SELECT * FROM precomputed_views WHERE user_id = ? AND view_name = ?",
+            (user_id, view_name),
+        ).fetchone()
+
+
+def test_precomputed_payloads_match_live_views(tmp_path) -> None:
+    db_path = str(tmp_path / "views.db")
+    user_ids = _seed(db_path, users=3, evaluated=2)
+
+    result = precompute_views(db_path=db_path, chunk_size=2)
+    assert (result.users_processed, result.views_written, result.views_fresh) == (3, 6, 0)
+
+    for user_id in user_ids:
+        for view_name, (loader, limit) in VIEW_LOADERS.items():
+            stored = _stored(db_path, user_id, view_name)
+            assert json.loads(stored["payload_json"]) == loader(user_id=user_id, db_path=db_path, recent_limit=limit)
+            assert stored["as_of"] == date.today().isoformat()
+
+    rerun = precompute_views(db_path=db_path, user_ids=user_ids[:1])
+    assert (rerun.users_processed, rerun.views_written, rerun.views_fresh) == (1, 0, 2)
+
+
+def test_pages_serve_stored_payloads_until_the_user_writes(tmp_path) -> None:
+    db_path = str(tmp_path / "views.db")
+    (user_id,) = _seed(db_path)
+    precompute_views(db_path=db_path, user_ids=[user_id])
+
+    with get_connection(db_path) as conn:
+        # A marker only the stored row carries, to tell a served payload from a live one.
+        conn.execute(
+            "UPDATE precomputed_views SET payload_json = ? WHERE user_id = ? AND view_name = 'insights'",
+            (json.dumps({"served": True}), user_id),
+        )
+        conn.commit()
+    assert load_view("insights", user_id=user_id, db_path=db_path) == {"served": True}
+    # Other limits are not stored and always computed live.
+    assert "served" not in load_view("insights", user_id=user_id, db_path=db_path, recent_limit=10)
+
+    with get_connection(db_path) as conn:
+        WorkoutLogRepository(conn).add(user_id, date.today(), "lower", 45, 4000, 6.0, True, True)
+    live, _ = VIEW_LOADERS["insights"]
+    assert load_view("insights", user_id=user_id, db_path=db_path) == live(user_id=user_id, db_path=db_path, recent_limit=42)
+    before_run = _stored(db_path, user_id, "insights")
+
+    decision_id = run_evaluation(user_id=user_id, db_path=db_path, domain_definition=HealthDomainDefinition())
+    view = load_view("action_center", user_id=user_id, db_path=db_path)
+    assert view["latest"]["id"] == decision_id
+    stored = _stored(db_path, user_id, "action_center")
+    assert stored["decision_id"] == decision_id
+    assert stored["data_version"] > before_run["data_version"]
+    assert json.loads(stored["payload_json"]) == view
+
+
+def test_payloads_from_another_view_version_are_rebuilt(tmp_path, monkeypatch) -> None:
+    db_path = str(tmp_path / "views.db")
+    (user_id,) = _seed(db_path)
+    precompute_views(db_path=db_path, user_ids=[user_id])
+    assert _stored(db_path, user_id, "insights")["view_version"] == VIEW_VERSIONS["insights"]
+
+    monkeypatch.setitem(VIEW_VERSIONS, "insights", "insights_next")
+    result = precompute_views(db_path=db_path, user_ids=[user_id])
+    assert (result.views_written, result.views_fresh) == (1, 1)
+    assert _stored(db_path, user_id, "insights")["view_version"] == "insights_next"
+
+    with get_connection(db_path) as conn:
+        conn.execute(
+            "UPDATE precomputed_views SET view_version = 'insights_v0', payload_json = ? WHERE user_id = ?",
+            (json.dumps({"served": True}), user_id),
+        )
+        conn.commit()
+    assert "served" not in load_view("insights", user_id=user_id, db_path=db_path)
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import random
+from datetime import date, timedelta
+
+from core.data.db import get_connection, init_db
+from core.data.repositories.decision_repo import DecisionRunRepository
+from core.data.repositories.goal_repo import GoalRepository
+from core.data.repositories.user_repo import UserRepository
+from core.data.repositories.workout_repo import WorkoutLogRepository
+from core.insights.weekly_aggregates import WeeklyAggregator
+from core.insights.weekly_summary import iso_week_of
+from core.models.enums import GoalType
+
+
+def _seed(db_path: str) -> tuple[int, int]:
+    init_db(db_path)
+    with get_connection(db_path) as conn:
+        user_id = UserRepository(conn).create()
+        goal_id = GoalRepository(conn).set_active_goal(user_id, GoalType.WEIGHT_LOSS, {})
+    return user_id, goal_id
+
+
+def _write_run(conn, user_id: int, goal_id: int, run_day: date, signals: dict) -> int:
+    decision_id = DecisionRunRepository(conn).create(user_id, goal_id, 50.0, 10.0, [], {"computed_signals": signals})
+    conn.execute("UPDATE decision_runs SET run_date = ? WHERE id = ?", (f"{run_day.isoformat()}T08:00:00+00:00", decision_id))
+    conn.commit()
+    return decision_id
+
+
+def _sessions(conn, user_id: int) -> dict[str, tuple[int, int]]:
+    return {
+        week["iso_week"]: (week["sessions_planned"], week["sessions_completed"])
+        for week in WeeklyAggregator(conn).weeks(user_id, limit=100)
+    }
+
+
+def test_workout_log_writes_maintain_iso_week_session_counts(tmp_path) -> None:
+    db_path = str(tmp_path / "weekly.db")
+    user_id, _ = _seed(db_path)
+
+    with get_connection(db_path) as conn:
+        repo = WorkoutLogRepository(conn)
+        repo.add(user_id, date(2024, 12, 29), "upper", 45)  # Sunday of 2024-W52
+        repo.add(user_id, date(2024, 12, 30), "lower", 45)  # Monday of 2025-W01
+        repo.add(user_id, date(2025, 1, 5), "upper", 45, completed_flag=False)
+        skipped = repo.add(user_id, date(2025, 1, 1), "cardio", 30, planned_flag=False)
+        assert _sessions(conn, user_id) == {"2024-W52": (1, 1), "2025-W01": (2, 1)}
+
+        conn.execute("UPDATE workout_logs SET log_date = '2024-12-28', planned_flag = 1 WHERE id = ?", (skipped,))
+        conn.execute("DELETE FROM workout_logs WHERE log_date = '2024-12-30'")
+        conn.commit()
+        assert _sessions(conn, user_id) == {"2024-W52": (2, 2), "2025-W01": (1, 0)}
+
+
+def test_incremental_refresh_matches_rebuild(tmp_path) -> None:
+    db_path = str(tmp_path / "weekly.db")
+    user_id, goal_id = _seed(db_path)
+    rng = random.Random(11)
+    start = date(2026, 8, 3)
+
+    with get_connection(db_path) as conn:
+        aggregator = WeeklyAggregator(conn)
+        expected: dict[str, list[float]] = {}
+        for index in range(40):
+            day = start + timedelta(days=index // 2)
+            compliance = round(rng.uniform(0.5, 1.0), 3)
+            signals = {"compliance_ratio": compliance, "recovery_index": None if index % 5 == 0 else 0.5}
+            _write_run(conn, user_id, goal_id, day, signals)
+            expected.setdefault(iso_week_of(day)[0], []).append(compliance)
+            if index % 3 == 0:
+                aggregator.refresh(user_id)
+            if index % 4 == 0:
+                WorkoutLogRepository(conn).add(user_id, day, "upper", 45)
+
+        incremental = aggregator.weeks(user_id, limit=100)
+        conn.execute("DELETE FROM insight_weekly_state")
+        conn.commit()
+        rebuilt = aggregator.weeks(user_id, limit=100)
+
+    assert incremental == rebuilt
+    assert [week["iso_week"] for week in incremental] == sorted(expected, reverse=True)
+    for week in incremental:
+        values = expected[week["iso_week"]]
+        compliance = week["signals"]["compliance_ratio"]
+        assert (compliance["first"], compliance["last"], compliance["count"]) == (values[0], values[-1], len(values))
+        assert abs(compliance["mean"] - sum(values) / len(values)) < 1e-9
+        assert week["run_count"] == len(values)
+
+
+def test_refresh_skips_runs_already_folded_by_a_racing_refresh(tmp_path) -> None:
+    db_path = str(tmp_path / "weekly.db")
+    user_id, goal_id = _seed(db_path)
+    day = date(2026, 10, 19)
+
+    with get_connection(db_path) as conn:
+        _write_run(conn, user_id, goal_id, day, {"compliance_ratio": 0.8})
+        WeeklyAggregator(conn).refresh(user_id)
+        _write_run(conn, user_id, goal_id, day, {"compliance_ratio": 0.6})
+        stale = conn.execute("SELECT last_decision_id FROM insight_weekly_state").fetchone()[0]
+        WeeklyAggregator(conn).refresh(user_id)
+        # Another process still holding the older watermark refreshes again.
+        conn.execute("UPDATE insight_weekly_state SET last_decision_id = ?", (stale,))
+        conn.commit()
+        (week,) = WeeklyAggregator(conn).weeks(user_id)
+
+    assert week["run_count"] == 2
+    assert week["signals"]["compliance_ratio"]["count"] == 2
+
+
+def test_weeks_only_refreshes_behind_the_latest_run(tmp_path) -> None:
+    db_path = str(tmp_path / "weekly.db")
+    user_id, goal_id = _seed(db_path)
+    day = date(2026, 10, 19)
+
+    with get_connection(db_path) as conn:
+        _write_run(conn, user_id, goal_id, day, {"compliance_ratio": 0.8})
+        aggregator = WeeklyAggregator(conn)
+        aggregator.weeks(user_id)
+        before = conn.total_changes
+        aggregator.weeks(user_id)
+        assert conn.total_changes == before
+
+        _write_run(conn, user_id, goal_id, day, {"compliance_ratio": 0.6})
+        (week,) = aggregator.weeks(user_id)
+
+    assert week["run_count"] == 2
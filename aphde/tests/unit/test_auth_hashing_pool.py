@@ -0,0 +1,53 @@
+import threading
+
+import pytest
+
+from core.auth.hashing_pool import HashPoolBusyError, PasswordHasherPool
+from core.auth.passwords import hash_password, needs_rehash, password_hash_rounds
+
+
+def test_password_hash_rounds_reads_bcrypt_cost() -> None:
+    hashed = hash_password("StrongPass123", rounds=4)
+    assert password_hash_rounds(hashed) == 4
+    assert needs_rehash(hashed, rounds=5)
+    assert not needs_rehash(hashed, rounds=4)
+    assert password_hash_rounds("not-a-hash") is None
+
+
+def test_pool_hashes_verifies_and_reports_metrics() -> None:
+    pool = PasswordHasherPool(workers=1, queue_size=2, rounds=4)
+    try:
+        hashed = pool.hash("StrongPass123")
+        assert pool.verify("StrongPass123", hashed)
+        assert not pool.verify("WrongPass123", hashed)
+        metrics = pool.metrics()
+    finally:
+        pool.shutdown()
+
+    assert metrics["hash_time"]["count"] == 3
+    assert metrics["queue_wait"]["count"] == 3
+    assert metrics["hash_time"]["max_ms"] > 0.0
+    assert metrics["in_flight"] == 0
+    assert metrics["rejected"] == 0
+
+
+def test_pool_rejects_when_queue_stays_full() -> None:
+    pool = PasswordHasherPool(workers=1, queue_size=0, rounds=4, admission_timeout=0.01)
+    release = threading.Event()
+    started = threading.Event()
+
+    def _blocking() -> None:
+        started.set()
+        release.wait()
+
+    holder = threading.Thread(target=pool._run, args=(_blocking,))
+    holder.start()
+    try:
+        assert started.wait(5)
+        with pytest.raises(HashPoolBusyError):
+            pool.hash("StrongPass123")
+        assert pool.metrics()["rejected"] == 1
+    finally:
+        release.set()
+        holder.join()
+        pool.shutdown()
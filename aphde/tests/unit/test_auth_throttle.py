@@ -0,0 +1,66 @@
+import pytest
+
+from core.auth.throttle import LoginThrottle, ThrottleRule
+
+
+class _Clock:
+    def __init__(self, value: float) -> None:
+        self.value = value
+
+    def __call__(self) -> float:
+        return self.value
+
+
+def test_sliding_window_weights_previous_window() -> None:
+    clock = _Clock(600.0)
+    throttle = LoginThrottle(email_rule=ThrottleRule(limit=4, window_seconds=60.0), clock=clock)
+    for _ in range(4):
+        throttle.record_failure(email="a@example.com")
+    assert throttle.retry_after(email="a@example.com") == pytest.approx(60.0)
+
+    # Halfway through the next window the previous four count as two.
+    clock.value = 690.0
+    assert throttle.retry_after(email="a@example.com") is None
+    throttle.record_failure(email="a@example.com")
+    throttle.record_failure(email="a@example.com")
+    assert throttle.retry_after(email="a@example.com") == pytest.approx(0.0, abs=1e-6)
+    clock.value = 691.0
+    assert throttle.retry_after(email="a@example.com") is None
+    assert throttle.retry_after(email="b@example.com") is None
+
+
+def test_client_limit_spans_emails_and_success_clears_email() -> None:
+    clock = _Clock(0.0)
+    throttle = LoginThrottle(
+        email_rule=ThrottleRule(limit=10, window_seconds=60.0),
+        client_rule=ThrottleRule(limit=3, window_seconds=60.0),
+        clock=clock,
+    )
+    for index in range(3):
+        throttle.record_failure(email=f"user{index}@example.com", client_id="203.0.113.9")
+    assert throttle.retry_after(email="other@example.com", client_id="203.0.113.9") is not None
+    assert throttle.retry_after(email="other@example.com", client_id="198.51.100.1") is None
+
+    for _ in range(9):
+        throttle.record_failure(email="user0@example.com")
+    throttle.record_success(email="user0@example.com")
+    for _ in range(9):
+        throttle.record_failure(email="user0@example.com")
+    assert throttle.retry_after(email="user0@example.com") is None
+
+
+def test_reservations_count_toward_the_limit_until_released() -> None:
+    clock = _Clock(0.0)
+    throttle = LoginThrottle(email_rule=ThrottleRule(limit=2, window_seconds=60.0), clock=clock)
+    throttle.record_failure(email="a@example.com")
+
+    # Concurrent attempts: only one more may be verified before any is recorded.
+    assert throttle.reserve(email="a@example.com") is None
+    assert throttle.reserve(email="a@example.com") is not None
+    throttle.release(email="a@example.com")
+    assert throttle.retry_after(email="a@example.com") is None
+
+    assert throttle.reserve(email="a@example.com") is None
+    throttle.record_failure(email="a@example.com")
+    throttle.release(email="a@example.com")
+    assert throttle.reserve(email="a@example.com") is not None
@@ -1,4 +1,9 @@
-from core.scoring.confidence import compute_confidence
+import math
+import random
+
+import numpy as np
+
+from core.scoring.confidence import compute_confidence, compute_confidence_batch, history_deviation_patterns
 from core.signals.aggregator import SignalBundle
 
 
@@ -104,3 +109,83 @@ def test_compute_confidence_is_deterministic_for_same_inputs() -> None:
     a = compute_confidence(**kwargs)
     b = compute_confidence(**kwargs)
     assert a == b
+
+
+def test_compute_confidence_batch_matches_single_user_results() -> None:
+    rng = random.Random(37)
+    keys = ["trend_miss", "compliance_miss", "recovery_miss"]
+    users = []
+    for _ in range(300):
+        users.append(
+            {
+                "signals": _signals(
+                    volatility_index=rng.choice([None, 0.02, 0.12, rng.random() * 0.2]),
+                    sufficiency={f"s{idx}": rng.random() < 0.75 for idx in range(6)},
+                ),
+                "deviations": {key: rng.random() < 0.4 for key in keys},
+                "history": [{"deviations": {key: rng.random() < 0.4 for key in keys}} for _ in range(rng.randint(0, 4))],
+                "recommendations": [
+                    {"id": f"r{idx}", "confidence": rng.random(), "reason_codes": ["A"] * rng.randint(0, 5)}
+                    for idx in range(rng.randint(0, 3))
+                ],
+                "available_days": rng.randint(0, 9),
+                "previous_alignment_confidence": rng.choice([None, rng.random()]),
+            }
+        )
+
+    history_width = max(len(user["history"]) for user in users)
+    rec_width = max(len(user["recommendations"]) for user in users)
+    history = np.zeros((len(users), history_width, len(keys)), dtype=bool)
+    history_mask = np.zeros((len(users), history_width), dtype=bool)
+    rec_base = np.zeros((len(users), rec_width))
+    rec_counts = np.zeros((len(users), rec_width), dtype=np.int64)
+    rec_mask = np.zeros((len(users), rec_width), dtype=bool)
+    for row, user in enumerate(users):
+        for position, item in enumerate(user["history"]):
+            history[row, position] = [item["deviations"][key] for key in keys]
+            history_mask[row, position] = True
+        for position, rec in enumerate(user["recommendations"]):
+            rec_base[row, position] = rec["confidence"]
+            rec_counts[row, position] = len(rec["reason_codes"])
+            rec_mask[row, position] = True
+
+    batch = compute_confidence_batch(
+        sufficiency=np.array([list(user["signals"].sufficiency.values()) for user in users]),
+        volatility=np.array([np.nan if u["signals"].volatility_index is None else u["signals"].volatility_index for u in users]),
+        deviations=np.array([[user["deviations"][key] for key in keys] for user in users]),
+        available_days=np.array([user["available_days"] for user in users]),
+        history_deviations=history,
+        history_mask=history_mask,
+        previous_alignment_confidence=np.array(
+            [np.nan if u["previous_alignment_confidence"] is None else u["previous_alignment_confidence"] for u in users]
+        ),
+        recommendation_base_confidence=rec_base,
+        recommendation_reason_counts=rec_counts,
+        recommendation_mask=rec_mask,
+    )
+
+    for row, user in enumerate(users):
+        single = compute_confidence(**user)
+        assert round(float(batch.alignment_confidence[row]), 4) == single["alignment_confidence"]
+        assert bool(batch.previous_used[row]) is single["confidence_breakdown"]["smoothing"]["previous_used"]
+        for name, value in single["confidence_breakdown"]["components"].items():
+            assert round(float(batch.components[name][row]), 4) == value
+        expected = [item["confidence"] for item in single["recommendation_confidence"]]
+        actual = [round(float(value), 4) for value in batch.recommendation_confidence[row] if not math.isnan(value)]
+        assert actual == expected
+
+
+def test_compute_confidence_history_patterns_match_history_scan() -> None:
+    rng = random.Random(38)
+    names = ("trend_miss", "compliance_miss", "recovery_miss")
+    history = [{"deviations": {name: rng.random() < 0.5 for name in names}} for _ in range(12)]
+    patterns = history_deviation_patterns(history)
+    for _ in range(50):
+        deviations = {name: rng.random() < 0.5 for name in names}
+        kwargs = {
+            "signals": _signals(),
+            "deviations": deviations,
+            "recommendations": [],
+            "history": history,
+        }
+        assert compute_confidence(**kwargs, history_patterns=patterns) == compute_confidence(**kwargs)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import pytest
+
+from core.context.base import PhaseModulation, PhaseTableContext, ThresholdShift
 from core.context.cycle_context import CycleContext
-from core.context.registry import apply_context
+from core.context.registry import ContextRegistry, apply_context
 
 
 def test_cycle_context_luteal_modulates_thresholds_and_scalars() -> None:
@@ -75,3 +78,42 @@ def test_context_registry_unsupported_type_is_ignored() -> None:
     assert result.context_applied is False
     assert result.context_metadata["context_type"] == "travel"
     assert any("Unsupported context_type" in note for note in result.context_notes)
+
+
+class _TravelContext(PhaseTableContext):
+    context_name = "travel"
+    context_version = "travel_v1"
+    phase_key = "state"
+    phase_table = {
+        "jetlag": PhaseModulation(
+            shifts=(ThresholdShift("min_recovery", offset=-0.1, low=0.35, high=0.95, note="Jet lag: lower recovery bar."),),
+            scalars=(("priority_score_scale", 0.9),),
+        ),
+    }
+
+
+def test_context_registry_composes_contexts_in_one_pass() -> None:
+    registry = ContextRegistry([CycleContext, _TravelContext])
+    result = registry.apply(
+        goal_type="weight_loss",
+        base_thresholds={"max_volatility": 0.08, "min_recovery": 0.55},
+        score_inputs={"priority_score": 0.45},
+        context_input={
+            "contexts": [
+                {"context_type": "cycle", "phase": "luteal"},
+                {"context_type": "travel", "state": "jetlag"},
+                {"context_type": "weather"},
+            ]
+        },
+    )
+
+    assert result.context_applied is True
+    assert result.modulated_thresholds["max_volatility"] == 0.092
+    assert result.modulated_thresholds["min_recovery"] == pytest.approx(0.42)
+    assert result.tolerance_adjustments["min_recovery_delta"] == -0.13
+    assert result.penalty_scalars["priority_score_scale"] == 0.95 * 0.9
+    assert result.context_version == "ctx_v1+travel_v1"
+    assert result.context_metadata["context_type"] == "cycle+travel"
+    assert result.context_metadata["phase"] == "luteal"
+    assert any("Unsupported context_type 'weather'" in note for note in result.context_notes)
+    assert registry.get("cycle") is registry.get("cycle")
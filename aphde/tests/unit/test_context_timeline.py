@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import json
+from datetime import date
+
+from core.context.timeline import ContextTimeline
+
+
+def _row(row_id: int, user_id: int, log_date: str, payload: dict | str, context_type: str = "cycle") -> dict:
+    raw = payload if isinstance(payload, str) else json.dumps(payload)
+    return {"id": row_id, "user_id": user_id, "log_date": log_date, "context_type": context_type, "context_payload_json": raw}
+
+
+def test_timeline_resolves_context_in_effect_per_date() -> None:
+    timeline = ContextTimeline.from_rows(
+        [
+            _row(4, 1, "2026-03-10", {"phase": "menstrual"}),
+            _row(1, 1, "2026-03-01", {"phase": "follicular"}),
+            _row(2, 1, "2026-03-05", {"phase": "ovulatory"}),
+            _row(3, 1, "2026-03-05", {"phase": "luteal"}),
+            _row(5, 1, "2026-03-12", "not-json"),
+            _row(6, 2, "2026-03-02", {"phase": "luteal"}),
+        ]
+    )
+
+    assert timeline.at(1, date(2026, 2, 28)) is None
+    assert timeline.at(1, date(2026, 3, 1)) == {"phase": "follicular"}
+    assert timeline.at(1, date(2026, 3, 4)) == {"phase": "follicular"}
+    # Highest id wins within a day.
+    assert timeline.at(1, date(2026, 3, 5)) == {"phase": "luteal"}
+    assert timeline.at(1, date(2026, 3, 11)) == {"phase": "menstrual"}
+    assert timeline.at(1, date(2026, 3, 20)) is None
+    assert timeline.at(2, date(2026, 3, 20)) == {"phase": "luteal"}
+    assert timeline.at(3, date(2026, 3, 20)) is None
+
+
+def test_timeline_composes_multiple_context_types() -> None:
+    timeline = ContextTimeline.from_rows(
+        [
+            _row(1, 1, "2026-03-01", {"phase": "luteal"}),
+            _row(2, 1, "2026-03-03", {"state": "jetlag"}, context_type="travel"),
+        ]
+    )
+
+    assert timeline.payload_at(1, date(2026, 3, 2), ("cycle", "travel")) == {"phase": "luteal"}
+    assert timeline.payload_at(1, date(2026, 3, 3), ("cycle", "travel")) == {
+        "contexts": [
+            {"context_type": "cycle", "phase": "luteal"},
+            {"context_type": "travel", "state": "jetlag"},
+        ]
+    }
+    assert timeline.payload_at(1, date(2026, 3, 3)) == {"phase": "luteal"}
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from datetime import date
+
+from core.data.db import get_connection, init_db
+from core.data.migrations.migrate_v8_data_versions import run_migration
+from core.data.repositories.data_version_repo import UserDataVersionRepository
+from core.data.repositories.goal_repo import GoalRepository
+from core.data.repositories.user_repo import UserRepository
+from core.data.repositories.weight_repo import WeightLogRepository
+from core.models.entities import WeightLog
+from core.models.enums import GoalType
+
+
+def test_writes_bump_only_the_owning_users_version(tmp_path) -> None:
+    db_path = tmp_path / "versions.db"
+    init_db(db_path)
+
+    with get_connection(db_path) as conn:
+        users = UserRepository(conn)
+        versions = UserDataVersionRepository(conn)
+        first, second = users.create(), users.create()
+        assert versions.get(first) == 0
+
+        GoalRepository(conn).set_active_goal(first, GoalType.WEIGHT_LOSS, {})
+        # Deactivating the previous goal is an update, so a second activation bumps twice.
+        GoalRepository(conn).set_active_goal(first, GoalType.STRENGTH_GAIN, {})
+        assert versions.get(first) == 3
+
+        WeightLogRepository(conn).add_many(
+            [WeightLog(user_id=first, log_date=date.today(), weight_kg=78.0 + i) for i in range(3)]
+        )
+        assert versions.get(first) == 6
+
+        conn.execute("DELETE FROM weight_logs WHERE user_id = ?", (first,))
+        conn.commit()
+        assert versions.get(first) == 9
+        assert versions.get_many([first, second, first]) == {first: 9, second: 0}
+
+
+def test_migration_adds_version_triggers_to_existing_database(tmp_path) -> None:
+    db_path = tmp_path / "legacy_v8.db"
+    with get_connection(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE weight_logs (id INTEGER PRIMARY KEY AUTOINCREMENT, user_id INTEGER, log_date TEXT, weight_kg REAL)"
+        )
+        conn.commit()
+
+    run_migration(db_path)
+    run_migration(db_path)
+
+    with get_connection(db_path) as conn:
+        conn.execute("INSERT INTO weight_logs (user_id, log_date, weight_kg) VALUES (4, '2026-01-01', 80.0)")
+        conn.execute("INSERT INTO weight_logs (user_id, log_date, weight_kg) VALUES (NULL, '2026-01-01', 80.0)")
+        conn.commit()
+        assert UserDataVersionRepository(conn).get(4) == 1
+        assert conn.execute("SELECT COUNT(*) AS n FROM user_data_versions").fetchone()["n"] == 1
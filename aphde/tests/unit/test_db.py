@@ -11,3 +11,52 @@ def test_init_db_creates_tables(tmp_path) -> None:
         ).fetchone()
 
     assert row is not None
+
+
+def test_connection_pool_reuses_connections_across_threads(tmp_path) -> None:
+    import threading
+
+    from core.data.db import ConnectionPool
+
+    db_path = tmp_path / "pool.db"
+    init_db(db_path)
+    pool = ConnectionPool(db_path, max_size=2)
+
+    with pool.connection() as conn:
+        conn.execute("INSERT INTO users (created_at) VALUES ('2026-01-01')")
+        first_id = id(conn)
+
+    seen: list[int] = []
+
+    def borrow() -> None:
+        with pool.connection() as conn:
+            seen.append(int(conn.execute("SELECT COUNT(*) AS n FROM users").fetchone()["n"]))
+            seen.append(id(conn))
+
+    worker = threading.Thread(target=borrow)
+    worker.start()
+    worker.join()
+    pool.close()
+
+    assert seen == [1, first_id]
+
+
+def test_connection_pool_closes_connections_returned_after_close(tmp_path) -> None:
+    import sqlite3
+
+    import pytest
+
+    from core.data.db import ConnectionPool
+
+    db_path = tmp_path / "pool.db"
+    init_db(db_path)
+    pool = ConnectionPool(db_path)
+
+    with pool.connection() as conn:
+        pool.close()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+    with pytest.raises(RuntimeError):
+        with pool.connection():
+            pass
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import random
+
+from core.decision.fallbacks import fallback_confidences, maintenance_fallback_candidates
 from core.decision.ranker import rank_recommendations
 from core.engine.runner import _ensure_minimum_recommendations
+from core.explain.serializers import recommendation_to_dict, recommendations_to_dicts
 from core.models.entities import Recommendation
 from core.models.enums import RecommendationCategory
 
@@ -31,6 +35,7 @@ def test_minimum_recommendations_keeps_ranked_when_already_two() -> None:
         ranked_recommendations=ranked,
         urgency=0.7,
         recommendation_ranker=rank_recommendations,
+        fallback_provider=maintenance_fallback_candidates,
     )
 
     assert len(ensured) == 2
@@ -45,6 +50,7 @@ def test_minimum_recommendations_adds_deterministic_fallback_when_one() -> None:
         ranked_recommendations=ranked,
         urgency=0.6,
         recommendation_ranker=rank_recommendations,
+        fallback_provider=maintenance_fallback_candidates,
     )
 
     assert len(ensured) == 2
@@ -59,9 +65,54 @@ def test_minimum_recommendations_returns_two_fallbacks_when_zero() -> None:
         ranked_recommendations=[],
         urgency=0.5,
         recommendation_ranker=rank_recommendations,
+        fallback_provider=maintenance_fallback_candidates,
     )
 
     assert len(ensured) == 2
     assert all(rec.rec_id for rec in ensured)
     assert all(rec.confidence > 0.0 for rec in ensured)
     assert [rec.priority for rec in ensured] == [1, 2]
+
+
+def test_rank_recommendations_returns_views_without_copying() -> None:
+    first = _rec("r1", RecommendationCategory.HABIT, 0.6, priority=7)
+    tied_a = _rec("r2", RecommendationCategory.TRAINING, 0.8, priority=7)
+    tied_b = _rec("r3", RecommendationCategory.TRAINING, 0.8, priority=7)
+
+    ranked = rank_recommendations([first, tied_a, tied_b], urgency=0.4)
+
+    assert [rec.rec_id for rec in ranked] == ["r2", "r3", "r1"]
+    assert [rec.priority for rec in ranked] == [1, 2, 3]
+    assert ranked[0].recommendation is tied_a
+    assert tied_a.priority == 7
+    assert ranked[0].score >= ranked[2].score
+    assert recommendations_to_dicts(ranked)[0] == recommendation_to_dict(ranked[0].to_recommendation())
+
+
+def test_fallback_confidences_match_formula_at_every_urgency() -> None:
+    def formula(urgency: float) -> tuple[float, ...]:
+        base_conf = max(0.0, min(1.0, 0.58 + (0.22 * (1.0 - urgency))))
+        return (
+            round(base_conf, 4),
+            round(max(0.0, min(1.0, base_conf - 0.03)), 4),
+            round(max(0.0, min(1.0, base_conf - 0.05)), 4),
+            round(max(0.0, min(1.0, base_conf - 0.02)), 4),
+        )
+
+    rng = random.Random(36)
+    urgencies = [index / 20000 for index in range(20001)] + [rng.random() for _ in range(20000)]
+    urgencies += [-0.5, 1.5, 0.99999999, 0.45454545454545]
+    for urgency in urgencies:
+        assert fallback_confidences(urgency) == formula(urgency)
+
+    candidates = maintenance_fallback_candidates(urgency=0.3)
+    assert [rec.rec_id for rec in candidates][:2] == ["maintain_progression", "incremental_overload"]
+    assert [rec.confidence for rec in candidates] == list(formula(0.3))
+    assert candidates[0].reason_codes is not maintenance_fallback_candidates(urgency=0.3)[0].reason_codes
+
+
+def test_minimum_recommendations_without_provider_keeps_ranked() -> None:
+    ranked = rank_recommendations([_rec("r1", RecommendationCategory.RECOVERY, 0.82)], urgency=0.6)
+    assert _ensure_minimum_recommendations(
+        ranked_recommendations=ranked, urgency=0.6, recommendation_ranker=rank_recommendations
+    ) == ranked
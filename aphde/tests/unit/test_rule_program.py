@@ -0,0 +1,175 @@
+import random
+
+import numpy as np
+import pytest
+
+from core.decision.rule_program import Rule, compile_rules, signal_matrix
+from core.decision.rules import ADDITIONAL_RISK_PROGRAM, detect_additional_risks
+from core.models.enums import GoalType
+from core.signals.aggregator import SignalBundle
+from core.strategies.factory import StrategyFactory
+
+
+def _safe(value, default):
+    return default if value is None else float(value)
+
+
+# Golden copies of the hand-written checks the rule tables replaced.
+def _legacy_weight_loss(s: SignalBundle, t: dict) -> tuple[dict, list]:
+    trend, compliance = _safe(s.trend_slope, 0.0), _safe(s.compliance_ratio, 0.5)
+    recovery, volatility = _safe(s.recovery_index, 0.5), _safe(s.volatility_index, 0.08)
+    deviations = {
+        "trend_miss": trend > float(t.get("max_weight_slope", -0.05)),
+        "compliance_miss": compliance < float(t.get("min_compliance", 0.8)),
+        "recovery_miss": recovery < float(t.get("min_recovery", 0.55)),
+        "volatility_miss": volatility > float(t.get("max_volatility", 0.06)),
+    }
+    risks = []
+    if deviations["trend_miss"]:
+        risks.append("STALL_RISK")
+    if deviations["compliance_miss"]:
+        risks.append("COMPLIANCE_DROP")
+    if deviations["recovery_miss"]:
+        risks.append("RECOVERY_DROP")
+    if deviations["volatility_miss"]:
+        risks.append("VOLATILITY_SPIKE")
+    return deviations, risks
+
+
+def _legacy_recomposition(s: SignalBundle, t: dict) -> tuple[dict, list]:
+    trend, overload = _safe(s.trend_slope, 0.0), _safe(s.progressive_overload_score, 0.5)
+    balance, compliance = _safe(s.muscle_balance_index, 0.5), _safe(s.compliance_ratio, 0.5)
+    deviations = {
+        "weight_drift": abs(trend) > float(t.get("max_abs_weight_slope", 0.06)),
+        "overload_miss": overload < float(t.get("min_overload", 0.65)),
+        "balance_miss": balance < float(t.get("min_balance", 0.65)),
+        "compliance_miss": compliance < float(t.get("min_compliance", 0.8)),
+    }
+    risks = []
+    if deviations["overload_miss"] or deviations["weight_drift"]:
+        risks.append("STALL_RISK")
+    if deviations["compliance_miss"]:
+        risks.append("COMPLIANCE_DROP")
+    return deviations, risks
+
+
+def _legacy_strength_gain(s: SignalBundle, t: dict) -> tuple[dict, list]:
+    overload, recovery = _safe(s.progressive_overload_score, 0.5), _safe(s.recovery_index, 0.5)
+    compliance, trend = _safe(s.compliance_ratio, 0.5), _safe(s.trend_slope, 0.0)
+    deviations = {
+        "overload_miss": overload < float(t.get("min_overload", 0.72)),
+        "recovery_miss": recovery < float(t.get("min_recovery", 0.6)),
+        "compliance_miss": compliance < float(t.get("min_compliance", 0.8)),
+        "progress_miss": trend < float(t.get("min_strength_trend", 0.0)),
+    }
+    risks = []
+    if deviations["overload_miss"] or deviations["progress_miss"]:
+        risks.append("STALL_RISK")
+    if deviations["recovery_miss"]:
+        risks.append("RECOVERY_DROP")
+    if deviations["compliance_miss"]:
+        risks.append("COMPLIANCE_DROP")
+    return deviations, risks
+
+
+def _legacy_general_health(s: SignalBundle, t: dict) -> tuple[dict, list]:
+    compliance, recovery = _safe(s.compliance_ratio, 0.5), _safe(s.recovery_index, 0.5)
+    volatility, balance = _safe(s.volatility_index, 0.08), _safe(s.muscle_balance_index, 0.5)
+    deviations = {
+        "compliance_miss": compliance < float(t.get("min_compliance", 0.7)),
+        "recovery_miss": recovery < float(t.get("min_recovery", 0.55)),
+        "volatility_miss": volatility > float(t.get("max_volatility", 0.08)),
+        "balance_miss": balance < float(t.get("min_balance", 0.6)),
+    }
+    risks = []
+    if deviations["compliance_miss"]:
+        risks.append("COMPLIANCE_DROP")
+    if deviations["recovery_miss"]:
+        risks.append("RECOVERY_DROP")
+    if deviations["volatility_miss"]:
+        risks.append("VOLATILITY_SPIKE")
+    return deviations, risks
+
+
+def _legacy_additional_risks(s: SignalBundle) -> list[str]:
+    risks = []
+    if s.recovery_index is not None and s.recovery_index < 0.45:
+        risks.append("RECOVERY_DROP")
+    if s.compliance_ratio is not None and s.compliance_ratio < 0.65:
+        risks.append("COMPLIANCE_DROP")
+    if s.volatility_index is not None and s.volatility_index > 0.10:
+        risks.append("VOLATILITY_SPIKE")
+    if s.progressive_overload_score is not None and s.progressive_overload_score < 0.5:
+        risks.append("STALL_RISK")
+    return sorted(set(risks))
+
+
+LEGACY = {
+    GoalType.WEIGHT_LOSS: _legacy_weight_loss,
+    GoalType.RECOMPOSITION: _legacy_recomposition,
+    GoalType.STRENGTH_GAIN: _legacy_strength_gain,
+    GoalType.GENERAL_HEALTH: _legacy_general_health,
+}
+
+# Exact threshold values are included so strict vs non-strict comparisons are exercised.
+_EDGE_VALUES = (None, -0.1, -0.06, -0.05, 0.0, 0.06, 0.08, 0.1, 0.45, 0.5, 0.55, 0.6, 0.65, 0.7, 0.72, 0.8, 1.0)
+_TARGETS = ({}, {"min_compliance": 0.9, "max_volatility": 0.2}, {"min_overload": "0.3", "max_weight_slope": 0.0})
+
+
+def _bundles(count: int) -> list[SignalBundle]:
+    rng = random.Random(34)
+    bundles = []
+    for _ in range(count):
+        values = [rng.choice(_EDGE_VALUES) if rng.random() < 0.6 else rng.uniform(-0.2, 1.1) for _ in range(6)]
+        bundles.append(
+            SignalBundle(
+                trend_slope=values[0],
+                volatility_index=values[1],
+                compliance_ratio=values[2],
+                muscle_balance_index=values[3],
+                recovery_index=values[4],
+                progressive_overload_score=values[5],
+                sufficiency={},
+            )
+        )
+    return bundles
+
+
+@pytest.mark.parametrize("goal_type", list(GoalType))
+def test_compiled_strategy_rules_match_legacy_checks(goal_type: GoalType) -> None:
+    strategy = StrategyFactory.create(goal_type)
+    program = strategy.rule_program
+    bundles = _bundles(600)
+    matrix = signal_matrix(bundles)
+
+    for target in _TARGETS:
+        batch_deviations, batch_risks = program.evaluate_batch(matrix, program.threshold_matrix([target] * len(bundles)))
+        batch_risk_lists = program.risk_lists(batch_risks)
+        for row, signals in enumerate(bundles):
+            expected_deviations, expected_risks = LEGACY[goal_type](signals, target)
+            evaluation = strategy.evaluate(signals, target)
+            assert evaluation["deviations"] == expected_deviations
+            assert list(evaluation["deviations"]) == list(expected_deviations)
+            assert evaluation["risks"] == expected_risks
+            assert dict(zip(expected_deviations, batch_deviations[row].tolist())) == expected_deviations
+            assert batch_risk_lists[row] == expected_risks
+
+
+def test_compiled_additional_risks_match_legacy_checks() -> None:
+    bundles = _bundles(800)
+    _, batch_risks = ADDITIONAL_RISK_PROGRAM.evaluate_batch(
+        signal_matrix(bundles), np.asarray(ADDITIONAL_RISK_PROGRAM.default_thresholds)
+    )
+    for signals, risks in zip(bundles, ADDITIONAL_RISK_PROGRAM.risk_lists(batch_risks)):
+        expected = _legacy_additional_risks(signals)
+        assert detect_additional_risks(signals) == expected
+        assert sorted(risks) == expected
+
+
+def test_compile_rules_rejects_unknown_references() -> None:
+    with pytest.raises(ValueError):
+        compile_rules([Rule(name="x", signal="sleep_hours", comparator="<", threshold="t")], [("t", 1.0)])
+    with pytest.raises(ValueError):
+        compile_rules([Rule(name="x", signal="trend_slope", comparator="<=", threshold="t")], [("t", 1.0)])
+    with pytest.raises(ValueError):
+        compile_rules([Rule(name="x", signal="trend_slope", comparator="<", threshold="u")], [("t", 1.0)])
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from core.insights.signal_frame import SignalSeriesFrame
+
+
+def _run(run_id: int, **signals: object) -> dict:
+    return {"id": run_id, "trace": {"computed_signals": signals}}
+
+
+def test_frame_aligns_columns_with_run_ids_oldest_first() -> None:
+    # Newest first, as the repositories return runs.
+    runs = [
+        _run(3, compliance_ratio=0.9, recovery_index="0.7"),
+        _run(2, compliance_ratio="n/a"),
+        _run(1, compliance_ratio=0.5, recovery_index=0.4, volatility_index=None),
+    ]
+    frame = SignalSeriesFrame.from_runs(runs)
+
+    assert len(frame) == 3
+    assert frame.run_ids == (1, 2, 3)
+    assert frame.column("compliance_ratio") == (0.5, None, 0.9)
+    assert frame.column("recovery_index") == (0.4, None, 0.7)
+    assert frame.column("volatility_index") == (None, None, None)
+    assert frame.series("compliance_ratio") == [0.5, 0.9]
+    assert frame.series("missing") == []
+
+
+def test_frame_skips_runs_without_usable_traces() -> None:
+    runs = [
+        {"id": 4, "trace": "not-a-dict"},
+        {"id": 3, "trace": {"computed_signals": []}},
+        _run(2, recovery_index=0.6),
+        {"id": 1},
+    ]
+    frame = SignalSeriesFrame.from_runs(runs)
+
+    assert frame.run_ids == (1, 2, 3, 4)
+    assert frame.column("recovery_index") == (None, 0.6, None, None)
+
+
+def test_head_and_tail_slice_oldest_and_newest_runs() -> None:
+    runs = [_run(run_id, recovery_index=run_id / 10) for run_id in range(10, 0, -1)]
+    frame = SignalSeriesFrame.from_runs(runs)
+
+    assert frame.head(3).run_ids == (1, 2, 3)
+    assert frame.head(3).series("recovery_index") == [0.1, 0.2, 0.3]
+    assert frame.tail(2).run_ids == (9, 10)
+    assert frame.tail(20).run_ids == frame.run_ids
+    assert frame.tail(0).run_ids == ()
+
+
+def test_keys_limit_columns_and_pad_missing_signals() -> None:
+    runs = [_run(2, recovery_index=0.6, trend_slope=0.1), _run(1, trend_slope=0.2)]
+    frame = SignalSeriesFrame.from_runs(runs, keys=("recovery_index", "compliance_ratio"))
+
+    assert set(frame.columns) == {"recovery_index", "compliance_ratio"}
+    assert frame.column("recovery_index") == (None, 0.6)
+    assert frame.column("compliance_ratio") == (None, None)
@@ -82,3 +82,53 @@ def test_build_signal_bundle_computes_all_primary_signals() -> None:
     assert bundle.progressive_overload_score is not None
     assert bundle.sufficiency is not None
     assert all(bundle.sufficiency.values())
+
+
+def test_multi_window_bundles_match_single_window_builds() -> None:
+    from datetime import date, timedelta
+
+    from core.signals.multi_window import build_multi_window_signal_bundles
+    from domains.health.thresholds import SIGNAL_SNAPSHOT_WINDOWS
+
+    as_of = date(2026, 3, 31)
+    weight_logs = []
+    workout_logs = []
+    for offset in range(60):
+        log_date = (as_of - timedelta(days=offset)).isoformat()
+        weight_logs.append({"log_date": log_date, "weight_kg": 78.0 + 0.03 * offset - 0.2 * (offset % 3)})
+        if offset % 2 == 0:
+            workout_logs.append(
+                {
+                    "log_date": log_date,
+                    "session_type": ("upper", "pull", "lower", "core", "legs")[offset % 5],
+                    "volume_load": 5000.0 - 12.0 * offset + (90.0 if offset % 4 == 0 else 0.0),
+                    "avg_rpe": 8.5 if offset % 6 < 3 else 7.0,
+                    "planned_flag": True,
+                    "completed_flag": offset % 8 != 0,
+                }
+            )
+    workout_logs.append({"log_date": (as_of + timedelta(days=1)).isoformat(), "session_type": "upper"})
+
+    bundles = build_multi_window_signal_bundles(
+        weight_logs=weight_logs, workout_logs=workout_logs, as_of=as_of, windows=SIGNAL_SNAPSHOT_WINDOWS
+    )
+    assert sorted(bundles) == [7, 14, 28, 56]
+
+    for window, bundle in bundles.items():
+        cutoff = (as_of - timedelta(days=window)).isoformat()
+        weights = sorted((row for row in weight_logs if row["log_date"] >= cutoff), key=lambda row: row["log_date"])
+        workouts = sorted(
+            (row for row in workout_logs if cutoff <= row["log_date"] <= as_of.isoformat()),
+            key=lambda row: row["log_date"],
+        )
+        expected = build_signal_bundle(
+            weight_values=[row["weight_kg"] for row in weights],
+            workout_logs=workouts,
+            window_days=window,
+        )
+        assert bundle.sufficiency == expected.sufficiency
+        for name in bundle.sufficiency:
+            actual_value = getattr(bundle, name)
+            expected_value = getattr(expected, name)
+            assert actual_value is not None and expected_value is not None
+            assert abs(actual_value - expected_value) < 1e-9, (window, name)
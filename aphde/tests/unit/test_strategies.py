@@ -1,6 +1,9 @@
+import pytest
+
 from core.models.enums import GoalType
 from core.signals.aggregator import SignalBundle
-from core.strategies.factory import StrategyFactory
+from core.strategies.factory import StrategyFactory, StrategyRegistry
+from core.strategies.weight_loss import WeightLossStrategy
 
 
 def _sample_signals() -> SignalBundle:
@@ -58,3 +61,31 @@ def test_strength_gain_and_general_health_generate_different_top_recommendations
     assert len(sg_recs) > 0
     assert len(gh_recs) > 0
     assert sg_recs[0].rec_id != gh_recs[0].rec_id
+
+
+def test_strategy_registry_caches_one_instance_per_goal_type() -> None:
+    assert StrategyFactory.create(GoalType.WEIGHT_LOSS) is StrategyFactory.create(GoalType.WEIGHT_LOSS)
+
+    registry = StrategyRegistry()
+    with pytest.raises(ValueError):
+        registry.get(GoalType.WEIGHT_LOSS)
+    registry.register(GoalType.WEIGHT_LOSS, WeightLossStrategy)
+    first = registry.get(GoalType.WEIGHT_LOSS)
+    assert registry.get(GoalType.WEIGHT_LOSS) is first
+    registry.register(GoalType.WEIGHT_LOSS, WeightLossStrategy)
+    assert registry.get(GoalType.WEIGHT_LOSS) is not first
+
+
+def test_precompiled_thresholds_and_templates_match_target_overrides() -> None:
+    strategy = StrategyFactory.create(GoalType.WEIGHT_LOSS)
+    signals = _sample_signals()
+
+    default_eval = strategy.evaluate(signals, {})
+    assert default_eval == strategy.evaluate(signals, {"min_compliance": 0.8})
+    assert strategy.evaluate(signals, {"min_compliance": 0.5})["deviations"]["compliance_miss"] is False
+
+    first = strategy.recommend(default_eval)
+    second = strategy.recommend(default_eval)
+    assert [rec.rec_id for rec in first] == ["wl_compliance_01", "wl_nutrition_01", "wl_recovery_01"]
+    assert first[0] is not second[0]
+    assert first[0].reason_codes == default_eval["risks"]
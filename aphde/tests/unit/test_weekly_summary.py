@@ -1,45 +1,67 @@
 from __future__ import annotations
 
-from core.insights.weekly_summary import build_weekly_insight
+from datetime import date
 
+from core.insights.weekly_summary import build_weekly_insight, build_weekly_trend, iso_week_of
 
-def _run(*, compliance: float, recovery: float, volatility: float, overload: float) -> dict:
+
+def _stats(first: float, last: float, mean: float, count: int) -> dict:
+    return {"first": first, "last": last, "mean": mean, "count": count}
+
+
+def _week(*, iso_week: str = "2026-W42", week_start: str = "2026-10-12", run_count: int = 4) -> dict:
     return {
-        "trace": {
-            "computed_signals": {
-                "compliance_ratio": compliance,
-                "recovery_index": recovery,
-                "volatility_index": volatility,
-                "progressive_overload_score": overload,
-            }
-        }
+        "iso_week": iso_week,
+        "week_start": week_start,
+        "week_end": "2026-10-18",
+        "sessions_planned": 4,
+        "sessions_completed": 3,
+        "run_count": run_count,
+        "signals": {
+            "compliance_ratio": _stats(0.72, 0.78, 0.75, run_count),
+            "recovery_index": _stats(0.60, 0.64, 0.62, run_count),
+            "volatility_index": _stats(0.10, 0.08, 0.09, run_count),
+            "progressive_overload_score": _stats(0.52, 0.60, 0.56, run_count),
+        },
+        "volatility_direction": "improving",
     }
 
 
 def test_weekly_summary_contains_expected_fields() -> None:
-    runs = [
-        _run(compliance=0.72, recovery=0.60, volatility=0.10, overload=0.52),
-        _run(compliance=0.74, recovery=0.61, volatility=0.09, overload=0.55),
-        _run(compliance=0.76, recovery=0.63, volatility=0.08, overload=0.58),
-        _run(compliance=0.78, recovery=0.64, volatility=0.08, overload=0.60),
-    ]
-    summary = build_weekly_insight(recent_runs=runs)
-    assert "week_start" in summary
-    assert "week_end" in summary
-    assert "planned_sessions" in summary
-    assert "completed_sessions" in summary
-    assert "compliance_pct" in summary
-    assert "compliance_avg_pct" in summary
-    assert "recovery_shift" in summary
-    assert "volatility_direction" in summary
-    assert "overload_progress" in summary
+    summary = build_weekly_insight(week=_week())
+    assert summary["week_start"] == "2026-10-12"
+    assert summary["week_end"] == "2026-10-18"
+    assert summary["planned_sessions"] == 4
+    assert summary["completed_sessions"] == 3
+    assert summary["compliance_pct"] == 78.0
+    assert summary["compliance_avg_pct"] == 75.0
+    assert summary["recovery_shift"] == "up"
+    assert summary["volatility_direction"] == "improving"
+    assert summary["overload_progress"] == "up"
     assert summary["data_sufficient"] is True
 
 
 def test_weekly_summary_marks_insufficient_data_when_window_small() -> None:
-    runs = [
-        _run(compliance=0.70, recovery=0.60, volatility=0.10, overload=0.52),
-        _run(compliance=0.71, recovery=0.61, volatility=0.09, overload=0.53),
-    ]
-    summary = build_weekly_insight(recent_runs=runs)
+    summary = build_weekly_insight(week=_week(run_count=2))
+    assert summary["data_sufficient"] is False
+
+
+def test_weekly_summary_without_aggregate_is_empty_current_week() -> None:
+    summary = build_weekly_insight(week=None, today=date(2026, 10, 21))
+    assert summary["iso_week"] == "2026-W43"
+    assert (summary["week_start"], summary["week_end"]) == ("2026-10-19", "2026-10-25")
+    assert summary["planned_sessions"] == 0
+    assert summary["recovery_shift"] == "flat"
     assert summary["data_sufficient"] is False
+
+
+def test_iso_week_handles_year_boundaries() -> None:
+    assert iso_week_of(date(2024, 12, 30)) == ("2025-W01", date(2024, 12, 30))
+    assert iso_week_of(date(2027, 1, 3)) == ("2026-W53", date(2026, 12, 28))
+
+
+def test_weekly_trend_is_oldest_first() -> None:
+    weeks = [_week(), _week(iso_week="2026-W41", week_start="2026-10-05")]
+    trend = build_weekly_trend(weeks)
+    assert [point["iso_week"] for point in trend] == ["2026-W41", "2026-W42"]
+    assert trend[0]["compliance_ratio_mean"] == 0.75
@@ -0,0 +1,105 @@
+from dataclasses import replace
+
+import pytest
+
+from core.decision.engine import run_decision_engine
+from core.decision.what_if import RESULT_COLUMNS, WhatIfAxis, simulate_what_if
+from core.models.enums import GoalType
+from core.signals.aggregator import bundle_from_signals
+from core.strategies.factory import StrategyFactory
+
+
+BASE = bundle_from_signals(
+    trend_slope=0.01,
+    volatility_index=0.07,
+    compliance_ratio=0.7,
+    muscle_balance_index=0.6,
+    recovery_index=0.5,
+    progressive_overload_score=0.6,
+)
+
+
+HISTORY = [{"deviations": {"compliance_miss": True, "trend_miss": index % 2 == 0}} for index in range(6)]
+
+
+def _engine_kwargs(goal_type: GoalType) -> dict:
+    return {
+        "strategy": StrategyFactory.create(goal_type),
+        "target": {"min_compliance": 0.85},
+        "input_summary": {"user_id": 1, "weight_log_count": 5, "workout_log_count": 8},
+        "context_input": {"context_type": "cycle", "phase": "luteal"},
+        "history": HISTORY,
+        "previous_alignment_confidence": 0.6,
+    }
+
+
+@pytest.mark.parametrize("goal_type", list(GoalType))
+def test_what_if_rows_match_individual_engine_runs(goal_type: GoalType) -> None:
+    kwargs = _engine_kwargs(goal_type)
+    axes = [
+        WhatIfAxis("compliance_ratio", (0.5, 0.8, 0.9, 1.0)),
+        WhatIfAxis("recovery_index", (-0.1, 0.0, 0.15), mode="delta"),
+        WhatIfAxis("volatility_index", (0.02, 0.12)),
+    ]
+
+    table = simulate_what_if(base_signals=BASE, axes=axes, **kwargs)
+
+    assert table.columns == ("compliance_ratio", "recovery_index", "volatility_index", *RESULT_COLUMNS)
+    assert len(table.rows) == 24
+    baseline = run_decision_engine(signals=BASE, **kwargs)
+    assert table.baseline["alignment_score"] == baseline.alignment_score
+    for record in table.to_records():
+        signals = replace(BASE, **{axis.signal: record[axis.signal] for axis in axes})
+        result = run_decision_engine(signals=signals, **kwargs)
+        assert record["alignment_score"] == result.alignment_score
+        assert record["risk_score"] == result.risk_score
+        assert record["alignment_confidence"] == result.alignment_confidence
+        assert record["triggered_rules"] == result.trace["triggered_rules"]
+        assert record["recommendation_ids"] == [rec["id"] for rec in result.recommendations]
+        assert record["alignment_delta"] == round(result.alignment_score - baseline.alignment_score, 2)
+
+
+def test_what_if_treats_set_signals_as_sufficient() -> None:
+    kwargs = _engine_kwargs(GoalType.STRENGTH_GAIN)
+    sparse = replace(BASE, recovery_index=None, sufficiency={**BASE.sufficiency, "recovery_index": False})
+
+    table = simulate_what_if(base_signals=sparse, axes=[WhatIfAxis("recovery_index", (0.5,))], **kwargs)
+
+    (record,) = table.to_records()
+    logged = run_decision_engine(signals=BASE, **kwargs)
+    assert record["alignment_confidence"] == logged.alignment_confidence
+    assert record["alignment_confidence"] > table.baseline["alignment_confidence"]
+
+
+def test_what_if_clamps_values_and_shares_duplicate_points() -> None:
+    table = simulate_what_if(
+        base_signals=BASE,
+        axes=[WhatIfAxis("compliance_ratio", (0.4, 0.5, 0.9), mode="delta")],
+        **_engine_kwargs(GoalType.WEIGHT_LOSS),
+    )
+
+    assert [row[0] for row in table.rows] == [1.0, 1.0, 1.0]
+    # Baseline plus one distinct clamped point.
+    assert table.unique_evaluations == 2
+    assert all(row == table.rows[0] for row in table.rows)
+
+
+def test_what_if_rejects_invalid_axes() -> None:
+    kwargs = _engine_kwargs(GoalType.GENERAL_HEALTH)
+    with pytest.raises(ValueError):
+        simulate_what_if(base_signals=BASE, axes=[WhatIfAxis("sleep_hours", (1.0,))], **kwargs)
+    with pytest.raises(ValueError):
+        simulate_what_if(base_signals=BASE, axes=[WhatIfAxis("compliance_ratio", (1.0,), mode="scale")], **kwargs)
+    with pytest.raises(ValueError):
+        simulate_what_if(
+            base_signals=replace(BASE, trend_slope=None),
+            axes=[WhatIfAxis("trend_slope", (0.1,), mode="delta")],
+            **kwargs,
+        )
+    with pytest.raises(ValueError):
+        simulate_what_if(
+            base_signals=BASE,
+            axes=[WhatIfAxis("compliance_ratio", (0.5, 0.6)), WhatIfAxis("recovery_index", (0.5, 0.6))],
+            max_points=3,
+            **kwargs,
+        )